@@ -0,0 +1,4 @@
+"""
+Survivor Fantasy point simulation. Run as `python -m point_simulation <command>`
+from scripts/ (see cli.py); the run_* scripts also work standalone.
+"""
@@ -0,0 +1,4 @@
+"""
+Benchmark suite for the point simulation: timed cases with fixed seeds,
+JSON baselines and equivalence checks. Run benchmarks/run_benchmarks.py.
+"""
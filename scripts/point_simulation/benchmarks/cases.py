@@ -0,0 +1,613 @@
+"""
+Benchmark cases for the simulation hot paths and the run_* pipelines.
+Each case has small/medium/large parameters, an untimed setup that builds its
+inputs from fixed seeds, and a timed run whose result is digested so later
+fast paths can be checked for identical output.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import random
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import yaml
+
+from src.scenario_generator import generate_scenario, load_probabilities
+from src.point_calculator import calculate_roster_points
+from src.dynamic_pricing import update_prices_from_episode, calculate_contestant_episode_points
+from src.price_generator import compute_expected_points_per_contestant, expected_points_to_prices
+from src.roster_enumerator import count_valid_rosters, count_tribe_valid_combos, sample_valid_rosters
+from src.roster_generator import RosterIndex, BUDGET_STRATEGIES
+from src.registry import get_registry
+from src.conditional import rest_of_season_expected_points
+from src.standings import group_teams, episode_points_from_outcomes, compute_standings
+from src.rank_index import RankIndex
+from src.bps import SOCIAL_EVENTS, rank_bonuses_by_episode
+from src.checkpoint import config_fingerprint
+
+from benchmarks import reference
+
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+SIZES = ("small", "medium", "large")
+SEED = 42
+ROSTER_SIZE = 7
+
+
+@lru_cache(maxsize=None)
+def load_context() -> Dict[str, Any]:
+    """Configs, probabilities and a fixed price table shared by all cases (built once)."""
+    with open(CONFIG_DIR / "scoring.yaml") as f:
+        scoring = yaml.safe_load(f)
+    with open(CONFIG_DIR / "season_template.yaml") as f:
+        season_template = yaml.safe_load(f)["episodes"]
+    with open(CONFIG_DIR / "contestants_s50.yaml") as f:
+        contestants = yaml.safe_load(f)["contestants"]
+    with open(CONFIG_DIR / "pricing.yaml") as f:
+        pricing = yaml.safe_load(f)
+    with open(CONFIG_DIR / "dynamic_pricing.yaml") as f:
+        dynamic = yaml.safe_load(f) or {}
+    probabilities = load_probabilities(CONFIG_DIR)
+    expected_points = compute_expected_points_per_contestant(
+        contestants, season_template, scoring, CONFIG_DIR, num_runs=100, seed=SEED
+    )
+    return {
+        "scoring": scoring,
+        "season_template": season_template,
+        "contestants": contestants,
+        "pricing": pricing,
+        "update_config": dict(pricing, **dynamic),
+        "probabilities": probabilities,
+        "expected_points": expected_points,
+        "prices": expected_points_to_prices(expected_points, pricing),
+        "budget": pricing.get("budget", 1_000_000),
+    }
+
+
+def config_hash() -> str:
+    """Fingerprint of the config files; equivalence digests are only comparable under the same config."""
+    files = sorted(CONFIG_DIR.glob("*.yaml"))
+    return config_fingerprint({p.name: p.read_text() for p in files})
+
+
+def _canonical(obj: Any) -> Any:
+    """Convert to JSON-safe form with string keys (tuples become lists, sets sorted lists)."""
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted(_canonical(v) for v in obj)
+    return obj
+
+
+def digest(result: Any) -> str:
+    """Stable sha256 of a benchmark result."""
+    payload = json.dumps(_canonical(result), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _scenarios(n: int) -> List[List[Dict[str, Any]]]:
+    ctx = load_context()
+    return [
+        generate_scenario(
+            ctx["contestants"], ctx["season_template"],
+            seed=SEED + i * 1000, probabilities=ctx["probabilities"],
+        )
+        for i in range(n)
+    ]
+
+
+def _pool(n: int) -> List[Dict]:
+    """First n contestants taken round-robin by tribe, so every pool covers all tribes."""
+    by_tribe: Dict[str, List[Dict]] = {}
+    for c in load_context()["contestants"]:
+        by_tribe.setdefault(c["starting_tribe"], []).append(c)
+    pool = []
+    i = 0
+    while len(pool) < n:
+        for members in by_tribe.values():
+            if i < len(members) and len(pool) < n:
+                pool.append(members[i])
+        i += 1
+    return pool
+
+
+# --- hot paths -------------------------------------------------------------
+
+def _setup_generate_scenario(params: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(load_context(), n=params["scenarios"])
+
+
+def _run_generate_scenario(state: Dict[str, Any]) -> Any:
+    return [
+        generate_scenario(
+            state["contestants"], state["season_template"],
+            seed=SEED + i * 1000, probabilities=state["probabilities"],
+        )
+        for i in range(state["n"])
+    ]
+
+
+def _setup_roster_points(params: Dict[str, Any]) -> Dict[str, Any]:
+    ctx = load_context()
+    rosters = sample_valid_rosters(
+        ctx["contestants"], ctx["prices"], ctx["budget"], params["rosters"],
+        seed=SEED, roster_min=ROSTER_SIZE, roster_max=ROSTER_SIZE,
+    )
+    scenarios = _scenarios(params["scenarios"])
+    jobs = []
+    for scenario in scenarios:
+        for i, roster in enumerate(rosters):
+            # Every other roster names a captain, rotating through the roster each episode
+            captains = [roster[e % len(roster)] for e in range(len(scenario))] if i % 2 else None
+            jobs.append((roster, scenario, captains))
+    return {"scoring": ctx["scoring"], "jobs": jobs}
+
+
+def _run_roster_points(state: Dict[str, Any]) -> Any:
+    scoring = state["scoring"]
+    return [
+        calculate_roster_points(roster, scenario, scoring, captain_per_episode=captains)
+        for roster, scenario, captains in state["jobs"]
+    ]
+
+
+def _setup_episode_points(params: Dict[str, Any]) -> Dict[str, Any]:
+    ctx = load_context()
+    return {
+        "scoring": ctx["scoring"],
+        "ids": [c["id"] for c in ctx["contestants"]],
+        "scenarios": _scenarios(params["scenarios"]),
+    }
+
+
+def _run_episode_points(state: Dict[str, Any]) -> Any:
+    scoring = state["scoring"]
+    ids = state["ids"]
+    return [
+        [[calculate_contestant_episode_points(cid, ep, scoring) for cid in ids] for ep in scenario]
+        for scenario in state["scenarios"]
+    ]
+
+
+def _check_episode_points(state: Dict[str, Any], result: Any) -> Optional[str]:
+    """Season total per contestant must equal solo calculate_roster_points."""
+    return reference.check_episode_points_match_roster_points(
+        state["ids"], state["scenarios"], state["scoring"], result
+    )
+
+
+def _setup_update_prices(params: Dict[str, Any]) -> Dict[str, Any]:
+    ctx = load_context()
+    return {
+        "scoring": ctx["scoring"],
+        "update_config": ctx["update_config"],
+        "prices": ctx["prices"],
+        "scenarios": _scenarios(params["scenarios"]),
+    }
+
+
+def _run_update_prices(state: Dict[str, Any]) -> Any:
+    histories = []
+    for scenario in state["scenarios"]:
+        prices = dict(state["prices"])
+        history = []
+        for ep_idx, ep in enumerate(scenario):
+            if ep.get("final_tribal"):
+                break
+            if ep.get("voted_out"):
+                prices = update_prices_from_episode(
+                    prices, ep, state["scoring"], state["update_config"],
+                    episode_index=ep_idx, tribal_episode_count=ep_idx + 1,
+                )
+                history.append(prices)
+        histories.append(history)
+    return histories
+
+
+def _setup_count_valid(params: Dict[str, Any]) -> Dict[str, Any]:
+    ctx = load_context()
+    return {"pool": _pool(params["pool"]), "prices": ctx["prices"], "budget": ctx["budget"]}
+
+
+def _run_count_valid(state: Dict[str, Any]) -> Any:
+    return count_valid_rosters(
+        state["pool"], state["prices"], state["budget"],
+        roster_min=ROSTER_SIZE, roster_max=ROSTER_SIZE,
+    )
+
+
+def _check_count_valid(state: Dict[str, Any], result: Any) -> Optional[str]:
+    expected = reference.count_valid_rosters(
+        state["pool"], state["prices"], state["budget"], ROSTER_SIZE, ROSTER_SIZE
+    )
+    if result != expected:
+        return f"count_valid_rosters returned {result}, reference {expected}"
+    return None
+
+
+def _setup_count_valid_two_tribes(params: Dict[str, Any]) -> Dict[str, Any]:
+    """As count_valid_rosters, over a pool from two starting tribes only (a tribe wiped out before the merge)."""
+    state = _setup_count_valid(params)
+    tribes = list(dict.fromkeys(c["starting_tribe"] for c in load_context()["contestants"]))[:2]
+    pool = [c for c in _pool(params["pool"] * 3 // 2) if c["starting_tribe"] in tribes]
+    return dict(state, pool=pool[:params["pool"]])
+
+
+def _check_count_valid_two_tribes(state: Dict[str, Any], result: Any) -> Optional[str]:
+    """No roster from two tribes is valid: every count is 0, as in the reference."""
+    if result["total"] or count_tribe_valid_combos(state["pool"], ROSTER_SIZE, ROSTER_SIZE):
+        return f"{len(state['pool'])} contestants from two tribes gave {result} valid rosters, expected none"
+    return _check_count_valid(state, result)
+
+
+def _setup_sample_valid(params: Dict[str, Any]) -> Dict[str, Any]:
+    ctx = load_context()
+    return {
+        "contestants": ctx["contestants"], "prices": ctx["prices"],
+        "budget": ctx["budget"], "n": params["rosters"],
+    }
+
+
+def _run_sample_valid(state: Dict[str, Any]) -> Any:
+    return sample_valid_rosters(
+        state["contestants"], state["prices"], state["budget"], state["n"],
+        seed=SEED, roster_min=ROSTER_SIZE, roster_max=ROSTER_SIZE,
+    )
+
+
+def _check_sample_valid(state: Dict[str, Any], result: Any) -> Optional[str]:
+    expected = reference.sample_valid_rosters(
+        state["contestants"], state["prices"], state["budget"], state["n"],
+        SEED, ROSTER_SIZE, ROSTER_SIZE,
+    )
+    if result != expected:
+        return "sample_valid_rosters differs from the reference sampler for the same seed"
+    return None
+
+
+def _setup_generate_rosters(params: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(load_context(), n=params["rosters"])
+
+
+def _run_generate_rosters(state: Dict[str, Any]) -> Any:
+    index = RosterIndex(
+        state["contestants"], state["prices"], state["budget"], state["expected_points"],
+        roster_min=ROSTER_SIZE, roster_max=ROSTER_SIZE,
+    )
+    rng = random.Random(SEED)
+    return {s: index.generate_rosters(s, state["n"], rng) for s in BUDGET_STRATEGIES}
+
+
+def _check_generate_rosters(state: Dict[str, Any], result: Any) -> Optional[str]:
+    """Every roster has at most ROSTER_SIZE players and is tribe-valid."""
+    registry = get_registry(state["contestants"])
+    for strategy, masks in result.items():
+        for mask in masks:
+            if not registry.tribe_valid(mask) or len(registry.indices(mask)) > ROSTER_SIZE:
+                return f"{strategy} produced an invalid roster {registry.to_ids(mask)}"
+    return None
+
+
+def _setup_rest_of_season(params: Dict[str, Any]) -> Dict[str, Any]:
+    # Forked after episode 10 of a fixed season (post-swap, before the merge)
+    return dict(load_context(), observed=_scenarios(1)[0][:10], runs=params["runs"])
+
+
+def _run_rest_of_season(state: Dict[str, Any]) -> Any:
+    return rest_of_season_expected_points(
+        state["observed"], state["contestants"], state["season_template"], state["scoring"],
+        probabilities=state["probabilities"], num_runs=state["runs"], seed=SEED,
+    )
+
+
+def _league_rows(n_teams: int, episodes: int = 14) -> Dict[str, List[Dict[str, Any]]]:
+    """tribe_entries / captain_picks rows for n_teams: 7-player rosters, ~10% transfer odds per episode."""
+    rng = random.Random(SEED)
+    ids = [c["id"] for c in load_context()["contestants"]]
+    entries, captains = [], []
+    for u in range(n_teams):
+        uid = f"user-{u:07d}"
+        held = dict.fromkeys(rng.sample(ids, ROSTER_SIZE), 1)  # contestant -> added_at_episode
+        for ep in range(1, episodes + 1):
+            if ep > 1 and rng.random() < 0.1:
+                out = rng.choice(list(held))
+                entries.append({"user_id": uid, "contestant_id": out, "added_at_episode": held.pop(out), "removed_at_episode": ep - 1})
+                held[rng.choice([c for c in ids if c not in held and c != out])] = ep
+            captains.append({"user_id": uid, "episode_id": ep, "contestant_id": rng.choice(list(held))})
+        entries.extend(
+            {"user_id": uid, "contestant_id": cid, "added_at_episode": added, "removed_at_episode": None}
+            for cid, added in held.items()
+        )
+    return {"entries": entries, "captains": captains}
+
+
+def _setup_standings(params: Dict[str, Any]) -> Dict[str, Any]:
+    ctx = load_context()
+    rows = _league_rows(params["teams"])
+    return {
+        "scoring": ctx["scoring"],
+        "teams": group_teams(rows["entries"], rows["captains"]),
+        "episode_points": episode_points_from_outcomes(_scenarios(1)[0][:14], ctx["scoring"]),
+    }
+
+
+def _setup_standings_sparse(params: Dict[str, Any]) -> Dict[str, Any]:
+    """As compute_standings, but every third contestant has no points rows at all (only overridden
+    contestants get contestant_episode_points rows), so some captains and entries have none."""
+    state = _setup_standings(params)
+    ids = [c["id"] for c in load_context()["contestants"]]
+    missing = set(ids[::3])
+    state["episode_points"] = {
+        ep: {cid: pts for cid, pts in points.items() if cid not in missing}
+        for ep, points in state["episode_points"].items()
+    }
+    return state
+
+
+def _run_standings(state: Dict[str, Any]) -> Any:
+    return compute_standings(state["teams"], state["episode_points"], state["scoring"])
+
+
+def _check_standings(state: Dict[str, Any], result: Any) -> Optional[str]:
+    current = result["episode_ids"][-1] if result["episode_ids"] else 0
+    totals = reference.team_totals(state["teams"], state["episode_points"], state["scoring"], current)
+    previous = reference.competition_ranks(
+        reference.team_totals(state["teams"], state["episode_points"], state["scoring"], current - 1)
+    )
+    for row in result["standings"]:
+        uid = row["user_id"]
+        if row["total_points"] != totals[uid]:
+            return f"{uid}: total {row['total_points']}, reference {totals[uid]}"
+        if row["previous_rank"] != previous[uid]:
+            return f"{uid}: previous_rank {row['previous_rank']}, ranking through episode {current - 1} gives {previous[uid]}"
+    return None
+
+
+def _setup_rank_index(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Season-to-date totals for n teams, three episodes of per-team deltas and a handful of corrections."""
+    rng = random.Random(SEED)
+    n = params["teams"]
+    uids = [f"user-{u:07d}" for u in range(n)]
+    totals = {uid: rng.randint(0, 60) * 5 + rng.randint(-10, 10) for uid in uids}
+    episodes = [{uid: rng.randint(-5, 40) + rng.choice((0, 0, 0, 25)) for uid in uids} for _ in range(3)]
+    corrections = {uid: rng.choice((-5, 5, 10)) for uid in rng.sample(uids, 100)}
+    return {
+        "totals": totals,
+        "episodes": episodes,
+        "corrections": corrections,
+        "queries": rng.sample(uids, min(n, 10000)),
+        "leagues": [rng.sample(uids, 20) for _ in range(200)],
+    }
+
+
+def _run_rank_index(state: Dict[str, Any]) -> Any:
+    index = RankIndex(state["totals"])
+    out = []
+    for deltas in state["episodes"] + [state["corrections"]]:
+        index.apply(deltas)
+        out.append({
+            "ranks": [index.rank(uid) for uid in state["queries"]],
+            "top": index.top(10),
+            "leagues": [[row["team"] for row in index.league(lg)] for lg in state["leagues"]],
+        })
+    return out
+
+
+def _check_rank_index(state: Dict[str, Any], result: Any) -> Optional[str]:
+    totals = dict(state["totals"])
+    for deltas in state["episodes"] + [state["corrections"]]:
+        for uid, delta in deltas.items():
+            totals[uid] += delta
+    expected = reference.competition_ranks(totals)
+    if result[-1]["ranks"] != [expected[uid] for uid in state["queries"]]:
+        return "RankIndex ranks differ from a full sort"
+    return None
+
+
+def _setup_bps(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Seasons with the generator's events plus random social / challenge BPS lists (empty in generated outcomes)."""
+    ctx = load_context()
+    with open(CONFIG_DIR / "bps.yaml") as f:
+        bps_config = yaml.safe_load(f)
+    rng = random.Random(SEED)
+    seasons = []
+    for s in range(params["scenarios"]):
+        season = generate_scenario(
+            ctx["contestants"], ctx["season_template"], seed=SEED + s * 7777, probabilities=ctx["probabilities"]
+        )
+        for ep in season:
+            active = ep["active_contestants"]
+            for key in SOCIAL_EVENTS + ("key_contributor", "costs_challenge"):
+                ep[key] = rng.sample(active, min(len(active), rng.randint(0, 2)))
+            ep["episode_narrator"] = rng.choice(active) if active and rng.random() < 0.5 else None
+        seasons.append(season)
+    return {"seasons": seasons, "bps": bps_config}
+
+
+def _run_bps(state: Dict[str, Any]) -> Any:
+    return [
+        {ep: sorted(bonuses.items()) for ep, bonuses in rank_bonuses_by_episode(season, state["bps"]).items()}
+        for season in state["seasons"]
+    ]
+
+
+def _check_bps(state: Dict[str, Any], result: Any) -> Optional[str]:
+    for season, got in zip(state["seasons"], result):
+        expected = reference.episode_rank_bonuses(season, state["bps"])
+        if {ep: sorted(b.items()) for ep, b in expected.items()} != got:
+            return "BPS rank bonuses differ from the bps.ts port"
+    return None
+
+
+# --- pipelines -------------------------------------------------------------
+
+def _setup_pipeline(params: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(params)
+
+
+def _quiet(fn, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(**kwargs)
+
+
+def _run_points_pipeline(state: Dict[str, Any]) -> Any:
+    from run_simulation import run_simulation
+    return _quiet(run_simulation, num_runs=state["runs"], num_rosters_per_strategy=state["rosters"], seed=SEED)
+
+
+def _run_pricing_pipeline(state: Dict[str, Any]) -> Any:
+    from run_pricing_simulation import run_pricing_simulation
+    return _quiet(
+        run_pricing_simulation,
+        price_estimation_runs=state["price_runs"], scenario_runs=state["scenarios"],
+        rosters_per_strategy=state["rosters"], seed=SEED,
+    )
+
+
+def _run_full_pipeline(state: Dict[str, Any]) -> Any:
+    from run_full_simulation import run_full_simulation
+    return _quiet(run_full_simulation, num_scenarios=state["scenarios"], rosters_per_strategy=state["rosters"], seed=SEED)
+
+
+def _run_dynamic_pipeline(state: Dict[str, Any]) -> Any:
+    from run_dynamic_pricing_simulation import run_dynamic_pricing_simulation
+    return _quiet(run_dynamic_pricing_simulation, num_scenarios=state["scenarios"], seed=SEED)
+
+
+def _run_trace_pipeline(state: Dict[str, Any]) -> Any:
+    from run_episode_trace_simulation import run_episode_trace
+    return _quiet(run_episode_trace, scenario_seed=SEED, num_teams=state["teams"])
+
+
+# name -> setup, run, optional reference check, sizes; pipelines cap repeats since one run is already long
+CASES: Dict[str, Dict[str, Any]] = {
+    "generate_scenario": {
+        "setup": _setup_generate_scenario,
+        "run": _run_generate_scenario,
+        "sizes": {"small": {"scenarios": 20}, "medium": {"scenarios": 100}, "large": {"scenarios": 400}},
+    },
+    "calculate_roster_points": {
+        "setup": _setup_roster_points,
+        "run": _run_roster_points,
+        "sizes": {
+            "small": {"scenarios": 5, "rosters": 20},
+            "medium": {"scenarios": 20, "rosters": 50},
+            "large": {"scenarios": 50, "rosters": 100},
+        },
+    },
+    "calculate_contestant_episode_points": {
+        "setup": _setup_episode_points,
+        "run": _run_episode_points,
+        "check": _check_episode_points,
+        "sizes": {"small": {"scenarios": 5}, "medium": {"scenarios": 20}, "large": {"scenarios": 80}},
+    },
+    "update_prices_from_episode": {
+        "setup": _setup_update_prices,
+        "run": _run_update_prices,
+        "sizes": {"small": {"scenarios": 10}, "medium": {"scenarios": 50}, "large": {"scenarios": 200}},
+    },
+    "count_valid_rosters": {
+        "setup": _setup_count_valid,
+        "run": _run_count_valid,
+        "check": _check_count_valid,
+        "sizes": {"small": {"pool": 16}, "medium": {"pool": 20}, "large": {"pool": 24}},
+    },
+    "count_valid_rosters_two_tribes": {
+        "setup": _setup_count_valid_two_tribes,
+        "run": _run_count_valid,
+        "check": _check_count_valid_two_tribes,
+        "sizes": {"small": {"pool": 11}, "medium": {"pool": 14}, "large": {"pool": 16}},
+    },
+    "sample_valid_rosters": {
+        "setup": _setup_sample_valid,
+        "run": _run_sample_valid,
+        "check": _check_sample_valid,
+        "sizes": {"small": {"rosters": 200}, "medium": {"rosters": 1000}, "large": {"rosters": 4000}},
+    },
+    "generate_rosters": {
+        "setup": _setup_generate_rosters,
+        "run": _run_generate_rosters,
+        "check": _check_generate_rosters,
+        "sizes": {"small": {"rosters": 2000}, "medium": {"rosters": 20000}, "large": {"rosters": 100000}},
+    },
+    "rest_of_season_expected_points": {
+        "setup": _setup_rest_of_season,
+        "run": _run_rest_of_season,
+        "sizes": {"small": {"runs": 50}, "medium": {"runs": 200}, "large": {"runs": 500}},
+    },
+    "compute_standings": {
+        "setup": _setup_standings,
+        "run": _run_standings,
+        "check": _check_standings,
+        "max_repeat": 2,
+        "sizes": {"small": {"teams": 2000}, "medium": {"teams": 20000}, "large": {"teams": 100000}},
+    },
+    "compute_standings_sparse_points": {
+        "setup": _setup_standings_sparse,
+        "run": _run_standings,
+        "check": _check_standings,
+        "max_repeat": 2,
+        "sizes": {"small": {"teams": 2000}, "medium": {"teams": 20000}, "large": {"teams": 100000}},
+    },
+    "rank_index": {
+        "setup": _setup_rank_index,
+        "run": _run_rank_index,
+        "check": _check_rank_index,
+        "max_repeat": 2,
+        "sizes": {"small": {"teams": 10000}, "medium": {"teams": 100000}, "large": {"teams": 1000000}},
+    },
+    "bps_rank_bonus": {
+        "setup": _setup_bps,
+        "run": _run_bps,
+        "check": _check_bps,
+        "sizes": {"small": {"scenarios": 20}, "medium": {"scenarios": 100}, "large": {"scenarios": 400}},
+    },
+    "run_simulation": {
+        "setup": _setup_pipeline,
+        "run": _run_points_pipeline,
+        "max_repeat": 2,
+        "sizes": {
+            "small": {"runs": 3, "rosters": 2},
+            "medium": {"runs": 10, "rosters": 5},
+            "large": {"runs": 40, "rosters": 10},
+        },
+    },
+    "run_pricing_simulation": {
+        "setup": _setup_pipeline,
+        "run": _run_pricing_pipeline,
+        "max_repeat": 2,
+        "sizes": {
+            "small": {"price_runs": 30, "scenarios": 4, "rosters": 2},
+            "medium": {"price_runs": 100, "scenarios": 12, "rosters": 3},
+            "large": {"price_runs": 300, "scenarios": 40, "rosters": 5},
+        },
+    },
+    "run_full_simulation": {
+        "setup": _setup_pipeline,
+        "run": _run_full_pipeline,
+        "max_repeat": 1,
+        "sizes": {
+            "small": {"scenarios": 2, "rosters": 1},
+            "medium": {"scenarios": 5, "rosters": 2},
+            "large": {"scenarios": 15, "rosters": 5},
+        },
+    },
+    "run_dynamic_pricing_simulation": {
+        "setup": _setup_pipeline,
+        "run": _run_dynamic_pipeline,
+        "max_repeat": 1,
+        "sizes": {"small": {"scenarios": 2}, "medium": {"scenarios": 5}, "large": {"scenarios": 15}},
+    },
+    "run_episode_trace": {
+        "setup": _setup_pipeline,
+        "run": _run_trace_pipeline,
+        "max_repeat": 1,
+        "sizes": {"small": {"teams": 1}, "medium": {"teams": 3}, "large": {"teams": 6}},
+    },
+}
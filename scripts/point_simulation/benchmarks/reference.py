@@ -0,0 +1,198 @@
+"""
+Reference implementations the benchmark suite checks fast paths against.
+These are deliberately plain and frozen: when src/ gains an optimized path
+(bitmask rosters, indexed generators, ...), its output must still match these
+exactly, including random-number consumption for seeded samplers.
+"""
+
+import random
+from itertools import combinations
+from typing import Dict, List, Any, Optional
+
+from src.point_calculator import calculate_roster_points
+
+
+def _valid(combo, prices: Dict[str, int], budget: int, tribe_map: Dict[str, str]) -> bool:
+    if len({tribe_map.get(c, "") for c in combo}) < 3:
+        return False
+    return sum(prices.get(c, 0) for c in combo) <= budget
+
+
+def count_valid_rosters(
+    contestants: List[Dict],
+    prices: Dict[str, int],
+    budget: int,
+    roster_min: int,
+    roster_max: int,
+) -> Dict[str, int]:
+    """Brute-force count of rosters with min 1 per tribe and cost <= budget."""
+    ids = [c["id"] for c in contestants]
+    tribe_map = {c["id"]: c["starting_tribe"] for c in contestants}
+    counts = {
+        size: sum(1 for combo in combinations(ids, size) if _valid(combo, prices, budget, tribe_map))
+        for size in range(roster_min, roster_max + 1)
+    }
+    result = {"total": sum(counts.values())}
+    for size, n in counts.items():
+        result[f"size_{size}"] = n
+    return result
+
+
+def sample_valid_rosters(
+    contestants: List[Dict],
+    prices: Dict[str, int],
+    budget: int,
+    n: int,
+    seed: Optional[int],
+    roster_min: int,
+    roster_max: int,
+) -> List[List[str]]:
+    """Rejection sampler with dedup; consumes the global random stream like the original."""
+    if seed is not None:
+        random.seed(seed)
+    ids = [c["id"] for c in contestants]
+    tribe_map = {c["id"]: c["starting_tribe"] for c in contestants}
+    seen = set()
+    rosters = []
+    attempts = 0
+    while len(rosters) < n and attempts < n * 500:
+        attempts += 1
+        size = roster_min if roster_min == roster_max else random.randint(roster_min, roster_max)
+        combo = tuple(sorted(random.sample(ids, size)))
+        if combo in seen:
+            continue
+        if _valid(combo, prices, budget, tribe_map):
+            seen.add(combo)
+            rosters.append(list(combo))
+    return rosters
+
+
+def check_episode_points_match_roster_points(
+    ids: List[str],
+    scenarios: List[List[Dict[str, Any]]],
+    scoring: Dict[str, Any],
+    episode_points: List[List[List[float]]],
+) -> Optional[str]:
+    """
+    Per-episode contestant points must add up to the solo roster total for the season.
+    Returns a description of the first mismatch, or None.
+    """
+    for s, scenario in enumerate(scenarios):
+        for i, cid in enumerate(ids):
+            season_total = sum(ep_points[i] for ep_points in episode_points[s])
+            solo_total = calculate_roster_points([cid], scenario, scoring)["total"]
+            if season_total != solo_total:
+                return f"scenario {s} {cid}: episode points sum to {season_total}, roster points {solo_total}"
+    return None
+
+
+def competition_ranks(totals: Dict[str, float]) -> Dict[str, int]:
+    """Full-sort competition ranks (1, 2, 2, 4), ties ordered by team ID."""
+    ranks = {}
+    prev_total = None
+    rank = 0
+    for i, uid in enumerate(sorted(totals, key=lambda u: (-totals[u], u))):
+        if totals[uid] != prev_total:
+            rank = i + 1
+            prev_total = totals[uid]
+        ranks[uid] = rank
+    return ranks
+
+
+def team_totals(
+    teams: Dict[str, Dict[str, Any]],
+    episode_points: Dict[int, Dict[str, float]],
+    scoring: Dict[str, Any],
+    through_episode: int,
+) -> Dict[str, float]:
+    """Team totals through an episode, scored episode by episode and entry by entry as scoring.ts does."""
+    captain_extra = scoring.get("captain_multiplier", 2.0) - 1
+    add_penalty = scoring.get("other", {}).get("add_player_penalty", -5)
+    totals = {}
+    for uid, team in teams.items():
+        if not team["entries"]:
+            continue
+        total = 0
+        for cid, added, removed in team["entries"]:
+            if 1 < added <= through_episode:
+                total += add_penalty
+        for ep in range(1, through_episode + 1):
+            points = episode_points.get(ep, {})
+            for cid, added, removed in team["entries"]:
+                if added <= ep and (removed is None or removed >= ep):
+                    total += points.get(cid, 0)
+                    if team["captains"].get(ep) == cid:
+                        total += captain_extra * points.get(cid, 0)
+        totals[uid] = total
+    return totals
+
+
+def bps_per_contestant(cid: str, ep: Dict[str, Any], config: Dict[str, Any]) -> float:
+    """Line-for-line port of app/lib/bps.ts calculateBPSPerContestant."""
+    pts = 0
+    active = ep.get("active_contestants") or []
+    if cid not in active and ep.get("voted_out") != cid:
+        return 0
+    social, advantage = config["social"], config["advantage"]
+    challenge, visibility = config["challenge"], config["visibility"]
+    for key in ("inclusion_in_plan", "safety_statement", "vote_info_correct", "advantage_info_correct",
+                "initiates_strategic", "kept_commitment", "swing_label", "named_target_survives"):
+        if cid in (ep.get(key) or []):
+            pts += social[key]
+    if ep.get("clue_finder") == cid:
+        pts += advantage["clue_found"]
+    if ep.get("idol_finder") == cid or ep.get("advantage_finder") == cid:
+        pts += advantage["advantage_or_idol_found"]
+    if cid in (ep.get("idol_played") or []) or cid in (ep.get("advantage_played") or []):
+        pts += advantage["advantage_or_idol_played"]
+        nullified = ep.get("idol_votes_nullified") or 0
+        if cid in (ep.get("idol_played") or []) and nullified > 0:
+            pts += advantage["idol_nullifies_votes"] * nullified
+    if cid in (ep.get("idol_failed") or []):
+        pts += advantage["failed_idol_play"]
+    if ep.get("immunity_type") == "team":
+        tribes = ep.get("contestant_tribes") or {}
+        for tribe, result in (ep.get("team_immunity_results") or {}).items():
+            if cid in tribes.get(tribe, []) and result == 1:
+                pts += challenge["wins_team_immunity"]
+                break
+    if ep.get("immunity_type") == "individual" and ep.get("individual_immunity_winner") == cid:
+        pts += challenge["wins_individual_immunity"]
+    if cid in (ep.get("key_contributor") or []):
+        pts += challenge["key_contributor"]
+    if cid in (ep.get("costs_challenge") or []):
+        pts += challenge["costs_challenge"]
+    cc = (ep.get("confessional_counts") or {}).get(cid, 0)
+    if 4 <= cc <= 6:
+        pts += visibility["confessionals_4_6"]
+    if cc >= 7:
+        pts += visibility["confessionals_7_plus"]
+    if ep.get("episode_narrator") is not None and ep.get("episode_narrator") == cid:
+        pts += visibility["episode_narrator"]
+    return pts
+
+
+def episode_rank_bonuses(episode_outcomes: List[Dict[str, Any]], config: Dict[str, Any]) -> Dict[int, Dict[str, float]]:
+    """Port of bps.ts getEpisodeRankBonuses: full sort, then walk tied groups."""
+    bonus_values = [config["episode_rank_bonus"][k] for k in ("first", "second", "third")]
+    result = {}
+    for ep_idx, ep in enumerate(episode_outcomes):
+        if ep.get("final_tribal"):
+            continue
+        participants = list(ep.get("active_contestants") or [])
+        if ep.get("voted_out"):
+            participants.append(ep["voted_out"])
+        if not participants:
+            continue
+        scores = sorted(((bps_per_contestant(c, ep, config), c) for c in participants), key=lambda s: -s[0])
+        bonus_map = {}
+        i = 0
+        bonus_index = 0
+        while i < len(scores) and bonus_index < len(bonus_values):
+            current = scores[i][0]
+            while i < len(scores) and scores[i][0] == current:
+                bonus_map[scores[i][1]] = bonus_values[bonus_index]
+                i += 1
+            bonus_index += 1
+        result[ep.get("episode_id", ep_idx + 1)] = bonus_map
+    return result
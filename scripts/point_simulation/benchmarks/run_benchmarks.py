@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner: times each case, checks equivalence, compares against baselines.
+Exits non-zero on a timing regression beyond --tolerance, a digest that differs
+from the baseline, a reference-check failure or nondeterministic output.
+
+    python benchmarks/run_benchmarks.py --size small
+    python benchmarks/run_benchmarks.py --size all --update-baseline
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.cases import CASES, SIZES, config_hash, digest
+
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+BASELINE_VERSION = 1
+DEFAULT_TOLERANCE = 0.30
+
+
+def calibrate(repeat: int = 5) -> float:
+    """
+    Seconds for a fixed pure-Python workload (dict updates, string sort).
+    Case times are divided by this so baselines transfer between machines.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        counts: Dict[int, int] = {}
+        for i in range(200_000):
+            k = i % 997
+            counts[k] = counts.get(k, 0) + i
+        sorted(str(i * 7919 % 100_003) for i in range(50_000))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_case(name: str, size: str, repeat: int) -> Dict[str, Any]:
+    """Set up one case, time `repeat` runs (best-of) and verify every run gives the same result."""
+    case = CASES[name]
+    state = case["setup"](case["sizes"][size])
+    repeat = max(1, min(repeat, case.get("max_repeat", repeat)))
+    times: List[float] = []
+    digests = set()
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = case["run"](state)
+        times.append(time.perf_counter() - start)
+        digests.add(digest(result))
+    errors = []
+    if len(digests) > 1:
+        errors.append("nondeterministic: repeated runs produced different results")
+    check = case.get("check")
+    if check is not None:
+        message = check(state, result)
+        if message:
+            errors.append(f"reference check failed: {message}")
+    return {
+        "seconds": min(times),
+        "runs": repeat,
+        "digest": sorted(digests)[0],
+        "errors": errors,
+    }
+
+
+def load_baseline(size: str) -> Optional[Dict[str, Any]]:
+    path = BASELINE_DIR / f"{size}.json"
+    if not path.exists():
+        return None
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINE_VERSION:
+        return None
+    return baseline
+
+
+def write_baseline(size: str, calibration: float, results: Dict[str, Dict[str, Any]]) -> Path:
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    path = BASELINE_DIR / f"{size}.json"
+    existing = load_baseline(size) or {}
+    cases = dict(existing.get("cases", {}))
+    for name, r in results.items():
+        cases[name] = {
+            "seconds": r["seconds"],
+            "normalized": r["seconds"] / calibration,
+            "digest": r["digest"],
+        }
+    payload = {
+        "version": BASELINE_VERSION,
+        "config_hash": config_hash(),
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "calibration_seconds": calibration,
+        "cases": dict(sorted(cases.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+        f.write("\n")
+    return path
+
+
+def compare(
+    name: str,
+    result: Dict[str, Any],
+    calibration: float,
+    baseline: Optional[Dict[str, Any]],
+    tolerance: float,
+    check_timing: bool,
+) -> List[str]:
+    """Failures for one case against its baseline entry (empty list if it passes)."""
+    failures = list(result["errors"])
+    if baseline is None or name not in baseline.get("cases", {}):
+        return failures
+    entry = baseline["cases"][name]
+    if baseline.get("config_hash") == config_hash():
+        if result["digest"] != entry["digest"]:
+            failures.append("output differs from baseline (equivalence check)")
+    if check_timing:
+        normalized = result["seconds"] / calibration
+        limit = entry["normalized"] * (1 + tolerance)
+        if normalized > limit:
+            failures.append(
+                f"regression: {normalized / entry['normalized']:.2f}x baseline "
+                f"(tolerance {1 + tolerance:.2f}x)"
+            )
+    return failures
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog=prog, description="Benchmark simulation hot paths and pipelines")
+    parser.add_argument("--size", choices=list(SIZES) + ["all"], default="small")
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="Run only these cases (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best-of)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown vs baseline, as a fraction (0.30 = 30%%)")
+    parser.add_argument("--no-timing-check", action="store_true", help="Only check equivalence")
+    parser.add_argument("--update-baseline", action="store_true", help="Record these results as the new baseline")
+    parser.add_argument("--json", type=str, default=None, help="Also write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    sizes = list(SIZES) if args.size == "all" else [args.size]
+    names = args.case or list(CASES)
+
+    calibration = calibrate()
+    print(f"Calibration: {calibration * 1000:.1f} ms (python {platform.python_version()})")
+
+    report: Dict[str, Any] = {"calibration_seconds": calibration, "sizes": {}}
+    failed = []
+    for size in sizes:
+        baseline = load_baseline(size)
+        if baseline is None:
+            print(f"\n[{size}] no baseline; timing and equivalence are not compared")
+        elif baseline.get("config_hash") != config_hash():
+            print(f"\n[{size}] config changed since baseline; equivalence check skipped")
+        else:
+            print(f"\n[{size}]")
+        results = {}
+        for name in names:
+            result = run_case(name, size, args.repeat)
+            failures = compare(name, result, calibration, baseline, args.tolerance, not args.no_timing_check)
+            result["failures"] = failures
+            results[name] = result
+
+            ratio = ""
+            if baseline and name in baseline.get("cases", {}):
+                ratio = f"{result['seconds'] / calibration / baseline['cases'][name]['normalized']:.2f}x baseline"
+            status = "FAIL" if failures else "ok"
+            print(f"  {name:<36} {result['seconds'] * 1000:>10.1f} ms  {ratio:<16} {status}")
+            # When re-baselining, only reference and determinism errors still count as failures
+            for failure in failures:
+                print(f"      {failure}")
+                if not args.update_baseline or failure in result["errors"]:
+                    failed.append(f"{name}[{size}]: {failure}")
+
+        report["sizes"][size] = results
+        if args.update_baseline:
+            errors = [n for n, r in results.items() if r["errors"]]
+            if errors:
+                print(f"  not updating baseline: {', '.join(errors)} failed reference checks")
+            else:
+                print(f"  baseline written to {write_baseline(size, calibration, results)}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if failed:
+        print("\n" + "=" * 50)
+        print(f"BENCHMARK FAILURES ({len(failed)})")
+        print("=" * 50)
+        for f in failed:
+            print(f"  {f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
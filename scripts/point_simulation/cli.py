@@ -0,0 +1,300 @@
+"""
+Single entry point for the point simulation:
+
+    cd scripts && python -m point_simulation <command> [options]
+
+Only argparse is imported up front. Each command imports its run_* module (and
+with it yaml and src/) when it runs, so --help and `validate` stay fast. The
+run_* scripts build their parsers from the add_*_arguments functions below, so
+options are identical whether a simulation is started here or directly.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+PACKAGE_DIR = Path(__file__).parent
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profile", action="store_true", help="Time each stage and write timings.json")
+    parser.add_argument("--cprofile", action="store_true", help="With --profile, also dump a cProfile per stage")
+
+
+def add_points_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--runs", type=int, default=500, help="Number of scenario runs")
+    parser.add_argument("--rosters", type=int, default=20, help="Rosters per strategy per run")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Output directory")
+    add_profile_arguments(parser)
+
+
+def add_price_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--runs", type=int, default=2000, help="Runs for price estimation")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-calibrate", action="store_true", help="Skip target_valid_pct calibration")
+    parser.add_argument("--bps", action="store_true", help="Include the BPS episode rank bonus (config/bps.yaml)")
+    sampling = parser.add_mutually_exclusive_group()
+    sampling.add_argument("--stratify", choices=("proportional", "neyman"), default=None,
+                          help="Stratify runs over the swap/merge structures (proportional or Neyman allocation)")
+    sampling.add_argument("--qmc", type=int, default=0, metavar="REPLICATES",
+                          help="Quasi-Monte Carlo: scrambled Halton seasons in N randomized replicates (0 = off)")
+    sampling.add_argument("--importance", action="store_true",
+                          help="Importance sampling: over-sample quits, medevacs, two-item pockets and idol plays")
+    sampling.add_argument("--control-variates", action="store_true",
+                          help="Adjust plain Monte Carlo by controls with known means (boot position, challenge draws)")
+    sampling.add_argument("--save-bank", type=str, default=None, metavar="FILE",
+                          help="Plain runs, keeping each season's points and trait-weighted draws in FILE for reprice")
+    parser.add_argument("--tilt", action="append", default=[], metavar="KEY=VALUE",
+                        help="With --importance: proposal probability (quit_probability, medevac_probability, "
+                             "probability_two_items) or idol_play_episodes=15,16 with idol_play_boost=N")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write prices.json to this directory")
+    add_profile_arguments(parser)
+
+
+def add_pricing_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--price-runs", type=int, default=2000, help="Runs for price estimation")
+    parser.add_argument("--scenario-runs", type=int, default=300, help="Scenario runs for scoring")
+    parser.add_argument("--rosters", type=int, default=25, help="Rosters per strategy (strategy mode only)")
+    parser.add_argument("--sample-rosters", type=int, default=None, help="Sample N rosters from all valid options (enables sample mode)")
+    parser.add_argument("--indexed-rosters", action="store_true", help="Batched strategy roster generator (for large --rosters)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", "-o", type=str, default=None)
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint in the output directory")
+    parser.add_argument("--checkpoint-every", type=int, default=25, help="Checkpoint every N scenarios (0 = off)")
+    add_profile_arguments(parser)
+
+
+def add_full_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scenarios", type=int, default=50, help="Number of simulated seasons")
+    parser.add_argument("--rosters", type=int, default=5, help="Rosters per strategy")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--conditional-runs", type=int, default=0,
+                        help="Pick replacements by rest-of-season expected points from N continuations (0 = preseason)")
+    parser.add_argument("--antithetic", action="store_true",
+                        help="Run scenarios as antithetic pairs (mirrored boot order and challenge placements)")
+    parser.add_argument("--stratified", action="store_true",
+                        help="Spread scenarios evenly over the four swap/merge structures")
+    parser.add_argument("--output", "-o", type=str, default=None)
+    add_profile_arguments(parser)
+
+
+def add_dynamic_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scenarios", type=int, default=50, help="Number of simulated seasons")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", "-o", type=str, default=None)
+    add_profile_arguments(parser)
+
+
+def add_trace_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for scenario")
+    parser.add_argument("--teams", type=int, default=3, help="Number of sample teams")
+    parser.add_argument("--output", "-o", type=str, default=None)
+    add_profile_arguments(parser)
+
+
+def add_outlook_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--observed", type=str, default=None,
+                        help="Aired episode outcomes JSON (default: app/seed/episode_outcomes.json)")
+    parser.add_argument("--runs", type=int, default=500, help="Continuations of the observed season")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write rest_of_season.json to this directory")
+    add_profile_arguments(parser)
+
+
+def add_reprice_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--bank", type=str, required=True, help="Price bank written by price --save-bank")
+    parser.add_argument("--set", action="append", default=[], metavar="CID.TRAIT=VALUE",
+                        help="Trait override on top of contestants_s50.yaml (survival_bias or challenge_ability)")
+    parser.add_argument("--min-ess", type=float, default=None,
+                        help="Warn below this effective-sample-size share of the bank (default 0.2)")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write reprice.json to this directory")
+
+
+def add_boots_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--validate-runs", type=int, default=0,
+                        help="Also simulate N seasons and compare survival / final tribal / win points")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write boot_positions.json to this directory")
+
+
+def add_whatif_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=8, help="Request threads")
+    parser.add_argument("--observed", type=str, default=None,
+                        help="Aired episode outcomes JSON (default: app/seed/episode_outcomes.json)")
+    parser.add_argument("--prices", type=str, default=None, help="Starting prices JSON (default: app/seed/prices.json)")
+    parser.add_argument("--runs", type=int, default=200, help="Continuations for rest-of-season expected points")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cache-size", type=int, default=1024, help="Cached answers (LRU)")
+    parser.add_argument("--quiet", action="store_true", help="Don't log each request")
+
+
+def add_standings_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--entries", type=str, required=True, help="tribe_entries rows (CSV or JSON)")
+    parser.add_argument("--captains", type=str, default=None, help="captain_picks rows (CSV or JSON)")
+    parser.add_argument("--points", type=str, default=None,
+                        help="contestant_episode_points rows (default: score --outcomes)")
+    parser.add_argument("--outcomes", type=str, default=None,
+                        help="Episode outcomes JSON (default: app/seed/episode_outcomes.json)")
+    parser.add_argument("--current-episode", type=int, default=None, help="Score through this episode (default: last)")
+    parser.add_argument("--phase", type=str, default="pre_merge", help="tribe_entries phase to score, or 'all'")
+    parser.add_argument("--bps", action="store_true",
+                        help="Add the BPS episode rank bonus to points scored from --outcomes")
+    parser.add_argument("--top", type=int, default=10, help="Teams to print")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write standings.csv and episode_points.csv here")
+    add_profile_arguments(parser)
+
+
+def add_export_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--output", "-o", type=str, default=None, help="Seed directory (default: app/seed)")
+    parser.add_argument("--manifest", type=str, default=None,
+                        help="Row hash manifest of the last applied delta (default: <output>/seed_manifest.json)")
+    parser.add_argument("--delta", type=str, default=None,
+                        help="Upserts / deletes since the manifest (default: <output>/seed_delta.sql)")
+    parser.add_argument("--commit-manifest", action="store_true",
+                        help="Record the last export's delta as applied (promote the pending manifest) before diffing")
+
+
+def add_seasons_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--seasons", "-n", type=int, default=100, help="Simulated seasons to export")
+    parser.add_argument("--format", choices=("copy", "csv", "jsonl"), default="copy",
+                        help="COPY text, CSV with header, or JSON Lines")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--episode-stride", type=int, default=100, help="Episode id offset between seasons")
+    parser.add_argument("--buffer-rows", type=int, default=10000, help="Rows buffered per table between writes")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Output directory (default: output/seasons)")
+
+
+def add_population_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--managers", "-n", type=int, default=10000, help="Managers to generate")
+    parser.add_argument("--format", choices=("copy", "csv"), default="copy", help="COPY text or CSV with header")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--prices", type=str, default=None, help="Starting prices JSON (default: app/seed/prices.json)")
+    parser.add_argument("--price-runs", type=int, default=200, help="Runs for expected points")
+    parser.add_argument("--pool-size", type=int, default=2000, help="Rosters per strategy pool")
+    parser.add_argument("--mix", action="append", default=[], metavar="STRATEGY=WEIGHT",
+                        help="Strategy mixture (repeatable; 'sampled' = uniform valid roster)")
+    parser.add_argument("--replace-rate", type=float, default=0.8, help="Chance per episode of replacing a voted-out player")
+    parser.add_argument("--transfer-rate", type=float, default=0.05, help="Chance per episode of a voluntary transfer")
+    parser.add_argument("--league-share", type=float, default=0.7, help="Share of managers in a league")
+    parser.add_argument("--league-min", type=int, default=4)
+    parser.add_argument("--league-max", type=int, default=16)
+    parser.add_argument("--buffer-rows", type=int, default=10000, help="Rows buffered per table between writes")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Output directory (default: output/population)")
+
+
+def add_materialize_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--outcomes", type=str, default=None,
+                        help="Episode outcomes JSON (default: app/seed/episode_outcomes.json)")
+    parser.add_argument("--seasons", type=int, default=0, help="Simulate this many seasons instead of --outcomes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--episode-stride", type=int, default=100,
+                        help="Episode id offset between simulated seasons")
+    parser.add_argument("--mode", choices=("copy", "insert"), default="copy",
+                        help="One COPY block, or multi-row INSERT ... ON CONFLICT statements")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT statement (0 = one statement)")
+    parser.add_argument("--no-upsert", action="store_true", help="Plain COPY / INSERT without ON CONFLICT")
+    parser.add_argument("--output", "-o", type=str, default=None, help="SQL file (default: output/episode_points.sql)")
+
+
+def add_sweep_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=SPEC",
+                        help="Swept key: a,b,c (values), lo:hi (range, random search) or lo:hi:n (n values)")
+    parser.add_argument("--space", type=str, default=None, help="YAML/JSON file mapping keys to value lists or {min, max[, num]}")
+    parser.add_argument("--random", type=int, default=0, help="Random search with N points (default: full grid)")
+    parser.add_argument("--scenarios", type=int, default=50, help="Seasons in the shared scenario bank")
+    parser.add_argument("--price-runs", type=int, default=500, help="Runs for expected points")
+    parser.add_argument("--rosters", type=int, default=3, help="Rosters per strategy for strategy spreads")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=None, help="Parallel workers (default: CPU count)")
+    parser.add_argument("--sort", type=str, default="pct_with_3plus_viable", help="Metric to rank points by")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't write the per-config cache")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Output directory (default: output/simulation/sweep)")
+
+
+def add_validate_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--config-dir", type=str, default=None, help="Config directory (default: config/)")
+
+
+# command -> (module exposing run_from_args, argument adder, help)
+COMMANDS = {
+    "points": ("run_simulation", add_points_arguments, "Scoring balance simulation"),
+    "price": ("run_price", add_price_arguments, "Estimate expected points and map them to prices"),
+    "pricing": ("run_pricing_simulation", add_pricing_arguments, "Phase 1 pricing simulation"),
+    "full": ("run_full_simulation", add_full_arguments, "Full-stack simulation (dynamic prices, replacements, captains)"),
+    "dynamic": ("run_dynamic_pricing_simulation", add_dynamic_arguments, "Dynamic pricing / replacement diversity"),
+    "trace": ("run_episode_trace_simulation", add_trace_arguments, "Week-by-week trace of one season"),
+    "sweep": ("run_sweep", add_sweep_arguments, "Grid or random sweep over pricing / dynamic pricing keys"),
+    "outlook": ("run_outlook", add_outlook_arguments, "Rest-of-season expected points from the aired episodes"),
+    "reprice": ("run_reprice", add_reprice_arguments, "Re-price after trait edits by reweighting a saved price bank"),
+    "boots": ("run_boots", add_boots_arguments, "Exact boot-position matrix and the survival / final tribal / win points"),
+    "standings": ("run_standings", add_standings_arguments, "League standings for user teams"),
+    "serve": ("run_whatif_service", add_whatif_arguments, "Local what-if scoring and pricing service"),
+    "export": ("export_seed_data", add_export_arguments, "Export seed data for the app"),
+    "materialize": ("export_episode_points", add_materialize_arguments, "Bulk contestant_episode_points SQL"),
+    "seasons": ("export_seasons", add_seasons_arguments, "Multi-season seed data for staging databases"),
+    "population": ("export_population", add_population_arguments, "Synthetic manager population for app load tests"),
+    "validate": (None, add_validate_arguments, "Check config files load and are consistent"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m point_simulation",
+        description="Survivor Fantasy point simulation",
+    )
+    sub = parser.add_subparsers(dest="command", metavar="<command>")
+    for name, (_, add_arguments, help_text) in COMMANDS.items():
+        add_arguments(sub.add_parser(name, help=help_text, description=help_text))
+    sub.add_parser("bench", help="Benchmark suite (options: bench --help)", add_help=False)
+    return parser
+
+
+def _use_package_path() -> None:
+    """Make src/, benchmarks/ and the run_* modules importable as top-level modules."""
+    path = str(PACKAGE_DIR)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def _validate(config_dir: Optional[str] = None) -> List[str]:
+    _use_package_path()
+    from src.config import validate_config
+    return validate_config(Path(config_dir) if config_dir else None)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "bench":
+        # The benchmark runner owns its options (case names come from the suite itself)
+        _use_package_path()
+        from benchmarks.run_benchmarks import main as bench_main
+        return bench_main(argv[1:], prog="python -m point_simulation bench")
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+
+    errors = _validate(getattr(args, "config_dir", None))
+    if errors:
+        print("Config errors:", file=sys.stderr)
+        for error in errors:
+            print(f"  {error}", file=sys.stderr)
+        return 1
+    if args.command == "validate":
+        print("Config OK")
+        return 0
+
+    import importlib
+    module = importlib.import_module(COMMANDS[args.command][0])
+    module.run_from_args(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Bulk contestant_episode_points for a local Postgres: every (episode, contestant)
+row with total_points and the category breakdown JSON, scored by the Python engine,
+for the seed season or many simulated seasons, in one SQL script.
+
+    python export_episode_points.py -o /tmp/points.sql
+    python export_episode_points.py --seasons 200 --mode insert --batch-size 5000 -o /tmp/points.sql
+    psql "$DATABASE_URL" -f /tmp/points.sql
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_materialize_arguments
+from src.config import load_scoring, load_season_template, load_contestants, load_probabilities
+from src.materialize import write_episode_points
+from src.scenario_generator import generate_scenario
+
+SEED_DIR = Path(__file__).parent.parent.parent / "app" / "seed"
+
+
+def simulated_seasons(num_seasons: int, seed: int = 42):
+    """num_seasons generated seasons, season s seeded with seed + s*7777."""
+    contestants = load_contestants()
+    season_template = load_season_template()
+    probabilities = load_probabilities()
+    for s in range(num_seasons):
+        yield generate_scenario(contestants, season_template, seed=seed + s * 7777, probabilities=probabilities)
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Write the points script from parsed arguments (see cli.add_materialize_arguments)."""
+    output = Path(args.output) if args.output else Path(__file__).parent.parent / "output" / "episode_points.sql"
+    if args.seasons:
+        seasons = simulated_seasons(args.seasons, args.seed)
+        source = f"{args.seasons} simulated seasons (seed {args.seed})"
+    else:
+        outcomes_path = Path(args.outcomes) if args.outcomes else SEED_DIR / "episode_outcomes.json"
+        with open(outcomes_path) as f:
+            seasons = [json.load(f)]
+        source = str(outcomes_path)
+
+    def progress(done: int) -> None:
+        if done % 100 == 0:
+            print(f"  {done:,} seasons")
+
+    start = time.perf_counter()
+    result = write_episode_points(
+        seasons, load_scoring(), output,
+        mode=args.mode, batch_rows=args.batch_size, episode_stride=args.episode_stride,
+        upsert=not args.no_upsert, progress=progress,
+    )
+    print(f"{result['rows']:,} rows from {source} in {result['statements']:,} statements "
+          f"({time.perf_counter() - start:.1f}s) -> {output}")
+    print(f"Load with: psql -f {output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk contestant_episode_points SQL for a local Postgres")
+    add_materialize_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Synthetic manager population for load-testing the app's leaderboard, transfers
+and captain routes. Writes one bulk-load file per table (auth.users, profiles,
+leagues, league_members, tribe_entries, captain_picks) plus load.sql.
+
+    python export_population.py --managers 100000 -o /tmp/population
+    python export_population.py --managers 2000000 --format csv --mix sampled=1 --mix value=1
+    cd /tmp/population && psql "$DATABASE_URL" -f load.sql
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_population_arguments
+from src.config import (
+    CONFIG_DIR,
+    load_scoring,
+    load_season_template,
+    load_contestants,
+    load_pricing,
+    load_dynamic_pricing,
+    load_probabilities,
+)
+from src.population import PopulationModel, STRATEGY_MIX, export_population
+from src.price_generator import compute_expected_points_per_contestant
+from src.scenario_generator import generate_scenario
+
+SEED_DIR = Path(__file__).parent.parent.parent / "app" / "seed"
+
+
+def parse_mix(specs) -> dict:
+    """--mix strategy=weight options as a strategy mix (default: STRATEGY_MIX)."""
+    if not specs:
+        return dict(STRATEGY_MIX)
+    mix = {}
+    for spec in specs:
+        name, _, weight = spec.partition("=")
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def build_model(
+    prices_path: Path = None,
+    seed: int = 42,
+    price_runs: int = 200,
+    pool_size: int = 2000,
+    strategy_mix: dict = None,
+    replace_rate: float = 0.8,
+    transfer_rate: float = 0.05,
+) -> PopulationModel:
+    """Season, price path and roster pools for the population (seeded)."""
+    contestants = load_contestants()
+    scoring = load_scoring()
+    season_template = load_season_template()
+    with open(Path(prices_path) if prices_path else SEED_DIR / "prices.json") as f:
+        prices = json.load(f)
+    expected_points = compute_expected_points_per_contestant(
+        contestants, season_template, scoring, CONFIG_DIR, num_runs=price_runs, seed=seed
+    )
+    season = generate_scenario(contestants, season_template, seed=seed, probabilities=load_probabilities())
+    return PopulationModel(
+        contestants, prices, expected_points, season, scoring,
+        dict(load_pricing(), **load_dynamic_pricing()),
+        strategy_mix=strategy_mix, pool_size=pool_size,
+        replace_rate=replace_rate, transfer_rate=transfer_rate, seed=seed,
+    )
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Generate and write the population from parsed arguments (see cli.add_population_arguments)."""
+    output_dir = Path(args.output) if args.output else Path(__file__).parent.parent / "output" / "population"
+    start = time.perf_counter()
+    model = build_model(
+        prices_path=args.prices,
+        seed=args.seed,
+        price_runs=args.price_runs,
+        pool_size=args.pool_size,
+        strategy_mix=parse_mix(args.mix),
+        replace_rate=args.replace_rate,
+        transfer_rate=args.transfer_rate,
+    )
+    print(f"Season of {len(model.episode_ids)} episodes, roster pools for {len(model.strategies)} strategies "
+          f"({time.perf_counter() - start:.1f}s)")
+
+    def progress(done: int) -> None:
+        if done % 100000 == 0:
+            print(f"  {done:,} managers")
+
+    result = export_population(
+        model, args.managers, output_dir,
+        fmt=args.format, seed=args.seed, buffer_rows=args.buffer_rows,
+        league_share=args.league_share, league_size=(args.league_min, args.league_max),
+        progress=progress,
+    )
+    print(f"{args.managers:,} managers in {time.perf_counter() - start:.1f}s -> {output_dir}")
+    for table, count in result["rows"].items():
+        print(f"  {table:<16} {count:>12,} rows")
+    mix = ", ".join(f"{k} {v:,}" for k, v in sorted(result["strategies"].items(), key=lambda kv: -kv[1]))
+    print(f"  strategies: {mix}")
+    print(f"Load with: cd {output_dir} && psql -f load.sql")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic manager population for app load tests")
+    add_population_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Multi-season seed data for staging databases: contestants with starting prices,
+the scoring config, and for each of N simulated seasons every episode outcome and
+the per-episode price history, streamed to one COPY / CSV / JSON Lines file per
+table (plus load.sql for COPY and CSV).
+
+    python export_seasons.py --seasons 300 -o /tmp/seasons
+    python export_seasons.py --seasons 50 --format jsonl -o /tmp/seasons
+    cd /tmp/seasons && psql "$DATABASE_URL" -f load.sql
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_seasons_arguments
+from export_seed_data import photo_url, starting_prices
+from src.config import (
+    CONFIG_DIR,
+    load_scoring,
+    load_season_template,
+    load_contestants,
+    load_pricing,
+    load_dynamic_pricing,
+    load_probabilities,
+)
+from src.scenario_generator import generate_scenario
+from src.seed_stream import export_seasons
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Generate and write the seasons from parsed arguments (see cli.add_seasons_arguments)."""
+    output_dir = Path(args.output) if args.output else Path(__file__).parent.parent / "output" / "seasons"
+    contestants = load_contestants()
+    scoring = load_scoring()
+    season_template = load_season_template()
+    probabilities = load_probabilities()
+    prices = starting_prices(CONFIG_DIR, scoring, season_template, contestants)
+    seeds = [args.seed + s * 7777 for s in range(args.seasons)]
+    seasons = (
+        generate_scenario(contestants, season_template, seed=seed, probabilities=probabilities) for seed in seeds
+    )
+
+    def progress(done: int) -> None:
+        if done % 100 == 0:
+            print(f"  {done:,} seasons")
+
+    start = time.perf_counter()
+    result = export_seasons(
+        [dict(c, photo_url=photo_url(c)) for c in contestants], prices, seasons, scoring,
+        dict(load_pricing(), **load_dynamic_pricing()), output_dir,
+        fmt=args.format, buffer_rows=args.buffer_rows, episode_stride=args.episode_stride,
+        seeds=seeds, progress=progress,
+    )
+    print(f"{result['seasons']:,} seasons in {time.perf_counter() - start:.1f}s -> {output_dir}")
+    for table, count in result["rows"].items():
+        print(f"  {table:<26} {count:>12,} rows")
+    if args.format != "jsonl":
+        print(f"Load with: cd {output_dir} && psql -f load.sql")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-season seed data for staging databases")
+    add_seasons_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
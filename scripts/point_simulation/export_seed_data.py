@@ -2,63 +2,75 @@
 """
 Export seed data for Survivor Fantasy prototype.
 Outputs contestants, prices, episode_outcomes, and scoring_config to app/seed/.
+Files are only rewritten when their content changes, and seed_delta.sql holds
+just the rows that changed since the last applied delta (per seed_manifest.json;
+record a loaded delta with --commit-manifest).
 """
 
+import argparse
+import io
 import json
 import sys
 from pathlib import Path
 
-import yaml
-
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from cli import add_export_arguments
+from src.config import load_scoring, load_season_template, load_contestants, load_pricing
 from src.scenario_generator import generate_scenario
+from src.seed_diff import commit_manifest, pending_manifest_path, seed_delta, write_if_changed
+
+# Seed tables for the row-level delta: table -> (key column, columns), in foreign-key order
+SEED_TABLES = {
+    "contestants": ("id", ("id", "name", "starting_tribe", "pre_merge_price", "photo_url")),
+    "episode_outcomes": ("episode_id", ("episode_id", "phase", "outcome")),
+    "scoring_config": ("id", ("id", "config")),
+}
 
 
 def load_config(config_dir: Path) -> tuple:
     """Load scoring, season, contestant configs."""
-    with open(config_dir / "scoring.yaml") as f:
-        scoring = yaml.safe_load(f)
-    with open(config_dir / "season_template.yaml") as f:
-        season = yaml.safe_load(f)
-    with open(config_dir / "contestants_s50.yaml") as f:
-        contestants = yaml.safe_load(f)["contestants"]
-    return scoring, season["episodes"], contestants
-
+    return load_scoring(config_dir), load_season_template(config_dir), load_contestants(config_dir)
 
-def main():
-    config_dir = Path(__file__).parent / "config"
-    output_dir = Path(__file__).parent.parent.parent / "app" / "seed"
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    scoring, season_template, contestants = load_config(config_dir)
-
-    # Use precomputed prices from pricing_analysis.json if available
+def starting_prices(config_dir: Path, scoring: dict, season_template: list, contestants: list) -> dict:
+    """Precomputed prices from pricing_analysis.json if available, else Monte Carlo (slower)."""
     pricing_path = Path(__file__).parent.parent / "output" / "simulation" / "pricing_analysis.json"
     if pricing_path.exists():
         with open(pricing_path) as f:
             pricing_data = json.load(f)
-        prices = pricing_data["prices"]
         print(f"Using precomputed prices from {pricing_path}")
+        return pricing_data["prices"]
+    from src.price_generator import (
+        compute_expected_points_per_contestant,
+        expected_points_to_prices,
+    )
+    pricing_config = load_pricing(config_dir)
+    expected_points = compute_expected_points_per_contestant(
+        contestants, season_template, scoring, config_dir, num_runs=200, seed=42
+    )
+    print("Computed prices from Monte Carlo")
+    return expected_points_to_prices(expected_points, pricing_config)
+
+
+def photo_url(c: dict) -> str:
+    return c.get("photo_url") or f"https://api.dicebear.com/7.x/avataaars/png?seed={c['id']}&size=80"
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Export seed data from parsed arguments (see cli.add_export_arguments)."""
+    config_dir = Path(__file__).parent / "config"
+    if args.output:
+        output_dir = Path(args.output)
     else:
-        # Fallback: compute prices (slower)
-        from src.price_generator import (
-            compute_expected_points_per_contestant,
-            expected_points_to_prices,
-        )
-        with open(config_dir / "pricing.yaml") as f:
-            pricing_config = yaml.safe_load(f)
-        expected_points = compute_expected_points_per_contestant(
-            contestants, season_template, scoring, config_dir, num_runs=200, seed=42
-        )
-        prices = expected_points_to_prices(expected_points, pricing_config)
-        print("Computed prices from Monte Carlo")
+        output_dir = Path(__file__).parent.parent.parent / "app" / "seed"
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build contestants with prices
-    def photo_url(c):
-        return c.get("photo_url") or f"https://api.dicebear.com/7.x/avataaars/png?seed={c['id']}&size=80"
+    scoring, season_template, contestants = load_config(config_dir)
+    prices = starting_prices(config_dir, scoring, season_template, contestants)
 
+    # Build contestants with prices
     contestants_with_prices = []
     for c in contestants:
         contestants_with_prices.append({
@@ -82,50 +94,79 @@ def main():
     if not pre_merge_only:
         pre_merge_only = episode_outcomes[:6]
 
-    # Write outputs
-    with open(output_dir / "contestants.json", "w") as f:
-        json.dump(contestants_with_prices, f, indent=2)
-
-    with open(output_dir / "episode_outcomes.json", "w") as f:
-        json.dump(pre_merge_only, f, indent=2)
-
-    with open(output_dir / "prices.json", "w") as f:
-        json.dump(prices, f, indent=2)
-
-    with open(output_dir / "scoring_config.json", "w") as f:
-        json.dump(scoring, f, indent=2)
+    # Write outputs (files whose content is unchanged are left alone)
+    written = []
+    for name, data in (
+        ("contestants.json", contestants_with_prices),
+        ("episode_outcomes.json", pre_merge_only),
+        ("prices.json", prices),
+        ("scoring_config.json", scoring),
+    ):
+        if write_if_changed(output_dir / name, json.dumps(data, indent=2)):
+            written.append(name)
 
     # Also write seed SQL for Supabase migration (app/supabase/migrations)
     migrations_dir = output_dir.parent / "supabase" / "migrations"
     migrations_dir.mkdir(parents=True, exist_ok=True)
     seed_sql_path = migrations_dir / "00002_seed_data.sql"
 
-    with open(seed_sql_path, "w") as f:
-        f.write("-- Seed data for Survivor Fantasy prototype\n\n")
-        # Contestants
-        f.write("INSERT INTO contestants (id, name, starting_tribe, pre_merge_price, photo_url) VALUES\n")
-        rows = [
-            f"  ('{c['id']}', '{c['name'].replace(chr(39), chr(39)+chr(39))}', '{c['starting_tribe']}', {c['pre_merge_price']}, '{c.get('photo_url', '').replace(chr(39), chr(39)+chr(39))}')"
+    f = io.StringIO()
+    f.write("-- Seed data for Survivor Fantasy prototype\n\n")
+    # Contestants
+    f.write("INSERT INTO contestants (id, name, starting_tribe, pre_merge_price, photo_url) VALUES\n")
+    rows = [
+        f"  ('{c['id']}', '{c['name'].replace(chr(39), chr(39)+chr(39))}', '{c['starting_tribe']}', {c['pre_merge_price']}, '{c.get('photo_url', '').replace(chr(39), chr(39)+chr(39))}')"
+        for c in contestants_with_prices
+    ]
+    f.write(",\n".join(rows) + "\nON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name, starting_tribe = EXCLUDED.starting_tribe, pre_merge_price = EXCLUDED.pre_merge_price, photo_url = EXCLUDED.photo_url;\n\n")
+    # Episode outcomes
+    f.write("INSERT INTO episode_outcomes (episode_id, phase, outcome) VALUES\n")
+    ep_rows = []
+    for ep in pre_merge_only:
+        outcome_json = json.dumps(ep).replace("'", "''")
+        ep_rows.append(f"  ({ep['episode_id']}, '{ep['phase']}', '{outcome_json}'::jsonb)")
+    f.write(",\n".join(ep_rows) + "\nON CONFLICT (episode_id) DO UPDATE SET phase = EXCLUDED.phase, outcome = EXCLUDED.outcome;\n\n")
+    # Scoring config
+    scoring_json = json.dumps(scoring).replace("'", "''")
+    f.write(f"INSERT INTO scoring_config (id, config) VALUES ('default', '{scoring_json}'::jsonb)\n")
+    f.write("ON CONFLICT (id) DO UPDATE SET config = EXCLUDED.config;\n")
+    if write_if_changed(seed_sql_path, f.getvalue()):
+        written.append(seed_sql_path.name)
+
+    # Row-level delta against the manifest of the last applied delta
+    seed_rows = {
+        "contestants": {
+            c["id"]: (c["id"], c["name"], c["starting_tribe"], c["pre_merge_price"], c.get("photo_url"))
             for c in contestants_with_prices
-        ]
-        f.write(",\n".join(rows) + "\nON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name, starting_tribe = EXCLUDED.starting_tribe, pre_merge_price = EXCLUDED.pre_merge_price, photo_url = EXCLUDED.photo_url;\n\n")
-        # Episode outcomes
-        f.write("INSERT INTO episode_outcomes (episode_id, phase, outcome) VALUES\n")
-        ep_rows = []
-        for ep in pre_merge_only:
-            outcome_json = json.dumps(ep).replace("'", "''")
-            ep_rows.append(f"  ({ep['episode_id']}, '{ep['phase']}', '{outcome_json}'::jsonb)")
-        f.write(",\n".join(ep_rows) + "\nON CONFLICT (episode_id) DO UPDATE SET phase = EXCLUDED.phase, outcome = EXCLUDED.outcome;\n\n")
-        # Scoring config
-        scoring_json = json.dumps(scoring).replace("'", "''")
-        f.write(f"INSERT INTO scoring_config (id, config) VALUES ('default', '{scoring_json}'::jsonb)\n")
-        f.write("ON CONFLICT (id) DO UPDATE SET config = EXCLUDED.config;\n")
+        },
+        "episode_outcomes": {str(ep["episode_id"]): (ep["episode_id"], ep["phase"], ep) for ep in pre_merge_only},
+        "scoring_config": {"default": ("default", scoring)},
+    }
+    manifest_path = Path(args.manifest) if args.manifest else output_dir / "seed_manifest.json"
+    delta_path = Path(args.delta) if args.delta else output_dir / "seed_delta.sql"
+    committed = args.commit_manifest and commit_manifest(manifest_path)
+    delta = seed_delta(SEED_TABLES, seed_rows, manifest_path, delta_path)
 
     print(f"Exported to {output_dir}:")
     print(f"  - contestants.json ({len(contestants_with_prices)} contestants)")
     print(f"  - episode_outcomes.json ({len(pre_merge_only)} episodes)")
     print(f"  - prices.json")
     print(f"  - scoring_config.json")
+    print(f"  Rewritten: {', '.join(written) if written else 'nothing (unchanged)'}")
+    if committed:
+        print(f"  Manifest: previous delta recorded as applied -> {manifest_path}")
+    elif args.commit_manifest:
+        print("  Manifest: nothing pending to commit")
+    print(f"  Delta: {delta['upserts']} upserts, {delta['deletes']} deletes -> {delta_path}")
+    if delta["upserts"] or delta["deletes"]:
+        print(f"    after loading it, run export --commit-manifest (until then deltas stay cumulative "
+              f"against {manifest_path.name}; pending: {pending_manifest_path(manifest_path).name})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export seed data for the Survivor Fantasy prototype")
+    add_export_arguments(parser)
+    run_from_args(parser.parse_args(argv))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Exact boot-position matrix and the survival / final tribal / win / quit points it
+decides, optionally checked against simulated seasons.
+
+    python run_boots.py --validate-runs 2000 -o /tmp/boots
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_boots_arguments
+from src.boot_positions import POINT_KEYS, boot_position_matrix, expected_boot_points, simulated_boot_points
+from src.config import CONFIG_DIR, load_contestants, load_probabilities, load_scoring, load_season_template
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Boot-position probabilities and expected points computed exactly, optionally checked by simulation."""
+    contestants = load_contestants()
+    scoring = load_scoring()
+    probabilities = load_probabilities(CONFIG_DIR)
+    matrix = boot_position_matrix(contestants)
+    expected = expected_boot_points(contestants, scoring, probabilities, matrix=matrix)
+    simulated = (
+        simulated_boot_points(contestants, load_season_template(), scoring, probabilities, args.validate_runs, args.seed)
+        if args.validate_runs > 0 else {}
+    )
+
+    names = {c["id"]: c.get("name", c["id"]) for c in contestants}
+    finalist = scoring["placement"]["final_tribal"]
+    width = max(map(len, names.values()), default=0)
+    print(f"  {'':<{width}} {'1st boot':>8} {'final 3':>8} {'survival':>9} {'final':>7} {'win':>7} {'total':>7}")
+    for cid in sorted(expected, key=lambda c: (-expected[c]["total"], c)):
+        e = expected[cid]
+        line = (f"  {names[cid]:<{width}} {matrix[cid][0]:8.1%} {e['final_tribal'] / finalist:8.1%} "
+                f"{e['survival']:9.2f} {e['final_tribal']:7.2f} {e['win_season']:7.2f} {e['total']:7.2f}")
+        if cid in simulated:
+            mean, se = simulated[cid]["total"]
+            line += f"   simulated {mean:6.2f} ± {se:.2f} (z {(mean - e['total']) / se if se else 0.0:+.1f})"
+        print(line)
+    if simulated:
+        z = [
+            (simulated[cid]["total"][0] - expected[cid]["total"]) / simulated[cid]["total"][1]
+            for cid in expected if simulated[cid]["total"][1]
+        ]
+        print(f"{args.validate_runs} simulated seasons: rms z {(sum(v * v for v in z) / len(z)) ** 0.5:.2f} "
+              f"over {len(z)} contestants (about 1 if the exact values are right)")
+    if args.output:
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        payload = {"point_keys": list(POINT_KEYS), "boot_position": matrix, "expected_points": expected}
+        if simulated:
+            payload["simulated"] = {"runs": args.validate_runs, "seed": args.seed, "points": simulated}
+        with open(output_dir / "boot_positions.json", "w") as f:
+            json.dump(payload, f, indent=2)
+        print(f"Boot positions saved to {output_dir / 'boot_positions.json'}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exact boot-position matrix and the survival / final tribal / win points")
+    add_boots_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,38 +7,41 @@ have multiple viable options (no single obvious pick).
 
 import sys
 import json
+import argparse
 from pathlib import Path
-from collections import defaultdict
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-import yaml
-
-from src.point_calculator import calculate_roster_points
+from cli import add_dynamic_arguments
+from src.config import (
+    load_scoring,
+    load_season_template,
+    load_contestants,
+    load_pricing,
+    load_dynamic_pricing,
+)
 from src.scenario_generator import generate_scenario
 from src.price_generator import (
     compute_expected_points_per_contestant,
     expected_points_to_prices,
 )
-from src.roster_enumerator import sample_valid_rosters, count_valid_rosters, count_tribe_valid_combos
-from src.dynamic_pricing import update_prices_from_episode, count_viable_replacements
+from src.dynamic_pricing import (
+    simulate_replacement_events,
+    summarize_replacement_events,
+    summarize_replacement_landscape,
+    landscape_budget_tiers,
+)
+from src.profiling import Profiler, NULL_PROFILER
 
 
 def load_config(config_dir: Path) -> tuple:
-    with open(config_dir / "scoring.yaml") as f:
-        scoring = yaml.safe_load(f)
-    with open(config_dir / "season_template.yaml") as f:
-        season = yaml.safe_load(f)
-    with open(config_dir / "contestants_s50.yaml") as f:
-        contestants = yaml.safe_load(f)["contestants"]
-    with open(config_dir / "pricing.yaml") as f:
-        pricing = yaml.safe_load(f)
-    dynamic_path = config_dir / "dynamic_pricing.yaml"
-    dynamic = {}
-    if dynamic_path.exists():
-        with open(dynamic_path) as f:
-            dynamic = yaml.safe_load(f) or {}
-    return scoring, season["episodes"], contestants, pricing, dynamic
+    return (
+        load_scoring(config_dir),
+        load_season_template(config_dir),
+        load_contestants(config_dir),
+        load_pricing(config_dir),
+        load_dynamic_pricing(config_dir),
+    )
 
 
 def run_dynamic_pricing_simulation(
@@ -46,20 +49,23 @@ def run_dynamic_pricing_simulation(
     rosters_per_scenario: int = 100,
     seed: int = 42,
     output_dir: Path = None,
+    profiler: Profiler = None,
 ) -> dict:
+    prof = profiler or NULL_PROFILER
     config_dir = Path(__file__).parent / "config"
     scoring, season_template, contestants, pricing_config, dynamic_config = load_config(config_dir)
-    budget = pricing_config.get("budget", 1_000_000)
-    tribe_map = {c["id"]: c["starting_tribe"] for c in contestants}
 
     print("Step 1: Computing initial expected points and prices...")
-    expected_points = compute_expected_points_per_contestant(
-        contestants, season_template, scoring, config_dir, num_runs=500, seed=seed
-    )
+    with prof.stage("price_estimation"):
+        expected_points = compute_expected_points_per_contestant(
+            contestants, season_template, scoring, config_dir, num_runs=500, seed=seed, profiler=prof
+        )
     prices = expected_points_to_prices(expected_points, pricing_config)
 
     # Merge dynamic config into pricing for update_prices_from_episode
     update_config = dict(pricing_config, **dynamic_config)
+    # Freed budgets tabulated for every vote-off (replacement landscape)
+    landscape_budgets = landscape_budget_tiers(pricing_config)
 
     print("Step 2: Running dynamic pricing scenarios...")
     scenario_results = []
@@ -67,77 +73,17 @@ def run_dynamic_pricing_simulation(
 
     for s in range(num_scenarios):
         scenario_seed = seed + s * 7777
-        episode_outcomes = generate_scenario(
-            contestants, season_template, seed=scenario_seed, config_dir=config_dir
-        )
-
-        # Track prices through episodes
-        current_prices = dict(prices)
-        price_history = [dict(current_prices)]
-
-        for ep_idx, ep in enumerate(episode_outcomes):
-            if ep.get("final_tribal"):
-                break
-
-            voted_out = ep.get("voted_out")
-            if not voted_out:
-                continue
-
-            # Budget freed = what the team had tied up in that player (pre-update price)
-            budget_freed = current_prices.get(voted_out, 100000)
-
-            # Update prices based on this episode (tribal_episode_count = ep_idx + 1)
-            current_prices = update_prices_from_episode(
-                current_prices, ep, scoring, update_config,
-                episode_index=ep_idx,
-                tribal_episode_count=ep_idx + 1,
-            )
-            price_history.append(dict(current_prices))
-
-            # Replacement scenario: teams with voted_out need to replace
-            # Replacement pool = everyone still in the game (active_contestants)
-            remaining = list(ep.get("active_contestants", []))
-            if not remaining:
-                continue
-
-            # Expected points for remaining (use initial - in practice would update)
-            ep_remaining = {c: expected_points.get(c, 0) for c in remaining}
-
-            viable = count_viable_replacements(
-                remaining,
-                current_prices,
-                ep_remaining,
-                budget_freed,
-                config=update_config,
+        with prof.stage("generate_scenario"):
+            episode_outcomes = generate_scenario(
+                contestants, season_template, seed=scenario_seed, config_dir=config_dir
             )
+        prof.count("scenarios")
 
-            replacement_stats.append({
-                "scenario": s,
-                "episode": ep_idx + 1,
-                "voted_out": voted_out,
-                "viable_count": viable["count"],
-                "best_value": viable["best_value"],
-                "affordable_count": viable.get("affordable_count", viable.get("all_options", 0)),
-                "viable_ids": [x[0] for x in viable["viable"]],
-            })
-
-            # Merge validation: when 10-12 players left, compute valid combo %
-            if len(remaining) in (10, 11, 12):
-                remaining_contestants = [c for c in contestants if c["id"] in remaining]
-                if len(remaining_contestants) >= 7:
-                    merge_budget = dynamic_config.get("merge_budget", budget)
-                    valid_counts = count_valid_rosters(
-                        remaining_contestants, current_prices, merge_budget,
-                        roster_min=7, roster_max=7,
-                    )
-                    total_tribe_valid = count_tribe_valid_combos(
-                        remaining_contestants, roster_min=7, roster_max=7,
-                    )
-                    merge_valid = valid_counts["total"]
-                    merge_pct = 100 * merge_valid / total_tribe_valid if total_tribe_valid > 0 else 0
-                    replacement_stats[-1]["merge_valid_pct"] = merge_pct
-                    replacement_stats[-1]["merge_valid_count"] = merge_valid
-                    replacement_stats[-1]["merge_total_tribe_valid"] = total_tribe_valid
+        events, price_history = simulate_replacement_events(
+            episode_outcomes, prices, expected_points, contestants, scoring, update_config,
+            scenario_index=s, profiler=prof, landscape_budgets=landscape_budgets,
+        )
+        replacement_stats.extend(events)
 
         scenario_results.append({
             "scenario_id": s,
@@ -145,15 +91,8 @@ def run_dynamic_pricing_simulation(
             "price_history": price_history,
         })
 
-    # Aggregate stats
-    viable_counts = [r["viable_count"] for r in replacement_stats]
-    avg_viable = sum(viable_counts) / len(viable_counts) if viable_counts else 0
-    min_viable = min(viable_counts) if viable_counts else 0
-    pct_with_3plus = 100 * sum(1 for v in viable_counts if v >= 3) / len(viable_counts) if viable_counts else 0
-
-    # Merge validation stats (10-12 players left)
-    merge_events = [r for r in replacement_stats if "merge_valid_pct" in r]
-    avg_merge_valid_pct = sum(r["merge_valid_pct"] for r in merge_events) / len(merge_events) if merge_events else 0
+    summary = summarize_replacement_events(replacement_stats)
+    landscape = summarize_replacement_landscape(replacement_stats, landscape_budgets)
 
     # Price evolution sample: first scenario, first 5 vote-offs
     price_evolution = []
@@ -170,14 +109,11 @@ def run_dynamic_pricing_simulation(
 
     analysis = {
         "num_scenarios": num_scenarios,
-        "replacement_events": len(replacement_stats),
-        "avg_viable_replacements": avg_viable,
-        "min_viable_replacements": min_viable,
-        "pct_with_3plus_viable": pct_with_3plus,
-        "merge_events": len(merge_events),
-        "avg_merge_valid_pct": avg_merge_valid_pct,
+        **summary,
         "merge_valid_pct_target": target_merge_valid,
         "replacement_stats": replacement_stats[:50],
+        "landscape_budgets": landscape_budgets,
+        "replacement_landscape": landscape,
         "price_evolution": price_evolution,
         "dynamic_config": dynamic_config,
         "initial_prices": prices,
@@ -185,7 +121,8 @@ def run_dynamic_pricing_simulation(
     }
 
     # Generate report
-    report = generate_dynamic_pricing_report(analysis, contestants)
+    with prof.stage("report"):
+        report = generate_dynamic_pricing_report(analysis, contestants)
 
     if output_dir:
         output_dir = Path(output_dir)
@@ -203,6 +140,8 @@ def run_dynamic_pricing_simulation(
                 "avg_merge_valid_pct": analysis["avg_merge_valid_pct"],
                 "merge_valid_pct_target": analysis["merge_valid_pct_target"],
                 "dynamic_config": analysis["dynamic_config"],
+                "landscape_budgets": analysis["landscape_budgets"],
+                "replacement_landscape": analysis["replacement_landscape"],
                 "replacement_stats_sample": analysis["replacement_stats"],
             }, f, indent=2)
         print(f"\nReport saved to {output_dir / 'DYNAMIC_PRICING_REPORT.md'}")
@@ -266,6 +205,27 @@ def generate_dynamic_pricing_report(analysis: dict, contestants: list) -> str:
         "",
         "---",
         "",
+    ]
+
+    budgets = analysis.get("landscape_budgets", [])
+    if analysis.get("replacement_landscape"):
+        lines.extend([
+            "## Replacement Landscape",
+            "",
+            "Avg viable options by episode had each budget been freed (same prices and remaining "
+            "players as the actual vote-off); in brackets, % of vote-offs with none viable.",
+            "",
+            "| Episode | Vote-offs | " + " | ".join(f"${b:,}" for b in budgets) + " |",
+            "|---------|-----------|" + "------|" * len(budgets),
+        ])
+        for row in analysis["replacement_landscape"]:
+            cells = " | ".join(
+                f"{avg:.1f} ({none:.0f}%)" for avg, none in zip(row["avg_viable"], row["pct_none_viable"])
+            )
+            lines.append(f"| {row['episode']} | {row['events']} | {cells} |")
+        lines.extend(["", "---", ""])
+
+    lines.extend([
         "## Merge Budget Pressure (10-12 Players Left)",
         "",
         "When the season reaches merge (10-12 players remaining), prices reflect demand-based movement. "
@@ -281,7 +241,7 @@ def generate_dynamic_pricing_report(analysis: dict, contestants: list) -> str:
         "",
         "## Example Replacement Scenarios",
         "",
-    ]
+    ])
 
     for i, r in enumerate(analysis.get("replacement_stats", [])[:10]):
         lines.append(f"### Event {i+1}: {r.get('voted_out', '?')} voted off (Episode {r.get('episode', '?')})")
@@ -340,16 +300,22 @@ def generate_dynamic_pricing_report(analysis: dict, contestants: list) -> str:
     return "\n".join(lines)
 
 
-def main():
-    base = Path(__file__).parent.parent.parent
-    output_dir = base / "output" / "simulation"
+def run_from_args(args: argparse.Namespace) -> None:
+    """Run and summarize from parsed arguments (see cli.add_dynamic_arguments)."""
+    profiler = Profiler(enabled=args.profile, cprofile=args.cprofile)
+
+    output_dir = args.output
+    if output_dir is None:
+        base = Path(__file__).parent.parent.parent
+        output_dir = base / "output" / "simulation"
 
     print("Running Dynamic Pricing Simulation...")
     analysis = run_dynamic_pricing_simulation(
-        num_scenarios=50,
+        num_scenarios=args.scenarios,
         rosters_per_scenario=100,
-        seed=42,
+        seed=args.seed,
         output_dir=output_dir,
+        profiler=profiler,
     )
 
     print("\n" + "=" * 50)
@@ -360,6 +326,16 @@ def main():
     print(f"% with 3+ viable: {analysis['pct_with_3plus_viable']:.1f}%")
     print(f"Merge events (10-12 players): {analysis['merge_events']}")
     print(f"Avg merge valid %: {analysis['avg_merge_valid_pct']:.1f}% (target: {analysis['merge_valid_pct_target']:.0f}%)")
+    profiler.print_summary()
+    timings_path = profiler.write(output_dir, "dynamic")
+    if timings_path:
+        print(f"Timings saved to {timings_path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dynamic pricing simulation (price updates, replacement diversity)")
+    add_dynamic_arguments(parser)
+    run_from_args(parser.parse_args(argv))
 
 
 if __name__ == "__main__":
@@ -9,13 +9,20 @@ Runs a single scenario with full episode-by-episode trace. Shows:
 """
 
 import sys
+import argparse
 from pathlib import Path
 from collections import defaultdict
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-import yaml
-
+from cli import add_trace_arguments
+from src.config import (
+    load_scoring,
+    load_season_template,
+    load_contestants,
+    load_pricing,
+    load_dynamic_pricing,
+)
 from src.point_calculator import calculate_roster_points
 from src.scenario_generator import generate_scenario
 from src.price_generator import (
@@ -28,26 +35,20 @@ from src.dynamic_pricing import (
     count_viable_replacements,
     calculate_contestant_episode_points,
 )
+from src.profiling import Profiler, NULL_PROFILER
 
 
 CAPTAIN_MULTIPLIER = 2.0
 
 
 def load_config(config_dir: Path) -> tuple:
-    with open(config_dir / "scoring.yaml") as f:
-        scoring = yaml.safe_load(f)
-    with open(config_dir / "season_template.yaml") as f:
-        season = yaml.safe_load(f)
-    with open(config_dir / "contestants_s50.yaml") as f:
-        contestants = yaml.safe_load(f)["contestants"]
-    with open(config_dir / "pricing.yaml") as f:
-        pricing = yaml.safe_load(f)
-    dynamic_path = config_dir / "dynamic_pricing.yaml"
-    dynamic = {}
-    if dynamic_path.exists():
-        with open(dynamic_path) as f:
-            dynamic = yaml.safe_load(f) or {}
-    return scoring, season["episodes"], contestants, pricing, dynamic
+    return (
+        load_scoring(config_dir),
+        load_season_template(config_dir),
+        load_contestants(config_dir),
+        load_pricing(config_dir),
+        load_dynamic_pricing(config_dir),
+    )
 
 
 def pick_captain(roster: list, expected_points: dict, ep_outcome: dict) -> str | None:
@@ -81,7 +82,9 @@ def run_episode_trace(
     scenario_seed: int = 42,
     num_teams: int = 3,
     output_dir: Path = None,
+    profiler: Profiler = None,
 ) -> dict:
+    prof = profiler or NULL_PROFILER
     config_dir = Path(__file__).parent / "config"
     scoring, season_template, contestants, pricing_config, dynamic_config = load_config(config_dir)
     budget = pricing_config.get("budget", 1_000_000)
@@ -92,9 +95,10 @@ def run_episode_trace(
     id_to_name = {c["id"]: c.get("name", c["id"]) for c in contestants}
 
     print("Computing expected points and prices...")
-    expected_points = compute_expected_points_per_contestant(
-        contestants, season_template, scoring, config_dir, num_runs=500, seed=scenario_seed
-    )
+    with prof.stage("price_estimation"):
+        expected_points = compute_expected_points_per_contestant(
+            contestants, season_template, scoring, config_dir, num_runs=500, seed=scenario_seed, profiler=prof
+        )
     prices = expected_points_to_prices(expected_points, pricing_config)
 
     # Calibrate for target valid % (same as full sim)
@@ -116,11 +120,12 @@ def run_episode_trace(
             }
 
     print("Generating rosters...")
-    all_rosters = generate_budget_rosters_for_simulation(
-        contestants, prices, budget, expected_points,
-        num_per_strategy=5, seed=scenario_seed,
-        roster_min=7, roster_max=7,
-    )
+    with prof.stage("roster_generation"):
+        all_rosters = generate_budget_rosters_for_simulation(
+            contestants, prices, budget, expected_points,
+            num_per_strategy=5, seed=scenario_seed,
+            roster_min=7, roster_max=7,
+        )
 
     # Pick sample teams: one value, one mid_tier, one random (first of each)
     strategies_wanted = ["value", "mid_tier", "random"]
@@ -137,9 +142,11 @@ def run_episode_trace(
         sample_rosters = all_rosters[:num_teams]
 
     print("Generating scenario...")
-    episode_outcomes = generate_scenario(
-        contestants, season_template, seed=scenario_seed, config_dir=config_dir
-    )
+    with prof.stage("generate_scenario"):
+        episode_outcomes = generate_scenario(
+            contestants, season_template, seed=scenario_seed, config_dir=config_dir
+        )
+    prof.count("scenarios")
 
     # Build price history and episode trace
     scenario_prices = dict(prices)
@@ -168,10 +175,12 @@ def run_episode_trace(
 
         # Update prices if tribal
         if voted_out:
-            scenario_prices = update_prices_from_episode(
-                scenario_prices, ep, scoring, update_config,
-                episode_index=ep_idx, tribal_episode_count=ep_idx + 1,
-            )
+            with prof.stage("update_prices"):
+                scenario_prices = update_prices_from_episode(
+                    scenario_prices, ep, scoring, update_config,
+                    episode_index=ep_idx, tribal_episode_count=ep_idx + 1,
+                )
+            prof.count("price_updates")
             price_history.append(dict(scenario_prices))
             prices_after = dict(scenario_prices)
         else:
@@ -205,9 +214,10 @@ def run_episode_trace(
                     budget_freed = price_history[ph_idx].get(voted_out, 100000)
                     remaining = list(ep.get("active_contestants", []))
                     ep_remaining = {c: expected_points.get(c, 0) for c in remaining}
-                    viable = count_viable_replacements(
-                        remaining, prices_at_ep, ep_remaining, budget_freed, config=update_config
-                    )
+                    with prof.stage("replacement_checks"):
+                        viable = count_viable_replacements(
+                            remaining, prices_at_ep, ep_remaining, budget_freed, config=update_config
+                        )
                     if viable["count"] > 0 and viable["viable"]:
                         best = viable["viable"][0]
                         new_player = best[0]
@@ -361,18 +371,19 @@ def generate_trace_report(trace_data: dict) -> str:
     return "\n".join(lines)
 
 
-def main():
-    import argparse
-    parser = argparse.ArgumentParser(description="Run episode trace simulation (week-by-week view)")
-    parser.add_argument("--seed", type=int, default=42, help="Random seed for scenario")
-    parser.add_argument("--teams", type=int, default=3, help="Number of sample teams")
-    args = parser.parse_args()
+def run_from_args(args: argparse.Namespace) -> None:
+    """Run and write the trace report from parsed arguments (see cli.add_trace_arguments)."""
+    profiler = Profiler(enabled=args.profile, cprofile=args.cprofile)
 
-    output_dir = Path(__file__).parent.parent.parent / "output" / "simulation"
+    if args.output:
+        output_dir = Path(args.output)
+    else:
+        output_dir = Path(__file__).parent.parent.parent / "output" / "simulation"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    trace_data = run_episode_trace(scenario_seed=args.seed, num_teams=args.teams)
-    report = generate_trace_report(trace_data)
+    trace_data = run_episode_trace(scenario_seed=args.seed, num_teams=args.teams, profiler=profiler)
+    with profiler.stage("report"):
+        report = generate_trace_report(trace_data)
 
     out_path = output_dir / "EPISODE_TRACE_REPORT.md"
     with open(out_path, "w") as f:
@@ -425,6 +436,16 @@ def main():
     with open(json_path, "w") as f:
         json.dump(json_data, f, indent=2)
     print(f"Data saved to {json_path}")
+    profiler.print_summary()
+    timings_path = profiler.write(output_dir, "trace")
+    if timings_path:
+        print(f"Timings saved to {timings_path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run episode trace simulation (week-by-week view)")
+    add_trace_arguments(parser)
+    run_from_args(parser.parse_args(argv))
 
 
 if __name__ == "__main__":
@@ -5,49 +5,60 @@ Runs episode-by-episode with dynamic pricing, replacement logic, and captain sel
 Produces comprehensive report on point breakdowns, emerging strategies, and system behavior.
 
 Transfer mechanics: Sell = no penalty; Add = configurable penalty (default -10) per add.
+
+Every roster and play style in a scenario plays the same season and price history
+(common random numbers), so strategy and style gaps are reported as paired
+differences with their variance reduction factor and effective sample size.
+--antithetic runs scenarios as antithetic pairs (mirrored boot order and
+challenge placements) on top of that; --stratified spreads them evenly over the
+four swap / merge structures.
 """
 
 import sys
 import json
+import argparse
 from pathlib import Path
 from collections import defaultdict
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-import yaml
-
+from cli import add_full_arguments
+from src.config import (
+    load_scoring,
+    load_season_template,
+    load_contestants,
+    load_pricing,
+    load_dynamic_pricing,
+)
 from src.point_calculator import calculate_roster_points
 from src.scenario_generator import generate_scenario
 from src.price_generator import (
     compute_expected_points_per_contestant,
     expected_points_to_prices,
 )
-from src.roster_generator import generate_budget_rosters_for_simulation
+from src.roster_generator import generate_budget_rosters_for_simulation, dedupe_rosters
 from src.dynamic_pricing import (
     update_prices_from_episode,
-    count_viable_replacements,
     calculate_contestant_episode_points,
 )
+from src.replacement_index import ReplacementIndex
+from src.conditional import rest_of_season_expected_points
+from src.profiling import Profiler, NULL_PROFILER
+from src.stratified import stratum_label, structure_for_unit
+from src.variance import paired_difference
 
 
 CAPTAIN_MULTIPLIER = 2.0
 
 
 def load_config(config_dir: Path) -> tuple:
-    with open(config_dir / "scoring.yaml") as f:
-        scoring = yaml.safe_load(f)
-    with open(config_dir / "season_template.yaml") as f:
-        season = yaml.safe_load(f)
-    with open(config_dir / "contestants_s50.yaml") as f:
-        contestants = yaml.safe_load(f)["contestants"]
-    with open(config_dir / "pricing.yaml") as f:
-        pricing = yaml.safe_load(f)
-    dynamic_path = config_dir / "dynamic_pricing.yaml"
-    dynamic = {}
-    if dynamic_path.exists():
-        with open(dynamic_path) as f:
-            dynamic = yaml.safe_load(f) or {}
-    return scoring, season["episodes"], contestants, pricing, dynamic
+    return (
+        load_scoring(config_dir),
+        load_season_template(config_dir),
+        load_contestants(config_dir),
+        load_pricing(config_dir),
+        load_dynamic_pricing(config_dir),
+    )
 
 
 def pick_captain(roster: list, expected_points: dict, ep_outcome: dict) -> str | None:
@@ -67,7 +78,27 @@ def run_full_simulation(
     rosters_per_strategy: int = 10,
     seed: int = 42,
     output_dir: Path = None,
+    profiler: Profiler = None,
+    conditional_runs: int = 0,
+    antithetic: bool = False,
+    stratified: bool = False,
 ) -> dict:
+    """
+    conditional_runs: when > 0, replacements are chosen by rest-of-season expected points
+    (that many continuations from the episodes aired so far) instead of preseason ones.
+    antithetic: scenarios 2k and 2k+1 are an antithetic pair from one seed (num_scenarios
+    is rounded up to even); paired statistics then use the pair mean as the unit.
+    stratified: unit i (scenario, or pair with antithetic) gets swap / merge structure
+    i mod 4, with num_scenarios rounded up to fill every structure equally; paired
+    statistics then use the stratified variance.
+    """
+    group = 2 if antithetic else 1
+    block = group * (4 if stratified else 1)
+    num_scenarios += -num_scenarios % block
+    scenario_strata = (
+        [stratum_label(structure_for_unit(s // group)) for s in range(num_scenarios)] if stratified else None
+    )
+    prof = profiler or NULL_PROFILER
     config_dir = Path(__file__).parent / "config"
     scoring, season_template, contestants, pricing_config, dynamic_config = load_config(config_dir)
     budget = pricing_config.get("budget", 1_000_000)
@@ -75,18 +106,21 @@ def run_full_simulation(
     add_player_penalty = scoring.get("other", {}).get("add_player_penalty", -10)
 
     print("Step 1: Computing expected points and prices...")
-    expected_points = compute_expected_points_per_contestant(
-        contestants, season_template, scoring, config_dir, num_runs=500, seed=seed
-    )
+    with prof.stage("price_estimation"):
+        expected_points = compute_expected_points_per_contestant(
+            contestants, season_template, scoring, config_dir, num_runs=500, seed=seed, profiler=prof
+        )
     prices = expected_points_to_prices(expected_points, pricing_config)
 
     # Calibrate for target valid %
-    from src.roster_enumerator import compute_combo_cost_percentiles, count_valid_rosters
+    from src.roster_enumerator import compute_combo_cost_percentiles, count_valid_rosters, combination_count
     target_valid = pricing_config.get("target_valid_pct")
     if target_valid and target_valid < 1:
-        percentiles = compute_combo_cost_percentiles(
-            contestants, prices, roster_min=7, roster_max=7, percentiles=[target_valid]
-        )
+        with prof.stage("roster_enumeration"):
+            percentiles = compute_combo_cost_percentiles(
+                contestants, prices, roster_min=7, roster_max=7, percentiles=[target_valid]
+            )
+        prof.count("enumerated_combos", combination_count(len(contestants), 7, 7))
         target_cost = percentiles.get(f"p{int(target_valid*100)}", budget)
         increment = pricing_config.get("price_increment", 2500)
         price_min = pricing_config.get("price_min", 100000)
@@ -107,11 +141,15 @@ def run_full_simulation(
             }
 
     print("Step 2: Generating rosters...")
-    rosters = generate_budget_rosters_for_simulation(
-        contestants, prices, budget, expected_points,
-        num_per_strategy=rosters_per_strategy, seed=seed,
-        roster_min=7, roster_max=7,
-    )
+    with prof.stage("roster_generation"):
+        rosters = generate_budget_rosters_for_simulation(
+            contestants, prices, budget, expected_points,
+            num_per_strategy=rosters_per_strategy, seed=seed,
+            roster_min=7, roster_max=7,
+        )
+
+    unique_rosters, rosters_by_strategy = dedupe_rosters(rosters, contestants)
+    print(f"  {len(rosters)} rosters, {len(unique_rosters)} distinct")
 
     # Play styles: (replace_when_viable,) — captaincy is REQUIRED for all
     play_styles = [
@@ -126,34 +164,49 @@ def run_full_simulation(
     replacement_count = 0
     replacement_penalty_agg = 0.0
     price_change_impact = []  # (ep_idx, price_delta_avg) per scenario
+    # (strategy, play_style) -> per-scenario [weighted total, weight], for paired comparisons
+    scenario_sums = defaultdict(lambda: [[0.0, 0] for _ in range(num_scenarios)])
 
     for s in range(num_scenarios):
-        scenario_seed = seed + s * 7777
-        episode_outcomes = generate_scenario(
-            contestants, season_template, seed=scenario_seed, config_dir=config_dir
-        )
+        scenario_seed = seed + (s // group) * 7777
+        with prof.stage("generate_scenario"):
+            episode_outcomes = generate_scenario(
+                contestants, season_template, seed=scenario_seed, config_dir=config_dir,
+                antithetic=bool(s % 2) if antithetic else None,
+                structure=structure_for_unit(s // group) if stratified else None,
+            )
+        prof.count("scenarios")
 
         # Build price history for this scenario (shared by all rosters)
         scenario_prices = dict(prices)
         price_history = [dict(scenario_prices)]
-        for ep_idx, ep in enumerate(episode_outcomes):
-            if ep.get("final_tribal"):
-                break
-            if ep.get("voted_out"):
-                scenario_prices = update_prices_from_episode(
-                    scenario_prices, ep, scoring, update_config,
-                    episode_index=ep_idx, tribal_episode_count=ep_idx + 1,
-                )
-                price_history.append(dict(scenario_prices))
-
-        for roster_data in rosters:
+        with prof.stage("update_prices"):
+            for ep_idx, ep in enumerate(episode_outcomes):
+                if ep.get("final_tribal"):
+                    break
+                if ep.get("voted_out"):
+                    scenario_prices = update_prices_from_episode(
+                        scenario_prices, ep, scoring, update_config,
+                        episode_index=ep_idx, tribal_episode_count=ep_idx + 1,
+                    )
+                    price_history.append(dict(scenario_prices))
+                    prof.count("price_updates")
+
+        # Replacement indexes by (episode, price-history step), shared by all rosters
+        replacement_indexes = {}
+        conditional_points = {}  # ep_idx -> rest-of-season expected points
+
+        # Play each distinct roster once; duplicates only add weight
+        scenario_rows = []
+        for roster_data in unique_rosters:
             roster = list(roster_data["roster"])
-            strategy = roster_data["strategy"]
+            rows = []
 
             for style_name, replace_when_viable in play_styles:
                 working_roster = list(roster)
                 captain_per_episode = []
                 total_replacement_penalty = 0
+                replacements = 0
                 ph_idx = 0
 
                 for ep_idx, ep in enumerate(episode_outcomes):
@@ -166,19 +219,33 @@ def run_full_simulation(
                         prices_at_ep = price_history[min(ph_idx + 1, len(price_history) - 1)]
                         budget_freed = price_history[ph_idx].get(voted_out, 100000)
                         remaining = list(ep.get("active_contestants", []))
-                        ep_remaining = {c: expected_points.get(c, 0) for c in remaining}
 
                         if replace_when_viable and remaining:
-                            viable = count_viable_replacements(
-                                remaining, prices_at_ep, ep_remaining, budget_freed, config=update_config
-                            )
+                            with prof.stage("replacement_checks"):
+                                index = replacement_indexes.get((ep_idx, ph_idx))
+                                if index is None:
+                                    ep_points = expected_points
+                                    if conditional_runs > 0:
+                                        if ep_idx not in conditional_points:
+                                            with prof.stage("conditional_expected_points"):
+                                                conditional_points[ep_idx] = rest_of_season_expected_points(
+                                                    episode_outcomes[:ep_idx + 1], contestants, season_template,
+                                                    scoring, config_dir=config_dir,
+                                                    num_runs=conditional_runs, seed=scenario_seed + ep_idx,
+                                                )
+                                        ep_points = conditional_points[ep_idx]
+                                    ep_remaining = {c: ep_points.get(c, 0) for c in remaining}
+                                    index = replacement_indexes[(ep_idx, ph_idx)] = ReplacementIndex(
+                                        remaining, prices_at_ep, ep_remaining
+                                    )
+                                viable = index.query(budget_freed, config=update_config)
                             if viable["count"] > 0 and viable["viable"]:
                                 best = viable["viable"][0]
                                 new_player = best[0]
                                 working_roster = [c for c in working_roster if c != voted_out]
                                 working_roster.append(new_player)
                                 total_replacement_penalty += add_player_penalty
-                                replacement_count += 1
+                                replacements += 1
 
                         ph_idx += 1
 
@@ -186,57 +253,79 @@ def run_full_simulation(
                     captain = pick_captain(working_roster, expected_points, ep)
                     captain_per_episode.append(captain)
 
-                points = calculate_roster_points(
-                    working_roster, episode_outcomes, scoring,
-                    captain_per_episode=captain_per_episode,
-                )
-                total = points["total"] + total_replacement_penalty
-
-                results.append({
+                with prof.stage("calculate_roster_points"):
+                    points = calculate_roster_points(
+                        working_roster, episode_outcomes, scoring,
+                        captain_per_episode=captain_per_episode,
+                    )
+                prof.count("roster_scorings")
+                rows.append({
                     "scenario": s,
-                    "strategy": strategy,
                     "play_style": style_name,
                     "roster": working_roster,
-                    "total": total,
+                    "total": points["total"] + total_replacement_penalty,
                     "base_points": points["total"],
                     "captain_bonus": points.get("captain_bonus", 0),
                     "replacement_penalty": total_replacement_penalty,
+                    "replacements": replacements,
                     "breakdown": points["breakdown"],
                     "event_breakdown": points.get("event_breakdown", {}),
                 })
-
-                for et, data in points.get("event_breakdown", {}).items():
-                    event_breakdown_agg[et]["count"] += data.get("count", 0)
-                    event_breakdown_agg[et]["points"] += data.get("points", 0)
-                captain_bonus_agg += points.get("captain_bonus", 0)
-                replacement_penalty_agg += total_replacement_penalty
-
-    # Aggregate by (strategy, play_style)
-    by_combo = defaultdict(list)
+            scenario_rows.append(rows)
+
+        for strategy, indices in rosters_by_strategy.items():
+            for i in indices:
+                weight = unique_rosters[i]["strategies"][strategy]
+                for row in scenario_rows[i]:
+                    results.append(dict(row, strategy=strategy, weight=weight))
+                    cell = scenario_sums[(strategy, row["play_style"])][s]
+                    cell[0] += row["total"] * weight
+                    cell[1] += weight
+                    for et, data in row["event_breakdown"].items():
+                        event_breakdown_agg[et]["count"] += data.get("count", 0) * weight
+                        event_breakdown_agg[et]["points"] += data.get("points", 0) * weight
+                    captain_bonus_agg += row["captain_bonus"] * weight
+                    replacement_count += row["replacements"] * weight
+                    replacement_penalty_agg += row["replacement_penalty"] * weight
+
+    # Aggregate by (strategy, play_style), weighting each distinct roster by its multiplicity
+    by_combo = {}
     for r in results:
-        by_combo[(r["strategy"], r["play_style"])].append(r["total"])
+        stats = by_combo.setdefault((r["strategy"], r["play_style"]), {"sum": 0, "count": 0, "min": r["total"], "max": r["total"]})
+        stats["sum"] += r["total"] * r["weight"]
+        stats["count"] += r["weight"]
+        stats["min"] = min(stats["min"], r["total"])
+        stats["max"] = max(stats["max"], r["total"])
 
     combo_stats = {}
-    for (strat, style), scores in by_combo.items():
+    for (strat, style), stats in by_combo.items():
         combo_stats[f"{strat}_{style}"] = {
-            "mean": sum(scores) / len(scores),
-            "min": min(scores),
-            "max": max(scores),
-            "count": len(scores),
+            "mean": stats["sum"] / stats["count"],
+            "min": stats["min"],
+            "max": stats["max"],
+            "count": stats["count"],
         }
 
     # Play style comparison (across all strategies)
-    by_style = defaultdict(list)
+    by_style = {}
     for r in results:
-        by_style[r["play_style"]].append(r["total"])
-    style_stats = {s: {"mean": sum(v)/len(v), "count": len(v)} for s, v in by_style.items()}
+        stats = by_style.setdefault(r["play_style"], {"sum": 0, "count": 0})
+        stats["sum"] += r["total"] * r["weight"]
+        stats["count"] += r["weight"]
+    style_stats = {s: {"mean": v["sum"] / v["count"], "count": v["count"]} for s, v in by_style.items()}
+    paired_stats = paired_comparisons(scenario_sums, combo_stats, group_size=group, strata=scenario_strata)
 
     analysis = {
         "num_scenarios": num_scenarios,
         "rosters_per_strategy": rosters_per_strategy,
-        "total_runs": len(results),
+        "conditional_runs": conditional_runs,
+        "antithetic": antithetic,
+        "stratified": stratified,
+        "total_runs": sum(r["weight"] for r in results),
+        "distinct_rosters": {strat: len(indices) for strat, indices in rosters_by_strategy.items()},
         "combo_stats": combo_stats,
         "style_stats": style_stats,
+        "paired_stats": paired_stats,
         "event_breakdown_agg": dict(event_breakdown_agg),
         "captain_bonus_total": captain_bonus_agg,
         "replacement_count": replacement_count,
@@ -247,7 +336,8 @@ def run_full_simulation(
         "expected_points": expected_points,
     }
 
-    report = generate_full_report(analysis, contestants)
+    with prof.stage("report"):
+        report = generate_full_report(analysis, contestants)
     if output_dir:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -257,6 +347,7 @@ def run_full_simulation(
             json.dump({
                 "combo_stats": analysis["combo_stats"],
                 "style_stats": analysis["style_stats"],
+                "paired_stats": analysis["paired_stats"],
                 "event_breakdown_agg": analysis["event_breakdown_agg"],
                 "captain_bonus_total": analysis["captain_bonus_total"],
                 "replacement_count": analysis["replacement_count"],
@@ -267,6 +358,44 @@ def run_full_simulation(
     return analysis
 
 
+def paired_comparisons(scenario_sums: dict, combo_stats: dict, group_size: int = 1, strata: list = None) -> dict:
+    """
+    Paired differences over scenarios: replace vs fixed overall and per strategy, and
+    the best strategy x style combo against every other. Each scenario's value is the
+    weighted mean total of that strategy / style; all of them share the scenario's
+    season, so the gaps are common-random-number estimates. strata: structure label
+    per scenario for stratified runs.
+    """
+    def compare(a: list, b: list) -> dict:
+        return paired_difference(a, b, group_size, strata=strata)
+
+    def series(keys) -> list:
+        out = []
+        for cells in zip(*(scenario_sums[k] for k in keys)):
+            total = sum(c[0] for c in cells)
+            weight = sum(c[1] for c in cells)
+            out.append(total / weight if weight else 0.0)
+        return out
+
+    strategies = sorted({strategy for strategy, _ in scenario_sums})
+    comparisons = {}
+    if any(style == "replace" for _, style in scenario_sums) and any(style == "fixed" for _, style in scenario_sums):
+        comparisons["replace vs fixed"] = compare(
+            series([(st, "replace") for st in strategies]), series([(st, "fixed") for st in strategies])
+        )
+        for strategy in strategies:
+            comparisons[f"{strategy}: replace vs fixed"] = compare(
+                series([(strategy, "replace")]), series([(strategy, "fixed")])
+            )
+    keys = {f"{strategy}_{style}": (strategy, style) for strategy, style in scenario_sums}
+    if combo_stats:
+        best = max(combo_stats, key=lambda k: combo_stats[k]["mean"])
+        for name in sorted(combo_stats):
+            if name != best:
+                comparisons[f"{best} vs {name}"] = compare(series([keys[best]]), series([keys[name]]))
+    return {"group_size": group_size, "stratified": strata is not None, "comparisons": comparisons}
+
+
 def generate_full_report(analysis: dict, contestants: list) -> str:
     lines = [
         "# Full-Stack Simulation Report",
@@ -275,8 +404,16 @@ def generate_full_report(analysis: dict, contestants: list) -> str:
         "",
         f"**Total runs:** {analysis['total_runs']:,} (scenarios × rosters × play styles)",
         f"**Scenarios:** {analysis['num_scenarios']}",
+        "**Distinct rosters per strategy:** "
+        + ", ".join(f"{k} {v}" for k, v in analysis.get("distinct_rosters", {}).items()),
         f"**Replacement penalty:** {analysis['replacement_penalty']} points per add",
+        "**Replacement picks by:** "
+        + (f"rest-of-season expected points ({analysis['conditional_runs']} continuations per vote-off)"
+           if analysis.get("conditional_runs") else "preseason expected points"),
         f"**Captain multiplier:** {analysis['captain_multiplier']}x (required every episode)",
+        "**Scenarios:** common random numbers across strategies and styles"
+        + (", antithetic pairs" if analysis.get("antithetic") else "")
+        + (", stratified by swap / merge structure" if analysis.get("stratified") else ""),
         "",
         "---",
         "",
@@ -398,6 +535,27 @@ def generate_full_report(analysis: dict, contestants: list) -> str:
                 style = suf
                 break
         lines.append(f"| {strat} | {style} | {stats['mean']:.1f} | {stats['min']} | {stats['max']} |")
+    paired = analysis.get("paired_stats", {}).get("comparisons", {})
+    if paired:
+        lines.extend([
+            "",
+            "---",
+            "",
+            "## Paired Comparisons (Common Random Numbers)",
+            "",
+            "Every strategy and play style plays the same seasons, so each gap is the mean of per-scenario",
+            "differences. VRF is the variance of two independent estimates over the paired one; ESS is the",
+            "independent scenarios per arm this precision would otherwise take.",
+            "",
+            "| Comparison | Mean diff | 95% CI | Paired SE | Independent SE | VRF | ESS |",
+            "|------------|-----------|--------|-----------|----------------|-----|-----|",
+        ])
+        for name, st in paired.items():
+            lo, hi = st["ci95"]
+            lines.append(
+                f"| {name} | {st['mean_diff']:+.1f} | [{lo:+.1f}, {hi:+.1f}] | {st['se']:.2f} | "
+                f"{st['se_independent']:.2f} | {st['vrf']:.1f}x | {st['ess']:,.0f} |"
+            )
     lines.extend([
         "",
         "---",
@@ -477,17 +635,30 @@ def generate_full_report(analysis: dict, contestants: list) -> str:
     return "\n".join(lines)
 
 
-def main():
-    base = Path(__file__).parent.parent.parent
-    output_dir = base / "output" / "simulation"
+def run_from_args(args: argparse.Namespace) -> None:
+    """Run and summarize from parsed arguments (see cli.add_full_arguments)."""
+    profiler = Profiler(enabled=args.profile, cprofile=args.cprofile)
+
+    output_dir = args.output
+    if output_dir is None:
+        base = Path(__file__).parent.parent.parent
+        output_dir = base / "output" / "simulation"
 
     print("Running Full-Stack Simulation...")
     analysis = run_full_simulation(
-        num_scenarios=50,
-        rosters_per_strategy=5,
-        seed=42,
+        num_scenarios=args.scenarios,
+        rosters_per_strategy=args.rosters,
+        seed=args.seed,
         output_dir=output_dir,
+        profiler=profiler,
+        conditional_runs=args.conditional_runs,
+        antithetic=args.antithetic,
+        stratified=args.stratified,
     )
+    profiler.print_summary()
+    timings_path = profiler.write(output_dir, "full")
+    if timings_path:
+        print(f"Timings saved to {timings_path}")
 
     print("\n" + "=" * 50)
     print("FULL SIMULATION SUMMARY")
@@ -497,6 +668,16 @@ def main():
     print(f"Replacements made: {analysis['replacement_count']}")
     for style, s in analysis.get("style_stats", {}).items():
         print(f"  {style}: avg {s['mean']:.1f}")
+    lift = analysis["paired_stats"]["comparisons"].get("replace vs fixed")
+    if lift:
+        print(f"Replace vs fixed: {lift['mean_diff']:+.1f} pts (paired SE {lift['se']:.2f}, "
+              f"VRF {lift['vrf']:.1f}x, ESS {lift['ess']:,.0f} scenarios)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-stack simulation (dynamic pricing, replacements, captaincy)")
+    add_full_arguments(parser)
+    run_from_args(parser.parse_args(argv))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Rest-of-season expected points for the remaining contestants, from the aired
+episodes (default: app/seed/episode_outcomes.json).
+
+    python run_outlook.py --runs 500 -o /tmp/outlook
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_outlook_arguments
+from src.config import CONFIG_DIR, load_scoring, load_season_template, load_contestants
+from src.conditional import rest_of_season_expected_points
+from src.profiling import Profiler
+
+SEED_DIR = Path(__file__).parent.parent.parent / "app" / "seed"
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Rest-of-season expected points for the remaining contestants, from the aired episodes."""
+    observed_path = Path(args.observed) if args.observed else SEED_DIR / "episode_outcomes.json"
+    with open(observed_path) as f:
+        observed = json.load(f)
+
+    profiler = Profiler(enabled=args.profile, cprofile=args.cprofile)
+    contestants = load_contestants()
+    expected_points = rest_of_season_expected_points(
+        observed, contestants, load_season_template(), load_scoring(), config_dir=CONFIG_DIR,
+        num_runs=args.runs, seed=args.seed, profiler=profiler,
+    )
+
+    print(f"{len(observed)} episodes aired, {len(expected_points)} contestants remaining")
+    names = {c["id"]: c.get("name", c["id"]) for c in contestants}
+    for cid in sorted(expected_points, key=lambda c: (-expected_points[c], c)):
+        print(f"  {names[cid]:<24} {expected_points[cid]:7.1f} pts")
+    profiler.print_summary()
+    if args.output:
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "rest_of_season.json", "w") as f:
+            json.dump({"episodes_aired": len(observed), "runs": args.runs, "expected_points": expected_points}, f, indent=2)
+        print(f"Rest-of-season expected points saved to {output_dir / 'rest_of_season.json'}")
+        profiler.write(output_dir, "outlook")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rest-of-season expected points from the aired episodes")
+    add_outlook_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Expected points per contestant by Monte Carlo (plain, stratified, QMC, importance
+sampling or control variates), mapped to prices and optionally calibrated.
+--save-bank keeps the seasons for reprice.
+
+    python run_price.py --runs 2000 -o /tmp/prices
+    python run_price.py --runs 200 --control-variates
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_price_arguments
+from src.config import CONFIG_DIR, load_bps, load_scoring, load_season_template, load_contestants, load_pricing
+from src.price_generator import (
+    compute_expected_points_per_contestant,
+    expected_points_to_prices,
+    calibrate_prices,
+    qmc_expected_points,
+)
+from src.control_variates import control_variate_expected_points
+from src.importance import DEFAULT_TILT, importance_expected_points, parse_tilt
+from src.reweight import build_price_bank
+from src.profiling import Profiler
+from src.stratified import stratified_expected_points
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Expected points by Monte Carlo, mapped to (optionally calibrated) prices."""
+    profiler = Profiler(enabled=args.profile, cprofile=args.cprofile)
+    contestants = load_contestants()
+    pricing = load_pricing()
+    bps_config = load_bps() if args.bps else None
+    estimate = None
+    with profiler.stage("price_estimation"):
+        if args.stratify:
+            try:
+                estimate = stratified_expected_points(
+                    contestants, load_season_template(), load_scoring(), CONFIG_DIR,
+                    num_runs=args.runs, seed=args.seed, allocation=args.stratify,
+                    profiler=profiler, bps_config=bps_config,
+                )
+            except ValueError as e:
+                raise SystemExit(str(e))
+            allocation = ", ".join(f"{label} {s['runs']}" for label, s in estimate["strata"].items())
+            method = f"Stratified ({estimate['allocation']}: {allocation})"
+        elif args.qmc:
+            estimate = qmc_expected_points(
+                contestants, load_season_template(), load_scoring(), CONFIG_DIR,
+                num_runs=args.runs, seed=args.seed, replicates=args.qmc,
+                profiler=profiler, bps_config=bps_config,
+            )
+            method = f"QMC ({estimate['replicates']} scrambled Halton replicates, {estimate['runs']} runs)"
+        elif args.importance:
+            estimate = importance_expected_points(
+                contestants, load_season_template(), load_scoring(), CONFIG_DIR,
+                num_runs=args.runs, seed=args.seed, tilt=dict(DEFAULT_TILT, **parse_tilt(args.tilt)),
+                profiler=profiler, bps_config=bps_config,
+            )
+            method = f"Importance sampling (ESS {estimate['ess']:,.0f} of {estimate['runs']} runs)"
+        elif args.control_variates:
+            estimate = control_variate_expected_points(
+                contestants, load_season_template(), load_scoring(), CONFIG_DIR,
+                num_runs=args.runs, seed=args.seed, profiler=profiler, bps_config=bps_config,
+            )
+            method = f"Control variates ({estimate['runs']} runs)"
+        elif args.save_bank:
+            bank = build_price_bank(
+                contestants, load_season_template(), load_scoring(), CONFIG_DIR,
+                num_runs=args.runs, seed=args.seed, profiler=profiler, bps_config=bps_config,
+            )
+            expected_points = {cid: sum(points) / len(points) for cid, points in bank["points"].items() if points}
+            bank_path = Path(args.save_bank)
+            bank_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(bank_path, "w") as f:
+                json.dump(bank, f)
+        else:
+            expected_points = compute_expected_points_per_contestant(
+                contestants, load_season_template(), load_scoring(), CONFIG_DIR,
+                num_runs=args.runs, seed=args.seed, profiler=profiler, bps_config=bps_config,
+            )
+    if estimate:
+        expected_points = estimate["expected_points"]
+    prices = expected_points_to_prices(expected_points, pricing)
+    if not args.no_calibrate:
+        with profiler.stage("roster_enumeration"):
+            prices, _ = calibrate_prices(prices, contestants, pricing, roster_size=pricing.get("roster_max", 7))
+
+    names = {c["id"]: c.get("name", c["id"]) for c in contestants}
+    for cid in sorted(prices, key=lambda c: (-prices[c], c)):
+        error = f"  ± {estimate['se'][cid]:.1f}" if estimate else ""
+        print(f"  {names[cid]:<24} ${prices[cid]:>9,}  {expected_points[cid]:7.1f} pts{error}")
+    if estimate:
+        print(f"{method}: variance reduction {estimate['vrf']:.2f}x against plain Monte Carlo, "
+              f"worth {estimate['vrf'] * estimate['runs']:,.0f} plain runs")
+    for name, e in (estimate or {}).get("events", {}).items():
+        print(f"  {name:<16} {e['per_season']:.4f} ± {e['se']:.4f} per season, "
+              f"{e['points_per_contestant']:+.3f} pts per contestant, sampled in {e['seasons_sampled']} seasons "
+              f"({e['vrf']:.1f}x variance reduction)")
+    if estimate and "tails" in estimate:
+        print("  Solo season totals: " + ", ".join(f"p{q * 100:g} {v:.0f}" for q, v in estimate["tails"].items()))
+    if args.save_bank:
+        print(f"Price bank ({args.runs} seasons) saved to {args.save_bank}")
+    profiler.print_summary()
+    if args.output:
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "prices.json", "w") as f:
+            payload = {"prices": prices, "expected_points": expected_points}
+            if estimate:
+                payload["estimate"] = {k: v for k, v in estimate.items() if k != "expected_points"}
+            json.dump(payload, f, indent=2)
+        print(f"Prices saved to {output_dir / 'prices.json'}")
+        profiler.write(output_dir, "price")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estimate expected points and map them to prices")
+    add_price_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
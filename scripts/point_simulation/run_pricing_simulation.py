@@ -13,29 +13,103 @@ from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-import yaml
-
+from cli import add_pricing_arguments
+from src.config import load_scoring, load_season_template, load_contestants, load_pricing
 from src.point_calculator import calculate_roster_points
 from src.scenario_generator import generate_scenario
 from src.price_generator import (
     compute_expected_points_per_contestant,
     expected_points_to_prices,
+    calibrate_prices,
+)
+from src.roster_generator import (
+    generate_budget_rosters_for_simulation,
+    generate_indexed_rosters_for_simulation,
+    dedupe_rosters,
+)
+from src.roster_enumerator import (
+    count_valid_rosters,
+    count_tribe_valid_combos,
+    sample_valid_rosters,
+    combination_count,
 )
-from src.roster_generator import generate_budget_rosters_for_simulation
-from src.roster_enumerator import count_valid_rosters, sample_valid_rosters, compute_combo_cost_percentiles
+from src.registry import ContestantRegistry, get_registry
+from src.profiling import Profiler, NULL_PROFILER
+from src.checkpoint import config_fingerprint, save_checkpoint, load_checkpoint, clear_checkpoint
+
+
+CHECKPOINT_FILENAME = "pricing_checkpoint.json"
 
 
 def load_config(config_dir: Path) -> tuple:
     """Load scoring, season, contestant, and pricing configs."""
-    with open(config_dir / "scoring.yaml") as f:
-        scoring = yaml.safe_load(f)
-    with open(config_dir / "season_template.yaml") as f:
-        season = yaml.safe_load(f)
-    with open(config_dir / "contestants_s50.yaml") as f:
-        contestants = yaml.safe_load(f)["contestants"]
-    with open(config_dir / "pricing.yaml") as f:
-        pricing = yaml.safe_load(f)
-    return scoring, season["episodes"], contestants, pricing
+    return (
+        load_scoring(config_dir),
+        load_season_template(config_dir),
+        load_contestants(config_dir),
+        load_pricing(config_dir),
+    )
+
+
+def _new_scoring_aggregate() -> dict:
+    """Running aggregate of scored rosters (JSON-serializable for checkpoints)."""
+    return {
+        "total_runs": 0,
+        "strategy_stats": {},  # strategy -> {sum, min, max, count, cost_sum, example_roster}
+        "contestant_picks": {},  # strategy -> {cid: count}
+        "roster_keys": [],  # unique sorted rosters, in first-seen order
+        "point_breakdown": {},
+        "event_breakdown": {},
+    }
+
+
+def _fold_scenario_results(
+    agg: dict,
+    seen_rosters: set,
+    scenario_results: list,
+    by_strategy: dict,
+    registry: ContestantRegistry,
+) -> None:
+    """
+    Fold one scenario's scored unique rosters into the running aggregate, weighted by
+    each roster's multiplicity within a strategy (seen_rosters holds roster bitmasks).
+    """
+    for s, indices in by_strategy.items():
+        for i in indices:
+            r = scenario_results[i]
+            w = r["strategies"][s]
+            stats = agg["strategy_stats"].get(s)
+            if stats is None:
+                stats = agg["strategy_stats"][s] = {
+                    "sum": 0,
+                    "min": r["total"],
+                    "max": r["total"],
+                    "count": 0,
+                    "cost_sum": 0,
+                    "example_roster": r["roster"],
+                }
+                agg["contestant_picks"][s] = {}
+            stats["sum"] += r["total"] * w
+            stats["min"] = min(stats["min"], r["total"])
+            stats["max"] = max(stats["max"], r["total"])
+            stats["count"] += w
+            stats["cost_sum"] += r["total_cost"] * w
+            picks = agg["contestant_picks"][s]
+            for cid in r["roster"]:
+                picks[cid] = picks.get(cid, 0) + w
+
+            key = registry.mask(r["roster"])
+            if key not in seen_rosters:
+                seen_rosters.add(key)
+                agg["roster_keys"].append(sorted(r["roster"]))
+
+            for cat, val in r.get("breakdown", {}).items():
+                agg["point_breakdown"][cat] = agg["point_breakdown"].get(cat, 0.0) + val * w
+            for event_type, data in r.get("event_breakdown", {}).items():
+                ev = agg["event_breakdown"].setdefault(event_type, {"count": 0, "points": 0})
+                ev["count"] += data.get("count", 0) * w
+                ev["points"] += data.get("points", 0) * w
+            agg["total_runs"] += w
 
 
 def run_pricing_simulation(
@@ -45,23 +119,74 @@ def run_pricing_simulation(
     sample_rosters: Optional[int] = None,
     seed: int = 42,
     output_dir: Path = None,
+    resume: bool = False,
+    checkpoint_every: int = 25,
+    profiler: Optional[Profiler] = None,
+    indexed_rosters: bool = False,
 ) -> dict:
-    """Run Phase 1: compute prices, build budget rosters, score across scenarios."""
+    """
+    Run Phase 1: compute prices, build budget rosters, score across scenarios.
+
+    With output_dir set, progress is checkpointed to pricing_checkpoint.json every
+    checkpoint_every scenarios (and every 4 * checkpoint_every price-estimation runs).
+    resume=True continues from that checkpoint and produces identical output.
+    indexed_rosters=True builds strategy rosters with the batched RosterIndex generator
+    (same rules, one RNG stream; use for large rosters_per_strategy).
+    """
+    prof = profiler or NULL_PROFILER
     config_dir = Path(__file__).parent / "config"
     scoring, season_template, contestants, pricing_config = load_config(config_dir)
     budget = pricing_config.get("budget", 1_000_000)
     roster_min = pricing_config.get("roster_min", 5)
     roster_max = pricing_config.get("roster_max", 7)
 
-    print("Step 1: Computing expected points per contestant...")
-    expected_points = compute_expected_points_per_contestant(
-        contestants,
-        season_template,
-        scoring,
-        config_dir,
-        num_runs=price_estimation_runs,
-        seed=seed,
-    )
+    checkpoint_path = Path(output_dir) / CHECKPOINT_FILENAME if output_dir else None
+    fingerprint = {
+        "price_estimation_runs": price_estimation_runs,
+        "scenario_runs": scenario_runs,
+        "rosters_per_strategy": rosters_per_strategy,
+        "sample_rosters": sample_rosters,
+        "indexed_rosters": indexed_rosters,
+        "seed": seed,
+        "config": config_fingerprint(scoring, season_template, contestants, pricing_config),
+    }
+    ckpt_state = {}
+    if resume and checkpoint_path:
+        ckpt_state = load_checkpoint(checkpoint_path, fingerprint) or {}
+        if ckpt_state:
+            print(f"Resuming from {checkpoint_path}")
+        else:
+            print(f"No checkpoint at {checkpoint_path}; starting fresh")
+
+    def write_checkpoint() -> None:
+        if checkpoint_path and checkpoint_every > 0:
+            save_checkpoint(checkpoint_path, fingerprint, ckpt_state)
+
+    def on_price_checkpoint(state: dict) -> None:
+        ckpt_state["price_estimation"] = state
+        write_checkpoint()
+
+    if "expected_points" in ckpt_state:
+        print("Step 1: Expected points restored from checkpoint")
+        expected_points = ckpt_state["expected_points"]
+    else:
+        print("Step 1: Computing expected points per contestant...")
+        with prof.stage("price_estimation"):
+            expected_points = compute_expected_points_per_contestant(
+                contestants,
+                season_template,
+                scoring,
+                config_dir,
+                num_runs=price_estimation_runs,
+                seed=seed,
+                resume_state=ckpt_state.get("price_estimation"),
+                on_checkpoint=on_price_checkpoint,
+                checkpoint_every=4 * checkpoint_every,
+                profiler=prof,
+            )
+        ckpt_state.pop("price_estimation", None)
+        ckpt_state["expected_points"] = expected_points
+        write_checkpoint()
 
     print("Step 2: Mapping expected points to prices...")
     prices = expected_points_to_prices(expected_points, pricing_config)
@@ -70,94 +195,92 @@ def run_pricing_simulation(
     target_valid_pct = pricing_config.get("target_valid_pct")
     if target_valid_pct is not None and roster_min == roster_max == 7:
         print("Step 2a: Calibrating prices for target valid %...")
-        percentiles = compute_combo_cost_percentiles(
-            contestants, prices, roster_min=roster_min, roster_max=roster_max,
-            percentiles=[target_valid_pct],
-        )
-        target_cost = percentiles.get(f"p{int(target_valid_pct*100)}", budget)
-        increment = pricing_config.get("price_increment", 5000)
-        price_min = pricing_config.get("price_min", 80000)
-        price_max = pricing_config.get("price_max", 260000)
-
-        if target_cost > 0:
-            scale = budget / target_cost
-            prices = {
-                cid: int(max(price_min, min(price_max, round(p * scale / increment) * increment)))
-                for cid, p in prices.items()
-            }
-            print(f"  Scaled prices by {scale:.3f} so {target_valid_pct*100:.0f}th percentile cost ≈ budget")
-
-        # Ensure top 7 by price exceed budget (can't own all 7 most expensive)
-        sorted_ids = sorted(prices.keys(), key=lambda x: prices[x], reverse=True)
-        top7_cost = sum(prices[cid] for cid in sorted_ids[:7])
-        if top7_cost <= budget:
-            min_top7 = budget + increment
-            scale2 = min_top7 / top7_cost if top7_cost > 0 else 1.0
-            prices = {
-                cid: int(max(price_min, min(price_max, round(p * scale2 / increment) * increment)))
-                for cid, p in prices.items()
-            }
-            print(f"  Adjusted scale so top 7 cost (${sum(prices[c] for c in sorted_ids[:7]):,}) > budget")
+        with prof.stage("roster_enumeration"):
+            prices, calibration = calibrate_prices(prices, contestants, pricing_config, roster_size=roster_min)
+        prof.count("enumerated_combos", combination_count(len(contestants), roster_min, roster_max))
+        if "scale" in calibration:
+            print(f"  Scaled prices by {calibration['scale']:.3f} so {target_valid_pct*100:.0f}th percentile cost ≈ budget")
+        if "top_scale" in calibration:
+            top7 = sorted(prices.values(), reverse=True)[:7]
+            print(f"  Adjusted scale so top 7 cost (${sum(top7):,}) > budget")
 
     # Count total valid team options (under budget) and total possible (tribe-valid only)
     print("Step 2b: Counting total valid roster options...")
-    roster_counts = count_valid_rosters(contestants, prices, budget, roster_min=roster_min, roster_max=roster_max)
-    total_valid_options = roster_counts["total"]
-    from itertools import combinations
-    tribe_map = {c["id"]: c["starting_tribe"] for c in contestants}
-    total_possible = sum(
-        1 for combo in combinations([c["id"] for c in contestants], roster_max)
-        if len(set(tribe_map[c] for c in combo)) >= 3
+    with prof.stage("roster_enumeration"):
+        roster_counts = count_valid_rosters(contestants, prices, budget, roster_min=roster_min, roster_max=roster_max)
+        total_valid_options = roster_counts["total"]
+        total_possible = count_tribe_valid_combos(contestants, roster_min=roster_max, roster_max=roster_max)
+    prof.count(
+        "enumerated_combos",
+        combination_count(len(contestants), roster_min, roster_max) + combination_count(len(contestants), roster_max, roster_max),
     )
     excluded_pct = 100 * (1 - total_valid_options / total_possible) if total_possible > 0 else 0
     size_str = ", ".join(f"{s}-player: {roster_counts.get(f'size_{s}', 0):,}" for s in range(roster_min, roster_max + 1))
     print(f"  Total valid under budget: {total_valid_options:,} | Total possible (tribe-valid): {total_possible:,} | Excluded by pricing: {excluded_pct:.1f}%")
 
     print("Step 3: Generating rosters for simulation...")
-    if sample_rosters is not None:
-        rosters = [
-            {
-                "roster": r,
-                "strategy": "sampled",
-                "total_cost": sum(prices.get(c, 0) for c in r),
-            }
-            for r in sample_valid_rosters(
-                contestants, prices, budget, n=sample_rosters, seed=seed, roster_min=roster_min, roster_max=roster_max
+    with prof.stage("roster_generation"):
+        if sample_rosters is not None:
+            rosters = [
+                {
+                    "roster": r,
+                    "strategy": "sampled",
+                    "total_cost": sum(prices.get(c, 0) for c in r),
+                }
+                for r in sample_valid_rosters(
+                    contestants, prices, budget, n=sample_rosters, seed=seed, roster_min=roster_min, roster_max=roster_max
+                )
+            ]
+            print(f"  Sampled {len(rosters)} unique rosters from {total_valid_options:,} valid options")
+        else:
+            generate = generate_indexed_rosters_for_simulation if indexed_rosters else generate_budget_rosters_for_simulation
+            rosters = generate(
+                contestants,
+                prices,
+                budget,
+                expected_points,
+                num_per_strategy=rosters_per_strategy,
+                seed=seed,
+                roster_min=roster_min,
+                roster_max=roster_max,
             )
-        ]
-        print(f"  Sampled {len(rosters)} unique rosters from {total_valid_options:,} valid options")
-    else:
-        rosters = generate_budget_rosters_for_simulation(
-            contestants,
-            prices,
-            budget,
-            expected_points,
-            num_per_strategy=rosters_per_strategy,
-            seed=seed,
-            roster_min=roster_min,
-            roster_max=roster_max,
-        )
+
+    unique_rosters, rosters_by_strategy = dedupe_rosters(rosters, contestants)
+    distinct_per_strategy = {s: len(indices) for s, indices in rosters_by_strategy.items()}
+    print(f"  {len(rosters)} rosters, {len(unique_rosters)} distinct (scored once per scenario)")
 
     print("Step 4: Running scenarios and scoring rosters...")
-    results = []
-    for run_idx in range(scenario_runs):
+    scoring_state = ckpt_state.get("scoring") or {"next_scenario": 0, "aggregate": _new_scoring_aggregate()}
+    agg = scoring_state["aggregate"]
+    registry = get_registry(contestants)
+    seen_rosters = {registry.mask(k) for k in agg["roster_keys"]}
+    if scoring_state["next_scenario"]:
+        print(f"  Resuming at scenario {scoring_state['next_scenario']}/{scenario_runs}")
+
+    for run_idx in range(scoring_state["next_scenario"], scenario_runs):
         scenario_seed = seed + run_idx * 1000
-        episode_outcomes = generate_scenario(
-            contestants,
-            season_template,
-            seed=scenario_seed,
-            config_dir=config_dir,
-        )
-
-        for roster_data in rosters:
-            points = calculate_roster_points(
-                roster_data["roster"],
-                episode_outcomes,
-                scoring,
+        with prof.stage("generate_scenario"):
+            episode_outcomes = generate_scenario(
+                contestants,
+                season_template,
+                seed=scenario_seed,
+                config_dir=config_dir,
             )
-            results.append({
+        prof.count("scenarios")
+
+        scenario_results = []
+        for roster_data in unique_rosters:
+            with prof.stage("calculate_roster_points"):
+                points = calculate_roster_points(
+                    roster_data["mask"],
+                    episode_outcomes,
+                    scoring,
+                    registry=registry,
+                )
+            prof.count("roster_scorings")
+            scenario_results.append({
                 "roster": roster_data["roster"],
-                "strategy": roster_data["strategy"],
+                "strategies": roster_data["strategies"],
                 "total_cost": roster_data["total_cost"],
                 "total": points["total"],
                 "breakdown": points["breakdown"],
@@ -165,33 +288,24 @@ def run_pricing_simulation(
                 "scenario_id": run_idx,
             })
 
-    # Aggregate analysis
-    strategy_scores = {}
-    strategy_rosters = {}  # One example per strategy
-    strategy_costs = {}
-    contestant_picks = {}  # Per strategy: {cid: count}
-    for r in results:
-        s = r["strategy"]
-        if s not in strategy_scores:
-            strategy_scores[s] = []
-            strategy_rosters[s] = r["roster"]
-            strategy_costs[s] = []
-            contestant_picks[s] = {}
-        strategy_scores[s].append(r["total"])
-        strategy_costs[s].append(r["total_cost"])
-        for cid in r["roster"]:
-            contestant_picks[s][cid] = contestant_picks[s].get(cid, 0) + 1
+        _fold_scenario_results(agg, seen_rosters, scenario_results, rosters_by_strategy, registry)
+        scoring_state["next_scenario"] = run_idx + 1
+        if checkpoint_every > 0 and (run_idx + 1) % checkpoint_every == 0 and run_idx + 1 < scenario_runs:
+            ckpt_state["scoring"] = scoring_state
+            write_checkpoint()
 
+    # Aggregate analysis
+    contestant_picks = agg["contestant_picks"]
     strategy_stats = {}
-    for s, scores in strategy_scores.items():
-        costs = strategy_costs[s]
+    for s, stats in agg["strategy_stats"].items():
         strategy_stats[s] = {
-            "mean": sum(scores) / len(scores),
-            "min": min(scores),
-            "max": max(scores),
-            "count": len(scores),
-            "avg_cost": sum(costs) / len(costs) if costs else 0,
-            "example_roster": strategy_rosters[s],
+            "mean": stats["sum"] / stats["count"],
+            "min": stats["min"],
+            "max": stats["max"],
+            "count": stats["count"],
+            "distinct_rosters": distinct_per_strategy.get(s, 0),
+            "avg_cost": stats["cost_sum"] / stats["count"] if stats["count"] else 0,
+            "example_roster": stats["example_roster"],
             "top_picks": sorted(
                 contestant_picks[s].items(),
                 key=lambda x: x[1],
@@ -200,21 +314,11 @@ def run_pricing_simulation(
         }
 
     # Roster diversity: unique roster compositions
-    roster_hashes = set()
-    for r in results:
-        key = tuple(sorted(r["roster"]))
-        roster_hashes.add(key)
-    unique_rosters = len(roster_hashes)
+    unique_rosters = len(agg["roster_keys"])
 
     # Aggregate point breakdowns and event breakdowns across all results
-    point_breakdown_agg = defaultdict(float)
-    event_breakdown_agg = defaultdict(lambda: {"count": 0, "points": 0})
-    for r in results:
-        for cat, val in r.get("breakdown", {}).items():
-            point_breakdown_agg[cat] += val
-        for event_type, data in r.get("event_breakdown", {}).items():
-            event_breakdown_agg[event_type]["count"] += data.get("count", 0)
-            event_breakdown_agg[event_type]["points"] += data.get("points", 0)
+    point_breakdown_agg = agg["point_breakdown"]
+    event_breakdown_agg = agg["event_breakdown"]
 
     sorted_ids = sorted(
         prices.keys(),
@@ -237,7 +341,7 @@ def run_pricing_simulation(
         "pricing_config": dict(pricing_config, actual_price_runs=price_estimation_runs, actual_scenario_runs=scenario_runs),
         "strategy_stats": strategy_stats,
         "contestant_picks": contestant_picks,
-        "total_runs": len(results),
+        "total_runs": agg["total_runs"],
         "unique_roster_compositions": unique_rosters,
         "total_valid_team_options": total_valid_options,
         "total_possible_combos": total_possible,
@@ -258,7 +362,8 @@ def run_pricing_simulation(
     }
 
     # Generate report
-    report = generate_pricing_report(analysis, contestants)
+    with prof.stage("report"):
+        report = generate_pricing_report(analysis, contestants)
 
     if output_dir:
         output_dir = Path(output_dir)
@@ -290,6 +395,7 @@ def run_pricing_simulation(
 
         print(f"\nReport saved to {output_dir / 'pricing_report.md'}")
         print(f"Analysis saved to {output_dir / 'pricing_analysis.json'}")
+        clear_checkpoint(output_dir / CHECKPOINT_FILENAME)
 
     return analysis
 
@@ -457,14 +563,17 @@ def generate_pricing_report(analysis: dict, contestants: list) -> str:
         "",
         "## Strategy Performance (Budget-Constrained Rosters)",
         "",
-        "| Strategy | Avg Score | Avg Cost | Min | Max | Count |",
-        "|----------|-----------|----------|-----|-----|-------|",
+        "| Strategy | Avg Score | Avg Cost | Min | Max | Count | Distinct rosters |",
+        "|----------|-----------|----------|-----|-----|-------|------------------|",
     ])
     lines.extend(strategy_desc)
 
     for strategy, stats in strategy_stats.items():
         avg_cost = stats.get("avg_cost", 0)
-        lines.append(f"| {strategy} | {stats['mean']:.1f} | ${avg_cost:,.0f} | {stats['min']} | {stats['max']} | {stats['count']} |")
+        lines.append(
+            f"| {strategy} | {stats['mean']:.1f} | ${avg_cost:,.0f} | {stats['min']} | {stats['max']} | "
+            f"{stats['count']} | {stats.get('distinct_rosters', '')} |"
+        )
 
     lines.extend([
         "",
@@ -589,15 +698,9 @@ def generate_roster_diversity_report(analysis: dict, contestants: list) -> str:
     return "\n".join(lines)
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Phase 1: Pricing Simulation")
-    parser.add_argument("--price-runs", type=int, default=2000, help="Runs for price estimation")
-    parser.add_argument("--scenario-runs", type=int, default=300, help="Scenario runs for scoring")
-    parser.add_argument("--rosters", type=int, default=25, help="Rosters per strategy (strategy mode only)")
-    parser.add_argument("--sample-rosters", type=int, default=None, help="Sample N rosters from all valid options (enables sample mode)")
-    parser.add_argument("--seed", type=int, default=42)
-    parser.add_argument("--output", "-o", type=str, default=None)
-    args = parser.parse_args()
+def run_from_args(args: argparse.Namespace) -> None:
+    """Run and summarize from parsed arguments (see cli.add_pricing_arguments)."""
+    profiler = Profiler(enabled=args.profile, cprofile=args.cprofile)
 
     if args.output is None:
         base = Path(__file__).parent.parent.parent
@@ -611,7 +714,15 @@ def main():
         sample_rosters=args.sample_rosters,
         seed=args.seed,
         output_dir=args.output,
+        resume=args.resume,
+        checkpoint_every=args.checkpoint_every,
+        profiler=profiler,
+        indexed_rosters=args.indexed_rosters,
     )
+    profiler.print_summary()
+    timings_path = profiler.write(args.output, "pricing")
+    if timings_path:
+        print(f"Timings saved to {timings_path}")
 
     print("\n" + "=" * 50)
     print("PHASE 1 SUMMARY")
@@ -627,7 +738,13 @@ def main():
     print(f"Unique rosters tested: {analysis['unique_roster_compositions']}")
     print("\nStrategy averages:")
     for s, stats in analysis["strategy_stats"].items():
-        print(f"  {s}: {stats['mean']:.1f}")
+        print(f"  {s}: {stats['mean']:.1f} ({stats.get('distinct_rosters', 0)} distinct rosters)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Phase 1: Pricing Simulation")
+    add_pricing_arguments(parser)
+    run_from_args(parser.parse_args(argv))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Re-price after trait edits (contestants_s50.yaml or --set) by reweighting a
+price bank saved with `price --save-bank`, instead of simulating new seasons.
+
+    python run_reprice.py --bank /tmp/bank.json --set c07.survival_bias=0.6
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_reprice_arguments
+from src.config import load_contestants, load_pricing
+from src.price_generator import expected_points_to_prices
+from src.reweight import MIN_ESS_FRACTION, TRAIT_KEYS, reweighted_expected_points
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Expected points and prices under edited traits, from a saved price bank instead of new seasons."""
+    with open(args.bank) as f:
+        bank = json.load(f)
+    # Loaded configs are shared objects: edit copies
+    contestants = [dict(c) for c in load_contestants()]
+    by_id = {c["id"]: c for c in contestants}
+    for item in args.set:
+        target, sep, value = item.partition("=")
+        cid, _, key = target.partition(".")
+        if not sep or cid not in by_id or key not in TRAIT_KEYS:
+            raise SystemExit(f"--set expects CID.TRAIT=VALUE with a known contestant and one of {', '.join(TRAIT_KEYS)}: {item!r}")
+        by_id[cid][key] = float(value)
+
+    start = time.perf_counter()
+    estimate = reweighted_expected_points(
+        bank, contestants, MIN_ESS_FRACTION if args.min_ess is None else args.min_ess,
+    )
+    pricing = load_pricing()
+    before = {cid: sum(points) / len(points) for cid, points in bank["points"].items()}
+    old_prices = expected_points_to_prices(before, pricing)
+    prices = expected_points_to_prices(estimate["expected_points"], pricing)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    names = {c["id"]: c.get("name", c["id"]) for c in contestants}
+    if not estimate["changes"]:
+        print("No trait changes against the bank")
+    for cid, changes in estimate["changes"].items():
+        print(f"  {names[cid]}: " + ", ".join(f"{key} {old:g} -> {new:g}" for key, (old, new) in changes.items()))
+    for cid in sorted(prices, key=lambda c: (-prices[c], c)):
+        print(f"  {names[cid]:<24} ${old_prices[cid]:>9,} -> ${prices[cid]:>9,}  "
+              f"{before[cid]:6.1f} -> {estimate['expected_points'][cid]:6.1f} pts  ± {estimate['se'][cid]:.1f}")
+    print(f"Reweighted {estimate['runs']} seasons in {elapsed:.0f} ms: effective sample size "
+          f"{estimate['ess']:,.0f} ({estimate['ess_fraction']:.0%})")
+    if estimate["warning"]:
+        print(f"WARNING: {estimate['warning']}", file=sys.stderr)
+    if args.output:
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "reprice.json", "w") as f:
+            json.dump({"prices": prices, **estimate}, f, indent=2)
+        print(f"Re-priced contestants saved to {output_dir / 'reprice.json'}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-price after trait edits by reweighting a saved price bank")
+    add_reprice_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,23 +13,18 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import yaml
-
+from cli import add_points_arguments
+from src.config import load_scoring, load_season_template, load_contestants
 from src.point_calculator import calculate_roster_points
 from src.scenario_generator import generate_scenario
 from src.roster_generator import generate_rosters_for_simulation
 from src.analyzer import analyze_results, generate_report
+from src.profiling import Profiler, NULL_PROFILER
 
 
 def load_config(config_dir: Path) -> tuple:
     """Load scoring, season, and contestant configs."""
-    with open(config_dir / "scoring.yaml") as f:
-        scoring = yaml.safe_load(f)
-    with open(config_dir / "season_template.yaml") as f:
-        season = yaml.safe_load(f)
-    with open(config_dir / "contestants_s50.yaml") as f:
-        contestants = yaml.safe_load(f)["contestants"]
-    return scoring, season["episodes"], contestants
+    return load_scoring(config_dir), load_season_template(config_dir), load_contestants(config_dir)
 
 
 def run_simulation(
@@ -37,37 +32,44 @@ def run_simulation(
     num_rosters_per_strategy: int = 20,
     seed: int = 42,
     output_dir: Path = None,
+    profiler: Profiler = None,
 ) -> dict:
     """Run full simulation and return analysis."""
+    prof = profiler or NULL_PROFILER
     config_dir = Path(__file__).parent / "config"
     scoring, season_template, contestants = load_config(config_dir)
     
     # Generate rosters
-    rosters = generate_rosters_for_simulation(
-        contestants,
-        num_per_strategy=num_rosters_per_strategy,
-        seed=seed,
-    )
+    with prof.stage("roster_generation"):
+        rosters = generate_rosters_for_simulation(
+            contestants,
+            num_per_strategy=num_rosters_per_strategy,
+            seed=seed,
+        )
     
     results = []
     for run_idx in range(num_runs):
         scenario_seed = seed + run_idx * 1000
-        episode_outcomes = generate_scenario(
-            contestants,
-            season_template,
-            seed=scenario_seed,
-            config_dir=config_dir,
-        )
+        with prof.stage("generate_scenario"):
+            episode_outcomes = generate_scenario(
+                contestants,
+                season_template,
+                seed=scenario_seed,
+                config_dir=config_dir,
+            )
+        prof.count("scenarios")
         
         for roster_data in rosters:
             roster = roster_data["roster"]
             strategy = roster_data["strategy"]
             
-            points = calculate_roster_points(
-                roster,
-                episode_outcomes,
-                scoring,
-            )
+            with prof.stage("calculate_roster_points"):
+                points = calculate_roster_points(
+                    roster,
+                    episode_outcomes,
+                    scoring,
+                )
+            prof.count("roster_scorings")
             
             results.append({
                 "roster": roster,
@@ -78,10 +80,12 @@ def run_simulation(
                 "scenario_id": run_idx,
             })
     
-    analysis = analyze_results(results)
+    with prof.stage("analysis"):
+        analysis = analyze_results(results)
     
     # Generate report
-    report = generate_report(analysis)
+    with prof.stage("report"):
+        report = generate_report(analysis)
     
     # Save outputs
     if output_dir:
@@ -104,13 +108,9 @@ def run_simulation(
     return analysis
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Survivor Fantasy Point Simulation")
-    parser.add_argument("--runs", type=int, default=500, help="Number of scenario runs")
-    parser.add_argument("--rosters", type=int, default=20, help="Rosters per strategy per run")
-    parser.add_argument("--seed", type=int, default=42, help="Random seed")
-    parser.add_argument("--output", "-o", type=str, default=None, help="Output directory")
-    args = parser.parse_args()
+def run_from_args(args: argparse.Namespace) -> None:
+    """Run and summarize from parsed arguments (see cli.add_points_arguments)."""
+    profiler = Profiler(enabled=args.profile, cprofile=args.cprofile)
     
     # Default output to survivor_fantasy/output/simulation
     if args.output is None:
@@ -123,7 +123,12 @@ def main():
         num_rosters_per_strategy=args.rosters,
         seed=args.seed,
         output_dir=args.output,
+        profiler=profiler,
     )
+    profiler.print_summary()
+    timings_path = profiler.write(args.output, "points")
+    if timings_path:
+        print(f"Timings saved to {timings_path}")
     
     print("\n" + "=" * 50)
     print("QUICK SUMMARY")
@@ -135,5 +140,11 @@ def main():
     print("\nFull report saved to output directory.")
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Survivor Fantasy Point Simulation")
+    add_points_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
 if __name__ == "__main__":
     main()
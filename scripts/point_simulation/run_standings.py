@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+League standings for user teams (reference for app/lib/leaderboard.ts).
+Loads tribe_entries and captain_picks rows (CSV or JSON), scores every team from
+the per-contestant episode points, and writes standings.csv and episode_points.csv.
+
+    python run_standings.py --entries tribe_entries.csv --captains captain_picks.csv -o /tmp/standings
+    python run_standings.py --entries teams.json --points contestant_episode_points.csv --current-episode 8
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_standings_arguments
+from src.config import load_bps, load_scoring
+from src.standings import (
+    read_rows,
+    load_teams,
+    episode_points_from_outcomes,
+    episode_points_from_rows,
+    compute_standings,
+    write_standings,
+)
+from src.profiling import Profiler, NULL_PROFILER
+
+SEED_DIR = Path(__file__).parent.parent.parent / "app" / "seed"
+
+
+def run_standings(
+    entries_path: Path,
+    captains_path: Path = None,
+    points_path: Path = None,
+    outcomes_path: Path = None,
+    current_episode: int = None,
+    phase: str = "pre_merge",
+    output_dir: Path = None,
+    profiler: Profiler = None,
+    bps: bool = False,
+) -> dict:
+    """
+    Standings from table exports; points come from points_path, else from episode outcomes
+    (with the BPS episode rank bonus when bps is set).
+    """
+    prof = profiler or NULL_PROFILER
+    config_dir = Path(__file__).parent / "config"
+    scoring = load_scoring(config_dir)
+
+    with prof.stage("load_teams"):
+        teams = load_teams(entries_path, captains_path, phase=None if phase == "all" else phase)
+    with prof.stage("episode_points"):
+        if points_path:
+            episode_points = episode_points_from_rows(read_rows(points_path))
+        else:
+            with open(outcomes_path or SEED_DIR / "episode_outcomes.json") as f:
+                episode_points = episode_points_from_outcomes(
+                    json.load(f), scoring, load_bps(config_dir) if bps else None
+                )
+    with prof.stage("compute_standings"):
+        result = compute_standings(teams, episode_points, scoring, current_episode=current_episode)
+    prof.count("teams", len(result["standings"]))
+
+    if output_dir:
+        with prof.stage("write"):
+            write_standings(result, output_dir)
+    return result
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Compute and print standings from parsed arguments (see cli.add_standings_arguments)."""
+    profiler = Profiler(enabled=args.profile, cprofile=args.cprofile)
+    start = time.perf_counter()
+    result = run_standings(
+        args.entries,
+        captains_path=args.captains,
+        points_path=args.points,
+        outcomes_path=args.outcomes,
+        bps=args.bps,
+        current_episode=args.current_episode,
+        phase=args.phase,
+        output_dir=args.output,
+        profiler=profiler,
+    )
+    elapsed = time.perf_counter() - start
+    standings = result["standings"]
+    episodes = result["episode_ids"]
+    print(f"{len(standings):,} teams through episode {episodes[-1] if episodes else 0} in {elapsed:.2f}s")
+    for r in standings[:args.top]:
+        last = r["episode_points"][-1] if r["episode_points"] else 0
+        print(f"  {r['rank']:>6}  {r['user_id']:<38} {r['total_points']:>8.1f}  ({last:+.1f}, rank {r['rank_change']:+d})")
+    profiler.print_summary()
+    if args.output:
+        print(f"Standings saved to {Path(args.output) / 'standings.csv'}")
+        profiler.write(Path(args.output), "standings")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="League standings for user teams")
+    add_standings_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Parameter sweep over pricing.yaml / dynamic_pricing.yaml keys.
+Grid or random search; every point runs against one shared scenario bank and
+results land in one table (SWEEP_RESULTS.md, sweep_results.json, sweep_results.csv).
+
+    python run_sweep.py --param price_curve=1.4,1.8,2.2 --param target_valid_pct=0.55:0.75:3
+    python run_sweep.py --space sweep.yaml --random 40 --workers 8
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_sweep_arguments
+from src.config import (
+    load_yaml,
+    load_scoring,
+    load_season_template,
+    load_contestants,
+    load_pricing,
+    load_dynamic_pricing,
+    load_probabilities,
+)
+from src.checkpoint import config_fingerprint
+from src.sweep import (
+    METRICS,
+    RANK_KEYS,
+    parse_param,
+    normalize_space,
+    grid_points,
+    random_points,
+    expected_points_for_sweep,
+    build_scenario_bank,
+    run_points,
+    rank_results,
+)
+
+
+def build_space(params: List[str], space_file: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Search space from a YAML/JSON file, then --param KEY=SPEC entries (which win)."""
+    space: Dict[str, Dict[str, Any]] = {}
+    if space_file:
+        path = Path(space_file)
+        if path.suffix == ".json":
+            with open(path) as f:
+                raw = json.load(f)
+        else:
+            raw = load_yaml(path.name, path.parent)
+        space.update(normalize_space(raw or {}))
+    for spec in params or []:
+        key, values = parse_param(spec)
+        space[key] = values
+    return space
+
+
+def run_sweep(
+    space: Dict[str, Dict[str, Any]],
+    random_samples: int = 0,
+    num_scenarios: int = 50,
+    price_runs: int = 500,
+    rosters_per_strategy: int = 3,
+    seed: int = 42,
+    workers: int = 1,
+    output_dir: Path = None,
+    use_cache: bool = True,
+    sort_by: str = "pct_with_3plus_viable",
+) -> dict:
+    """Evaluate the current config plus every point in space; returns ranked results."""
+    config_dir = Path(__file__).parent / "config"
+    scoring = load_scoring(config_dir)
+    season_template = load_season_template(config_dir)
+    contestants = load_contestants(config_dir)
+    pricing_config = load_pricing(config_dir)
+    dynamic_config = load_dynamic_pricing(config_dir)
+    probabilities = load_probabilities(config_dir)
+
+    unknown = [k for k in space if k not in pricing_config and k not in dynamic_config]
+    if unknown:
+        raise ValueError(f"Not a pricing.yaml or dynamic_pricing.yaml key: {', '.join(unknown)}")
+    if not space:
+        raise ValueError("Empty search space; pass --param KEY=VALUES or --space FILE")
+    if sort_by not in RANK_KEYS:
+        raise ValueError(f"Unknown sort metric {sort_by!r}; choose from {', '.join(RANK_KEYS)}")
+
+    points = random_points(space, random_samples, seed) if random_samples else grid_points(space)
+    points = [{}] + points  # the current config, for reference
+    cache_dir = Path(output_dir) / "cache" if output_dir and use_cache else None
+
+    print(f"Step 1: Expected points ({price_runs} runs)...")
+    expected_points, expected_key = expected_points_for_sweep(
+        contestants, season_template, scoring, probabilities, config_dir,
+        num_runs=price_runs, seed=seed, cache_dir=cache_dir,
+    )
+
+    print(f"Step 2: Building scenario bank ({num_scenarios} seasons)...")
+    bank = build_scenario_bank(contestants, season_template, probabilities, num_scenarios, seed)
+    bank_key = config_fingerprint("bank", expected_key, season_template, probabilities, num_scenarios, seed)
+
+    shared = {
+        "contestants": contestants,
+        "scoring": scoring,
+        "pricing_config": pricing_config,
+        "dynamic_config": dynamic_config,
+        "bank": bank,
+        "bank_key": bank_key,
+        "expected_points": expected_points,
+        "expected_key": expected_key,
+        "rosters_per_strategy": rosters_per_strategy,
+        "seed": seed,
+        "cache_dir": cache_dir,
+    }
+
+    print(f"Step 3: Evaluating {len(points)} points ({workers} worker{'s' if workers != 1 else ''})...")
+
+    def progress(i: int, row: Dict[str, Any]) -> None:
+        label = _point_label(row["overrides"])
+        if "skipped" in row:
+            print(f"  [{i + 1}/{len(points)}] {label}: skipped ({row['skipped']})")
+        else:
+            note = " (cached)" if row.get("cached_result") else ""
+            print(
+                f"  [{i + 1}/{len(points)}] {label}: "
+                f"viable {row['avg_viable_replacements']:.1f}, 3+ {row['pct_with_3plus_viable']:.1f}%, "
+                f"merge {row['avg_merge_valid_pct']:.1f}%, spread {row['strategy_spread']:.1f}{note}"
+            )
+
+    results = run_points(points, shared, workers=workers, on_result=progress)
+    for i, row in enumerate(results):
+        row["point"] = i
+    ranked = rank_results(results, sort_by)
+
+    sweep = {
+        "keys": list(space),
+        "space": space,
+        "mode": f"random ({random_samples})" if random_samples else "grid",
+        "num_scenarios": num_scenarios,
+        "price_runs": price_runs,
+        "rosters_per_strategy": rosters_per_strategy,
+        "seed": seed,
+        "sort_by": sort_by,
+        "current": {k: dict(pricing_config, **dynamic_config).get(k) for k in space},
+        "results": ranked,
+    }
+
+    if output_dir:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "SWEEP_RESULTS.md", "w") as f:
+            f.write(generate_sweep_report(sweep))
+        with open(output_dir / "sweep_results.json", "w") as f:
+            json.dump(sweep, f, indent=2)
+        write_results_csv(sweep, output_dir / "sweep_results.csv")
+        print(f"\nResults saved to {output_dir / 'SWEEP_RESULTS.md'}")
+
+    return sweep
+
+
+def _point_label(overrides: Dict[str, Any]) -> str:
+    if not overrides:
+        return "current config"
+    return ", ".join(f"{k}={v:g}" if isinstance(v, float) else f"{k}={v}" for k, v in overrides.items())
+
+
+def _strategies(results: List[Dict[str, Any]]) -> List[str]:
+    names: List[str] = []
+    for r in results:
+        for s in r.get("strategy_means", {}):
+            if s not in names:
+                names.append(s)
+    return names
+
+
+def write_results_csv(sweep: dict, path: Path) -> None:
+    keys = sweep["keys"]
+    strategies = _strategies(sweep["results"])
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["point"] + keys + METRICS + [f"mean_{s}" for s in strategies] + ["skipped"])
+        for r in sweep["results"]:
+            values = [r["overrides"].get(k, sweep["current"][k]) for k in keys]
+            metrics = [r.get(m, "") for m in METRICS]
+            means = [r.get("strategy_means", {}).get(s, "") for s in strategies]
+            writer.writerow([r["point"]] + values + metrics + means + [r.get("skipped", "")])
+
+
+def generate_sweep_report(sweep: dict) -> str:
+    keys = sweep["keys"]
+    lines = [
+        "# Pricing Parameter Sweep",
+        "",
+        f"**Search:** {sweep['mode']} over {', '.join(f'`{k}`' for k in keys)}  ",
+        f"**Scenario bank:** {sweep['num_scenarios']} seasons (seed {sweep['seed']}), "
+        f"expected points from {sweep['price_runs']} runs, {sweep['rosters_per_strategy']} rosters per strategy  ",
+        f"**Ranked by:** `{sweep['sort_by']}`",
+        "",
+        "Point 0 is the current config. `merge gap` is avg merge valid % minus its target; "
+        "`spread` is the best minus the worst strategy mean.",
+        "",
+        "| # | " + " | ".join(keys) + " | avg viable | 3+ viable % | min viable | merge valid % | merge gap | spread |",
+        "|---|" + "---|" * len(keys) + "---|---|---|---|---|---|",
+    ]
+    for r in sweep["results"]:
+        values = " | ".join(f"{r['overrides'].get(k, sweep['current'][k])}" for k in keys)
+        if "skipped" in r:
+            lines.append(f"| {r['point']} | {values} | skipped: {r['skipped']} | | | | | |")
+            continue
+        lines.append(
+            f"| {r['point']} | {values} | {r['avg_viable_replacements']:.2f} | {r['pct_with_3plus_viable']:.1f} | "
+            f"{r['min_viable_replacements']} | {r['avg_merge_valid_pct']:.1f} | {r['merge_valid_gap']:+.1f} | "
+            f"{r['strategy_spread']:.1f} |"
+        )
+
+    strategies = _strategies(sweep["results"])
+    if strategies:
+        lines.extend([
+            "",
+            "## Strategy means",
+            "",
+            "| # | " + " | ".join(strategies) + " |",
+            "|---|" + "---|" * len(strategies),
+        ])
+        for r in sweep["results"]:
+            if "skipped" in r:
+                continue
+            means = r.get("strategy_means", {})
+            lines.append(f"| {r['point']} | " + " | ".join(f"{means.get(s, 0):.1f}" for s in strategies) + " |")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Run the sweep from parsed arguments (see cli.add_sweep_arguments)."""
+    output_dir = args.output
+    if output_dir is None:
+        output_dir = Path(__file__).parent.parent.parent / "output" / "simulation" / "sweep"
+    space = build_space(args.param, args.space)
+    sweep = run_sweep(
+        space,
+        random_samples=args.random,
+        num_scenarios=args.scenarios,
+        price_runs=args.price_runs,
+        rosters_per_strategy=args.rosters,
+        seed=args.seed,
+        workers=args.workers or os.cpu_count() or 1,
+        output_dir=output_dir,
+        use_cache=not args.no_cache,
+        sort_by=args.sort,
+    )
+    best = next((r for r in sweep["results"] if "skipped" not in r), None)
+    if best is not None:
+        print(f"\nBest by {args.sort}: point {best['point']} ({_point_label(best['overrides'])})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parameter sweep over pricing and dynamic pricing config")
+    add_sweep_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Local what-if service: scoring, price updates and replacement checks for
+hypothetical episode outcomes, over HTTP with JSON bodies.
+
+    python run_whatif_service.py --port 8765
+    curl -s localhost:8765/what-if -d '{"voted_out": "c07", "votes": 6}'
+
+GET  /health, /state
+POST /what-if              {voted_out, votes, pocket_items, phase, episode: {...}, teams: {...}}
+POST /episode-points       same spec (or {"outcome": <full episode outcome>})
+POST /update-prices        same spec, optional prices
+POST /viable-replacements  {budget | voted_out, prices, remaining, value_tolerance}
+
+Config, prices and rest-of-season expected points load once at startup;
+requests run on a fixed thread pool and repeated requests hit an LRU.
+"""
+
+import sys
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import add_whatif_arguments
+from src.whatif import WhatIfService, load_whatif_service
+
+SEED_DIR = Path(__file__).parent.parent.parent / "app" / "seed"
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that hands each connection to a fixed-size thread pool."""
+
+    def __init__(self, address, handler_class, service: WhatIfService, workers: int = 8):
+        super().__init__(address, handler_class)
+        self.service = service
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+
+class WhatIfHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: int, body) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        path = self.path.strip("/")
+        if path == "health":
+            self._send(200, {"ok": True})
+        elif path == "state":
+            self._send(200, self.server.service.state())
+        else:
+            self._send(404, {"error": f"unknown endpoint /{path}"})
+
+    def do_POST(self):
+        path = self.path.strip("/")
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(payload, dict):
+                self._send(400, {"error": f"request body must be a JSON object, not {type(payload).__name__}"})
+                return
+            self._send(200, self.server.service.handle(path, payload))
+        except KeyError as e:
+            status = 404 if e.args and e.args[0] == path else 400
+            self._send(status, {"error": f"unknown endpoint /{path}" if status == 404 else f"missing or unknown {e}"})
+        except (ValueError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            # Anything else is a bug in the service; answer rather than drop the connection
+            self.log_error("%s failed: %r", path, e)
+            self._send(500, {"error": f"internal error: {type(e).__name__}: {e}"})
+
+    def log_message(self, format, *args):
+        if not getattr(self.server, "quiet", False):
+            super().log_message(format, *args)
+
+
+def build_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    workers: int = 8,
+    observed_path: Path = None,
+    prices_path: Path = None,
+    expected_runs: int = 200,
+    seed: int = 42,
+    cache_size: int = 1024,
+) -> PooledHTTPServer:
+    """Load the game state and bind the server (call serve_forever() to run it)."""
+    config_dir = Path(__file__).parent / "config"
+    observed_path = Path(observed_path) if observed_path else SEED_DIR / "episode_outcomes.json"
+    prices_path = Path(prices_path) if prices_path else SEED_DIR / "prices.json"
+    with open(prices_path) as f:
+        prices = json.load(f)
+    observed = []
+    if observed_path.exists():
+        with open(observed_path) as f:
+            observed = json.load(f)
+
+    service = load_whatif_service(
+        config_dir, prices, observed=observed,
+        expected_runs=expected_runs, seed=seed, cache_size=cache_size,
+    )
+    return PooledHTTPServer((host, port), WhatIfHandler, service, workers=workers)
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Serve until interrupted (see cli.add_whatif_arguments)."""
+    print(f"Loading game state (expected points from {args.runs} continuations)...")
+    server = build_server(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        observed_path=args.observed,
+        prices_path=args.prices,
+        expected_runs=args.runs,
+        seed=args.seed,
+        cache_size=args.cache_size,
+    )
+    server.quiet = args.quiet
+    state = server.service.state()
+    print(f"  {state['episodes_aired']} episodes aired, {len(state['remaining'])} contestants remaining")
+    print(f"Serving what-if queries on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local what-if scoring and pricing service")
+    add_whatif_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
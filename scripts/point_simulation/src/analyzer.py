@@ -232,7 +232,8 @@ This section explains the exact rules of each simulated game so you can verify t
 - **3% chance** (given they have an item) that they had 2 items
 
 #### Quit / Medevac
-- **Not implemented** in current simulation (quit probability ~0.02, medevac ~0.05—too rare to appear in 100 runs).
+- **2% of seasons** have a quit and **5%** a medevac (at a random tribal episode, a random remaining player). It replaces that episode's vote: no tribal, and the leaver drops out of the boot order.
+- **Quit:** -10 to the quitter; medevac scores 0. Too rare to show up reliably in a few hundred runs; `price --importance` estimates them by importance sampling.
 
 ---
 
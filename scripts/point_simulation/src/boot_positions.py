@@ -0,0 +1,228 @@
+"""
+Exact boot-position distribution and the points it decides, without simulation.
+The generator's boot order is the first-occurrence order of n survival_bias-weighted
+draws (n = number of contestants), then the undrawn contestants shuffled. By the
+exponential race (one Poisson clock per contestant), contestant c is first drawn at
+draw d + 1 with geometric probability, and the d draws before are independent
+draws among the others. c's boot position is how many distinct others those hit.
+That occupancy distribution is the coefficient table of prod_j (1 + y (e^(q_j x) - 1))
+(Poisson-binomial in y, exponential generating function in x), built one
+contestant at a time. An undrawn contestant is equally likely to be at any
+position after the drawn ones.
+expected_boot_points runs each contestant's position through the season: votes
+take the contestant ranked first among those left, a quit or medevac takes a
+uniform player (quit_medevac rates, at a uniform tribal). The result is exact
+expected survival, final tribal, win and quit points; simulated_boot_points is the
+Monte Carlo estimate to check them (and the generator) against.
+"""
+
+import math
+import random
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+from .point_calculator import calculate_roster_points
+from .scenario_generator import _build_dynamic_season_structure, _weighted_boot_order, generate_scenario
+from .stratified import STRATA, STRATUM_WEIGHTS
+
+POINT_KEYS = ("survival", "final_tribal", "win_season", "quit")
+
+
+def occupancy_distribution(weights: Sequence[float], max_draws: int) -> List[List[float]]:
+    """dist[d][k]: probability that d draws (each item with probability proportional to its weight) hit exactly k distinct items."""
+    total = sum(weights)
+    items = len(weights)
+    # egf[d][k]: coefficient of x^d y^k in prod_j (1 + y (e^(q_j x) - 1)), q_j = w_j / total
+    egf = [[0.0] * (items + 1) for _ in range(max_draws + 1)]
+    egf[0][0] = 1.0
+    for done, w in enumerate(weights):
+        q = w / total if total > 0 else 0.0
+        terms = [q ** m / math.factorial(m) for m in range(max_draws + 1)]
+        new = [row[:] for row in egf]
+        for d in range(max_draws):
+            row = egf[d]
+            for m in range(1, max_draws - d + 1):
+                target, t = new[d + m], terms[m]
+                for k in range(done + 1):
+                    if row[k]:
+                        target[k + 1] += row[k] * t
+        egf = new
+    return [[math.factorial(d) * v for v in egf[d]] for d in range(max_draws + 1)]
+
+
+def boot_position_matrix(contestants: List[Dict]) -> Dict[str, List[float]]:
+    """contestant_id -> probability of each boot position (0 = first boot), as generate_scenario draws the boot order."""
+    contestant_ids = [c["id"] for c in contestants]
+    weights = [c.get("survival_bias", 0.5) for c in contestants]
+    n, total = len(contestant_ids), sum(weights)
+    by_weight: Dict[float, List[float]] = {}
+    for i, w in enumerate(weights):
+        if w in by_weight:
+            continue
+        occupancy = occupancy_distribution(weights[:i] + weights[i + 1:], n)
+        p = w / total if total > 0 else 0.0
+        row = [0.0] * n
+        for d in range(n):
+            # First drawn at draw d + 1, behind every distinct contestant among the d draws before
+            first = p * (1.0 - p) ** d
+            for k in range(n):
+                row[k] += first * occupancy[d][k]
+        missed = (1.0 - p) ** n
+        for drawn in range(n):
+            share = missed * occupancy[n][drawn] / (n - drawn)
+            for k in range(drawn, n):
+                row[k] += share
+        by_weight[w] = row
+    return {cid: list(by_weight[w]) for cid, w in zip(contestant_ids, weights)}
+
+
+def boot_position_counts(contestants: List[Dict], samples: int, seed: Any = None) -> Dict[str, List[int]]:
+    """contestant_id -> how often each boot position came up in samples boot orders drawn as the generator does."""
+    rng = random.Random(seed)
+    contestant_ids = [c["id"] for c in contestants]
+    weights = [c.get("survival_bias", 0.5) for c in contestants]
+    counts = {cid: [0] * len(contestant_ids) for cid in contestant_ids}
+    for _ in range(samples):
+        for k, cid in enumerate(_weighted_boot_order(contestant_ids, weights, rng)):
+            counts[cid][k] += 1
+    return counts
+
+
+def _tribal_survival_points(structure: Tuple[int, int], scoring_config: Dict[str, Any]) -> List[float]:
+    """Survival points for each tribal episode (in order) of a season with this (swap_at, merge_at)."""
+    survival_cfg = scoring_config.get("survival", {})
+    pre_merge = survival_cfg.get("pre_merge_tribal", survival_cfg.get("pre_merge", 1))
+    post_merge = survival_cfg.get("post_merge", 3)
+    return [
+        pre_merge if ep["phase"] in ("pre_merge", "swap") else post_merge
+        for ep in _build_dynamic_season_structure(*structure)
+        if ep.get("tribal", True) and not ep.get("final_tribal", False)
+    ]
+
+
+def _position_points(
+    position: Sequence[float],
+    tribal_points: Sequence[float],
+    num_contestants: int,
+    quit_probability: float,
+    medevac_probability: float,
+) -> Tuple[float, float, float]:
+    """
+    (expected survival points, probability of reaching the final tribal, probability
+    of quitting) for a contestant with this boot-position distribution. The state is
+    their rank among the players left in the boot order plus which leaves are still
+    to come; a leave at a tribal with R tribals left happens there with probability
+    1/R per pending kind (uniform distinct episodes), and takes a uniform player.
+    """
+    pending_start = {
+        (True, True): quit_probability * medevac_probability,
+        (True, False): quit_probability * (1.0 - medevac_probability),
+        (False, True): (1.0 - quit_probability) * medevac_probability,
+        (False, False): (1.0 - quit_probability) * (1.0 - medevac_probability),
+    }
+    state = {(r, pending): position[r] * p for pending, p in pending_start.items() if p for r in range(num_contestants)}
+    survival = quit = 0.0
+    tribals = len(tribal_points)
+    for e, points in enumerate(tribal_points):
+        left, active = tribals - e, num_contestants - e
+        nxt: Dict[Tuple[int, Tuple[bool, bool]], float] = {}
+
+        def add(key, p):
+            nxt[key] = nxt.get(key, 0.0) + p
+
+        for (r, pending), p in state.items():
+            if not p:
+                continue
+            vote = p
+            for kind, waiting in enumerate(pending):
+                if not waiting:
+                    continue
+                here = p / left
+                vote -= here
+                after = (False, pending[1]) if kind == 0 else (pending[0], False)
+                # The leaver is uniform over the active players: this one, one ranked ahead, or one behind
+                if kind == 0:
+                    quit += here / active
+                if r > 0:
+                    add((r - 1, after), here * r / active)
+                add((r, after), here * (active - 1 - r) / active)
+            if r == 0:
+                continue
+            survival += vote * points
+            add((r - 1, pending), vote)
+        state = nxt
+    return survival, sum(state.values()), quit
+
+
+def expected_boot_points(
+    contestants: List[Dict],
+    scoring_config: Dict[str, Any],
+    probabilities: Optional[Dict[str, Any]] = None,
+    matrix: Optional[Dict[str, List[float]]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    contestant_id -> exact expected points from survival, final_tribal, win_season
+    (a third of the finalists' chances) and quit, plus their total, over the four
+    swap/merge structures and the quit / medevac rates in probabilities.
+    """
+    matrix = matrix or boot_position_matrix(contestants)
+    leave_cfg = (probabilities or {}).get("quit_medevac", {})
+    quit_p = leave_cfg.get("quit_probability", 0.0)
+    medevac_p = leave_cfg.get("medevac_probability", 0.0)
+    placement = scoring_config["placement"]
+    quit_points = scoring_config.get("other", {}).get("quit", 0)
+    tribal_points = {s: _tribal_survival_points(s, scoring_config) for s in STRATA}
+    n = len(contestants)
+    out = {}
+    for c in contestants:
+        survival = final = quit = 0.0
+        for s, w in zip(STRATA, STRATUM_WEIGHTS):
+            sv, fin, qt = _position_points(matrix[c["id"]], tribal_points[s], n, quit_p, medevac_p)
+            survival += w * sv
+            final += w * fin
+            quit += w * qt
+        points = {
+            "survival": survival,
+            "final_tribal": final * placement["final_tribal"],
+            "win_season": final / 3 * placement["win_season"],
+            "quit": quit * quit_points,
+        }
+        points["total"] = sum(points[k] for k in POINT_KEYS)
+        out[c["id"]] = points
+    return out
+
+
+def simulated_boot_points(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring_config: Dict[str, Any],
+    probabilities: Optional[Dict[str, Any]] = None,
+    num_runs: int = 2000,
+    seed: int = 42,
+) -> Dict[str, Dict[str, Tuple[float, float]]]:
+    """contestant_id -> POINT_KEYS and total -> (mean, standard error) over num_runs seasons (run i uses seed + i*1000)."""
+    contestant_ids = [c["id"] for c in contestants]
+    sums = {cid: dict.fromkeys(POINT_KEYS + ("total",), 0.0) for cid in contestant_ids}
+    squares = {cid: dict.fromkeys(POINT_KEYS + ("total",), 0.0) for cid in contestant_ids}
+    for run_idx in range(num_runs):
+        season = generate_scenario(contestants, season_template, seed=seed + run_idx * 1000, probabilities=probabilities)
+        for cid in contestant_ids:
+            result = calculate_roster_points([cid], season, scoring_config)
+            events = result["event_breakdown"]
+            values = {
+                "survival": result["survival"],
+                "final_tribal": events["final_tribal"]["points"],
+                "win_season": events["win_season"]["points"],
+                "quit": events["quit"]["points"],
+            }
+            values["total"] = sum(values.values())
+            for key, v in values.items():
+                sums[cid][key] += v
+                squares[cid][key] += v * v
+    out = {}
+    for cid in contestant_ids:
+        out[cid] = {}
+        for key, total in sums[cid].items():
+            m = total / num_runs if num_runs else 0.0
+            var = (squares[cid][key] - num_runs * m * m) / (num_runs - 1) if num_runs > 1 else 0.0
+            out[cid][key] = (m, math.sqrt(max(0.0, var) / num_runs) if num_runs else 0.0)
+    return out
@@ -0,0 +1,126 @@
+"""
+Episode Impact Bonus System (BPS), as app/lib/bps.ts. Every contestant in an
+episode (active or voted out) gets a BPS total from config/bps.yaml; only the
+episode rank bonus (top three BPS scores: +3/+2/+1 by default) reaches the main
+score. Tied contestants share a bonus and the next distinct score takes the next
+one, like getEpisodeRankBonuses. Final tribal episodes get no bonus.
+episode_bps scores the whole episode in one pass over its event lists instead of
+testing every contestant against every list.
+"""
+
+import heapq
+from typing import Dict, List, Any, Optional
+
+# bps.yaml social weights; each is a list of contestant IDs in the episode outcome
+SOCIAL_EVENTS = (
+    "inclusion_in_plan",
+    "safety_statement",
+    "vote_info_correct",
+    "advantage_info_correct",
+    "initiates_strategic",
+    "kept_commitment",
+    "swing_label",
+    "named_target_survives",
+)
+RANK_KEYS = ("first", "second", "third")
+
+
+def episode_participants(ep: Dict[str, Any]) -> List[str]:
+    """Active contestants plus the one voted out, in outcome order."""
+    participants = list(ep.get("active_contestants", []))
+    voted_out = ep.get("voted_out")
+    if voted_out and voted_out not in participants:
+        participants.append(voted_out)
+    return participants
+
+
+def episode_bps(ep: Dict[str, Any], bps_config: Dict[str, Any]) -> Dict[str, float]:
+    """contestant_id -> BPS for everyone in the episode (calculateBPSPerContestant)."""
+    scores = dict.fromkeys(episode_participants(ep), 0)
+    if not scores:
+        return scores
+    social = bps_config.get("social", {})
+    advantage = bps_config.get("advantage", {})
+    challenge = bps_config.get("challenge", {})
+    visibility = bps_config.get("visibility", {})
+
+    def credit(cids, pts) -> None:
+        if pts:
+            for cid in set(cids):
+                if cid in scores:
+                    scores[cid] += pts
+
+    # A) Social & Strategic
+    for event in SOCIAL_EVENTS:
+        credit(ep.get(event) or (), social.get(event, 0))
+
+    # B) Advantage & Risk
+    if ep.get("clue_finder"):
+        credit((ep["clue_finder"],), advantage.get("clue_found", 0))
+    credit([c for c in (ep.get("idol_finder"), ep.get("advantage_finder")) if c], advantage.get("advantage_or_idol_found", 0))
+    idol_played = ep.get("idol_played") or []
+    credit(list(idol_played) + list(ep.get("advantage_played") or []), advantage.get("advantage_or_idol_played", 0))
+    nullified = ep.get("idol_votes_nullified", 0) or 0
+    if nullified > 0:
+        credit(idol_played, advantage.get("idol_nullifies_votes", 0) * nullified)
+    # holds_idol_through_tribal needs possession tracking the outcomes do not carry (skipped in bps.ts too)
+    credit(ep.get("idol_failed") or (), advantage.get("failed_idol_play", 0))
+
+    # C) Challenge
+    if ep.get("immunity_type") == "team":
+        tribes = ep.get("contestant_tribes", {})
+        winners = [c for tribe, result in ep.get("team_immunity_results", {}).items() if result == 1
+                   for c in tribes.get(tribe, [])]
+        credit(winners, challenge.get("wins_team_immunity", 0))
+    if ep.get("immunity_type") == "individual" and ep.get("individual_immunity_winner"):
+        credit((ep["individual_immunity_winner"],), challenge.get("wins_individual_immunity", 0))
+    credit(ep.get("key_contributor") or (), challenge.get("key_contributor", 0))
+    credit(ep.get("costs_challenge") or (), challenge.get("costs_challenge", 0))
+
+    # D) Visibility
+    mid, high = visibility.get("confessionals_4_6", 0), visibility.get("confessionals_7_plus", 0)
+    for cid, count in (ep.get("confessional_counts") or {}).items():
+        if cid in scores:
+            if 4 <= count <= 6:
+                scores[cid] += mid
+            elif count >= 7:
+                scores[cid] += high
+    if ep.get("episode_narrator") is not None:
+        credit((ep["episode_narrator"],), visibility.get("episode_narrator", 0))
+    return scores
+
+
+def rank_bonus_values(bps_config: Dict[str, Any]) -> List[float]:
+    bonus = bps_config.get("episode_rank_bonus", {})
+    return [bonus.get(key, 0) for key in RANK_KEYS]
+
+
+def episode_rank_bonuses(ep: Dict[str, Any], bps_config: Dict[str, Any]) -> Dict[str, float]:
+    """
+    contestant_id -> rank bonus for one episode (only contestants who get one). The
+    top len(bonus values) distinct BPS scores are found by partial selection, not a
+    full sort; every contestant on the k-th distinct score gets the k-th bonus.
+    """
+    if ep.get("final_tribal"):
+        return {}
+    scores = episode_bps(ep, bps_config)
+    if not scores:
+        return {}
+    values = rank_bonus_values(bps_config)
+    top = heapq.nlargest(len(values), set(scores.values()))
+    bonus_for = dict(zip(top, values))
+    return {cid: bonus_for[s] for cid, s in scores.items() if s in bonus_for}
+
+
+def rank_bonuses_by_episode(
+    episode_outcomes: List[Dict[str, Any]],
+    bps_config: Optional[Dict[str, Any]],
+) -> Dict[int, Dict[str, float]]:
+    """episode_id -> contestant_id -> rank bonus for a season (getEpisodeRankBonuses); {} without a config."""
+    if not bps_config:
+        return {}
+    return {
+        ep.get("episode_id", ep_idx + 1): episode_rank_bonuses(ep, bps_config)
+        for ep_idx, ep in enumerate(episode_outcomes)
+        if not ep.get("final_tribal")
+    }
@@ -0,0 +1,265 @@
+"""
+Bulk-load files for the app's Postgres tables.
+A TableWriter streams rows to one file per table in PostgreSQL COPY text format
+(tab-separated, \\N for NULL), CSV with a header or JSON Lines (one object per
+row), through a bounded line buffer, so millions of rows never sit in memory.
+write_load_script emits the psql \\copy commands that load the COPY / CSV files
+in order.
+A SqlWriter streams rows into a .sql script instead: one inline COPY ... FROM
+stdin block (upserted through a staging table when there are conflict keys) or
+batched multi-row INSERT ... ON CONFLICT statements.
+"""
+
+import csv
+import io
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Sequence, TextIO
+
+FORMATS = ("copy", "csv", "jsonl")
+SQL_MODES = ("copy", "insert")
+EXTENSIONS = {"copy": ".copy", "csv": ".csv", "jsonl": ".jsonl"}
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_COPY_SPECIAL = re.compile(r"[\\\t\n\r]")
+
+
+def copy_value(value: Any) -> str:
+    """One field in COPY text format: NULL as \\N, booleans t/f, dicts/lists as JSON."""
+    if type(value) is str:
+        return value.translate(_COPY_ESCAPES) if _COPY_SPECIAL.search(value) else value
+    if type(value) is int:
+        return str(value)
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, separators=(",", ":"))
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def csv_value(value: Any) -> Any:
+    """One CSV field: NULL as an empty unquoted field, booleans t/f, dicts/lists as JSON."""
+    if value is None:
+        return ""
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+def sql_literal(value: Any) -> str:
+    """A SQL literal: NULL, TRUE/FALSE, numbers bare, strings and JSON single-quoted."""
+    if value is None:
+        return "NULL"
+    if value is True:
+        return "TRUE"
+    if value is False:
+        return "FALSE"
+    if type(value) in (int, float):
+        return repr(value)
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, separators=(",", ":"))
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class TableWriter:
+    """
+    Rows for one table, written to <output_dir>/<file_name><ext> in buffer_rows
+    batches. Use as a context manager; rows are tuples in `columns` order.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        table: str,
+        columns: Sequence[str],
+        fmt: str = "copy",
+        buffer_rows: int = 10000,
+        file_name: Optional[str] = None,
+    ):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown bulk format {fmt!r} (expected one of {', '.join(FORMATS)})")
+        self.table = table
+        self.columns = tuple(columns)
+        self.fmt = fmt
+        self.buffer_rows = max(1, buffer_rows)
+        self.path = Path(output_dir) / f"{file_name or table.replace('.', '_')}{EXTENSIONS[fmt]}"
+        self.rows_written = 0
+        self._buffer: List[Sequence[Any]] = []
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._file) if fmt == "csv" else None
+        if self._csv is not None:
+            self._csv.writerow(self.columns)
+
+    def write(self, row: Sequence[Any]) -> None:
+        self._buffer.append(row)
+        if len(self._buffer) >= self.buffer_rows:
+            self.flush()
+
+    def write_many(self, rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self.write(row)
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        if self._csv is not None:
+            self._csv.writerows([csv_value(v) for v in row] for row in self._buffer)
+        elif self.fmt == "jsonl":
+            columns = self.columns
+            self._file.write("".join(
+                json.dumps(dict(zip(columns, row)), separators=(",", ":")) + "\n" for row in self._buffer
+            ))
+        else:
+            self._file.write("".join("\t".join(map(copy_value, row)) + "\n" for row in self._buffer))
+        self.rows_written += len(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def load_command(self) -> str:
+        """psql \\copy for this file (run from the output directory)."""
+        if self.fmt == "jsonl":
+            raise ValueError("JSON Lines files have no \\copy command")
+        options = " WITH (FORMAT csv, HEADER true)" if self.fmt == "csv" else ""
+        return f"\\copy {self.table} ({', '.join(self.columns)}) FROM '{self.path.name}'{options}"
+
+
+class SqlWriter:
+    """
+    Rows for one table as SQL statements on an open text stream (several tables can
+    share one script). mode "copy" writes one COPY ... FROM stdin block; with
+    conflict keys the block loads a temp staging table that is then upserted in one
+    INSERT ... ON CONFLICT, so run the script inside a transaction (BEGIN/COMMIT).
+    mode "insert" writes multi-row INSERT ... ON CONFLICT statements of batch_rows
+    rows each (0 = one statement). Lines reach the stream every buffer_rows rows.
+    """
+
+    def __init__(
+        self,
+        out: TextIO,
+        table: str,
+        columns: Sequence[str],
+        mode: str = "copy",
+        conflict: Optional[Sequence[str]] = None,
+        batch_rows: int = 1000,
+        buffer_rows: int = 10000,
+    ):
+        if mode not in SQL_MODES:
+            raise ValueError(f"Unknown SQL mode {mode!r} (expected one of {', '.join(SQL_MODES)})")
+        self.out = out
+        self.table = table
+        self.columns = tuple(columns)
+        self.mode = mode
+        self.conflict = tuple(conflict or ())
+        self.batch_rows = batch_rows
+        self.buffer_rows = max(1, buffer_rows)
+        self.rows_written = 0
+        self.statements = 0
+        self._in_statement = 0  # rows in the open INSERT / COPY block
+        self._lines: List[str] = []
+        self._stage = f"_stage_{table.replace('.', '_')}"
+        self._column_list = ", ".join(self.columns)
+
+    def _on_conflict(self) -> str:
+        if not self.conflict:
+            return ""
+        updates = [c for c in self.columns if c not in self.conflict]
+        action = (
+            "DO UPDATE SET " + ", ".join(f"{c} = EXCLUDED.{c}" for c in updates) if updates else "DO NOTHING"
+        )
+        return f"\nON CONFLICT ({', '.join(self.conflict)}) {action}"
+
+    def write(self, row: Sequence[Any]) -> None:
+        lines = self._lines
+        if self.mode == "copy":
+            if not self._in_statement:
+                if self.conflict:
+                    lines.append(
+                        f"CREATE TEMP TABLE {self._stage} (LIKE {self.table} INCLUDING DEFAULTS) ON COMMIT DROP;\n"
+                    )
+                target = self._stage if self.conflict else self.table
+                lines.append(f"COPY {target} ({self._column_list}) FROM stdin;\n")
+            lines.append("\t".join(map(copy_value, row)) + "\n")
+        else:
+            if not self._in_statement:
+                lines.append(f"INSERT INTO {self.table} ({self._column_list}) VALUES\n")
+            else:
+                lines.append(",\n")
+            lines.append("(" + ", ".join(map(sql_literal, row)) + ")")
+        self._in_statement += 1
+        self.rows_written += 1
+        if self.mode == "insert" and self.batch_rows and self._in_statement >= self.batch_rows:
+            self._end_statement()
+        if len(lines) >= self.buffer_rows:
+            self.flush()
+
+    def write_many(self, rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self.write(row)
+
+    def _end_statement(self) -> None:
+        if not self._in_statement:
+            return
+        if self.mode == "copy":
+            self._lines.append("\\.\n")
+            if self.conflict:
+                self._lines.append(
+                    f"INSERT INTO {self.table} ({self._column_list})\n"
+                    f"SELECT {self._column_list} FROM {self._stage}{self._on_conflict()};\n"
+                    f"DROP TABLE {self._stage};\n"
+                )
+        else:
+            self._lines.append(self._on_conflict() + ";\n")
+        self._in_statement = 0
+        self.statements += 1
+
+    def flush(self) -> None:
+        if self._lines:
+            self.out.write("".join(self._lines))
+            self._lines.clear()
+
+    def close(self) -> None:
+        """End the open statement and flush (the stream stays open)."""
+        self._end_statement()
+        self.flush()
+
+    def __enter__(self) -> "SqlWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_load_script(output_dir: Path, writers: Iterable[TableWriter], name: str = "load.sql") -> Path:
+    """load.sql: one \\copy per table, in the given (foreign-key) order, inside one transaction."""
+    path = Path(output_dir) / name
+    out = io.StringIO()
+    out.write("-- psql -f load.sql (run from this directory)\n")
+    out.write("BEGIN;\n")
+    for writer in writers:
+        out.write(writer.load_command() + "\n")
+    out.write("COMMIT;\n")
+    path.write_text(out.getvalue())
+    return path
+
+
+def table_counts(writers: Iterable[TableWriter]) -> Dict[str, int]:
+    return {w.table: w.rows_written for w in writers}
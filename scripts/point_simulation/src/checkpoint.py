@@ -0,0 +1,73 @@
+"""
+Checkpoint files for long Monte Carlo runs.
+State is plain JSON written to a temp file and renamed over the checkpoint,
+so an interrupted write never leaves a truncated checkpoint behind.
+Each checkpoint carries a fingerprint of the run parameters and config; a
+checkpoint is only resumed by a run with the same fingerprint.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+CHECKPOINT_VERSION = 1
+
+
+def config_fingerprint(*configs: Any) -> str:
+    """Stable hash of config objects (dicts/lists loaded from YAML)."""
+    payload = json.dumps(configs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def save_checkpoint(path: Path, fingerprint: Dict[str, Any], state: Dict[str, Any]) -> None:
+    """Atomically write state to path (temp file + os.replace)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": CHECKPOINT_VERSION,
+        "fingerprint": fingerprint,
+        "state": state,
+    }
+    fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(path: Path, fingerprint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Load checkpoint state from path.
+    Returns None if no checkpoint exists; raises ValueError if the checkpoint
+    was written by a run with different parameters or config.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        payload = json.load(f)
+    if payload.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Checkpoint {path} has unsupported version {payload.get('version')}")
+    if payload.get("fingerprint") != fingerprint:
+        raise ValueError(
+            f"Checkpoint {path} was written for different run parameters or config; "
+            "delete it or rerun without --resume"
+        )
+    return payload.get("state", {})
+
+
+def clear_checkpoint(path: Path) -> None:
+    """Remove checkpoint after a run completes."""
+    path = Path(path)
+    if path.exists():
+        path.unlink()
@@ -0,0 +1,73 @@
+"""
+Rest-of-season expected points from an observed game state.
+Preseason prices come from compute_expected_points_per_contestant over whole
+seasons. Once episodes have aired, the season generator is forked from the
+observed state (remaining players, tribes, phase, boots so far) and only the
+unaired episodes are simulated and scored, so the estimate can be refreshed
+after every episode or admin edit.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from .config import load_probabilities
+from .dynamic_pricing import calculate_contestant_episode_points
+from .profiling import Profiler, NULL_PROFILER
+from .scenario_generator import generate_scenario
+
+
+def remaining_contestants(observed: List[Dict[str, Any]], contestants: List[Dict]) -> List[str]:
+    """Contestant IDs still in the game after the observed episodes (config order)."""
+    if not observed:
+        return [c["id"] for c in contestants]
+    last = observed[-1]
+    active = set(last.get("active_contestants", []))
+    for key in ("voted_out", "quit", "medevac"):
+        active.discard(last.get(key))
+    return [c["id"] for c in contestants if c["id"] in active]
+
+
+def rest_of_season_expected_points(
+    observed: List[Dict[str, Any]],
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring_config: Dict[str, Any],
+    probabilities: Optional[Dict[str, Any]] = None,
+    config_dir: Optional[Path] = None,
+    num_runs: int = 500,
+    seed: int = 42,
+    profiler: Optional[Profiler] = None,
+) -> Dict[str, float]:
+    """
+    Average points each remaining contestant scores in the unaired episodes,
+    over num_runs continuations of the observed season. With no observed
+    episodes this is the preseason estimate (same seeds and scoring as
+    compute_expected_points_per_contestant).
+    """
+    prof = profiler or NULL_PROFILER
+    if probabilities is None and config_dir is not None:
+        probabilities = load_probabilities(config_dir)
+    remaining = remaining_contestants(observed, contestants)
+    totals = {cid: 0.0 for cid in remaining}
+    if num_runs <= 0:
+        return totals
+    start = len(observed)
+
+    for run_idx in range(num_runs):
+        with prof.stage("generate_scenario"):
+            season = generate_scenario(
+                contestants,
+                season_template,
+                seed=seed + run_idx * 1000,
+                probabilities=probabilities,
+                observed=observed,
+            )
+        prof.count("scenarios")
+
+        with prof.stage("calculate_contestant_episode_points"):
+            # A solo roster's total is the sum of its per-episode points
+            for ep in season[start:]:
+                for cid in remaining:
+                    totals[cid] += calculate_contestant_episode_points(cid, ep, scoring_config)
+
+    return {cid: total / num_runs for cid, total in totals.items()}
@@ -0,0 +1,185 @@
+"""
+Cached config loading shared by the run_* scripts and the point_simulation CLI.
+Parsed YAML is memoized per process and persisted to config/.cache/parsed.pickle,
+keyed by each file's mtime and size, so repeated invocations (parameter sweeps,
+the CLI's validate command) skip both the yaml import and parsing.
+Loaded configs are shared objects: copy before modifying.
+"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+CACHE_FILENAME = "parsed.pickle"
+
+_MISSING = object()
+# config_dir -> {filename: ((mtime_ns, size), parsed)}
+_caches: Dict[str, Dict[str, Tuple[Tuple[int, int], Any]]] = {}
+
+
+def _cache_path(config_dir: Path) -> Path:
+    return config_dir / ".cache" / CACHE_FILENAME
+
+
+def _load_disk_cache(config_dir: Path) -> Dict[str, Tuple[Tuple[int, int], Any]]:
+    key = str(config_dir.resolve())
+    cache = _caches.get(key)
+    if cache is None:
+        cache = {}
+        try:
+            with open(_cache_path(config_dir), "rb") as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            pass
+        _caches[key] = cache
+    return cache
+
+
+def _save_disk_cache(config_dir: Path, cache: Dict[str, Any]) -> None:
+    """Best effort: a read-only config dir just means no cross-process cache."""
+    import tempfile
+    path = _cache_path(config_dir)
+    try:
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=CACHE_FILENAME + ".", dir=path.parent)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _parse_yaml(path: Path) -> Any:
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        return yaml.load(f, Loader=loader)
+
+
+def load_yaml(name: str, config_dir: Optional[Path] = None, default: Any = _MISSING) -> Any:
+    """
+    Parsed contents of config_dir/name, reparsed only when the file changes.
+    Returns default if the file does not exist (raises FileNotFoundError if no default).
+    """
+    config_dir = Path(config_dir) if config_dir is not None else CONFIG_DIR
+    path = config_dir / name
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        if default is _MISSING:
+            raise
+        return default
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache = _load_disk_cache(config_dir)
+    entry = cache.get(name)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    data = _parse_yaml(path)
+    cache[name] = (stamp, data)
+    _save_disk_cache(config_dir, cache)
+    return data
+
+
+def load_scoring(config_dir: Optional[Path] = None) -> Dict[str, Any]:
+    return load_yaml("scoring.yaml", config_dir)
+
+
+def load_season_template(config_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    return load_yaml("season_template.yaml", config_dir)["episodes"]
+
+
+def load_contestants(config_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    return load_yaml("contestants_s50.yaml", config_dir)["contestants"]
+
+
+def load_pricing(config_dir: Optional[Path] = None) -> Dict[str, Any]:
+    return load_yaml("pricing.yaml", config_dir)
+
+
+def load_dynamic_pricing(config_dir: Optional[Path] = None) -> Dict[str, Any]:
+    return load_yaml("dynamic_pricing.yaml", config_dir, default=None) or {}
+
+
+def load_probabilities(config_dir: Optional[Path] = None) -> Dict[str, Any]:
+    return load_yaml("probabilities.yaml", config_dir, default=None) or {}
+
+
+def load_bps(config_dir: Optional[Path] = None) -> Dict[str, Any]:
+    return load_yaml("bps.yaml", config_dir, default=None) or {}
+
+
+def _check_probabilities(node: Any, path: str, errors: List[str]) -> None:
+    """Floats in probabilities.yaml must be in [0, 1]; each x_min must not exceed its x_max."""
+    if isinstance(node, dict):
+        for k, v in node.items():
+            _check_probabilities(v, f"{path}.{k}" if path else str(k), errors)
+            if isinstance(k, str) and k.endswith("_min"):
+                upper = node.get(k[:-4] + "_max")
+                if isinstance(v, (int, float)) and isinstance(upper, (int, float)) and v > upper:
+                    errors.append(f"probabilities.yaml: {path}.{k} = {v} is above {k[:-4]}_max = {upper}")
+    elif isinstance(node, list):
+        for i, v in enumerate(node):
+            _check_probabilities(v, f"{path}[{i}]", errors)
+    elif isinstance(node, float) and not 0 <= node <= 1:
+        errors.append(f"probabilities.yaml: {path} = {node} is not a probability")
+
+
+def validate_config(config_dir: Optional[Path] = None) -> List[str]:
+    """
+    Check that the configs load and are internally consistent.
+    Returns a list of human-readable problems (empty if the config is valid).
+    """
+    errors: List[str] = []
+    try:
+        scoring = load_scoring(config_dir)
+        season_template = load_season_template(config_dir)
+        contestants = load_contestants(config_dir)
+        pricing = load_pricing(config_dir)
+        dynamic = load_dynamic_pricing(config_dir)
+        probabilities = load_probabilities(config_dir)
+    except FileNotFoundError as e:
+        return [f"missing config file: {e.filename}"]
+    except (KeyError, TypeError) as e:
+        return [f"malformed config: missing {e}"]
+    except Exception as e:  # yaml.YAMLError; yaml is imported lazily
+        return [f"unparseable config: {e}"]
+
+    if not isinstance(scoring, dict) or not scoring:
+        errors.append("scoring.yaml: expected a mapping of point values")
+    if not season_template:
+        errors.append("season_template.yaml: no episodes")
+
+    ids = [c.get("id") for c in contestants]
+    if any(not cid for cid in ids):
+        errors.append("contestants_s50.yaml: contestant without id")
+    duplicates = sorted({cid for cid in ids if cid and ids.count(cid) > 1})
+    if duplicates:
+        errors.append(f"contestants_s50.yaml: duplicate ids {', '.join(duplicates)}")
+    tribes = {c.get("starting_tribe") for c in contestants}
+    if None in tribes:
+        errors.append("contestants_s50.yaml: contestant without starting_tribe")
+    elif len(tribes) != 3:
+        errors.append(f"contestants_s50.yaml: expected 3 starting tribes, found {len(tribes)}")
+
+    merged = dict(pricing, **dynamic)
+    if merged.get("budget", 1) <= 0:
+        errors.append("pricing.yaml: budget must be positive")
+    if merged.get("price_min", 0) > merged.get("price_max", float("inf")):
+        errors.append("pricing.yaml: price_min is above price_max")
+    if merged.get("roster_min", 0) > merged.get("roster_max", float("inf")):
+        errors.append("pricing.yaml: roster_min is above roster_max")
+    if merged.get("price_increment", 1) <= 0:
+        errors.append("pricing.yaml: price_increment must be positive")
+    target = merged.get("target_valid_pct")
+    if target is not None and not 0 < target <= 1:
+        errors.append(f"pricing.yaml: target_valid_pct {target} must be in (0, 1]")
+    for key in ("replacement_value_tolerance_base", "replacement_value_tolerance_max"):
+        if key in merged and merged[key] < 0:
+            errors.append(f"dynamic_pricing.yaml: {key} must be non-negative")
+    if merged.get("replacement_value_tolerance_base", 0) > merged.get("replacement_value_tolerance_max", float("inf")):
+        errors.append("dynamic_pricing.yaml: replacement_value_tolerance_base is above _max")
+
+    _check_probabilities(probabilities, "", errors)
+    return errors
@@ -0,0 +1,214 @@
+"""
+Control variates for expected-points Monte Carlo.
+Parts of a solo season total have expectations known without simulating seasons:
+- team challenge placements are uniform rankings of the tribes, so given who is
+  in the challenge, each contestant's expected placement points are the mean over
+  places;
+- the individual immunity winner is a challenge_ability-weighted draw among the
+  active players, and the season winner a uniform pick from the final three;
+- survival, challenge attendance, the boot penalty and final-tribal points follow
+  from the contestant's boot position and the season structure, whose exact
+  distribution boot_positions.boot_position_matrix computes.
+Each season scores these controls alongside the solo totals, and the estimate is
+adjusted by the least-squares fit (variance.control_variate_mean).
+"""
+
+import math
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+from .boot_positions import boot_position_matrix
+from .config import load_probabilities
+from .price_generator import price_seasons
+from .profiling import Profiler, NULL_PROFILER
+from .scenario_generator import _build_dynamic_season_structure
+from .stratified import STRATA, STRATUM_WEIGHTS
+from .variance import control_variate_mean
+
+CONTROLS = ("boot_position", "team_challenges", "individual_immunity", "winner")
+
+
+def _team_points(table: Dict[str, Any], result: int, teams: int, last_key: Optional[str]) -> float:
+    """Placement points as point_calculator scores them (last_key: the key for the remaining places)."""
+    if result == 1:
+        return table["first"]
+    if result == 2 and teams == 3:
+        return table["second_three_team"]
+    if result == 2 and teams == 2:
+        return table.get("second_two_team", 0)
+    return table[last_key] if last_key else 0
+
+
+def _mean_team_points(table: Dict[str, Any], teams: int, last_key: Optional[str]) -> float:
+    return sum(_team_points(table, place, teams, last_key) for place in range(1, teams + 1)) / teams if teams else 0.0
+
+
+def _challenge_tables(scoring_config: Dict[str, Any]) -> Tuple[Tuple[str, str, str, Dict[str, Any], Optional[str]], ...]:
+    """(type key, results key, teams key, points table, last-place key) for team immunity and reward."""
+    return (
+        ("immunity_type", "team_immunity_results", "immunity_teams",
+         scoring_config["team_immunity"], "last_or_second_two_team"),
+        ("reward_type", "team_reward_results", "reward_teams", scoring_config["team_reward"], None),
+    )
+
+
+def boot_position_points(
+    structure: Tuple[int, int],
+    num_contestants: int,
+    scoring_config: Dict[str, Any],
+    probabilities: Optional[Dict[str, Any]] = None,
+) -> List[float]:
+    """
+    Expected points of the contestant at each boot position (0 = first boot) in a
+    season with this (swap_at, merge_at), from what the position decides: survival,
+    mean team challenge points in the episodes attended, the boot penalty at mean
+    votes, and the final-tribal points with a 1-in-3 chance of the win.
+    """
+    survival_cfg = scoring_config.get("survival", {})
+    pre_merge = survival_cfg.get("pre_merge_tribal", survival_cfg.get("pre_merge", 1))
+    post_merge = survival_cfg.get("post_merge", 3)
+    tribal = scoring_config["tribal"]
+    vote_cfg = (probabilities or {}).get("vote_counts", {})
+    mean_votes = {
+        "pre_merge": (vote_cfg.get("pre_merge_min", 4) + vote_cfg.get("pre_merge_max", 7)) / 2,
+        "post_merge": (vote_cfg.get("post_merge_min", 5) + vote_cfg.get("post_merge_max", 10)) / 2,
+    }
+    tribals = [
+        ep for ep in _build_dynamic_season_structure(*structure)
+        if ep.get("tribal", True) and not ep.get("final_tribal", False)
+    ]
+    attended, survived = [], []
+    for ep in tribals:
+        pre = ep["phase"] in ("pre_merge", "swap")
+        challenge = sum(
+            _mean_team_points(table, ep.get(teams_key, 3), last_key)
+            for type_key, _, teams_key, table, last_key in _challenge_tables(scoring_config)
+            if ep.get(type_key) == "team"
+        )
+        attended.append((challenge, mean_votes["pre_merge" if pre else "post_merge"]))
+        survived.append(pre_merge if pre else post_merge)
+    placement = scoring_config["placement"]
+    finalist = sum(survived) + sum(c for c, _ in attended) + placement["final_tribal"] + placement["win_season"] / 3
+    points = []
+    for k in range(num_contestants):
+        if k >= len(tribals):
+            points.append(finalist)
+            continue
+        _, votes = attended[k]
+        boot = tribal["voted_out_base"] + tribal["voted_out_per_vote"] * votes
+        points.append(sum(survived[:k]) + sum(c for c, _ in attended[:k + 1]) + boot)
+    return points
+
+
+def season_controls(
+    contestant_ids: Sequence[str],
+    season: List[Dict[str, Any]],
+    trace: Dict[str, Any],
+    challenge_ability: Dict[str, float],
+    scoring_config: Dict[str, Any],
+    position_points: Dict[Tuple[int, int], List[float]],
+) -> Dict[str, List[float]]:
+    """
+    contestant_id -> one value per control (CONTROLS order) for a season generated
+    with trace. Every control but boot_position is an observed draw minus its
+    expectation given everything drawn before it, so its expectation is 0.
+    """
+    position = {cid: k for k, cid in enumerate(trace["boot_order"])}
+    structure_points = position_points[tuple(trace["structure"])]
+    controls = {cid: [structure_points[position[cid]], 0.0, 0.0, 0.0] for cid in contestant_ids}
+    tables = _challenge_tables(scoring_config)
+    individual = scoring_config["individual_immunity"]
+    win = scoring_config["placement"]["win_season"]
+    for ep in season:
+        if ep.get("final_tribal"):
+            final_three = ep.get("final_three") or []
+            for cid in final_three:
+                if cid in controls:
+                    controls[cid][3] += win * ((cid == ep.get("winner")) - 1 / len(final_three))
+            continue
+        active = ep.get("active_contestants", [])
+        in_episode = list(active) + ([ep["voted_out"]] if ep.get("voted_out") else [])
+        for type_key, results_key, teams_key, table, last_key in tables:
+            if ep.get(type_key) != "team":
+                continue
+            results = ep.get(results_key, {})
+            teams = ep.get(teams_key, 3)
+            expected = _mean_team_points(table, teams, last_key)
+            tribe_of = {c: t for t in results for c in ep.get("contestant_tribes", {}).get(t, [])}
+            for cid in in_episode:
+                if cid in controls and cid in tribe_of:
+                    controls[cid][1] += _team_points(table, results[tribe_of[cid]], teams, last_key) - expected
+        winner = ep.get("individual_immunity_winner")
+        if ep.get("immunity_type") == "individual" and winner:
+            total = sum(challenge_ability.get(c, 0.5) for c in active)
+            for cid in active:
+                if cid in controls and total > 0:
+                    controls[cid][2] += individual * ((cid == winner) - challenge_ability.get(cid, 0.5) / total)
+    return controls
+
+
+def control_variate_expected_points(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring_config: Dict[str, Any],
+    config_dir: Optional[Path] = None,
+    num_runs: int = 2000,
+    seed: int = 42,
+    profiler: Optional[Profiler] = None,
+    bps_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Expected points per contestant from num_runs price_seasons (the same seasons as
+    compute_expected_points_per_contestant), adjusted by the CONTROLS, all with
+    exact expectations. Returns expected_points,
+    plain_expected_points (unadjusted), se, se_mc, vrf (summed variances, plain over
+    adjusted) and runs.
+    """
+    prof = profiler or NULL_PROFILER
+    probabilities = load_probabilities(config_dir) if config_dir is not None else None
+    contestant_ids = [c["id"] for c in contestants]
+    challenge_ability = {c["id"]: c.get("challenge_ability", 0.5) for c in contestants}
+    if num_runs <= 0:
+        return {"expected_points": {}, "plain_expected_points": {}, "se": {}, "se_mc": {}, "vrf": 1.0, "runs": 0}
+
+    position_points = {s: boot_position_points(s, len(contestant_ids), scoring_config, probabilities) for s in STRATA}
+    mean_points = [
+        sum(w * position_points[s][k] for s, w in zip(STRATA, STRATUM_WEIGHTS)) for k in range(len(contestant_ids))
+    ]
+    with prof.stage("boot_positions"):
+        matrix = boot_position_matrix(contestants)
+
+    totals = {cid: [] for cid in contestant_ids}
+    controls = {cid: [[] for _ in CONTROLS] for cid in contestant_ids}
+    seasons = price_seasons(
+        contestants, season_template, scoring_config, range(num_runs), seed=seed,
+        probabilities=probabilities, profiler=profiler, bps_config=bps_config, trace=True,
+    )
+    for _, season, trace, season_points in seasons:
+        for cid, points in season_points.items():
+            totals[cid].append(points)
+        with prof.stage("season_controls"):
+            for cid, values in season_controls(
+                contestant_ids, season, trace, challenge_ability, scoring_config, position_points,
+            ).items():
+                for series, value in zip(controls[cid], values):
+                    series.append(value)
+
+    expected, plain, se, se_mc = {}, {}, {}, {}
+    for cid in contestant_ids:
+        boot_mean = sum(p * v for p, v in zip(matrix[cid], mean_points))
+        fit = control_variate_mean(totals[cid], controls[cid], [boot_mean, 0.0, 0.0, 0.0])
+        expected[cid] = fit["estimate"]
+        plain[cid] = sum(totals[cid]) / num_runs
+        se[cid] = math.sqrt(fit["variance"])
+        se_mc[cid] = math.sqrt(fit["variance_plain"])
+    total_cv = sum(v * v for v in se.values())
+    total_mc = sum(v * v for v in se_mc.values())
+    return {
+        "expected_points": expected,
+        "plain_expected_points": plain,
+        "se": se,
+        "se_mc": se_mc,
+        "vrf": total_mc / total_cv if total_cv > 0 else 1.0,
+        "runs": num_runs,
+    }
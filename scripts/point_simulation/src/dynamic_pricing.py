@@ -4,7 +4,12 @@ Prices change based on recent episode performance so replacement scenarios
 have multiple viable options (no single obvious pick).
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Sequence, Tuple, Union
+
+from .profiling import Profiler, NULL_PROFILER
+from .registry import ContestantRegistry, Roster, get_registry, popcount
+from .roster_enumerator import count_valid_rosters, count_tribe_valid_combos, combination_count
+from .replacement_index import ReplacementIndex, adaptive_tolerance
 
 
 def _contestant_went_to_tribal(cid: str, ep: Dict[str, Any]) -> bool:
@@ -26,130 +31,142 @@ def _contestant_went_to_tribal(cid: str, ep: Dict[str, Any]) -> bool:
     return False
 
 
-def calculate_contestant_episode_points(
+def _episode_point_items(
     cid: str,
     ep: Dict[str, Any],
     scoring_config: Dict[str, Any],
-) -> float:
+) -> Iterator[Tuple[str, float]]:
     """
-    Calculate points earned by a single contestant in a single episode.
-    Used for episode-reactive price updates.
+    (category label, points) for each scoring rule that applies to one contestant in
+    one episode, in scoring order. Labels as in scoring.ts POINT_BREAKDOWN_CATEGORIES;
+    the two categories only this engine scores are "Team reward (2nd)" and "Strategic player".
     """
-    pts = 0.0
+    if cid not in ep.get("active_contestants", []) and ep.get("voted_out") != cid:
+        return
     phase = ep.get("phase", "pre_merge")
     survival = scoring_config.get("survival", {})
-    pre_merge_tribal = survival.get("pre_merge_tribal", survival.get("pre_merge", 1))
-    post_merge = survival.get("post_merge", 3)
-
-    if cid not in ep.get("active_contestants", []) and ep.get("voted_out") != cid:
-        return 0.0
+    tribal = scoring_config.get("tribal", {})
+    advantages = scoring_config.get("advantages", {})
+    tribes = ep.get("contestant_tribes", {})
 
-    # Survival: pre-merge/swap tribal = pre_merge_tribal; post-merge = post_merge
-    if ep.get("tribal", True) and not ep.get("final_tribal", False):
-        if cid in ep.get("survived", []):
-            pts += pre_merge_tribal if phase in ("pre_merge", "swap") else post_merge
+    if ep.get("tribal", True) and not ep.get("final_tribal", False) and cid in ep.get("survived", []):
+        if phase in ("pre_merge", "swap"):
+            yield "Survival", survival.get("pre_merge_tribal", survival.get("pre_merge", 1))
+        else:
+            yield "Survival", survival.get("post_merge", 3)
 
-    # Team immunity
     if ep.get("immunity_type") == "team":
-        team_result = ep.get("team_immunity_results", {})
-        for tribe, result in team_result.items():
-            if cid in ep.get("contestant_tribes", {}).get(tribe, []):
+        immunity = scoring_config["team_immunity"]
+        for tribe, result in ep.get("team_immunity_results", {}).items():
+            if cid in tribes.get(tribe, []):
                 if result == 1:
-                    pts += scoring_config["team_immunity"]["first"]
+                    yield "Team immunity (1st)", immunity["first"]
                 elif result == 2 and ep.get("immunity_teams", 3) == 3:
-                    pts += scoring_config["team_immunity"]["second_three_team"]
+                    yield "Team immunity (2nd)", immunity["second_three_team"]
                 elif result == 2 and ep.get("immunity_teams", 2) == 2:
-                    pts += scoring_config["team_immunity"].get("second_two_team", 0)
+                    yield "Team immunity (2nd)", immunity.get("second_two_team", 0)
                 else:
-                    pts += scoring_config["team_immunity"]["last_or_second_two_team"]
+                    yield "Team immunity (last)", immunity["last_or_second_two_team"]
                 break
 
-    # Team reward
     if ep.get("reward_type") == "team":
-        reward_result = ep.get("team_reward_results", {})
-        for tribe, result in reward_result.items():
-            if cid in ep.get("contestant_tribes", {}).get(tribe, []):
+        reward = scoring_config["team_reward"]
+        for tribe, result in ep.get("team_reward_results", {}).items():
+            if cid in tribes.get(tribe, []):
                 if result == 1:
-                    pts += scoring_config["team_reward"]["first"]
+                    yield "Team reward (1st)", reward["first"]
                 elif result == 2 and ep.get("reward_teams", 3) == 3:
-                    pts += scoring_config["team_reward"]["second_three_team"]
+                    yield "Team reward (2nd)", reward["second_three_team"]
                 elif result == 2 and ep.get("reward_teams", 2) == 2:
-                    pts += scoring_config["team_reward"].get("second_two_team", 0)
+                    yield "Team reward (2nd)", reward.get("second_two_team", 0)
                 break
 
-    # Individual immunity
     if ep.get("immunity_type") == "individual" and ep.get("individual_immunity_winner") == cid:
-        pts += scoring_config["individual_immunity"]
-
-    # Vote matched (only if contestant went to tribal - their tribe lost immunity)
-    if _contestant_went_to_tribal(cid, ep) and cid in ep.get("vote_matched", []):
-        pts += scoring_config["tribal"].get("vote_matched", 1)
-
-    # Correct target vote
-    correct_target = scoring_config.get("tribal", {}).get("correct_target_vote", 0)
-    if correct_target and ep.get("voted_out") and ep.get("vote_targets", {}).get(cid) == ep.get("voted_out"):
-        pts += correct_target
+        yield "Individual immunity", scoring_config["individual_immunity"]
 
-    # Zero votes received
-    zero_votes = scoring_config.get("tribal", {}).get("zero_votes_received", 0)
-    if zero_votes and _contestant_went_to_tribal(cid, ep) and ep.get("votes_received", {}).get(cid, 0) == 0:
-        pts += zero_votes
+    went_to_tribal = _contestant_went_to_tribal(cid, ep)
+    if went_to_tribal and cid in ep.get("vote_matched", []):
+        yield "Vote matched", tribal.get("vote_matched", 1)
+    if ep.get("voted_out") and ep.get("vote_targets", {}).get(cid) == ep.get("voted_out"):
+        yield "Correct target vote", tribal.get("correct_target_vote", 0)
+    if went_to_tribal and ep.get("votes_received", {}).get(cid, 0) == 0:
+        yield "Zero votes received", tribal.get("zero_votes_received", 0)
 
-    # Voted out
     if ep.get("voted_out") == cid:
-        base = scoring_config["tribal"]["voted_out_base"]
-        per_vote = scoring_config["tribal"]["voted_out_per_vote"]
-        pocket_mult = scoring_config["tribal"]["voted_out_pocket_multiplier"]
         items = ep.get("voted_out_pocket_items", 0)
         votes = ep.get("voted_out_votes", 0)
-        pts += base * (pocket_mult ** items) + (per_vote * votes)
+        pocket_mult = tribal["voted_out_pocket_multiplier"]
+        yield "Voted out", tribal["voted_out_base"] * (pocket_mult ** items) + tribal["voted_out_per_vote"] * votes
 
-    # Confessionals
     confessionals = scoring_config.get("confessionals", {})
     if confessionals:
         cc = ep.get("confessional_counts", {}).get(cid, 0)
         if 4 <= cc <= 6:
-            pts += confessionals.get("range_4_6", 0)
+            yield "Confessionals (4-6)", confessionals.get("range_4_6", 0)
         if cc >= 7:
-            pts += confessionals.get("range_7_plus", 0)
+            yield "Confessionals (7+)", confessionals.get("range_7_plus", 0)
 
-    # Advantages
     if cid in ep.get("clue_readers", []):
-        pts += scoring_config["advantages"].get("clue_read", 2)
+        yield "Clue read", advantages.get("clue_read", 2)
     if cid in ep.get("advantage_played", []):
-        pts += scoring_config["advantages"].get("advantage_play", 5)
+        yield "Advantage played", advantages.get("advantage_play", 5)
     if cid in ep.get("idol_played", []):
-        per_vote = scoring_config["advantages"].get("idol_play_per_vote")
+        per_vote = advantages.get("idol_play_per_vote")
         if per_vote is not None:
-            nullified = ep.get("idol_votes_nullified", ep.get("voted_out_votes", 0))
-            pts += per_vote * nullified
+            yield "Idol played", per_vote * ep.get("idol_votes_nullified", ep.get("voted_out_votes", 0))
         else:
-            pts += scoring_config["advantages"].get("idol_play", 8)
+            yield "Idol played", advantages.get("idol_play", 8)
     if cid in ep.get("idol_failed", []):
-        pts += scoring_config["advantages"]["idol_failure"]
-    if _contestant_went_to_tribal(cid, ep) and cid in ep.get("strategic_player", []):
-        pts += scoring_config["advantages"]["strategic_player"]
+        yield "Idol failed", advantages["idol_failure"]
+    if went_to_tribal and cid in ep.get("strategic_player", []):
+        yield "Strategic player", advantages["strategic_player"]
 
     if ep.get("quit") == cid:
-        pts += scoring_config["other"]["quit"]
+        yield "Quit", scoring_config["other"]["quit"]
+
+    if ep.get("final_tribal") and cid in ep.get("final_three", []):
+        yield "Final tribal", scoring_config["placement"]["final_tribal"]
+        if cid == ep.get("winner"):
+            yield "Win season", scoring_config["placement"]["win_season"]
+
+
+def calculate_contestant_episode_points(
+    cid: str,
+    ep: Dict[str, Any],
+    scoring_config: Dict[str, Any],
+) -> float:
+    """
+    Calculate points earned by a single contestant in a single episode.
+    Used for episode-reactive price updates.
+    """
+    return float(sum(pts for _, pts in _episode_point_items(cid, ep, scoring_config)))
 
-    if ep.get("final_tribal"):
-        if cid in ep.get("final_three", []):
-            pts += scoring_config["placement"]["final_tribal"]
-            if cid == ep.get("winner"):
-                pts += scoring_config["placement"]["win_season"]
 
-    return pts
+def calculate_contestant_episode_breakdown(
+    cid: str,
+    ep: Dict[str, Any],
+    scoring_config: Dict[str, Any],
+) -> Dict[str, float]:
+    """
+    calculate_contestant_episode_points split by category: label -> points, non-zero
+    categories only. The values always sum to calculate_contestant_episode_points.
+    """
+    out: Dict[str, float] = {}
+    for label, pts in _episode_point_items(cid, ep, scoring_config):
+        if pts:
+            out[label] = out.get(label, 0) + pts
+    return out
 
 
 def update_prices_from_episode(
-    prior_prices: Dict[str, int],
+    prior_prices: Union[Dict[str, int], List[int]],
     episode_outcome: Dict[str, Any],
     scoring_config: Dict[str, Any],
     config: Dict[str, Any],
     episode_index: Optional[int] = None,
     tribal_episode_count: Optional[int] = None,
-) -> Dict[str, int]:
+    registry: Optional[ContestantRegistry] = None,
+) -> Union[Dict[str, int], List[int]]:
     """
     Update prices based on episode performance (demand-based).
     - Strong performers (above avg points): demand up → price goes up
@@ -158,7 +175,31 @@ def update_prices_from_episode(
     - Diversity compression (if > 0): pulls toward median; set to 0 for full differentiation.
     - Season inflation (if merge_multiplier > 1): optional; 1.0 = disabled.
     - Eliminated (voted-out) contestants: prices are frozen; no further changes after they leave.
+    With a registry, prior_prices is a registry-indexed price array (registry.array)
+    and the result is one too.
     """
+    if registry is not None:
+        updated = _updated_prices(
+            registry.ids, prior_prices, episode_outcome, scoring_config, config, episode_index, tribal_episode_count,
+        )
+        return list(prior_prices) if updated is None else updated
+    ids = list(prior_prices)
+    updated = _updated_prices(
+        ids, list(prior_prices.values()), episode_outcome, scoring_config, config, episode_index, tribal_episode_count,
+    )
+    return dict(prior_prices) if updated is None else dict(zip(ids, updated))
+
+
+def _updated_prices(
+    ids: Sequence[str],
+    prior: Sequence[int],
+    episode_outcome: Dict[str, Any],
+    scoring_config: Dict[str, Any],
+    config: Dict[str, Any],
+    episode_index: Optional[int],
+    tribal_episode_count: Optional[int],
+) -> Optional[List[int]]:
+    """update_prices_from_episode on positional prices (prior[k] is ids[k]'s); None if nobody played."""
     reactivity = config.get("price_reactivity", 0.05)
     base_min = config.get("price_min", 80000)
     base_max = config.get("price_max", 260000)
@@ -182,37 +223,32 @@ def update_prices_from_episode(
         ep_pts[cid] = calculate_contestant_episode_points(cid, episode_outcome, scoring_config)
 
     if not ep_pts:
-        return dict(prior_prices)
+        return None
 
     avg_pts = sum(ep_pts.values()) / len(ep_pts)
     pts_range = max(1.0, max(ep_pts.values()) - min(ep_pts.values()))
 
+    # Positions of the contestants who played this episode (still in game + voted out this ep);
+    # everyone else is eliminated and their price is frozen
+    playing = [k for k, cid in enumerate(ids) if cid in ep_pts]
+
     # Price delta: (pts - avg) / pts_range * reactivity
     # Clamp delta to avoid wild swings
-    new_prices = {}
-    for cid, prior in prior_prices.items():
-        if cid not in ep_pts:
-            new_prices[cid] = prior
-            continue
-        pts = ep_pts[cid]
-        delta_norm = (pts - avg_pts) / pts_range if pts_range > 0 else 0
+    new_prices = list(prior)
+    for k in playing:
+        delta_norm = (ep_pts[ids[k]] - avg_pts) / pts_range if pts_range > 0 else 0
         delta_norm = max(-1, min(1, delta_norm))
         # Apply reactivity: price moves by up to ±reactivity
         change_pct = delta_norm * reactivity
-        new_val = prior * (1 + change_pct)
-        new_prices[cid] = new_val
-
-    # Eliminated contestants: freeze prices (no changes after voted out)
-    # active = contestants who participated this episode (still in game + voted out this ep)
-    eliminated = {cid for cid in prior_prices if cid not in active}
+        new_prices[k] = prior[k] * (1 + change_pct)
 
     # Diversity compression: pull prices toward median (only for active contestants)
     if diversity_compression > 0:
-        vals = [new_prices[c] for c in active if new_prices.get(c, 0) > 0]
+        vals = [new_prices[k] for k in playing if new_prices[k] > 0]
         if vals:
             median = sorted(vals)[len(vals) // 2]
-            for cid in active:
-                new_prices[cid] = new_prices[cid] * (1 - diversity_compression) + median * diversity_compression
+            for k in playing:
+                new_prices[k] = new_prices[k] * (1 - diversity_compression) + median * diversity_compression
 
     # Season inflation: only apply when merge_multiplier > 1 (1.0 = disabled, demand-based only)
     # Only for active contestants; eliminated prices stay frozen
@@ -221,8 +257,8 @@ def update_prices_from_episode(
     tribals = tribal_episode_count if tribal_episode_count is not None else (episode_index + 1 if episode_index is not None else 1)
     if voted_out and merge_episodes > 0 and merge_multiplier > 1:
         inflation_factor = merge_multiplier ** (1.0 / merge_episodes)
-        for cid in active:
-            new_prices[cid] = new_prices[cid] * inflation_factor
+        for k in playing:
+            new_prices[k] = new_prices[k] * inflation_factor
 
     # Bounds: scale with season progress only when inflation is active; otherwise fixed
     # Only for active contestants; eliminated prices stay frozen
@@ -230,16 +266,11 @@ def update_prices_from_episode(
     price_min = base_min * (1 + progress)
     price_max = base_max * (1 + progress)
 
-    # Build result: active contestants get rounded/clamped; eliminated keep prior price
-    result = {}
-    for cid, prior in prior_prices.items():
-        if cid in eliminated:
-            result[cid] = prior  # Frozen: no change after voted out
-        else:
-            p = new_prices[cid]
-            rounded = round(p / increment) * increment
-            result[cid] = int(max(price_min, min(price_max, rounded)))
-
+    # Active contestants get rounded/clamped; eliminated keep prior price
+    result = list(prior)
+    for k in playing:
+        rounded = round(new_prices[k] / increment) * increment
+        result[k] = int(max(price_min, min(price_max, rounded)))
     return result
 
 
@@ -253,42 +284,35 @@ def _adaptive_value_tolerance(
     Preserves strategic tension while reducing "one obvious pick" outcomes.
     """
     base = config.get("replacement_value_tolerance_base", 0.10)
-    max_tol = config.get("replacement_value_tolerance_max", 0.18)
-    late_threshold = config.get("late_season_threshold", 12)
-    compressed_ratio = config.get("highly_compressed_ratio", 0.35)
-
-    tolerance = base
     if not affordable_prices:
         return base
 
     price_range = max(affordable_prices) - min(affordable_prices)
     median = sorted(affordable_prices)[len(affordable_prices) // 2]
-    compression_ratio = (price_range / median) if median > 0 else 1.0
-
-    # Widen when highly compressed (similar prices = harder to differentiate)
-    if compression_ratio < compressed_ratio:
-        tolerance = min(max_tol, base + 0.05)
-
-    # Widen when late-season (fewer options = need broader "viable" band)
-    if remaining_count < late_threshold:
-        tolerance = min(max_tol, tolerance + 0.04)
-
-    return min(max_tol, tolerance)
+    return adaptive_tolerance(price_range, median, remaining_count, config)
 
 
 def count_viable_replacements(
-    replacement_pool: List[str],
-    prices: Dict[str, int],
-    expected_points: Dict[str, float],
+    replacement_pool: Roster,
+    prices: Union[Dict[str, int], Sequence[int]],
+    expected_points: Union[Dict[str, float], Sequence[float]],
     budget_available: int,
     value_tolerance: Optional[float] = None,
     config: Optional[Dict[str, Any]] = None,
+    registry: Optional[ContestantRegistry] = None,
 ) -> Dict[str, Any]:
     """
     Count how many replacement options are "viable" (within value_tolerance of best).
     Value tolerance is adaptive: widens when prices are compressed or late-season.
+    With a registry, replacement_pool may be a bitmask or index list (candidates in
+    registry order) and prices / expected_points are registry arrays; viable still
+    lists contestant IDs.
     """
-    affordable = [(c, prices.get(c, 0), expected_points.get(c, 0)) for c in replacement_pool if prices.get(c, 0) <= budget_available]
+    if registry is not None:
+        candidates = [(registry.ids[i], prices[i], expected_points[i]) for i in registry.indices(replacement_pool)]
+    else:
+        candidates = [(c, prices.get(c, 0), expected_points.get(c, 0)) for c in replacement_pool]
+    affordable = [(c, p, ep) for c, p, ep in candidates if p <= budget_available]
     if not affordable:
         return {"count": 0, "best_value": 0, "viable": [], "all_options": 0, "affordable_count": 0}
 
@@ -296,7 +320,7 @@ def count_viable_replacements(
     if value_tolerance is None and config:
         affordable_prices = [p for _, p, _ in affordable]
         value_tolerance = _adaptive_value_tolerance(
-            affordable_prices, len(replacement_pool), config
+            affordable_prices, len(candidates), config
         )
     elif value_tolerance is None:
         value_tolerance = 0.10
@@ -315,3 +339,174 @@ def count_viable_replacements(
         "affordable_count": len(affordable),
         "value_tolerance_used": value_tolerance,
     }
+
+
+def simulate_replacement_events(
+    episode_outcomes: List[Dict[str, Any]],
+    prices: Dict[str, int],
+    expected_points: Dict[str, float],
+    contestants: List[Dict],
+    scoring_config: Dict[str, Any],
+    config: Dict[str, Any],
+    scenario_index: int = 0,
+    profiler: Optional[Profiler] = None,
+    landscape_budgets: Optional[List[int]] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, int]]]:
+    """
+    Walk one season's price path and record, after each vote-off, how many
+    replacements are viable; at 10-12 players left also record the % of
+    tribe-valid 7-player combos under merge_budget.
+    config is pricing.yaml merged with dynamic_pricing.yaml.
+    With landscape_budgets, each event also gets viable_by_budget: the viable
+    count had each of those budgets been freed (see summarize_replacement_landscape).
+    Returns (replacement events, price history starting with the initial prices).
+    """
+    prof = profiler or NULL_PROFILER
+    merge_budget = config.get("merge_budget", config.get("budget", 1_000_000))
+    # Prices, expected points and the replacement pool as registry arrays and bitmasks;
+    # the price history is reported by contestant ID
+    registry = get_registry(contestants)
+    price_array = registry.array(prices)
+    expected_array = registry.array(expected_points)
+    price_history = [dict(prices)]
+    events: List[Dict[str, Any]] = []
+
+    for ep_idx, ep in enumerate(episode_outcomes):
+        if ep.get("final_tribal"):
+            break
+
+        voted_out = ep.get("voted_out")
+        if not voted_out:
+            continue
+
+        # Budget freed = what the team had tied up in that player (pre-update price)
+        budget_freed = price_array[registry.index[voted_out]] if voted_out in registry else 100000
+
+        with prof.stage("update_prices"):
+            price_array = update_prices_from_episode(
+                price_array, ep, scoring_config, config,
+                episode_index=ep_idx,
+                tribal_episode_count=ep_idx + 1,
+                registry=registry,
+            )
+        prof.count("price_updates")
+        current_prices = registry.to_dict(price_array)
+        price_history.append(current_prices)
+
+        # Replacement pool = everyone still in the game
+        remaining = registry.mask(ep.get("active_contestants", []))
+        if not remaining:
+            continue
+
+        # Expected points for remaining (use initial - in practice would update)
+        with prof.stage("replacement_checks"):
+            index = ReplacementIndex(remaining, price_array, expected_array, registry=registry)
+            viable = index.query(budget_freed, config=config)
+            by_budget = [index.viable_count(b, config=config) for b in landscape_budgets or []]
+
+        event = {
+            "scenario": scenario_index,
+            "episode": ep_idx + 1,
+            "voted_out": voted_out,
+            "viable_count": viable["count"],
+            "best_value": viable["best_value"],
+            "affordable_count": viable.get("affordable_count", viable.get("all_options", 0)),
+            "viable_ids": [x[0] for x in viable["viable"]],
+        }
+        if landscape_budgets:
+            event["viable_by_budget"] = by_budget
+        events.append(event)
+
+        # Merge validation: when 10-12 players left, compute valid combo %
+        if popcount(remaining) in (10, 11, 12):
+            remaining_contestants = [c for c in contestants if registry.has(remaining, c["id"])]
+            if len(remaining_contestants) >= 7:
+                with prof.stage("roster_enumeration"):
+                    valid_counts = count_valid_rosters(
+                        remaining_contestants, current_prices, merge_budget,
+                        roster_min=7, roster_max=7,
+                    )
+                    total_tribe_valid = count_tribe_valid_combos(
+                        remaining_contestants, roster_min=7, roster_max=7,
+                    )
+                prof.count("enumerated_combos", 2 * combination_count(len(remaining_contestants), 7, 7))
+                merge_valid = valid_counts["total"]
+                event["merge_valid_pct"] = 100 * merge_valid / total_tribe_valid if total_tribe_valid > 0 else 0
+                event["merge_valid_count"] = merge_valid
+                event["merge_total_tribe_valid"] = total_tribe_valid
+
+    return events, price_history
+
+
+def price_history_by_episode(
+    episode_outcomes: List[Dict[str, Any]],
+    prices: Dict[str, int],
+    scoring_config: Dict[str, Any],
+    config: Dict[str, Any],
+) -> List[Dict[str, int]]:
+    """
+    Prices going into each episode: entry k is the price table for episode k + 1,
+    after every vote-off before it (the contestant_episode_prices view of a season).
+    """
+    current_prices = dict(prices)
+    by_episode = []
+    final = False
+    for ep_idx, ep in enumerate(episode_outcomes):
+        by_episode.append(current_prices)
+        if ep.get("final_tribal"):
+            final = True
+        if ep.get("voted_out") and not final:
+            current_prices = update_prices_from_episode(
+                current_prices, ep, scoring_config, config,
+                episode_index=ep_idx, tribal_episode_count=ep_idx + 1,
+            )
+    return by_episode
+
+
+def summarize_replacement_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate replacement diversity and merge budget pressure over events."""
+    viable_counts = [r["viable_count"] for r in events]
+    merge_events = [r for r in events if "merge_valid_pct" in r]
+    n = len(viable_counts)
+    return {
+        "replacement_events": n,
+        "avg_viable_replacements": sum(viable_counts) / n if n else 0,
+        "min_viable_replacements": min(viable_counts) if n else 0,
+        "pct_with_3plus_viable": 100 * sum(1 for v in viable_counts if v >= 3) / n if n else 0,
+        "merge_events": len(merge_events),
+        "avg_merge_valid_pct": (
+            sum(r["merge_valid_pct"] for r in merge_events) / len(merge_events) if merge_events else 0
+        ),
+    }
+
+
+def landscape_budget_tiers(config: Dict[str, Any], tiers: int = 5) -> List[int]:
+    """Evenly spaced freed budgets from price_min to price_max, rounded to price_increment."""
+    low = config.get("price_min", 100000)
+    high = config.get("price_max", 260000)
+    increment = config.get("price_increment", 5000) or 1
+    if tiers < 2 or high <= low:
+        return [low]
+    return [int(round((low + (high - low) * t / (tiers - 1)) / increment) * increment) for t in range(tiers)]
+
+
+def summarize_replacement_landscape(events: List[Dict[str, Any]], budgets: List[int]) -> List[Dict[str, Any]]:
+    """
+    Replacement landscape by episode: for each freed budget in budgets, the average
+    viable count and % of vote-offs with no viable replacement (events need viable_by_budget).
+    """
+    by_episode: Dict[int, List[List[int]]] = {}
+    for e in events:
+        if "viable_by_budget" in e:
+            by_episode.setdefault(e["episode"], []).append(e["viable_by_budget"])
+    rows = []
+    for episode in sorted(by_episode):
+        counts = by_episode[episode]
+        n = len(counts)
+        rows.append({
+            "episode": episode,
+            "events": n,
+            "avg_viable": [sum(c[j] for c in counts) / n for j in range(len(budgets))],
+            "pct_none_viable": [100 * sum(1 for c in counts if c[j] == 0) / n for j in range(len(budgets))],
+        })
+    return rows
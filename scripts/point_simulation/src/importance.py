@@ -0,0 +1,173 @@
+"""
+Importance sampling for rare, high-impact season events: quits, medevacs,
+two-item pocket boots and idol plays at chosen tribals. Seasons are drawn with
+those events over-sampled (generate_tilted_scenario) and every result is weighted
+by the season's likelihood ratio. The estimates stay unbiased for the nominal
+probabilities, while the events turn up in a large share of the runs instead of
+a handful.
+"""
+
+import math
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Tuple
+
+from .config import load_probabilities
+from .price_generator import price_seasons
+from .profiling import Profiler
+from .scenario_generator import generate_tilted_scenario
+
+RARE_EVENTS = ("quit", "medevac", "two_item_pocket", "idol_play")
+# Moderate by design: the season weight multiplies every tilted draw's ratio (one per
+# pocket item boot), so strong tilts collapse the effective sample size
+DEFAULT_TILT = {"quit_probability": 0.15, "medevac_probability": 0.2, "probability_two_items": 0.12}
+TAIL_QUANTILES = (0.001, 0.01, 0.05, 0.5, 0.95, 0.99)
+
+
+def parse_tilt(items: Iterable[str]) -> Dict[str, Any]:
+    """KEY=VALUE strings: numbers, or comma-separated episode numbers for idol_play_episodes."""
+    tilt: Dict[str, Any] = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got {item!r}")
+        key = key.strip()
+        tilt[key] = [int(v) for v in value.split(",") if v.strip()] if key == "idol_play_episodes" else float(value)
+    return tilt
+
+
+def rare_event_points(
+    season: List[Dict[str, Any]],
+    scoring_config: Dict[str, Any],
+    idol_episodes: Sequence[int] = (),
+) -> Dict[str, Tuple[int, float]]:
+    """
+    event -> (count, points scored from it, summed over contestants) in one season.
+    two_item_pocket points are the boot penalty beyond an empty pocket; idol_play
+    counts only plays at idol_episodes (episode numbers; every play when empty).
+    Medevacs score nothing themselves.
+    """
+    tribal = scoring_config["tribal"]
+    advantages = scoring_config["advantages"]
+    events = {name: [0, 0.0] for name in RARE_EVENTS}
+    for ep_idx, ep in enumerate(season):
+        if ep.get("quit"):
+            events["quit"][0] += 1
+            events["quit"][1] += scoring_config["other"]["quit"]
+        if ep.get("medevac"):
+            events["medevac"][0] += 1
+        if ep.get("voted_out") and ep.get("voted_out_pocket_items", 0) == 2:
+            base, mult = tribal["voted_out_base"], tribal["voted_out_pocket_multiplier"]
+            events["two_item_pocket"][0] += 1
+            events["two_item_pocket"][1] += base * mult ** 2 - base
+        if ep.get("idol_played") and (not idol_episodes or ep_idx + 1 in idol_episodes):
+            per_vote = advantages.get("idol_play_per_vote")
+            nullified = ep.get("idol_votes_nullified", ep.get("voted_out_votes", 0))
+            pts = per_vote * nullified if per_vote is not None else advantages.get("idol_play", 8)
+            events["idol_play"][0] += len(ep["idol_played"])
+            events["idol_play"][1] += pts * len(ep["idol_played"])
+    return {name: (count, points) for name, (count, points) in events.items()}
+
+
+def weighted_quantiles(values: Sequence[float], weights: Sequence[float], quantiles: Sequence[float]) -> Dict[float, float]:
+    """Quantiles of the weighted sample (self-normalized weights)."""
+    pairs = sorted(zip(values, weights))
+    total = sum(weights)
+    out = {}
+    cumulative, i = 0.0, 0
+    for q in sorted(quantiles):
+        while i < len(pairs) - 1 and cumulative + pairs[i][1] < q * total:
+            cumulative += pairs[i][1]
+            i += 1
+        out[q] = pairs[i][0] if pairs else 0.0
+    return out
+
+
+def _weighted_stats(values: Sequence[float], weights: Sequence[float]) -> Tuple[float, float, float]:
+    """(estimate, its variance, plain Monte Carlo variance for the same runs) of E_p[value]."""
+    n = len(values)
+    terms = [w * v for v, w in zip(values, weights)]
+    estimate = sum(terms) / n
+    var_is = sum((t - estimate) ** 2 for t in terms) / (n - 1) / n if n > 1 else 0.0
+    second = sum(w * v * v for v, w in zip(values, weights)) / n
+    return estimate, var_is, max(0.0, second - estimate ** 2) / n
+
+
+def importance_expected_points(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring_config: Dict[str, Any],
+    config_dir: Optional[Path] = None,
+    num_runs: int = 2000,
+    seed: int = 42,
+    tilt: Optional[Dict[str, Any]] = None,
+    profiler: Optional[Profiler] = None,
+    bps_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Expected points and rare-event rates from num_runs tilted seasons (tilt defaults
+    to DEFAULT_TILT, drawn as price_seasons with the tilt), each weighted by its
+    likelihood ratio.
+    Returns expected_points and se per contestant; events (per season: count and
+    points with SEs, seasons sampled with the event, and vrf against plain Monte Carlo);
+    tails (weighted quantiles of solo season totals); ess (Kish effective sample size
+    of the weights); vrf (summed expected-point variances, plain over weighted); runs.
+    """
+    tilt = dict(DEFAULT_TILT if tilt is None else tilt)
+    probabilities = load_probabilities(config_dir) if config_dir is not None else None
+    contestant_ids = [c["id"] for c in contestants]
+    idol_episodes = tuple(tilt.get("idol_play_episodes", ()))
+    weights: List[float] = []
+    totals = {cid: [] for cid in contestant_ids}
+    counts = {name: [] for name in RARE_EVENTS}
+    points = {name: [] for name in RARE_EVENTS}
+
+    def tilted(run_idx: int, run_seed: int, trace: Dict[str, Any]) -> List[Dict[str, Any]]:
+        season, trace["likelihood_ratio"] = generate_tilted_scenario(
+            contestants, season_template, tilt, seed=run_seed, probabilities=probabilities,
+        )
+        return season
+
+    for _, season, trace, season_points in price_seasons(
+        contestants, season_template, scoring_config, range(num_runs), seed=seed,
+        profiler=profiler, bps_config=bps_config, draw=tilted,
+    ):
+        weights.append(trace["likelihood_ratio"])
+        for cid, pts in season_points.items():
+            totals[cid].append(pts)
+        for name, (count, pts) in rare_event_points(season, scoring_config, idol_episodes).items():
+            counts[name].append(count)
+            points[name].append(pts / len(contestant_ids))
+
+    if not weights:
+        return {"expected_points": {}, "se": {}, "events": {}, "tails": {}, "ess": 0.0, "vrf": 1.0, "runs": 0}
+    expected, se = {}, {}
+    total_is = total_plain = 0.0
+    for cid in contestant_ids:
+        expected[cid], var_is, var_plain = _weighted_stats(totals[cid], weights)
+        se[cid] = math.sqrt(var_is)
+        total_is += var_is
+        total_plain += var_plain
+    events = {}
+    for name in RARE_EVENTS:
+        rate, var_rate, var_plain = _weighted_stats(counts[name], weights)
+        per_contestant, var_points, _ = _weighted_stats(points[name], weights)
+        events[name] = {
+            "per_season": rate,
+            "se": math.sqrt(var_rate),
+            "points_per_contestant": per_contestant,
+            "points_se": math.sqrt(var_points),
+            "seasons_sampled": sum(1 for c in counts[name] if c),
+            "vrf": var_plain / var_rate if var_rate > 0 else 1.0,
+        }
+    pooled = [v for cid in contestant_ids for v in totals[cid]]
+    pooled_weights = weights * len(contestant_ids)
+    return {
+        "expected_points": expected,
+        "se": se,
+        "events": events,
+        "tails": weighted_quantiles(pooled, pooled_weights, TAIL_QUANTILES),
+        "ess": sum(weights) ** 2 / sum(w * w for w in weights),
+        "vrf": total_plain / total_is if total_is > 0 else 1.0,
+        "runs": num_runs,
+        "tilt": tilt,
+    }
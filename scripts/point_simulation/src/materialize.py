@@ -0,0 +1,73 @@
+"""
+Offline materialization of contestant_episode_points: the bulk counterpart of
+the app's materializePointsForEpisode (app/lib/materializePoints.ts), which
+upserts one episode at a time. Every (episode, contestant) row of a season, or
+of many simulated seasons, is scored by the Python engine and streamed into one
+SQL script, as a COPY block or batched INSERT ... ON CONFLICT statements.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from .bulk_export import SqlWriter
+from .dynamic_pricing import calculate_contestant_episode_breakdown
+
+TABLE = "contestant_episode_points"
+COLUMNS = ("episode_id", "contestant_id", "total_points", "breakdown")
+CONFLICT = ("episode_id", "contestant_id")
+
+
+def episode_point_rows(
+    episode_outcomes: List[Dict[str, Any]],
+    scoring_config: Dict[str, Any],
+    episode_offset: int = 0,
+) -> Iterator[Tuple[int, str, int, Dict[str, float]]]:
+    """
+    (episode_id, contestant_id, total_points, breakdown) for everyone active or
+    voted out in each episode, with episode_id shifted by episode_offset.
+    total_points is the integer the column stores (scoring values are integers).
+    """
+    for ep_idx, ep in enumerate(episode_outcomes):
+        episode_id = ep.get("episode_id", ep_idx + 1) + episode_offset
+        cids = list(ep.get("active_contestants", []))
+        if ep.get("voted_out") and ep["voted_out"] not in cids:
+            cids.append(ep["voted_out"])
+        for cid in cids:
+            breakdown = calculate_contestant_episode_breakdown(cid, ep, scoring_config)
+            yield episode_id, cid, int(round(sum(breakdown.values()))), breakdown
+
+
+def write_episode_points(
+    seasons: Iterable[List[Dict[str, Any]]],
+    scoring_config: Dict[str, Any],
+    path: Path,
+    mode: str = "copy",
+    batch_rows: int = 1000,
+    episode_stride: int = 100,
+    upsert: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Stream the rows of each season into one SQL script inside a transaction.
+    Season s gets episode ids offset by s * episode_stride, so many simulated seasons
+    can share the table. With upsert, rows replace existing (episode_id, contestant_id)
+    rows; otherwise COPY / INSERT straight into the table. Returns row and
+    statement counts.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    seasons_written = 0
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(f"-- {TABLE}: psql -f {path.name}\nBEGIN;\n")
+        writer = SqlWriter(
+            out, TABLE, COLUMNS, mode=mode,
+            conflict=CONFLICT if upsert else None, batch_rows=batch_rows,
+        )
+        for s, episode_outcomes in enumerate(seasons):
+            writer.write_many(episode_point_rows(episode_outcomes, scoring_config, s * episode_stride))
+            seasons_written += 1
+            if progress:
+                progress(seasons_written)
+        writer.close()
+        out.write("COMMIT;\n")
+    return {"seasons": seasons_written, "rows": writer.rows_written, "statements": writer.statements}
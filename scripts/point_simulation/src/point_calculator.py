@@ -2,15 +2,18 @@
 Point calculator for Survivor fantasy scoring.
 Computes points for a roster given episode outcomes.
 Returns granular event-level breakdown for detailed reporting.
-Supports optional captaincy: captain gets 2x points for chosen episodes.
+Supports optional captaincy: captain gets 2x points for chosen episodes, and the
+optional BPS episode rank bonus (bps.yaml), which the captain's 2x includes.
 """
 
 from typing import Dict, List, Any, Optional
 
+from .bps import rank_bonuses_by_episode
 from .dynamic_pricing import (
     calculate_contestant_episode_points,
     _contestant_went_to_tribal,
 )
+from .registry import ContestantRegistry, Roster
 
 
 # All event types for granular tracking
@@ -49,21 +52,35 @@ def _init_event_breakdown() -> Dict[str, Dict[str, int]]:
 
 
 def calculate_roster_points(
-    roster: List[str],
+    roster: Roster,
     episode_outcomes: List[Dict[str, Any]],
     scoring_config: Dict[str, Any],
     captain_per_episode: Optional[List[Optional[str]]] = None,
+    registry: Optional[ContestantRegistry] = None,
+    bps_config: Optional[Dict[str, Any]] = None,
+    rank_bonuses: Optional[Dict[int, Dict[str, float]]] = None,
 ) -> Dict[str, Any]:
     """
     Calculate total points and granular event-level breakdown for a roster.
     
-    roster: List of contestant IDs on the user's tribe (FIXED - no replacement when voted out)
+    roster: Contestant IDs on the user's tribe (FIXED - no replacement when voted out),
+        or a bitmask / index list when registry is given
     episode_outcomes: List of outcome dicts per episode
     scoring_config: Scoring configuration from YAML
     captain_per_episode: Optional list of captain IDs per episode (captain gets 2x pts for that ep)
+    registry: ContestantRegistry for rosters given as bitmasks or indices
+    bps_config: bps.yaml; adds each episode's BPS rank bonus (counted under tribal)
+    rank_bonuses: precomputed bps.rank_bonuses_by_episode, to share across rosters
     
     Returns: { total, breakdown, event_breakdown, captain_bonus }
     """
+    # With a registry the roster stays a bitmask: who is in each episode, the captain
+    # and the finalists are bit tests against it
+    roster_mask = None
+    if registry is not None:
+        roster_mask = registry.mask(roster)
+    elif isinstance(roster, int):
+        raise ValueError("calculate_roster_points: a roster bitmask needs a registry")
     breakdown = {
         "survival": 0,
         "challenges": 0,
@@ -79,10 +96,13 @@ def calculate_roster_points(
     survival_cfg = scoring_config.get("survival", {})
     pre_merge_tribal = survival_cfg.get("pre_merge_tribal", survival_cfg.get("pre_merge", 1))
     post_merge = survival_cfg.get("post_merge", 3)
+    if rank_bonuses is None and bps_config:
+        rank_bonuses = rank_bonuses_by_episode(episode_outcomes, bps_config)
 
     for ep_idx, ep in enumerate(episode_outcomes):
         phase = ep.get("phase", "pre_merge")
         episode_pts_by_cid = {}  # Track pts per player this ep for captain bonus
+        episode_bonuses = rank_bonuses.get(ep.get("episode_id", ep_idx + 1), {}) if rank_bonuses else {}
         if phase in ("pre_merge", "swap"):
             survival_pts = pre_merge_tribal
             survival_key = "survival_pre_merge" if phase == "pre_merge" else "survival_swap"
@@ -90,13 +110,28 @@ def calculate_roster_points(
             survival_pts = post_merge
             survival_key = "survival_post_merge"
         
-        for cid in roster:
-            is_voted_out_this_ep = ep.get("voted_out") == cid
-            if not is_voted_out_this_ep and cid not in ep.get("active_contestants", []):
-                continue
+        if roster_mask is not None:
+            present = registry.mask(ep.get("active_contestants", []))
+            if registry.has(roster_mask, ep.get("voted_out")):
+                present |= 1 << registry.index[ep["voted_out"]]
+            members = registry.to_ids(roster_mask & present)
+        else:
+            members = [
+                cid for cid in roster
+                if ep.get("voted_out") == cid or cid in ep.get("active_contestants", [])
+            ]
 
+        for cid in members:
             # Points this player earns this episode (for captain bonus)
             episode_pts_by_cid[cid] = calculate_contestant_episode_points(cid, ep, scoring_config)
+
+            # BPS episode rank bonus
+            bonus = episode_bonuses.get(cid, 0)
+            if bonus > 0:
+                episode_pts_by_cid[cid] += bonus
+                breakdown["tribal"] += bonus
+                event_breakdown["episode_rank_bonus"]["count"] += 1
+                event_breakdown["episode_rank_bonus"]["points"] += bonus
             
             # Survival
             if ep.get("tribal", True) and not ep.get("final_tribal", False):
@@ -247,22 +282,25 @@ def calculate_roster_points(
         # Captain bonus: captain gets (multiplier - 1) extra points for this episode
         if captain_per_episode and ep_idx < len(captain_per_episode):
             captain = captain_per_episode[ep_idx]
-            if captain and captain in roster:
+            if captain and (registry.has(roster_mask, captain) if roster_mask is not None else captain in roster):
                 captain_bonus_total += (captain_multiplier - 1) * episode_pts_by_cid.get(captain, 0)
         
         # Placement (final tribal)
         if ep.get("final_tribal"):
-            for cid in roster:
-                if cid in ep.get("final_three", []):
-                    pts_ft = scoring_config["placement"]["final_tribal"]
-                    breakdown["placement"] += pts_ft
-                    event_breakdown["final_tribal"]["count"] += 1
-                    event_breakdown["final_tribal"]["points"] += pts_ft
-                    if cid == ep.get("winner"):
-                        pts_win = scoring_config["placement"]["win_season"]
-                        breakdown["placement"] += pts_win
-                        event_breakdown["win_season"]["count"] += 1
-                        event_breakdown["win_season"]["points"] += pts_win
+            if roster_mask is not None:
+                finalists = registry.to_ids(roster_mask & registry.mask(ep.get("final_three", [])))
+            else:
+                finalists = [cid for cid in roster if cid in ep.get("final_three", [])]
+            for cid in finalists:
+                pts_ft = scoring_config["placement"]["final_tribal"]
+                breakdown["placement"] += pts_ft
+                event_breakdown["final_tribal"]["count"] += 1
+                event_breakdown["final_tribal"]["points"] += pts_ft
+                if cid == ep.get("winner"):
+                    pts_win = scoring_config["placement"]["win_season"]
+                    breakdown["placement"] += pts_win
+                    event_breakdown["win_season"]["count"] += 1
+                    event_breakdown["win_season"]["points"] += pts_win
     
     total = sum(breakdown.values()) + captain_bonus_total
     return {
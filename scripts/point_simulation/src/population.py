@@ -0,0 +1,310 @@
+"""
+Synthetic manager populations for load-testing the app.
+A PopulationModel plays one simulated season (episode outcomes and the price
+path from update_prices_from_episode) and precomputes roster pools: budget
+strategy rosters from RosterIndex plus uniform valid rosters from
+sample_valid_roster_masks for casual players. Each manager draws a strategy
+from the mixture, takes a roster from its pool, then moves through the season
+replacing voted-out players and making occasional voluntary transfers under the
+transfers route's rules (7 players, 1+ per starting tribe, within budget at
+that episode's prices), with a captain every episode.
+Managers are generated in fixed blocks, each with its own seeded RNG, so the
+output depends only on the seed and rows stream out in bounded memory.
+"""
+
+import random
+import uuid
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Tuple
+
+from .bulk_export import TableWriter, write_load_script, table_counts
+from .dynamic_pricing import price_history_by_episode
+from .roster_enumerator import sample_valid_roster_masks
+from .roster_generator import RosterIndex, BUDGET_STRATEGIES
+
+# "sampled" = a uniformly random valid roster; the rest are BUDGET_STRATEGIES
+STRATEGY_MIX = {
+    "sampled": 0.35,
+    "max_expected": 0.10,
+    "value": 0.15,
+    "balanced": 0.10,
+    "mid_tier": 0.05,
+    "stars_and_scrubs": 0.10,
+    "five_premium": 0.05,
+    "random": 0.10,
+}
+# best: highest expected points on the roster; sticky: keep until voted out or sold
+CAPTAIN_STYLES = {"best": 0.5, "sticky": 0.3, "random": 0.2}
+
+BLOCK_SIZE = 1000  # managers per RNG block; fixed so output never depends on chunking
+NAMESPACE = uuid.UUID("5b1c1a52-4d0f-4c55-9f59-2f8a0c6c7e10")
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Casey", "Riley", "Morgan", "Jamie", "Avery", "Quinn", "Drew", "Parker"]
+LAST_NAMES = ["Smith", "Garcia", "Chen", "Patel", "Okafor", "Nguyen", "Kowalski", "Silva", "Murphy", "Haddad", "Jensen", "Ito"]
+TRIBE_WORDS = ["Torch", "Idol", "Jury", "Blindside", "Merge", "Tribal", "Outwit", "Buff", "Shelter", "Reward", "Fire", "Vote"]
+
+# Tables in foreign-key order: table -> columns
+TABLES = {
+    "auth.users": ("id", "aud", "role", "email"),
+    "profiles": ("id", "first_name", "last_name", "tribe_name"),
+    "leagues": ("id", "name", "invite_code", "created_by"),
+    "league_members": ("league_id", "user_id"),
+    "tribe_entries": ("user_id", "contestant_id", "phase", "is_wild_card", "added_at_episode", "removed_at_episode"),
+    "captain_picks": ("user_id", "episode_id", "contestant_id"),
+}
+
+
+def _weighted(choices: Dict[str, float]) -> Tuple[List[str], List[float]]:
+    names = [k for k, w in choices.items() if w > 0]
+    total = 0.0
+    cumulative = []
+    for k in names:
+        total += choices[k]
+        cumulative.append(total)
+    return names, cumulative
+
+
+class PopulationModel:
+    """One simulated season plus roster pools, shared by every generated manager."""
+
+    def __init__(
+        self,
+        contestants: List[Dict],
+        prices: Dict[str, int],
+        expected_points: Dict[str, float],
+        season: List[Dict[str, Any]],
+        scoring_config: Dict[str, Any],
+        update_config: Dict[str, Any],
+        strategy_mix: Optional[Dict[str, float]] = None,
+        captain_styles: Optional[Dict[str, float]] = None,
+        pool_size: int = 2000,
+        replace_rate: float = 0.8,
+        transfer_rate: float = 0.05,
+        seed: int = 42,
+    ):
+        mix = strategy_mix or STRATEGY_MIX
+        unknown = [k for k in mix if k != "sampled" and k not in BUDGET_STRATEGIES]
+        if unknown:
+            raise ValueError(f"Unknown strategies: {', '.join(unknown)}")
+        self.budget = update_config.get("budget", 1_000_000)
+        self.roster_size = update_config.get("roster_max", 7)
+        self.replace_rate = replace_rate
+        self.transfer_rate = transfer_rate
+        self.expected = expected_points
+        self.tribe_of = {c["id"]: c["starting_tribe"] for c in contestants}
+        self.strategies, self._strategy_cdf = _weighted(mix)
+        self.captain_styles, self._captain_cdf = _weighted(captain_styles or CAPTAIN_STYLES)
+
+        self.episode_ids = [ep.get("episode_id", k + 1) for k, ep in enumerate(season)]
+        history = price_history_by_episode(season, prices, scoring_config, update_config)
+        self.prices_at = dict(zip(self.episode_ids, history))
+        # Who is still in the game going into each episode, best expected points first
+        self.alive_at: Dict[int, List[str]] = {}
+        gone: set = set()
+        for ep_id, ep in zip(self.episode_ids, season):
+            self.alive_at[ep_id] = sorted(
+                (c["id"] for c in contestants if c["id"] not in gone),
+                key=lambda cid: (-expected_points.get(cid, 0), cid),
+            )
+            gone.update(ep[key] for key in ("voted_out", "quit", "medevac") if ep.get(key))
+        self.alive_set = {ep_id: set(alive) for ep_id, alive in self.alive_at.items()}
+
+        index = RosterIndex(contestants, prices, self.budget, expected_points, self.roster_size, self.roster_size)
+        rng = random.Random(seed)
+        self.pools: Dict[str, List[Tuple[str, ...]]] = {}
+        for strategy in self.strategies:
+            if strategy == "sampled":
+                masks = sample_valid_roster_masks(
+                    contestants, prices, self.budget, pool_size, seed=seed,
+                    roster_min=self.roster_size, roster_max=self.roster_size,
+                )
+            else:
+                masks = index.generate_rosters(strategy, pool_size, rng)
+            filled = {}
+            for m in masks:
+                roster = self._complete(index.registry.to_ids(m), prices)
+                filled[roster] = filled.get(roster, 0) + 1
+            # Keep each roster's share of the strategy's draws
+            self.pools[strategy] = [r for r, k in filled.items() for _ in range(k)]
+
+    def _complete(self, roster: List[str], prices: Dict[str, int]) -> Tuple[str, ...]:
+        """
+        Fill a strategy roster to roster_size like a manager would: add the best expected
+        player that still leaves room for the cheapest fill; if even that cannot fit, drop
+        the priciest player whose tribe stays covered and try again.
+        """
+        held = list(roster)
+        by_price = sorted(prices, key=lambda c: (prices[c], c))
+        while len(held) < self.roster_size:
+            need = self.roster_size - len(held)
+            room = self.budget - sum(prices[c] for c in held)
+            free = [c for c in by_price if c not in held]
+            cheapest = sum(prices[c] for c in free[:need])
+            if cheapest > room:
+                tribes = [self.tribe_of[c] for c in held]
+                droppable = [c for c in held if tribes.count(self.tribe_of[c]) > 1] or held
+                held.remove(max(droppable, key=lambda c: (prices[c], c)))
+                continue
+
+            def fits(c: str) -> bool:
+                others = [x for x in free if x != c][: need - 1]
+                return prices[c] + sum(prices[x] for x in others) <= room
+
+            held.append(max(filter(fits, free), key=lambda c: (self.expected.get(c, 0), c)))
+        return tuple(held)
+
+    def _pick(self, names: List[str], cdf: List[float], rng: random.Random) -> str:
+        x = rng.random() * cdf[-1]
+        for name, bound in zip(names, cdf):
+            if x < bound:
+                return name
+        return names[-1]
+
+    def _replacement(
+        self, held: Dict[str, int], sold: str, ever_held: set, ep_id: int, rng: random.Random
+    ) -> Optional[str]:
+        """An affordable add that keeps every tribe covered, best expected or random."""
+        prices = self.prices_at[ep_id]
+        tribe_of = self.tribe_of
+        room = self.budget - sum(prices.get(c, 0) for c in held if c != sold)
+        covered = {tribe_of[c] for c in held if c != sold}
+        need = tribe_of[sold] if tribe_of[sold] not in covered else None
+        options = [
+            c for c in self.alive_at[ep_id]
+            if c not in ever_held and prices.get(c, 0) <= room and (need is None or tribe_of[c] == need)
+        ]
+        if not options:
+            return None
+        return options[0] if rng.random() < 0.5 else rng.choice(options)
+
+    def manager(self, index: int, rng: random.Random) -> Dict[str, Any]:
+        """
+        One manager: {"index", "strategy", "captain_style", "entries": [(contestant, added,
+        removed or None)], "captains": {episode_id: contestant}}.
+        A player sold going into episode E is removed_at_episode E - 1; the add is added_at_episode E.
+        """
+        strategy = self._pick(self.strategies, self._strategy_cdf, rng)
+        style = self._pick(self.captain_styles, self._captain_cdf, rng)
+        roster = rng.choice(self.pools[strategy])
+        first = self.episode_ids[0] if self.episode_ids else 1
+        held = dict.fromkeys(roster, first)  # contestant -> added_at_episode
+        ever_held = set(roster)
+        entries = []
+        captains = {}
+        captain = None
+        expected = self.expected
+
+        for k, ep_id in enumerate(self.episode_ids):
+            alive = self.alive_set[ep_id]
+            if k:
+                sells = [c for c in held if c not in alive and rng.random() < self.replace_rate]
+                if rng.random() < self.transfer_rate:
+                    keep = [c for c in held if c in alive and c not in sells]
+                    if keep:
+                        sells.append(rng.choice(keep))
+                for sold in sells:
+                    add = self._replacement(held, sold, ever_held, ep_id, rng)
+                    if add is None:
+                        continue
+                    entries.append((sold, held.pop(sold), ep_id - 1))
+                    held[add] = ep_id
+                    ever_held.add(add)
+                    if captain == sold:
+                        captain = add
+
+            choices = [c for c in held if c in alive] or list(held)
+            if style == "random":
+                captain = rng.choice(choices)
+            elif style == "best" or captain not in choices:
+                captain = max(choices, key=lambda c: (expected.get(c, 0), c))
+            captains[ep_id] = captain
+
+        entries.extend((cid, added, None) for cid, added in held.items())
+        return {"index": index, "strategy": strategy, "captain_style": style, "entries": entries, "captains": captains}
+
+
+def manager_id(seed: int, index: int) -> str:
+    """Stable UUID for manager `index` of the population generated with `seed`."""
+    return str(uuid.uuid5(NAMESPACE, f"manager:{seed}:{index}"))
+
+
+def iter_manager_blocks(model: PopulationModel, n: int, seed: int = 42) -> Iterator[Tuple[random.Random, List[Dict[str, Any]]]]:
+    """(block RNG, managers) for blocks of BLOCK_SIZE managers; block b uses seed + b * 7777."""
+    for block, start in enumerate(range(0, n, BLOCK_SIZE)):
+        rng = random.Random(seed + block * 7777)
+        yield rng, [model.manager(i, rng) for i in range(start, min(n, start + BLOCK_SIZE))]
+
+
+def block_leagues(
+    managers: Sequence[Dict[str, Any]],
+    rng: random.Random,
+    league_share: float = 0.7,
+    league_size: Tuple[int, int] = (4, 16),
+) -> List[List[int]]:
+    """Leagues (lists of manager indices, creator first) among one block's managers."""
+    members = [m["index"] for m in managers if rng.random() < league_share]
+    rng.shuffle(members)
+    leagues = []
+    lo, hi = league_size
+    while len(members) >= lo:
+        size = min(len(members), rng.randint(lo, hi))
+        leagues.append(members[:size])
+        members = members[size:]
+    return leagues
+
+
+def export_population(
+    model: PopulationModel,
+    n: int,
+    output_dir: Path,
+    fmt: str = "copy",
+    seed: int = 42,
+    buffer_rows: int = 10000,
+    league_share: float = 0.7,
+    league_size: Tuple[int, int] = (4, 16),
+    progress=None,
+) -> Dict[str, Any]:
+    """
+    Stream n managers to one bulk-load file per table (TABLES) plus load.sql.
+    Returns {"files": {table: path}, "rows": {table: count}, "strategies": {name: count}}.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    writers = {
+        table: TableWriter(output_dir, table, columns, fmt=fmt, buffer_rows=buffer_rows)
+        for table, columns in TABLES.items()
+    }
+    strategies: Dict[str, int] = {}
+    league_no = 0
+    try:
+        for rng, managers in iter_manager_blocks(model, n, seed):
+            ids = {}
+            for m in managers:
+                i = m["index"]
+                uid = ids[i] = manager_id(seed, i)
+                strategies[m["strategy"]] = strategies.get(m["strategy"], 0) + 1
+                first = FIRST_NAMES[i % len(FIRST_NAMES)]
+                last = LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]
+                writers["auth.users"].write((uid, "authenticated", "authenticated", f"manager{i + 1}@example.test"))
+                writers["profiles"].write((uid, first, last, f"{TRIBE_WORDS[i % len(TRIBE_WORDS)]} {i + 1}"))
+                for cid, added, removed in m["entries"]:
+                    writers["tribe_entries"].write((uid, cid, "pre_merge", False, added, removed))
+                for ep_id, cid in m["captains"].items():
+                    writers["captain_picks"].write((uid, ep_id, cid))
+            for members in block_leagues(managers, rng, league_share, league_size):
+                league_no += 1
+                league_id = str(uuid.uuid5(NAMESPACE, f"league:{seed}:{league_no}"))
+                writers["leagues"].write((league_id, f"League {league_no}", f"LT{seed}X{league_no:08d}", ids[members[0]]))
+                for i in members:
+                    writers["league_members"].write((league_id, ids[i]))
+            if progress:
+                progress(managers[-1]["index"] + 1)
+    finally:
+        for w in writers.values():
+            w.close()
+    write_load_script(output_dir, writers.values())
+    return {
+        "files": {table: str(w.path) for table, w in writers.items()},
+        "rows": table_counts(writers.values()),
+        "strategies": strategies,
+    }
@@ -1,14 +1,79 @@
 """
 Price generator for Survivor fantasy.
 Runs Monte Carlo to estimate expected points per contestant, then maps to prices.
+qmc_expected_points is the quasi-Monte Carlo variant: seasons driven by scrambled
+Halton points, with randomized replicates for error bars. control_variates.py
+adjusts the plain estimate by controls with known expectations.
 """
 
-from collections import defaultdict
+import math
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple
 
+from .bps import rank_bonuses_by_episode
+from .config import load_probabilities
 from .point_calculator import calculate_roster_points
-from .scenario_generator import generate_scenario
+from .profiling import Profiler, NULL_PROFILER
+from .qmc import ScrambledHalton
+from .scenario_generator import generate_scenario, qmc_dimensions
+from .variance import mean, sample_variance
+from .roster_enumerator import compute_combo_cost_percentiles
+
+
+def solo_points(
+    contestant_ids: List[str],
+    episode_outcomes: List[Dict[str, Any]],
+    scoring_config: Dict[str, Any],
+    bps_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, float]:
+    """Each contestant's season total as a solo roster (BPS rank bonus ranked once for the season)."""
+    rank_bonuses = rank_bonuses_by_episode(episode_outcomes, bps_config)
+    return {
+        cid: calculate_roster_points([cid], episode_outcomes, scoring_config, rank_bonuses=rank_bonuses)["total"]
+        for cid in contestant_ids
+    }
+
+
+def price_seasons(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring_config: Dict[str, Any],
+    runs: Iterable[int],
+    seed: int = 42,
+    probabilities: Optional[Dict[str, Any]] = None,
+    profiler: Optional[Profiler] = None,
+    bps_config: Optional[Dict[str, Any]] = None,
+    trace: bool = False,
+    options: Optional[Callable[[int], Dict[str, Any]]] = None,
+    draw: Optional[Callable[[int, int, Dict[str, Any]], List[Dict[str, Any]]]] = None,
+) -> Iterator[Tuple[int, List[Dict[str, Any]], Dict[str, Any], Dict[str, float]]]:
+    """
+    The seasons behind every expected-points estimate: run i is drawn with seed
+    + i*1000, so estimators over the same runs see the same seasons. Yields
+    (run index, season, trace, solo_points) for each index in runs; trace is
+    generate_scenario's trace when trace is set, else empty. options(i) adds
+    generate_scenario keyword arguments for run i (a forced structure, a QMC point);
+    draw(i, run_seed, trace) replaces the generate_scenario call altogether (e.g. a
+    tilted draw, which can leave its likelihood ratio in trace).
+    """
+    prof = profiler or NULL_PROFILER
+    contestant_ids = [c["id"] for c in contestants]
+    for run_idx in runs:
+        run_seed = seed + run_idx * 1000
+        run_trace: Dict[str, Any] = {}
+        with prof.stage("generate_scenario"):
+            if draw is not None:
+                season = draw(run_idx, run_seed, run_trace)
+            else:
+                season = generate_scenario(
+                    contestants, season_template, seed=run_seed, probabilities=probabilities,
+                    trace=run_trace if trace else None, **(options(run_idx) if options else {}),
+                )
+        prof.count("scenarios")
+        with prof.stage("calculate_roster_points"):
+            points = solo_points(contestant_ids, season, scoring_config, bps_config)
+        prof.count("roster_scorings", len(contestant_ids))
+        yield run_idx, season, run_trace, points
 
 
 def compute_expected_points_per_contestant(
@@ -18,35 +83,124 @@ def compute_expected_points_per_contestant(
     config_dir: Path,
     num_runs: int = 2000,
     seed: int = 42,
+    resume_state: Optional[Dict[str, Any]] = None,
+    on_checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None,
+    checkpoint_every: int = 0,
+    profiler: Optional[Profiler] = None,
+    bps_config: Optional[Dict[str, Any]] = None,
+    qmc_replicates: int = 0,
+    control_variates: bool = False,
 ) -> Dict[str, float]:
     """
     Run Monte Carlo: for each contestant, score them as a solo roster across many scenarios.
-    Return average points per contestant.
+    Return average points per contestant. With bps_config, scores include the BPS
+    episode rank bonus (ranked once per scenario). qmc_replicates > 0 uses
+    qmc_expected_points with that many replicates instead (no checkpointing);
+    control_variates uses control_variate_expected_points on the same seasons (no
+    checkpointing), which reaches plain Monte Carlo's precision with far fewer runs.
+
+    Checkpointing: state is { next_run, totals } (running point totals per contestant).
+    on_checkpoint(state) is called every checkpoint_every runs; passing that state back
+    as resume_state continues the run and gives identical averages.
+    """
+    contestant_ids = [c["id"] for c in contestants]
+    if num_runs <= 0:
+        return {}
+    if qmc_replicates > 0:
+        return qmc_expected_points(
+            contestants, season_template, scoring_config, config_dir, num_runs=num_runs, seed=seed,
+            replicates=qmc_replicates, profiler=profiler, bps_config=bps_config,
+        )["expected_points"]
+    if control_variates:
+        from .control_variates import control_variate_expected_points
+        return control_variate_expected_points(
+            contestants, season_template, scoring_config, config_dir, num_runs=num_runs, seed=seed,
+            profiler=profiler, bps_config=bps_config,
+        )["expected_points"]
+
+    if resume_state:
+        start_run = resume_state["next_run"]
+        totals = dict(resume_state["totals"])
+    else:
+        start_run = 0
+        totals = {cid: 0 for cid in contestant_ids}
+
+    probabilities = load_probabilities(config_dir) if config_dir is not None else None
+    seasons = price_seasons(
+        contestants, season_template, scoring_config, range(start_run, num_runs), seed=seed,
+        probabilities=probabilities, profiler=profiler, bps_config=bps_config,
+    )
+    for run_idx, _, _, season_points in seasons:
+        for cid, points in season_points.items():
+            totals[cid] += points
+
+        done = run_idx + 1
+        if on_checkpoint and checkpoint_every > 0 and done % checkpoint_every == 0 and done < num_runs:
+            on_checkpoint({"next_run": done, "totals": dict(totals)})
+
+    return {
+        cid: total / num_runs
+        for cid, total in totals.items()
+    }
+
+
+def qmc_expected_points(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring_config: Dict[str, Any],
+    config_dir: Path,
+    num_runs: int = 2000,
+    seed: int = 42,
+    replicates: int = 8,
+    profiler: Optional[Profiler] = None,
+    bps_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Expected points from replicates independently scrambled Halton point sets of
+    num_runs / replicates seasons each (rounded up). Each point drives the season's
+    structure, boot order, challenge results, vote counts and pocket items
+    (generate_scenario's qmc); run i's other draws use seed + i*1000.
+    se comes from the spread of the replicate means; se_mc is plain Monte Carlo's
+    for the same runs (pooled within-replicate variance); vrf compares the summed
+    variances. Returns expected_points, se, se_mc, vrf, runs and replicates.
     """
+    probabilities = load_probabilities(config_dir) if config_dir is not None else None
     contestant_ids = [c["id"] for c in contestants]
-    points_by_contestant = defaultdict(list)
-
-    for run_idx in range(num_runs):
-        scenario_seed = seed + run_idx * 1000
-        episode_outcomes = generate_scenario(
-            contestants,
-            season_template,
-            seed=scenario_seed,
-            config_dir=config_dir,
-        )
-
-        for cid in contestant_ids:
-            # Score solo roster (just this contestant)
-            result = calculate_roster_points(
-                [cid],
-                episode_outcomes,
-                scoring_config,
-            )
-            points_by_contestant[cid].append(result["total"])
+    replicates = max(2, replicates)
+    per_replicate = max(1, math.ceil(num_runs / replicates))
+    dimensions = qmc_dimensions(len(contestants))
+    samples = [{cid: [] for cid in contestant_ids} for _ in range(replicates)]
 
+    point_sets = [ScrambledHalton(dimensions, per_replicate, seed=f"{seed}:qmc:{r}") for r in range(replicates)]
+    runs = replicates * per_replicate
+
+    def qmc_point(run_idx: int) -> Dict[str, Any]:
+        r, i = divmod(run_idx, per_replicate)
+        return {"qmc": point_sets[r].point(i)}
+
+    seasons = price_seasons(
+        contestants, season_template, scoring_config, range(runs), seed=seed,
+        probabilities=probabilities, profiler=profiler, bps_config=bps_config, options=qmc_point,
+    )
+    for run_idx, _, _, season_points in seasons:
+        for cid, points_scored in season_points.items():
+            samples[run_idx // per_replicate][cid].append(points_scored)
+
+    expected, se, se_mc = {}, {}, {}
+    for cid in contestant_ids:
+        replicate_means = [mean(samples[r][cid]) for r in range(replicates)]
+        expected[cid] = mean(replicate_means)
+        se[cid] = math.sqrt(sample_variance(replicate_means) / replicates)
+        se_mc[cid] = math.sqrt(mean([sample_variance(samples[r][cid]) for r in range(replicates)]) / runs)
+    total_qmc = sum(v * v for v in se.values())
+    total_mc = sum(v * v for v in se_mc.values())
     return {
-        cid: sum(pts) / len(pts)
-        for cid, pts in points_by_contestant.items()
+        "expected_points": expected,
+        "se": se,
+        "se_mc": se_mc,
+        "vrf": total_mc / total_qmc if total_qmc > 0 else 1.0,
+        "runs": runs,
+        "replicates": replicates,
     }
 
 
@@ -105,3 +259,49 @@ def expected_points_to_prices(
         prices[cid] = int(max(price_min, min(price_max, rounded)))
 
     return prices
+
+
+def calibrate_prices(
+    prices: Dict[str, int],
+    contestants: List[Dict],
+    pricing_config: Dict[str, Any],
+    roster_size: int = 7,
+) -> Tuple[Dict[str, int], Dict[str, float]]:
+    """
+    Scale prices so ~target_valid_pct of roster_size combos fit the budget, then
+    make sure the roster_size most expensive players together exceed the budget.
+    Returns (prices, {"scale", "top_scale"}); a scale is omitted when not applied.
+    """
+    target_valid_pct = pricing_config.get("target_valid_pct")
+    if target_valid_pct is None:
+        return prices, {}
+    budget = pricing_config.get("budget", 1_000_000)
+    increment = pricing_config.get("price_increment", 5000)
+    price_min = pricing_config.get("price_min", 80000)
+    price_max = pricing_config.get("price_max", 260000)
+    info: Dict[str, float] = {}
+
+    percentiles = compute_combo_cost_percentiles(
+        contestants, prices, roster_min=roster_size, roster_max=roster_size,
+        percentiles=[target_valid_pct],
+    )
+    target_cost = percentiles.get(f"p{int(target_valid_pct*100)}", budget)
+    if target_cost > 0:
+        scale = budget / target_cost
+        prices = {
+            cid: int(max(price_min, min(price_max, round(p * scale / increment) * increment)))
+            for cid, p in prices.items()
+        }
+        info["scale"] = scale
+
+    sorted_ids = sorted(prices.keys(), key=lambda x: prices[x], reverse=True)
+    top_cost = sum(prices[cid] for cid in sorted_ids[:roster_size])
+    if top_cost <= budget:
+        min_top = budget + increment
+        top_scale = min_top / top_cost if top_cost > 0 else 1.0
+        prices = {
+            cid: int(max(price_min, min(price_max, round(p * top_scale / increment) * increment)))
+            for cid, p in prices.items()
+        }
+        info["top_scale"] = top_scale
+    return prices, info
@@ -0,0 +1,154 @@
+"""
+Lightweight stage timers and counters for simulation runs.
+Disabled profilers cost one attribute check per call: stage() returns a shared
+no-op context manager and count() returns immediately.
+Stage times are inclusive (a stage nested inside another counts toward both).
+Optional cProfile capture is per stage; nested stages are folded into the
+outermost profiled stage, since only one cProfile can be active at a time.
+"""
+
+import cProfile
+import json
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# throughput name -> (counter, stage whose time it is divided by)
+THROUGHPUTS = {
+    "scenarios_per_sec": ("scenarios", "generate_scenario"),
+    "roster_scorings_per_sec": ("roster_scorings", "calculate_roster_points"),
+    "enumerated_combos_per_sec": ("enumerated_combos", "roster_enumeration"),
+    "price_updates_per_sec": ("price_updates", "update_prices"),
+}
+
+_NULL_STAGE = nullcontext()
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "start", "cprof")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.cprof = None
+
+    def __enter__(self):
+        p = self.profiler
+        if p.cprofile and p._active_cprofile is None:
+            self.cprof = p._cprofiles.setdefault(self.name, cProfile.Profile())
+            p._active_cprofile = self.cprof
+            self.cprof.enable()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        p = self.profiler
+        if self.cprof is not None:
+            self.cprof.disable()
+            p._active_cprofile = None
+        stats = p.stages.get(self.name)
+        if stats is None:
+            stats = p.stages[self.name] = {"seconds": 0.0, "calls": 0}
+        stats["seconds"] += elapsed
+        stats["calls"] += 1
+        return False
+
+
+class Profiler:
+    """Named stage timers and counters; enable with --profile on the run_* scripts."""
+
+    def __init__(self, enabled: bool = False, cprofile: bool = False):
+        self.enabled = enabled
+        self.cprofile = enabled and cprofile
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self._cprofiles: Dict[str, cProfile.Profile] = {}
+        self._active_cprofile = None
+        self._started = time.perf_counter()
+
+    def stage(self, name: str):
+        """Context manager timing one pass through a named stage."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add n to a named counter."""
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self) -> Dict[str, Any]:
+        """Stage timings, counters, derived throughputs and peak RSS."""
+        throughput = {}
+        for name, (counter, stage) in THROUGHPUTS.items():
+            seconds = self.stages.get(stage, {}).get("seconds", 0)
+            if counter in self.counters and seconds > 0:
+                throughput[name] = self.counters[counter] / seconds
+        return {
+            "wall_seconds": time.perf_counter() - self._started,
+            "stages": {
+                name: dict(stats, mean_ms=1000 * stats["seconds"] / stats["calls"])
+                for name, stats in sorted(self.stages.items(), key=lambda x: -x[1]["seconds"])
+            },
+            "counters": dict(self.counters),
+            "throughput": throughput,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+    def write(self, output_dir: Path, run_name: str) -> Optional[Path]:
+        """Write timings.json (and per-stage .prof files with cprofile) to output_dir."""
+        if not self.enabled:
+            return None
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        summary = dict(self.summary(), run=run_name)
+        if self._cprofiles:
+            prof_dir = output_dir / "profiles"
+            prof_dir.mkdir(exist_ok=True)
+            summary["cprofile_dumps"] = {}
+            for name, prof in self._cprofiles.items():
+                path = prof_dir / f"{run_name}_{name}.prof"
+                prof.dump_stats(str(path))
+                summary["cprofile_dumps"][name] = str(path)
+        path = output_dir / "timings.json"
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+        return path
+
+    def print_summary(self) -> None:
+        """Print a short timing table to stdout."""
+        if not self.enabled:
+            return
+        summary = self.summary()
+        print("\n" + "=" * 50)
+        print("PROFILE")
+        print("=" * 50)
+        print(f"Wall time: {summary['wall_seconds']:.2f}s")
+        for name, stats in summary["stages"].items():
+            print(f"  {name}: {stats['seconds']:.3f}s ({stats['calls']:,} calls, {stats['mean_ms']:.3f} ms/call)")
+        for name, value in summary["throughput"].items():
+            print(f"  {name}: {value:,.0f}")
+        if summary["peak_rss_mb"] is not None:
+            print(f"  peak_rss_mb: {summary['peak_rss_mb']:.1f}")
+
+
+NULL_PROFILER = Profiler()
@@ -0,0 +1,63 @@
+"""
+Scrambled Halton sequences for quasi-Monte Carlo season sampling.
+Dimension d uses the d-th prime as its radical-inverse base. Each digit position
+gets its own random digit permutation (random digit scrambling), and digits past
+the ones the sequence will ever set become a random offset inside the last cell.
+Every point is therefore uniform on [0, 1)^d, while the set of points stays
+evenly spread. Independently scrambled copies are the randomized replicates that
+give QMC estimates their error bars.
+"""
+
+import math
+import random
+from typing import List, Optional
+
+
+def first_primes(count: int) -> List[int]:
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+class ScrambledHalton:
+    """
+    One randomized Halton point set of up to max_points points in `dimensions`
+    dimensions. point(i) is the i-th point (i from 0; the unscrambled origin is
+    not special once scrambled).
+    """
+
+    def __init__(self, dimensions: int, max_points: int, seed: Optional[object] = None):
+        rng = random.Random(seed)
+        self.dimensions = dimensions
+        self.max_points = max(1, max_points)
+        self.bases = first_primes(dimensions)
+        self._perms: List[List[List[int]]] = []
+        self._tails: List[List[float]] = []
+        for base in self.bases:
+            depth = max(1, math.ceil(math.log(self.max_points) / math.log(base) + 1e-9))
+            perms = [rng.sample(range(base), base) for _ in range(depth)]
+            # tails[k]: value of digit positions >= k when the index has no digits left there
+            tails = [0.0] * (depth + 1)
+            tails[depth] = rng.random() * base ** -depth
+            for k in range(depth - 1, -1, -1):
+                tails[k] = tails[k + 1] + perms[k][0] * base ** -(k + 1)
+            self._perms.append(perms)
+            self._tails.append(tails)
+
+    def point(self, index: int) -> List[float]:
+        if not 0 <= index < self.max_points:
+            raise IndexError(f"Point {index} outside 0..{self.max_points - 1}")
+        out = []
+        for base, perms, tails in zip(self.bases, self._perms, self._tails):
+            i, k, u, scale = index, 0, 0.0, 1.0 / base
+            while i:
+                i, digit = divmod(i, base)
+                u += perms[k][digit] * scale
+                scale /= base
+                k += 1
+            out.append(u + tails[k])
+        return out
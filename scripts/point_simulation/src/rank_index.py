@@ -0,0 +1,291 @@
+"""
+Order statistics over league scores, kept up to date across episodes.
+RankIndex buckets team totals by floor(score * scale) and keeps a Fenwick tree
+of team counts per bucket, so a team's rank, the k-th best score and the next
+non-empty bucket are O(log B) for B buckets. Applying an episode moves each team
+between buckets; when an update touches most teams the tree is rebuilt from the
+bucket counts in O(B) instead. Points are integers, so with scale 1 a bucket
+holds one exact score and ties need no scan.
+"""
+
+import math
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+
+
+class RankIndex:
+    """Team scores with competition ranks (1, 2, 2, 4); ties are listed by team ID."""
+
+    def __init__(self, scores: Optional[Dict[str, float]] = None, scale: float = 1.0):
+        self.scale = scale
+        self.scores: Dict[str, float] = {}
+        self.bucket_of: Dict[str, int] = {}
+        self.members: Dict[int, Dict[str, float]] = {}
+        # True while every score is an exact bucket value (no within-bucket scan needed)
+        self.exact = True
+        self.low = 0
+        self.size = 0
+        self.counts: List[int] = []
+        self.tree: List[int] = [0]
+        if scores:
+            self._load(scores)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __contains__(self, team: str) -> bool:
+        return team in self.scores
+
+    # --- Fenwick tree over buckets low..low+size-1 --------------------------
+
+    def _bucket(self, score: float) -> int:
+        scaled = score * self.scale
+        b = math.floor(scaled)
+        if b != scaled:
+            self.exact = False
+        return b
+
+    def _rebuild(self, low: int, high: int) -> None:
+        """Size the tree for buckets low..high (with headroom) and rebuild it from the members."""
+        span = max(64, high - low + 1)
+        self.low = low - span // 2
+        self.size = 1 << (2 * span).bit_length()
+        self.counts = [0] * self.size
+        for b, teams in self.members.items():
+            self.counts[b - self.low] = len(teams)
+        self._rebuild_tree()
+
+    def _rebuild_tree(self) -> None:
+        tree = [0] + list(self.counts)
+        n = self.size
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+        self.tree = tree
+
+    def _ensure(self, b: int) -> None:
+        if not self.low <= b < self.low + self.size:
+            buckets = list(self.members) + [b]
+            self._rebuild(min(buckets), max(buckets))
+
+    def _add(self, b: int, delta: int) -> None:
+        i = b - self.low
+        self.counts[i] += delta
+        i += 1
+        tree = self.tree
+        n = self.size
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def _count_upto(self, b: int) -> int:
+        """Teams in buckets <= b."""
+        i = min(b - self.low + 1, self.size)
+        total = 0
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _bucket_at(self, k: int) -> int:
+        """Bucket holding the k-th lowest team (1-based) by binary lifting."""
+        pos = 0
+        step = self.size
+        tree = self.tree
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and tree[nxt] < k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return pos + self.low
+
+    # --- updates ------------------------------------------------------------
+
+    def _load(self, scores: Dict[str, float]) -> None:
+        bucket_of, members = self.bucket_of, self.members
+        scale = self.scale
+        floor = math.floor
+        for team, score in scores.items():
+            scaled = score * scale
+            b = floor(scaled)
+            if b != scaled:
+                self.exact = False
+            bucket_of[team] = b
+            bucket = members.get(b)
+            if bucket is None:
+                bucket = members[b] = {}
+            bucket[team] = score
+        self.scores.update(scores)
+        if members:
+            self._rebuild(min(members), max(members))
+
+    def set(self, team: str, score: float) -> None:
+        """Insert a team or change its score."""
+        b = self._bucket(score)
+        old = self.bucket_of.get(team)
+        if old is not None:
+            if old == b:
+                self.scores[team] = self.members[b][team] = score
+                return
+            self._discard(team, old)
+        self._ensure(b)
+        self.scores[team] = score
+        self.bucket_of[team] = b
+        self.members.setdefault(b, {})[team] = score
+        self._add(b, 1)
+
+    def _discard(self, team: str, b: int) -> None:
+        bucket = self.members[b]
+        del bucket[team]
+        if not bucket:
+            del self.members[b]
+        self._add(b, -1)
+
+    def remove(self, team: str) -> None:
+        b = self.bucket_of.pop(team)
+        del self.scores[team]
+        self._discard(team, b)
+
+    def apply(self, deltas: Dict[str, float]) -> None:
+        """Add one episode's per-team points (teams not yet indexed start from 0)."""
+        scores = self.scores
+        if not scores:
+            self._load(deltas)
+        elif len(deltas) * self.size.bit_length() < self.size:
+            for team, delta in deltas.items():
+                self.set(team, scores.get(team, 0) + delta)
+        else:
+            self._move((team, scores.get(team, 0) + delta) for team, delta in deltas.items())
+
+    def update(self, new_scores: Dict[str, float]) -> None:
+        """
+        Set many teams' scores at once. Small batches update the tree per team; a
+        batch touching more teams than there are buckets moves them in the bucket
+        counts and rebuilds the tree once in O(B).
+        """
+        if not self.scores:
+            self._load(new_scores)
+        elif len(new_scores) * self.size.bit_length() < self.size:
+            for team, score in new_scores.items():
+                self.set(team, score)
+        else:
+            self._move(new_scores.items())
+
+    def _move(self, items: Iterable[Tuple[str, float]]) -> None:
+        scores, bucket_of, members = self.scores, self.bucket_of, self.members
+        scale = self.scale
+        floor = math.floor
+        for team, score in items:
+            scaled = score * scale
+            b = floor(scaled)
+            if b != scaled:
+                self.exact = False
+            old = bucket_of.get(team)
+            if old != b:
+                if old is not None:
+                    bucket = members[old]
+                    del bucket[team]
+                    if not bucket:
+                        del members[old]
+                bucket_of[team] = b
+                bucket = members.get(b)
+                if bucket is None:
+                    bucket = members[b] = {}
+                bucket[team] = score
+            else:
+                members[b][team] = score
+            scores[team] = score
+        if members and (min(members) < self.low or max(members) >= self.low + self.size):
+            self._rebuild(min(members), max(members))
+        else:
+            self.counts = [0] * self.size
+            for b, teams in members.items():
+                self.counts[b - self.low] = len(teams)
+            self._rebuild_tree()
+
+    # --- queries ------------------------------------------------------------
+
+    def count_above(self, score: float) -> int:
+        """Teams with a strictly higher score."""
+        if not self.scores:
+            return 0
+        scaled = score * self.scale
+        b = math.floor(scaled)
+        above = len(self.scores) - self._count_upto(b)
+        if not self.exact or b != scaled:
+            above += sum(1 for s in self.members.get(b, {}).values() if s > score)
+        return above
+
+    def rank(self, team: str) -> int:
+        """Competition rank of a team (1 = best)."""
+        return 1 + self.count_above(self.scores[team])
+
+    def _bucket_teams(self, b: int) -> List[Tuple[str, float]]:
+        bucket = self.members[b]
+        if self.exact:
+            # One score per bucket: order by team ID only
+            return [(team, bucket[team]) for team in sorted(bucket)]
+        return sorted(bucket.items(), key=lambda item: (-item[1], item[0]))
+
+    def _buckets_desc(self) -> Iterator[int]:
+        """Non-empty buckets, highest first, each found by a Fenwick descent."""
+        n = len(self.scores)
+        seen = 0
+        while seen < n:
+            b = self._bucket_at(n - seen)
+            yield b
+            seen += len(self.members[b])
+
+    def iter_ranked(self) -> Iterator[Tuple[str, float, int]]:
+        """(team, score, rank) for every team, best first, ties by team ID."""
+        seen = 0
+        prev_score = None
+        rank = 0
+        for b in self._buckets_desc():
+            for team, score in self._bucket_teams(b):
+                seen += 1
+                if score != prev_score:
+                    rank = seen
+                    prev_score = score
+                yield team, score, rank
+
+    def top(self, n: int) -> List[Tuple[str, float, int]]:
+        """The n best teams as (team, score, rank)."""
+        out = []
+        if n <= 0:
+            return out
+        for item in self.iter_ranked():
+            out.append(item)
+            if len(out) >= n:
+                break
+        return out
+
+    def ranks(self) -> Dict[str, int]:
+        """Competition rank of every team, in one pass over the buckets."""
+        if not self.exact:
+            return {team: rank for team, _, rank in self.iter_ranked()}
+        ranks: Dict[str, int] = {}
+        seen = 0
+        for b in self._buckets_desc():
+            bucket = self.members[b]
+            ranks.update(dict.fromkeys(bucket, seen + 1))
+            seen += len(bucket)
+        return ranks
+
+    def league(self, teams: Iterable[str]) -> List[Dict[str, Any]]:
+        """A league's teams, best first, with league and overall ranks."""
+        members = sorted(
+            ((t, self.scores[t]) for t in teams if t in self.scores),
+            key=lambda item: (-item[1], item[0]),
+        )
+        rows = []
+        prev_score = None
+        league_rank = 0
+        for i, (team, score) in enumerate(members):
+            if score != prev_score:
+                league_rank = i + 1
+                prev_score = score
+            rows.append({"team": team, "score": score, "league_rank": league_rank, "rank": self.rank(team)})
+        return rows
@@ -0,0 +1,137 @@
+"""
+Dense integer IDs for contestants.
+A ContestantRegistry interns contestant IDs ("c01", ...) to indices 0..n-1 in
+config order, so rosters can be held as bitmasks (bit i set = contestant i on
+the roster) or index lists. Validity checks, set operations, dedup and hashing
+are then integer operations.
+Accepting the interned form: roster enumeration, dedup, roster scoring
+(calculate_roster_points), price updates (update_prices_from_episode, with
+registry-indexed price arrays) and replacement checks (count_viable_replacements,
+ReplacementIndex, simulate_replacement_events). Episode outcomes stay keyed by
+contestant ID (they are generated, stored and exported that way), so the
+expected-points estimators (price_generator, conditional and the variance
+reduction modules) score contestants by ID and return ID-keyed tables.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Tuple, TypeVar, Union
+
+# A roster in any accepted form: bitmask, or a sequence of contestant IDs or indices
+Roster = Union[int, Sequence[str], Sequence[int]]
+
+V = TypeVar("V")
+
+# A valid roster has contestants from at least this many starting tribes
+MIN_TRIBES = 3
+# Registries kept by get_registry (one per distinct contestant pool)
+REGISTRY_CACHE_SIZE = 256
+
+
+def popcount(mask: int) -> int:
+    """Number of contestants in a roster bitmask."""
+    return bin(mask).count("1")
+
+
+class ContestantRegistry:
+    """Contestant ID <-> index mapping, tribe bitmasks and roster conversions."""
+
+    __slots__ = ("ids", "index", "tribes", "tribe_of", "tribe_bits", "tribe_masks", "all_tribes", "valid_coverage")
+
+    def __init__(self, contestants: List[Dict[str, Any]]):
+        self.ids: List[str] = [c["id"] for c in contestants]
+        self.index: Dict[str, int] = {cid: i for i, cid in enumerate(self.ids)}
+        self.tribes: List[str] = list(dict.fromkeys(c["starting_tribe"] for c in contestants))
+        tribe_index = {t: k for k, t in enumerate(self.tribes)}
+        # tribe_of[i] = tribe number of contestant i; tribe_bits[i] = 1 << tribe_of[i]
+        self.tribe_of: List[int] = [tribe_index[c["starting_tribe"]] for c in contestants]
+        self.tribe_bits: List[int] = [1 << t for t in self.tribe_of]
+        # tribe_masks[t] = roster bitmask of every contestant in tribe t
+        self.tribe_masks: List[int] = [0] * len(self.tribes)
+        for i, t in enumerate(self.tribe_of):
+            self.tribe_masks[t] |= 1 << i
+        self.all_tribes: int = (1 << len(self.tribes)) - 1
+        # valid_coverage[bits] = whether a roster covering tribe bitmask bits has MIN_TRIBES tribes
+        self.valid_coverage: List[bool] = [popcount(bits) >= MIN_TRIBES for bits in range(self.all_tribes + 1)]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, cid: str) -> bool:
+        return cid in self.index
+
+    def mask(self, roster: Roster) -> int:
+        """Bitmask for a roster given as a bitmask, contestant IDs or indices."""
+        if isinstance(roster, int):
+            return roster
+        m = 0
+        index = self.index
+        for c in roster:
+            m |= 1 << (c if isinstance(c, int) else index[c])
+        return m
+
+    def indices(self, roster: Roster) -> List[int]:
+        """Ascending contestant indices of a roster."""
+        if not isinstance(roster, int):
+            return sorted(c if isinstance(c, int) else self.index[c] for c in roster)
+        out = []
+        i = 0
+        while roster:
+            if roster & 1:
+                out.append(i)
+            roster >>= 1
+            i += 1
+        return out
+
+    def to_ids(self, roster: Roster) -> List[str]:
+        """Contestant IDs of a roster (bitmasks and index lists in index order; ID lists unchanged)."""
+        if not isinstance(roster, int) and all(isinstance(c, str) for c in roster):
+            return list(roster)
+        ids = self.ids
+        return [ids[i] for i in self.indices(roster)]
+
+    def array(self, values: Dict[str, V], default: V = 0) -> List[V]:
+        """Per-contestant values (prices, expected points, ...) as a list indexed like the registry."""
+        return [values.get(cid, default) for cid in self.ids]
+
+    def to_dict(self, values: Sequence[V]) -> Dict[str, V]:
+        """Inverse of array: contestant_id -> value, for reports and exports."""
+        return dict(zip(self.ids, values))
+
+    def has(self, roster: int, cid: Optional[str]) -> bool:
+        """True if contestant cid (an ID, possibly unknown or None) is on a roster bitmask."""
+        i = self.index.get(cid)
+        return i is not None and bool(roster >> i & 1)
+
+    def tribe_coverage(self, roster: Roster) -> int:
+        """Bitmask of the starting tribes represented on a roster."""
+        bits = 0
+        if isinstance(roster, int):
+            for t, tm in enumerate(self.tribe_masks):
+                if roster & tm:
+                    bits |= 1 << t
+            return bits
+        tribe_bits = self.tribe_bits
+        for i in self.indices(roster):
+            bits |= tribe_bits[i]
+        return bits
+
+    def tribe_valid(self, roster: Roster) -> bool:
+        """True if the roster has contestants from at least MIN_TRIBES starting tribes."""
+        return self.valid_coverage[self.tribe_coverage(roster)]
+
+    def cost(self, roster: Roster, price_array: Sequence[int]) -> int:
+        """Roster cost from a registry-indexed price array (see array)."""
+        return sum(price_array[i] for i in self.indices(roster))
+
+
+@lru_cache(maxsize=REGISTRY_CACHE_SIZE)
+def _registry_for(key: Tuple[Tuple[str, str], ...]) -> ContestantRegistry:
+    return ContestantRegistry([{"id": cid, "starting_tribe": tribe} for cid, tribe in key])
+
+
+def get_registry(contestants: Iterable[Dict[str, Any]]) -> ContestantRegistry:
+    """
+    Shared registry for a contestant list (one per distinct list of IDs and tribes,
+    the REGISTRY_CACHE_SIZE most recently used kept).
+    """
+    return _registry_for(tuple((c["id"], c["starting_tribe"]) for c in contestants))
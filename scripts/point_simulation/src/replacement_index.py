@@ -0,0 +1,150 @@
+"""
+Replacement index: answers count_viable_replacements for any freed budget by bisection.
+Built once per tribal (replacement pool + prices after the update). Candidates are
+sorted by price, so the affordable set for budget B is a prefix; prefix maxima of
+value (expected points / price), prefix price spreads and medians, and each prefix's
+sorted values make every per-budget quantity an O(log n) lookup. landscape() tabulates
+the answer for every distinct budget at once.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Any, Optional, Sequence, Union
+
+from .registry import ContestantRegistry, Roster
+
+
+def adaptive_tolerance(
+    price_range: int,
+    median: int,
+    remaining_count: int,
+    config: Dict[str, Any],
+) -> float:
+    """
+    Value tolerance from the affordable price range and median (dynamic_pricing._adaptive_value_tolerance):
+    widen when prices are highly compressed or late-season (few players remaining).
+    """
+    base = config.get("replacement_value_tolerance_base", 0.10)
+    max_tol = config.get("replacement_value_tolerance_max", 0.18)
+    late_threshold = config.get("late_season_threshold", 12)
+    compressed_ratio = config.get("highly_compressed_ratio", 0.35)
+
+    tolerance = base
+    compression_ratio = (price_range / median) if median > 0 else 1.0
+
+    # Widen when highly compressed (similar prices = harder to differentiate)
+    if compression_ratio < compressed_ratio:
+        tolerance = min(max_tol, base + 0.05)
+
+    # Widen when late-season (fewer options = need broader "viable" band)
+    if remaining_count < late_threshold:
+        tolerance = min(max_tol, tolerance + 0.04)
+
+    return min(max_tol, tolerance)
+
+
+class ReplacementIndex:
+    """Viable-replacement queries for one replacement pool at one set of prices."""
+
+    def __init__(
+        self,
+        replacement_pool: Roster,
+        prices: Union[Dict[str, int], Sequence[int]],
+        expected_points: Union[Dict[str, float], Sequence[float]],
+        registry: Optional[ContestantRegistry] = None,
+    ):
+        """With a registry, the pool may be a bitmask or index list and prices / expected_points are registry arrays."""
+        if registry is not None:
+            pool = registry.indices(replacement_pool)
+            ids = [registry.ids[i] for i in pool]
+            pool_prices = [prices[i] for i in pool]
+            pool_expected = [expected_points[i] for i in pool]
+        else:
+            ids = list(replacement_pool)
+            pool_prices = [prices.get(c, 0) for c in ids]
+            pool_expected = [expected_points.get(c, 0) for c in ids]
+        self.pool_size = len(ids)
+        # Ties in price keep pool order, so listing a prefix by position reproduces the pool order
+        order = sorted(range(len(ids)), key=pool_prices.__getitem__)
+        self.ids = [ids[i] for i in order]
+        self.positions = order
+        self.prices = [pool_prices[i] for i in order]
+        self.expected = [pool_expected[i] for i in order]
+        self.values = [(ep / p) if p > 0 else 0 for ep, p in zip(self.expected, self.prices)]
+
+        # prefix_max[k] = best value among the k cheapest; sorted_values[k] = their values, ascending
+        self.prefix_max: List[float] = [0]
+        self.sorted_values: List[List[float]] = [[]]
+        current: List[float] = []
+        for v in self.values:
+            insort(current, v)
+            self.prefix_max.append(max(self.prefix_max[-1], v) if len(current) > 1 else v)
+            self.sorted_values.append(list(current))
+
+    def affordable_count(self, budget: int) -> int:
+        return bisect_right(self.prices, budget)
+
+    def tolerance(self, k: int, config: Optional[Dict[str, Any]]) -> float:
+        """Adaptive value tolerance for the k cheapest candidates (see adaptive_tolerance)."""
+        if not config:
+            return 0.10
+        if k == 0:
+            return config.get("replacement_value_tolerance_base", 0.10)
+        price_range = self.prices[k - 1] - self.prices[0]
+        return adaptive_tolerance(price_range, self.prices[k // 2], self.pool_size, config)
+
+    def viable_count(self, budget: int, value_tolerance: Optional[float] = None, config: Optional[Dict[str, Any]] = None) -> int:
+        """Number of viable replacements for budget, without listing them."""
+        k = self.affordable_count(budget)
+        if k == 0:
+            return 0
+        tol = value_tolerance if value_tolerance is not None else self.tolerance(k, config)
+        threshold = self.prefix_max[k] * (1 - tol)
+        return k - bisect_left(self.sorted_values[k], threshold)
+
+    def query(
+        self,
+        budget: int,
+        value_tolerance: Optional[float] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Same result as count_viable_replacements(pool, prices, expected_points, budget, ...)."""
+        k = self.affordable_count(budget)
+        if k == 0:
+            return {"count": 0, "best_value": 0, "viable": [], "all_options": 0, "affordable_count": 0}
+        tol = value_tolerance if value_tolerance is not None else self.tolerance(k, config)
+        best_value = self.prefix_max[k]
+        threshold = best_value * (1 - tol)
+        members = sorted((i for i in range(k) if self.values[i] >= threshold), key=lambda i: self.positions[i])
+        return {
+            "count": len(members),
+            "best_value": best_value,
+            "viable": [
+                (self.ids[i], self.prices[i], round(self.expected[i], 1), round(self.values[i], 4))
+                for i in members
+            ],
+            "all_options": k,
+            "affordable_count": k,
+            "value_tolerance_used": tol,
+        }
+
+    def landscape(self, value_tolerance: Optional[float] = None, config: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        One row per distinct answer: a freed budget from budget_min up to the next row's
+        budget_min affords the affordable_count cheapest candidates, of which viable_count
+        are viable. Budgets below the first row afford no one.
+        """
+        rows = []
+        n = len(self.prices)
+        for k in range(1, n + 1):
+            if k < n and self.prices[k] == self.prices[k - 1]:
+                continue  # same price: the budget that affords k also affords k + 1
+            tol = value_tolerance if value_tolerance is not None else self.tolerance(k, config)
+            threshold = self.prefix_max[k] * (1 - tol)
+            rows.append({
+                "budget_min": self.prices[k - 1],
+                "affordable_count": k,
+                "best_value": self.prefix_max[k],
+                "viable_count": k - bisect_left(self.sorted_values[k], threshold),
+                "value_tolerance": tol,
+            })
+        return rows
@@ -0,0 +1,179 @@
+"""
+Re-pricing after trait edits without re-simulating.
+survival_bias and challenge_ability enter a season only through weighted draws:
+the draws behind the boot order, the strategic player (survival_bias among the
+matched voters) and the individual immunity winner (challenge_ability among the
+active players). A price bank keeps every season's solo points with those draws,
+so after an edit to contestants_s50.yaml the same seasons can be reweighted by
+the likelihood ratio of the edited traits to the ones they were drawn with
+(self-normalized importance sampling). Only the draws touching an edited
+contestant are revisited. Big edits leave a few seasons carrying the weight; the
+effective sample size says when to re-simulate instead.
+"""
+
+import math
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from .config import load_probabilities
+from .price_generator import price_seasons
+from .profiling import Profiler
+
+TRAIT_KEYS = ("survival_bias", "challenge_ability")
+# Below this share of the bank's seasons in effective sample size, re-simulate
+MIN_ESS_FRACTION = 0.2
+
+
+def _traits(contestants: List[Dict]) -> Dict[str, Dict[str, float]]:
+    return {c["id"]: {key: c.get(key, 0.5) for key in TRAIT_KEYS} for c in contestants}
+
+
+def build_price_bank(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring_config: Dict[str, Any],
+    config_dir: Optional[Path] = None,
+    num_runs: int = 2000,
+    seed: int = 42,
+    profiler: Optional[Profiler] = None,
+    bps_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    The price-estimation seasons (price_seasons, as in
+    compute_expected_points_per_contestant) with what reweighting needs: traits
+    (those the seasons were drawn with), points (contestant -> solo points per
+    season) and seasons (per season: boot draw counts, strategic [chosen, matched
+    voters] and immunity [winner, active players]). JSON-serializable.
+    """
+    probabilities = load_probabilities(config_dir) if config_dir is not None else None
+    contestant_ids = [c["id"] for c in contestants]
+    points: Dict[str, List[float]] = {cid: [] for cid in contestant_ids}
+    seasons = []
+    for _, season, trace, season_points in price_seasons(
+        contestants, season_template, scoring_config, range(num_runs), seed=seed,
+        probabilities=probabilities, profiler=profiler, bps_config=bps_config, trace=True,
+    ):
+        for cid, pts in season_points.items():
+            points[cid].append(pts)
+        boot: Dict[str, int] = {}
+        for cid in trace["boot_draws"]:
+            boot[cid] = boot.get(cid, 0) + 1
+        seasons.append({
+            "boot": boot,
+            "strategic": [
+                [ep["strategic_player"][0], ep["vote_matched"]] for ep in season if ep.get("strategic_player")
+            ],
+            "immunity": [
+                [ep["individual_immunity_winner"], ep["active_contestants"]]
+                for ep in season
+                if ep.get("immunity_type") == "individual" and ep.get("individual_immunity_winner")
+            ],
+        })
+    return {"seed": seed, "runs": num_runs, "traits": _traits(contestants), "points": points, "seasons": seasons}
+
+
+def trait_changes(bank: Dict[str, Any], contestants: List[Dict]) -> Dict[str, Dict[str, Tuple[float, float]]]:
+    """contestant_id -> trait -> (bank value, new value) for every trait that differs."""
+    old, new = bank["traits"], _traits(contestants)
+    if set(old) != set(new):
+        raise ValueError("Contestants differ from the bank's; re-simulate instead of reweighting")
+    changes: Dict[str, Dict[str, Tuple[float, float]]] = {}
+    for cid, traits in new.items():
+        for key, value in traits.items():
+            if value != old[cid][key]:
+                changes.setdefault(cid, {})[key] = (old[cid][key], value)
+    return changes
+
+
+def _draw_log_ratio(
+    draws: List[List[Any]],
+    old: Dict[str, float],
+    new: Dict[str, float],
+    changed: Dict[str, float],
+) -> float:
+    """Log likelihood ratio of weighted picks [chosen, candidates]; changed: contestant -> new minus old weight."""
+    total = 0.0
+    for chosen, candidates in draws:
+        if chosen in changed:
+            if new[chosen] <= 0:
+                return -math.inf
+            total += math.log(new[chosen] / old[chosen])
+        delta = sum(changed[c] for c in changed if c in candidates)
+        if delta:
+            before = sum(old[c] for c in candidates)
+            total -= math.log((before + delta) / before)
+    return total
+
+
+def reweighted_expected_points(
+    bank: Dict[str, Any],
+    contestants: List[Dict],
+    min_ess_fraction: float = MIN_ESS_FRACTION,
+) -> Dict[str, Any]:
+    """
+    Expected points under contestants' traits from the bank's seasons, each weighted
+    by its likelihood ratio against the bank's traits. Returns expected_points, se,
+    changes (trait_changes), ess and ess_fraction (Kish effective sample size of the
+    weights, and its share of the seasons), and warning (a message when ess_fraction
+    is below min_ess_fraction, else None).
+    """
+    changes = trait_changes(bank, contestants)
+    old = {key: {cid: t[key] for cid, t in bank["traits"].items()} for key in TRAIT_KEYS}
+    new = {key: {cid: t[key] for cid, t in _traits(contestants).items()} for key in TRAIT_KEYS}
+    delta = {
+        key: {cid: new[key][cid] - old[key][cid] for cid, c in changes.items() if key in c}
+        for key in TRAIT_KEYS
+    }
+    for key in TRAIT_KEYS:
+        for cid in delta[key]:
+            if old[key][cid] <= 0:
+                raise ValueError(f"{cid} had {key} 0 in the bank, so no season drew them; re-simulate")
+    survival = delta["survival_bias"]
+    boot_shift = 0.0
+    if survival:
+        boot_shift = math.log(sum(new["survival_bias"].values()) / sum(old["survival_bias"].values()))
+
+    log_ratios = []
+    for season in bank["seasons"]:
+        lr = 0.0
+        if survival:
+            boot = season["boot"]
+            for cid in survival:
+                if boot.get(cid):
+                    lr += boot[cid] * (math.log(new["survival_bias"][cid] / old["survival_bias"][cid])
+                                       if new["survival_bias"][cid] > 0 else -math.inf)
+            lr -= sum(boot.values()) * boot_shift
+            lr += _draw_log_ratio(season["strategic"], old["survival_bias"], new["survival_bias"], survival)
+        if delta["challenge_ability"]:
+            lr += _draw_log_ratio(
+                season["immunity"], old["challenge_ability"], new["challenge_ability"], delta["challenge_ability"],
+            )
+        log_ratios.append(lr)
+
+    runs = len(log_ratios)
+    top = max(log_ratios, default=0.0)
+    if top == -math.inf:
+        raise ValueError("No season in the bank is possible under the new traits; re-simulate")
+    weights = [math.exp(lr - top) for lr in log_ratios]
+    norm = sum(weights)
+    weights = [w / norm for w in weights]
+    ess = 1.0 / sum(w * w for w in weights) if runs else 0.0
+    expected, se = {}, {}
+    for cid, values in bank["points"].items():
+        m = sum(w * v for w, v in zip(weights, values))
+        expected[cid] = m
+        se[cid] = math.sqrt(sum(w * w * (v - m) ** 2 for w, v in zip(weights, values)))
+    fraction = ess / runs if runs else 0.0
+    warning = None
+    if fraction < min_ess_fraction:
+        warning = (f"Effective sample size {ess:,.0f} of {runs} seasons ({fraction:.0%}) is below "
+                   f"{min_ess_fraction:.0%}: the edit is too large to reweight reliably, re-simulate")
+    return {
+        "expected_points": expected,
+        "se": se,
+        "changes": changes,
+        "ess": ess,
+        "ess_fraction": fraction,
+        "warning": warning,
+        "runs": runs,
+    }
@@ -1,11 +1,17 @@
 """
 Enumerates and samples valid roster combinations under budget and tribe constraints.
 Used to count total team options and to sample diverse rosters for simulation.
+Works on registry indices and bitmasks internally (see registry.py); rosters are
+returned as contestant ID lists.
 """
 
 import random
+from bisect import bisect_right
 from itertools import combinations
-from typing import Dict, List, Any, Optional, Tuple
+from math import comb
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+from .registry import MIN_TRIBES, ContestantRegistry, get_registry, popcount
 
 
 def get_tribe_map(contestants: List[Dict]) -> Dict[str, str]:
@@ -13,6 +19,11 @@ def get_tribe_map(contestants: List[Dict]) -> Dict[str, str]:
     return {c["id"]: c["starting_tribe"] for c in contestants}
 
 
+def combination_count(num_contestants: int, roster_min: int, roster_max: int) -> int:
+    """Number of combinations scanned when enumerating roster_min..roster_max sized rosters."""
+    return sum(comb(num_contestants, size) for size in range(roster_min, roster_max + 1))
+
+
 def is_valid_roster(
     roster: Tuple[str, ...],
     prices: Dict[str, int],
@@ -27,12 +38,87 @@ def is_valid_roster(
     if not (roster_min <= len(roster) <= roster_max):
         return False
     tribes_represented = set(tribe_map.get(c, "") for c in roster)
-    if len(tribes_represented) < 3:
+    if len(tribes_represented) < MIN_TRIBES:
         return False
     cost = sum(prices.get(c, 0) for c in roster)
     return cost <= budget
 
 
+def is_valid_mask(
+    mask: int,
+    registry: ContestantRegistry,
+    price_array: Sequence[int],
+    budget: int,
+    roster_min: int = 5,
+    roster_max: int = 7,
+) -> bool:
+    """is_valid_roster for a roster bitmask, with prices as a registry-indexed array."""
+    indices = registry.indices(mask)
+    if not (roster_min <= len(indices) <= roster_max):
+        return False
+    if not registry.tribe_valid(mask):
+        return False
+    return sum(price_array[i] for i in indices) <= budget
+
+
+def _tribe_valid_count(registry: ContestantRegistry, size: int) -> int:
+    """
+    Combinations of `size` from at least MIN_TRIBES tribes: all combinations less
+    those covering exactly each too-small tribe set (inclusion-exclusion over its subsets).
+    """
+    sizes = [popcount(tm) for tm in registry.tribe_masks]
+    total = comb(len(registry), size)
+    for covered in range(registry.all_tribes + 1):
+        if registry.valid_coverage[covered]:
+            continue
+        sub = covered
+        while True:
+            sign = -1 if popcount(covered ^ sub) % 2 else 1
+            total -= sign * comb(sum(n for t, n in enumerate(sizes) if sub >> t & 1), size)
+            if not sub:
+                break
+            sub = (sub - 1) & covered
+    return total
+
+
+def _budget_valid_count(registry: ContestantRegistry, price_array: Sequence[int], budget: int, size: int) -> int:
+    """
+    Combinations of `size` from at least MIN_TRIBES tribes and cost <= budget.
+    Depth-first over contestants sorted by price: a branch stops at the first
+    contestant it can't afford, and the last pick is counted by bisection.
+    """
+    order = sorted(range(len(registry)), key=lambda i: price_array[i])
+    prices = [price_array[i] for i in order]
+    bits = [registry.tribe_bits[i] for i in order]
+    n = len(order)
+    tribes = range(len(registry.tribes))
+    # by_tribe[t][k] = contestants of tribe t among the k cheapest
+    by_tribe = []
+    for t in tribes:
+        counts = [0]
+        for b in bits:
+            counts.append(counts[-1] + (b >> t & 1))
+        by_tribe.append(counts)
+
+    def count(start: int, picks: int, remaining: int, covered: int) -> int:
+        needed = MIN_TRIBES - popcount(covered)
+        if needed > picks:
+            return 0
+        hi = bisect_right(prices, remaining, start)
+        if picks == 1:
+            if needed <= 0:
+                return hi - start
+            return sum(by_tribe[t][hi] - by_tribe[t][start] for t in tribes if not covered >> t & 1)
+        total = 0
+        for j in range(start, min(hi, n - picks + 1)):
+            total += count(j + 1, picks - 1, remaining - prices[j], covered | bits[j])
+        return total
+
+    if size == 0:
+        return 0
+    return count(0, size, budget, 0)
+
+
 def count_tribe_valid_combos(
     contestants: List[Dict],
     roster_min: int = 7,
@@ -42,15 +128,8 @@ def count_tribe_valid_combos(
     Count all tribe-valid roster combinations (min 1 per tribe) without budget filter.
     Used to compute merge_valid_pct = valid_under_budget / total_tribe_valid.
     """
-    all_ids = [c["id"] for c in contestants]
-    tribe_map = get_tribe_map(contestants)
-    count = 0
-    for size in range(roster_min, roster_max + 1):
-        for combo in combinations(all_ids, size):
-            tribes_represented = set(tribe_map.get(c, "") for c in combo)
-            if len(tribes_represented) >= 3:
-                count += 1
-    return count
+    registry = get_registry(contestants)
+    return sum(_tribe_valid_count(registry, size) for size in range(roster_min, roster_max + 1))
 
 
 def count_valid_rosters(
@@ -64,15 +143,11 @@ def count_valid_rosters(
     Count all valid roster combinations (roster_min to roster_max players, min 1 per tribe, under budget).
     Returns dict with total and per-size breakdown.
     """
-    all_ids = [c["id"] for c in contestants]
-    tribe_map = get_tribe_map(contestants)
+    registry = get_registry(contestants)
+    price_array = registry.array(prices)
 
     sizes = list(range(roster_min, roster_max + 1))
-    counts = {s: 0 for s in sizes}
-    for size in sizes:
-        for combo in combinations(all_ids, size):
-            if is_valid_roster(combo, prices, budget, tribe_map, roster_min, roster_max):
-                counts[size] += 1
+    counts = {s: _budget_valid_count(registry, price_array, budget, s) for s in sizes}
 
     result = {"total": sum(counts.values())}
     for s in sizes:
@@ -91,29 +166,53 @@ def sample_valid_rosters(
 ) -> List[List[str]]:
     """
     Sample n unique valid rosters. Uses rejection sampling with deduplication.
-    Returns list of rosters (each roster is a list of contestant IDs).
+    Returns list of rosters (each roster is a sorted list of contestant IDs).
     """
+    registry = get_registry(contestants)
+    masks = sample_valid_roster_masks(contestants, prices, budget, n, seed, roster_min, roster_max)
+    return [sorted(registry.to_ids(m)) for m in masks]
+
+
+def sample_valid_roster_masks(
+    contestants: List[Dict],
+    prices: Dict[str, int],
+    budget: int,
+    n: int,
+    seed: Optional[int] = None,
+    roster_min: int = 5,
+    roster_max: int = 7,
+) -> List[int]:
+    """sample_valid_rosters returning registry bitmasks (same draws, same order)."""
     if seed is not None:
         random.seed(seed)
-    all_ids = [c["id"] for c in contestants]
-    tribe_map = get_tribe_map(contestants)
+    registry = get_registry(contestants)
+    price_array = registry.array(prices)
+    tribe_bits = registry.tribe_bits
+    valid_coverage = registry.valid_coverage
+    population = range(len(registry))
     seen: set = set()
-    rosters: List[List[str]] = []
+    masks: List[int] = []
 
     max_attempts = n * 500  # Avoid infinite loop
     attempts = 0
-    while len(rosters) < n and attempts < max_attempts:
+    while len(masks) < n and attempts < max_attempts:
         size = roster_min if roster_min == roster_max else random.randint(roster_min, roster_max)
-        combo = tuple(sorted(random.sample(all_ids, size)))
-        if combo in seen:
-            attempts += 1
-            continue
-        if is_valid_roster(combo, prices, budget, tribe_map, roster_min, roster_max):
-            seen.add(combo)
-            rosters.append(list(combo))
+        picks = random.sample(population, size)
+        mask = 0
+        covered = 0
+        cost = 0
+        for i in picks:
+            mask |= 1 << i
+            covered |= tribe_bits[i]
+            cost += price_array[i]
         attempts += 1
+        if mask in seen:
+            continue
+        if valid_coverage[covered] and cost <= budget:
+            seen.add(mask)
+            masks.append(mask)
 
-    return rosters
+    return masks
 
 
 def compute_combo_cost_percentiles(
@@ -129,17 +228,20 @@ def compute_combo_cost_percentiles(
     """
     if percentiles is None:
         percentiles = [0.5, 0.75, 0.9]
-    all_ids = [c["id"] for c in contestants]
-    tribe_map = get_tribe_map(contestants)
+    registry = get_registry(contestants)
+    price_array = registry.array(prices)
+    tribe_bits = registry.tribe_bits
+    valid_coverage = registry.valid_coverage
     costs: List[int] = []
 
     for size in range(roster_min, roster_max + 1):
-        for combo in combinations(all_ids, size):
-            tribes_represented = set(tribe_map.get(c, "") for c in combo)
-            if len(tribes_represented) < 3:
+        for combo in combinations(range(len(registry)), size):
+            covered = 0
+            for i in combo:
+                covered |= tribe_bits[i]
+            if not valid_coverage[covered]:
                 continue
-            cost = sum(prices.get(c, 0) for c in combo)
-            costs.append(cost)
+            costs.append(sum([price_array[i] for i in combo]))
 
     if not costs:
         return {f"p{int(p*100)}": 0 for p in percentiles}
@@ -165,14 +267,17 @@ def enumerate_valid_rosters(
     Enumerate all valid rosters (or up to max_rosters if set).
     Use when total count is manageable; for large counts, use sample_valid_rosters.
     """
-    all_ids = [c["id"] for c in contestants]
-    tribe_map = get_tribe_map(contestants)
+    registry = get_registry(contestants)
+    price_array = registry.array(prices)
     rosters: List[List[str]] = []
 
     for size in [5, 6, 7]:
-        for combo in combinations(all_ids, size):
-            if is_valid_roster(combo, prices, budget, tribe_map, roster_min, roster_max):
-                rosters.append(list(combo))
+        if not (roster_min <= size <= roster_max):
+            continue
+        for combo in combinations(range(len(registry)), size):
+            mask = registry.mask(combo)
+            if is_valid_mask(mask, registry, price_array, budget, roster_min, roster_max):
+                rosters.append(registry.to_ids(mask))
                 if max_rosters is not None and len(rosters) >= max_rosters:
                     return rosters
     return rosters
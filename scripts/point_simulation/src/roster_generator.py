@@ -5,7 +5,9 @@ Post-merge: 5 contestants (from remaining pool)
 """
 
 import random
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from .registry import ContestantRegistry, get_registry
 
 
 def get_tribes(contestants: List[Dict]) -> Dict[str, List[str]]:
@@ -38,58 +40,31 @@ def generate_pre_merge_roster(
     if len(tribe_names) < 3:
         raise ValueError("Need at least 3 tribes")
     
+    traits = {c["id"]: c for c in contestants}
     roster = []
     
     # Pick 2 from each tribe
     for tribe in tribe_names:
         pool = tribes[tribe]
         if strategy == "challenge_beast":
-            sorted_pool = sorted(
-                [(c, next((x["challenge_ability"] for x in contestants if x["id"] == c), 0.5)) 
-                 for c in pool],
-                key=lambda x: x[1],
-                reverse=True,
-            )
-            picks = [x[0] for x in sorted_pool[:2]]
+            picks = sorted(pool, key=lambda c: traits[c]["challenge_ability"], reverse=True)[:2]
         elif strategy == "idol_hunter":
-            sorted_pool = sorted(
-                [(c, next((x["idol_likelihood"] for x in contestants if x["id"] == c), 0.3)) 
-                 for c in pool],
-                key=lambda x: x[1],
-                reverse=True,
-            )
-            picks = [x[0] for x in sorted_pool[:2]]
+            picks = sorted(pool, key=lambda c: traits[c]["idol_likelihood"], reverse=True)[:2]
         elif strategy == "utr":
-            sorted_pool = sorted(
-                [(c, next((x["survival_bias"] for x in contestants if x["id"] == c), 0.5)) 
-                 for c in pool],
-                key=lambda x: x[1],
-                reverse=True,
-            )
-            picks = [x[0] for x in sorted_pool[:2]]
+            picks = sorted(pool, key=lambda c: traits[c]["survival_bias"], reverse=True)[:2]
         else:  # random or balanced
             picks = random.sample(pool, min(2, len(pool)))
         
         roster.extend(picks)
     
     # Wild card (1 from any tribe)
-    all_ids = [c["id"] for c in contestants]
-    remaining = [c for c in all_ids if c not in roster]
+    picked = set(roster)
+    remaining = [c["id"] for c in contestants if c["id"] not in picked]
     
     if strategy == "challenge_beast" and remaining:
-        sorted_rem = sorted(
-            [(c, next((x["challenge_ability"] for x in contestants if x["id"] == c), 0.5)) for c in remaining],
-            key=lambda x: x[1],
-            reverse=True,
-        )
-        roster.append(sorted_rem[0][0])
+        roster.append(max(remaining, key=lambda c: traits[c]["challenge_ability"]))
     elif strategy == "idol_hunter" and remaining:
-        sorted_rem = sorted(
-            [(c, next((x["idol_likelihood"] for x in contestants if x["id"] == c), 0.3)) for c in remaining],
-            key=lambda x: x[1],
-            reverse=True,
-        )
-        roster.append(sorted_rem[0][0])
+        roster.append(max(remaining, key=lambda c: traits[c]["idol_likelihood"]))
     elif remaining:
         roster.append(random.choice(remaining))
     
@@ -252,6 +227,12 @@ def _generate_premium_roster(
     return roster[:roster_max]
 
 
+BUDGET_STRATEGIES = [
+    "max_expected", "value", "balanced", "mid_tier",
+    "stars_and_scrubs", "five_premium", "six_premium", "random",
+]
+
+
 def generate_budget_roster(
     contestants: List[Dict],
     prices: Dict[str, int],
@@ -365,12 +346,7 @@ def generate_budget_rosters_for_simulation(
     Returns list of { roster, strategy, total_cost } dicts.
     """
     rosters = []
-    strategies = [
-        "max_expected", "value", "balanced", "mid_tier",
-        "stars_and_scrubs", "five_premium", "six_premium", "random",
-    ]
-    
-    for strategy in strategies:
+    for strategy in BUDGET_STRATEGIES:
         for i in range(num_per_strategy):
             r = generate_budget_roster(
                 contestants,
@@ -390,3 +366,260 @@ def generate_budget_rosters_for_simulation(
             })
     
     return rosters
+
+
+def dedupe_rosters(
+    rosters: List[Dict[str, Any]],
+    contestants: List[Dict],
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
+    """
+    Collapse identical rosters (same players, any order) from the *_rosters_for_simulation generators.
+    Returns (unique, by_strategy):
+      unique: [{ roster, mask, total_cost, multiplicity, strategies: {strategy: count} }] in first-seen order
+        (mask: the roster's registry bitmask, for scoring with calculate_roster_points(..., registry=...))
+      by_strategy: strategy -> indices into unique, in the order that strategy first produced them
+    Score each unique roster once and weight aggregates by strategies[strategy].
+    """
+    registry = get_registry(contestants)
+    index_by_mask: Dict[int, int] = {}
+    unique: List[Dict[str, Any]] = []
+    by_strategy: Dict[str, List[int]] = {}
+    for r in rosters:
+        key = registry.mask(r["roster"])
+        i = index_by_mask.get(key)
+        if i is None:
+            i = index_by_mask[key] = len(unique)
+            unique.append({
+                "roster": r["roster"],
+                "mask": key,
+                "total_cost": r.get("total_cost"),
+                "multiplicity": 0,
+                "strategies": {},
+            })
+        entry = unique[i]
+        entry["multiplicity"] += 1
+        strategy = r["strategy"]
+        if strategy not in entry["strategies"]:
+            entry["strategies"][strategy] = 0
+            by_strategy.setdefault(strategy, []).append(i)
+        entry["strategies"][strategy] += 1
+    return unique, by_strategy
+
+
+class RosterIndex:
+    """
+    Prices, expected points, tribes and per-strategy pick orders precomputed once, for
+    generating large batches of budget-strategy rosters as registry bitmasks.
+    Same rules as generate_budget_roster (ties broken uniformly at random), but draws
+    come from a caller-supplied random.Random instead of reseeding the global RNG.
+    """
+
+    def __init__(
+        self,
+        contestants: List[Dict],
+        prices: Dict[str, int],
+        budget: int,
+        expected_points: Optional[Dict[str, float]] = None,
+        roster_min: int = 5,
+        roster_max: int = 7,
+    ):
+        self.registry: ContestantRegistry = get_registry(contestants)
+        if len(self.registry.tribes) < 3:
+            raise ValueError("Need at least 3 tribes")
+        self.budget = budget
+        self.roster_min = roster_min
+        self.roster_max = roster_max
+        self.expected_points = expected_points or {}
+        self.prices: List[int] = self.registry.array(prices, 0)
+        self._score_prices: List[int] = self.registry.array(prices, 1)
+        self.expected: List[float] = self.registry.array(self.expected_points, 0)
+        n = len(self.registry)
+        self.tribe_members: List[List[int]] = [self.registry.indices(tm) for tm in self.registry.tribe_masks]
+        self.by_price: List[int] = sorted(range(n), key=lambda i: self.prices[i])
+        self._groups: Dict[str, Tuple[List[List[int]], List[List[List[int]]]]] = {}
+        # strategy -> the one roster it always yields, when it never faces a real tie
+        self._fixed: Dict[str, Optional[int]] = {}
+
+    def _scores(self, strategy: str) -> List[float]:
+        """Per-contestant pick scores (score_for_pick in generate_budget_roster)."""
+        eps, prices = self.expected, self._score_prices
+        if strategy in ("max_expected", "five_premium", "six_premium"):
+            # The premium strategies pick 1 per tribe then fill to roster_max, best expected first
+            return list(eps)
+        if strategy == "value":
+            return [ep / p if p > 0 else 0 for ep, p in zip(eps, prices)]
+        if strategy == "balanced":
+            return [(ep / p if p > 0 else 0) + 0.001 * ep for ep, p in zip(eps, prices)]
+        if strategy == "mid_tier":
+            all_eps = sorted(self.expected_points.values()) if self.expected_points else [0]
+            mid_low = all_eps[len(all_eps) // 4]
+            mid_high = all_eps[3 * len(all_eps) // 4]
+            return [
+                (ep / p if p > 0 else 0) if mid_low <= ep <= mid_high else -1000
+                for ep, p in zip(eps, prices)
+            ]
+        raise ValueError(f"Unknown budget strategy: {strategy}")
+
+    def _score_groups(self, strategy: str) -> Tuple[List[List[int]], List[List[List[int]]]]:
+        """Contestants grouped by equal score, best first: overall and per tribe."""
+        groups = self._groups.get(strategy)
+        if groups is None:
+            scores = self._scores("max_expected" if strategy == "stars_and_scrubs" else strategy)
+
+            def grouped(members: List[int]) -> List[List[int]]:
+                out: Dict[float, List[int]] = {}
+                for i in members:
+                    out.setdefault(scores[i], []).append(i)
+                return [out[k] for k in sorted(out, reverse=True)]
+
+            groups = self._groups[strategy] = (
+                grouped(list(range(len(self.registry)))),
+                [grouped(members) for members in self.tribe_members],
+            )
+        return groups
+
+    def _choose(self, options: List[int], rng: random.Random, ties: List[int]) -> int:
+        if len(options) > 1:
+            ties[0] += 1
+            return rng.choice(options)
+        return options[0]
+
+    def _best_affordable(
+        self, groups: List[List[int]], used: int, remaining: int, rng: random.Random, ties: List[int]
+    ) -> Optional[int]:
+        prices = self.prices
+        for group in groups:
+            options = [i for i in group if not used >> i & 1 and prices[i] <= remaining]
+            if options:
+                return self._choose(options, rng, ties)
+        return None
+
+    def _build(self, strategy: str, rng: random.Random, ties: List[int]) -> int:
+        prices = self.prices
+        roster_max = self.roster_max
+        mask = 0
+        size = 0
+        remaining = self.budget
+
+        if strategy == "stars_and_scrubs":
+            overall, _ = self._score_groups(strategy)
+            for _ in range(2):
+                pick = self._best_affordable(overall, mask, remaining, rng, ties)
+                if pick is None:
+                    break
+                mask |= 1 << pick
+                size += 1
+                remaining -= prices[pick]
+            # Cheapest affordable from each tribe not yet represented, then cheapest overall
+            for members, tribe_mask in zip(self.tribe_members, self.registry.tribe_masks):
+                if mask & tribe_mask:
+                    continue
+                pool = [i for i in members if not mask >> i & 1]
+                if pool:
+                    cheapest = min(pool, key=lambda i: prices[i])
+                    if prices[cheapest] <= remaining:
+                        mask |= 1 << cheapest
+                        size += 1
+                        remaining -= prices[cheapest]
+            for i in self.by_price:
+                if size >= roster_max:
+                    break
+                if not mask >> i & 1 and prices[i] <= remaining:
+                    mask |= 1 << i
+                    size += 1
+                    remaining -= prices[i]
+            return mask
+
+        if strategy == "random":
+            for members in self.tribe_members:
+                affordable = [i for i in members if prices[i] <= remaining]
+                pick = self._choose(affordable, rng, ties) if affordable else min(members, key=lambda i: prices[i])
+                mask |= 1 << pick
+                size += 1
+                remaining -= prices[pick]
+            candidates = [i for i in range(len(prices)) if not mask >> i & 1 and prices[i] <= remaining]
+            while size < roster_max and candidates:
+                pick = self._choose(candidates, rng, ties)
+                mask |= 1 << pick
+                size += 1
+                remaining -= prices[pick]
+                candidates = [i for i in candidates if i != pick and prices[i] <= remaining]
+            return mask
+
+        overall, per_tribe = self._score_groups(strategy)
+        for members, groups in zip(self.tribe_members, per_tribe):
+            pick = self._best_affordable(groups, mask, remaining, rng, ties)
+            if pick is None:
+                pick = min(members, key=lambda i: prices[i])
+            mask |= 1 << pick
+            size += 1
+            remaining -= prices[pick]
+        # Fill best-first; once a score group has nothing affordable it never will (budget only shrinks)
+        for group in overall:
+            options = [i for i in group if not mask >> i & 1 and prices[i] <= remaining]
+            while options and size < roster_max:
+                pick = self._choose(options, rng, ties)
+                mask |= 1 << pick
+                size += 1
+                remaining -= prices[pick]
+                options = [i for i in options if i != pick and prices[i] <= remaining]
+            if size >= roster_max:
+                break
+        return mask
+
+    def generate_roster(self, strategy: str, rng: random.Random) -> int:
+        """One roster bitmask for a budget strategy (see BUDGET_STRATEGIES)."""
+        return self._build(strategy, rng, [0])
+
+    def generate_rosters(self, strategy: str, n: int, rng: Optional[random.Random] = None) -> List[int]:
+        """
+        n roster bitmasks for a budget strategy. Strategies that never face a tie
+        (most deterministic ones at a given price list) are built once and repeated.
+        """
+        if strategy not in BUDGET_STRATEGIES:
+            raise ValueError(f"Unknown budget strategy: {strategy}")
+        rng = rng or random.Random()
+        if n <= 0:
+            return []
+        fixed = self._fixed.get(strategy)
+        if fixed is not None:
+            return [fixed] * n
+        ties = [0]
+        first = self._build(strategy, rng, ties)
+        if not ties[0]:
+            self._fixed[strategy] = first
+            return [first] * n
+        build = self._build
+        return [first] + [build(strategy, rng, ties) for _ in range(n - 1)]
+
+    def roster_cost(self, mask: int) -> int:
+        prices = self.prices
+        return sum(prices[i] for i in self.registry.indices(mask))
+
+
+def generate_indexed_rosters_for_simulation(
+    contestants: List[Dict],
+    prices: Dict[str, int],
+    budget: int,
+    expected_points: Dict[str, float],
+    num_per_strategy: int = 20,
+    seed: Optional[int] = None,
+    roster_min: int = 5,
+    roster_max: int = 7,
+) -> List[Dict[str, Any]]:
+    """
+    generate_budget_rosters_for_simulation on a RosterIndex: same { roster, strategy, total_cost }
+    output and rules, drawn from one random.Random(seed) stream. Fast enough for 100k+ rosters
+    per strategy; identical rosters share one ID list.
+    """
+    index = RosterIndex(contestants, prices, budget, expected_points, roster_min, roster_max)
+    rng = random.Random(seed)
+    rosters = []
+    decoded: Dict[int, Tuple[List[str], int]] = {}
+    for strategy in BUDGET_STRATEGIES:
+        for mask in index.generate_rosters(strategy, num_per_strategy, rng):
+            entry = decoded.get(mask)
+            if entry is None:
+                entry = decoded[mask] = (index.registry.to_ids(mask), index.roster_cost(mask))
+            rosters.append({"roster": entry[0], "strategy": strategy, "total_cost": entry[1]})
+    return rosters
@@ -2,21 +2,168 @@
 Generates random Survivor season scenarios for Monte Carlo simulation.
 Uses research-based probabilities from config/probabilities.yaml.
 Supports: 24 contestants, tribe swap at 16/17, merge at 12/11.
+Can also continue a season from observed episodes (see generate_scenario's observed),
+draw antithetic season pairs (see generate_scenario's antithetic), force the
+swap / merge structure for stratified sampling (see generate_scenario's structure)
+and take its key draws from a quasi-Monte Carlo point (see qmc_dimensions).
+generate_tilted_scenario over-samples rare events (quits, medevacs, two-item
+pockets, idol plays at chosen tribals) and returns the season's likelihood ratio.
 """
 
+import math
 import random
 from typing import Dict, List, Any, Optional, Tuple
 
+from .config import load_probabilities
 
-def load_probabilities(config_dir) -> Dict:
-    """Load probability config."""
-    import yaml
-    from pathlib import Path
-    path = Path(config_dir) / "probabilities.yaml"
-    if path.exists():
-        with open(path) as f:
-            return yaml.safe_load(f)
-    return {}
+
+def _antithetic_streams(seed: Optional[int]) -> Dict[str, random.Random]:
+    """Boot race, draw-count and challenge-placement streams, shared by both members of a pair."""
+    base = seed if seed is not None else random.getrandbits(64)
+    return {name: random.Random(f"{base}:{name}") for name in ("race", "draws", "placements")}
+
+
+def _antithetic_boot_order(
+    contestant_ids: List[str],
+    weights: List[float],
+    streams: Dict[str, random.Random],
+    mirrored: bool,
+) -> List[str]:
+    """
+    Boot order with the same distribution as the default draw (24 weighted draws,
+    first occurrences, then the rest shuffled), built from an exponential race: the
+    first-occurrence order of weighted draws is the order of keys -ln(U)/w, and the
+    draws spent before each new boot are geometric. The mirrored member uses 1 - U in
+    the race and reverses the shuffled tail, so early boots in one season tend to be
+    late boots in the other.
+    """
+    race = streams["race"]
+    order = _race_order(contestant_ids, weights, [
+        u if mirrored else 1.0 - u for u in (race.random() for _ in contestant_ids)
+    ])
+
+    total = sum(weights)
+    weight_of = dict(zip(contestant_ids, weights))
+    draws = streams["draws"]
+    used = 0
+    seen = 0.0
+    boot_order = []
+    for cid in order:
+        p_new = (total - seen) / total if total > 0 else 0.0
+        if p_new <= 0:
+            break
+        used += 1
+        while draws.random() >= p_new:
+            used += 1
+        if used > len(contestant_ids):
+            break
+        boot_order.append(cid)
+        seen += weight_of[cid]
+    tail = [c for c in contestant_ids if c not in set(boot_order)]
+    tail = race.sample(tail, len(tail))
+    boot_order.extend(reversed(tail) if mirrored else tail)
+    return boot_order
+
+
+def _weighted_boot_order(
+    contestant_ids: List[str],
+    weights: List[float],
+    rng: Any,
+    draws: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    The default boot order: first occurrences in len(contestant_ids) weighted draws,
+    then the rest shuffled. draws, if given, receives the weighted draws.
+    """
+    drawn = rng.choices(contestant_ids, weights=weights, k=len(contestant_ids))
+    if draws is not None:
+        draws.extend(drawn)
+    boot_order = list(dict.fromkeys(drawn))
+    while len(boot_order) < len(contestant_ids):
+        remaining = [c for c in contestant_ids if c not in boot_order]
+        boot_order.extend(rng.sample(remaining, len(remaining)))
+    return boot_order
+
+
+def _race_order(contestant_ids: List[str], weights: List[float], uniforms: List[float]) -> List[str]:
+    """First-occurrence order of repeated weighted draws: contestants by -ln(U)/w, U in (0, 1]."""
+    keys = [
+        (-math.log(u) / w if u > 0 and w > 0 else math.inf, cid)
+        for cid, w, u in zip(contestant_ids, weights, uniforms)
+    ]
+    return [cid for _, cid in sorted(keys)]
+
+
+def _qmc_boot_order(
+    contestant_ids: List[str],
+    weights: List[float],
+    race: List[float],
+    draws: List[float],
+    tail: List[float],
+) -> List[str]:
+    """
+    _antithetic_boot_order from one uniform per contestant per part: the race, the
+    geometric draw count before each new boot (inverse CDF) and the tail ranking.
+    """
+    order = _race_order(contestant_ids, weights, [1.0 - u for u in race])
+    total = sum(weights)
+    weight_of = dict(zip(contestant_ids, weights))
+    used = 0
+    seen = 0.0
+    boot_order = []
+    for cid, u in zip(order, draws):
+        p_new = (total - seen) / total if total > 0 else 0.0
+        if p_new <= 0:
+            break
+        used += 1 if p_new >= 1 else 1 + int(math.log(1.0 - u) / math.log(1.0 - p_new))
+        if used > len(contestant_ids):
+            break
+        boot_order.append(cid)
+        seen += weight_of[cid]
+    booted = set(boot_order)
+    rest = [(u, cid) for cid, u in zip(contestant_ids, tail) if cid not in booted]
+    return boot_order + [cid for _, cid in sorted(rest)]
+
+
+def _qmc_placements(n: int, u: float) -> List[int]:
+    """The floor(u * n!)-th ranking of 1..n (Lehmer code): a uniform ranking for uniform u."""
+    index = min(int(u * math.factorial(n)), math.factorial(n) - 1)
+    ranks = list(range(1, n + 1))
+    placements = []
+    for k in range(n, 0, -1):
+        j, index = divmod(index, math.factorial(k - 1))
+        placements.append(ranks.pop(j))
+    return placements
+
+
+def _qmc_randint(low: int, high: int, u: float) -> int:
+    return low + min(int(u * (high - low + 1)), high - low)
+
+
+def _qmc_choice(items: List[str], weights: List[float], u: float) -> str:
+    """Weighted choice by inverse CDF."""
+    target = u * sum(weights)
+    cumulative = 0.0
+    for item, w in zip(items, weights):
+        cumulative += w
+        if target < cumulative:
+            return item
+    return items[-1]
+
+
+def _bernoulli(rng: Any, p: float, q: float) -> Tuple[bool, float]:
+    """Event drawn with probability q in place of p, and its likelihood ratio p/q (or (1-p)/(1-q))."""
+    hit = rng.random() < q
+    if p == q:
+        return hit, 1.0
+    return hit, p / q if hit else (1.0 - p) / (1.0 - q)
+
+
+def _placements(n: int, rng: Any, mirrored: bool) -> List[int]:
+    """A uniform ranking 1..n; the mirrored member of a pair gets the reversed ranking."""
+    placements = list(range(1, n + 1))
+    rng.shuffle(placements)
+    return [n + 1 - p for p in placements] if mirrored else placements
 
 
 def _build_dynamic_season_structure(
@@ -88,18 +235,193 @@ def _build_dynamic_season_structure(
     return episodes
 
 
+# Quasi-Monte Carlo layout: structure coins, boot race, per-episode draws, then boot draw counts and tail
+QMC_EPISODE_FIELDS = ("immunity", "reward", "individual", "votes", "pocket")
+QMC_EPISODES = max(len(_build_dynamic_season_structure(s, m)) for s in (16, 17) for m in (12, 11))
+
+
+def qmc_dimensions(num_contestants: int) -> int:
+    """Uniforms one season takes from a QMC point (generate_scenario's qmc)."""
+    return 2 + 3 * num_contestants + len(QMC_EPISODE_FIELDS) * QMC_EPISODES
+
+
+def _qmc_layout(point: List[float], num_contestants: int) -> Dict[str, Any]:
+    """Named slices of a QMC point, in qmc_dimensions order."""
+    n, fields = num_contestants, len(QMC_EPISODE_FIELDS)
+    after = 2 + n + fields * QMC_EPISODES
+    return {
+        "swap": point[0],
+        "merge": point[1],
+        "race": point[2:2 + n],
+        "episodes": [
+            dict(zip(QMC_EPISODE_FIELDS, point[2 + n + e * fields:2 + n + (e + 1) * fields]))
+            for e in range(QMC_EPISODES)
+        ],
+        "draws": point[after:after + n],
+        "tail": point[after + n:after + 2 * n],
+    }
+
+
+def _observed_state(observed: List[Dict[str, Any]], contestant_ids: List[str]) -> Dict[str, Any]:
+    """
+    Game state after the observed episodes: boots in order, who is still active,
+    current tribes, and which swap_at / merge_at values the aired phases allow.
+    """
+    if any(ep.get("final_tribal") for ep in observed):
+        raise ValueError("Observed episodes already include the finale")
+    last = observed[-1]
+    left = {last.get("voted_out"), last.get("quit"), last.get("medevac")}
+    active = [c for c in last.get("active_contestants", []) if c not in left]
+    booted = [ep["voted_out"] for ep in observed if ep.get("voted_out")]
+    # Anyone gone without a vote-off (quit, medevac) counts as booted at the end
+    gone = set(booted) | set(active)
+    booted += [c for c in contestant_ids if c not in gone]
+
+    phases = [ep.get("phase", "pre_merge") for ep in observed]
+    n_pre = phases.count("pre_merge")
+    n_swap = phases.count("swap")
+    if phases[-1] == "pre_merge":
+        swap_options = [v for v in (16, 17) if 24 - v >= n_pre]
+    else:
+        swap_options = [v for v in (16, 17) if 24 - v == n_pre]
+    if phases[-1] == "post_merge":
+        merge_options = [v for v in (12, 11) if 24 - v == n_pre + n_swap]
+    else:
+        merge_options = [v for v in (12, 11) if 24 - v >= n_pre + n_swap]
+    if not swap_options or not merge_options:
+        raise ValueError(
+            f"Observed phases ({n_pre} pre-merge, {n_swap} swap episodes) don't fit a swap at 16/17 and merge at 12/11"
+        )
+    return {
+        "episodes": len(observed),
+        "booted": booted,
+        "active": active,
+        "tribes": {t: list(members) for t, members in last.get("contestant_tribes", {}).items()},
+        "swap_options": swap_options,
+        "merge_options": merge_options,
+    }
+
+
+def _continue_boot_order(
+    contestant_ids: List[str],
+    weights: List[float],
+    booted: List[str],
+    max_tries: int = 100,
+) -> List[str]:
+    """
+    Boot order that starts with the observed boots, drawn like the preseason order
+    (24 weighted draws, first occurrences, then the rest shuffled). Given the boots
+    so far, the draws spent on repeats before each new boot are geometric, so sample
+    how many of the 24 draws the observed boots used, then spend the remainder.
+    """
+    total = sum(weights)
+    weight_of = dict(zip(contestant_ids, weights))
+    used = len(contestant_ids)
+    for _ in range(max_tries if booted else 1):
+        used = 0
+        seen = 0.0
+        for cid in booted:
+            p_new = (total - seen) / total if total > 0 else 1.0
+            used += 1
+            while random.random() >= p_new:
+                used += 1
+            seen += weight_of.get(cid, 0)
+        if used <= len(contestant_ids):
+            break
+    else:
+        used = len(contestant_ids)  # observed boots outran the draws: the rest is the shuffled tail
+
+    boot_order = list(booted)
+    draws = random.choices(contestant_ids, weights=weights, k=len(contestant_ids) - used)
+    boot_order.extend(c for c in dict.fromkeys(draws) if c not in boot_order)
+    while len(boot_order) < len(contestant_ids):
+        remaining = [c for c in contestant_ids if c not in boot_order]
+        boot_order.extend(random.sample(remaining, len(remaining)))
+    return boot_order
+
+
 def generate_scenario(
     contestants: List[Dict],
     season_template: List[Dict],
     seed: Optional[int] = None,
     probabilities: Optional[Dict] = None,
     config_dir: Optional[object] = None,
+    observed: Optional[List[Dict[str, Any]]] = None,
+    antithetic: Optional[bool] = None,
+    structure: Optional[Tuple[int, int]] = None,
+    qmc: Optional[List[float]] = None,
+    trace: Optional[Dict[str, Any]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Generate a full season of episode outcomes using research-based probabilities.
     24 contestants, tribe swap at 16/17, merge at 12/11.
+    observed: episodes that have already aired (outcome dicts as generated or exported);
+        they are returned unchanged as the season's first episodes and only the rest
+        is simulated, from the remaining players, tribes and phase. An empty list gives
+        the same season as no observed episodes.
+    antithetic: None draws everything from the seeded module RNG. False / True draw
+        the boot order and team challenge placements from their own streams, with True
+        mirroring their uniforms (reversed placements): the two seasons for one seed
+        are an antithetic pair sharing every other draw. Ignored with observed.
+    structure: (swap_at, merge_at) to use instead of the two coin flips (which are still
+        drawn, so every later draw matches the unforced season for the same seed).
+    qmc: a point of qmc_dimensions(len(contestants)) uniforms (e.g. a scrambled Halton
+        point). The structure coins, boot order, team and individual challenge results,
+        vote counts and pocket items come from it by inverse CDF, with the same
+        distributions; every other draw still comes from the seeded module RNG.
+        Takes precedence over antithetic; ignored with observed.
+    trace: a dict to fill with the season's drawn boot_order (before any quit or
+        medevac leaves it), structure (swap_at, merge_at) and boot_draws (the weighted
+        draws behind the boot order; empty unless drawn the default way), for control
+        variates and likelihood-ratio reweighting.
+    Quits and medevacs (probabilities' quit_medevac, per season) replace that
+    episode's vote: the leaver is in its active_contestants and named under "quit" /
+    "medevac", there is no tribal, and they leave the boot order. Their draws come from
+    a stream of their own, so a season without one matches the other draws exactly.
     Returns list of episode outcome dicts.
     """
+    return _generate_season(
+        contestants, season_template, seed, probabilities, config_dir, observed, antithetic, structure, qmc,
+        trace=trace,
+    )[0]
+
+
+def generate_tilted_scenario(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    tilt: Dict[str, Any],
+    seed: Optional[int] = None,
+    probabilities: Optional[Dict] = None,
+    config_dir: Optional[object] = None,
+) -> Tuple[List[Dict[str, Any]], float]:
+    """
+    A season drawn with rare events over-sampled, and its likelihood ratio (nominal
+    over tilted probability of the draws that were tilted), so that weighting each
+    season's results by the ratio gives unbiased nominal estimates. tilt keys, each
+    a proposal for the probabilities.yaml value of the same name:
+    quit_probability, medevac_probability, probability_two_items; and
+    idol_play_episodes (episode numbers) with idol_play_boost (how many times more
+    likely each idol is played at one of them than at another later tribal).
+    """
+    return _generate_season(
+        contestants, season_template, seed, probabilities, config_dir, tilt=tilt,
+    )
+
+
+def _generate_season(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    seed: Optional[int] = None,
+    probabilities: Optional[Dict] = None,
+    config_dir: Optional[object] = None,
+    observed: Optional[List[Dict[str, Any]]] = None,
+    antithetic: Optional[bool] = None,
+    structure: Optional[Tuple[int, int]] = None,
+    qmc: Optional[List[float]] = None,
+    tilt: Optional[Dict[str, Any]] = None,
+    trace: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], float]:
+    """generate_scenario's season and its likelihood ratio under tilt (1.0 without one)."""
     if seed is not None:
         random.seed(seed)
 
@@ -113,14 +435,30 @@ def generate_scenario(
     pocket_cfg = probabilities.get("voted_out_pocket", {})
     vote_cfg = probabilities.get("vote_counts", {})
     matched_cfg = probabilities.get("vote_matched", {})
+    leave_cfg = probabilities.get("quit_medevac", {})
+    tilt = tilt or {}
+    ratio = 1.0
 
     contestant_ids = [c["id"] for c in contestants]
     contestant_map = {c["id"]: c for c in contestants}
+    state = _observed_state(observed, contestant_ids) if observed else None
+    qmc_u = _qmc_layout(qmc, len(contestant_ids)) if qmc is not None and not state else None
+    streams = _antithetic_streams(seed) if antithetic is not None and not state and not qmc_u else None
+    mirrored = bool(streams) and antithetic
+    placement_rng = streams["placements"] if streams else random
 
     # 50% swap at 16, 50% at 17
-    swap_at = 16 if random.random() < 0.5 else 17
+    swap_at = 16 if (qmc_u["swap"] if qmc_u else random.random()) < 0.5 else 17
     # 50% merge at 12, 50% at 11
-    merge_at = 12 if random.random() < 0.5 else 11
+    merge_at = 12 if (qmc_u["merge"] if qmc_u else random.random()) < 0.5 else 11
+    if structure:
+        swap_at, merge_at = structure
+    if state:
+        # Conditioned on the aired phases: keep the draw if allowed, else the only value left
+        if swap_at not in state["swap_options"]:
+            swap_at = state["swap_options"][0]
+        if merge_at not in state["merge_options"]:
+            merge_at = state["merge_options"][0]
 
     season_episodes = _build_dynamic_season_structure(swap_at, merge_at)
     tribal_episode_indices = [
@@ -136,12 +474,18 @@ def generate_scenario(
     }
 
     # Boot order: weighted by survival_bias
+    boot_draws: List[str] = []
     weights = [contestant_map[c].get("survival_bias", 0.5) for c in contestant_ids]
-    boot_order = random.choices(contestant_ids, weights=weights, k=len(contestant_ids))
-    boot_order = list(dict.fromkeys(boot_order))
-    while len(boot_order) < len(contestant_ids):
-        remaining = [c for c in contestant_ids if c not in boot_order]
-        boot_order.extend(random.sample(remaining, len(remaining)))
+    if state:
+        boot_order = _continue_boot_order(contestant_ids, weights, state["booted"])
+    elif qmc_u:
+        boot_order = _qmc_boot_order(contestant_ids, weights, qmc_u["race"], qmc_u["draws"], qmc_u["tail"])
+    elif streams:
+        boot_order = _antithetic_boot_order(contestant_ids, weights, streams, mirrored)
+    else:
+        boot_order = _weighted_boot_order(contestant_ids, weights, random, boot_draws)
+    if trace is not None:
+        trace.update({"boot_order": list(boot_order), "structure": (swap_at, merge_at), "boot_draws": boot_draws})
 
     # Idol finds: 3-6 per season
     num_idols = random.randint(
@@ -156,12 +500,19 @@ def generate_scenario(
     # Idol plays: mix of success and failure
     success_rate = idol_cfg.get("play_success_rate", 0.55)
     idol_play_events = []  # (ep_idx, finder_id, success: bool)
+    idol_targets = {e - 1 for e in tilt.get("idol_play_episodes", ())}
+    idol_boost = tilt.get("idol_play_boost", 1.0) if idol_targets else 1.0
     for i in range(num_idols):
         finder = idol_finders[i % len(idol_finders)]
         find_ep = idol_find_episodes[i % len(idol_find_episodes)]
         later_eps = [j for j in tribal_episode_indices if j > find_ep]
         if later_eps:
-            play_ep = random.choice(later_eps)
+            if idol_boost != 1.0:
+                boosts = [idol_boost if j in idol_targets else 1.0 for j in later_eps]
+                play_ep = random.choices(later_eps, weights=boosts, k=1)[0]
+                ratio *= sum(boosts) / (len(later_eps) * (idol_boost if play_ep in idol_targets else 1.0))
+            else:
+                play_ep = random.choice(later_eps)
             success = random.random() < success_rate
             idol_play_events.append((play_ep, finder, success))
     idol_play_events.sort(key=lambda x: x[0])
@@ -198,14 +549,39 @@ def generate_scenario(
     for ep_idx, finder in zip(idol_find_episodes, idol_finders):
         idol_holders.add(finder)
 
-    active = set(contestant_ids)
+    # Quit / medevac: at most one of each, at different tribal episodes, from their own stream
+    leave_rng = random.Random(f"{seed if seed is not None else random.getrandbits(64)}:leave")
+    leave_episodes = {}
+    for kind in ("quit", "medevac"):
+        p = leave_cfg.get(f"{kind}_probability", 0.0)
+        hit, r = _bernoulli(leave_rng, p, tilt.get(f"{kind}_probability", p))
+        ratio *= r
+        options = [i for i in tribal_episode_indices if i not in leave_episodes]
+        if hit and options:
+            leave_episodes[leave_rng.choice(options)] = kind
+
+    # Insertion-ordered (dict, not set) so iteration order never depends on
+    # PYTHONHASHSEED: the same seed gives the same season in every process.
+    active = dict.fromkeys(contestant_ids)
     boot_index = 0
     episode_outcomes = []
     elims_since_start = 0
+    start_episode = 0
+    if state:
+        # Fork from the observed state; scheduled events in aired episodes never happen
+        active = dict.fromkeys(state["active"])
+        boot_index = elims_since_start = len(state["booted"])
+        tribes = state["tribes"] or tribes
+        idol_holders = {c for c in idol_holders if c in active}
+        episode_outcomes = list(observed)
+        start_episode = state["episodes"]
 
     for ep_idx, ep_template in enumerate(season_episodes):
+        if ep_idx < start_episode:
+            continue
         ep_id = ep_template.get("id", ep_idx + 1)
         phase = ep_template.get("phase", "pre_merge")
+        qmc_ep = qmc_u["episodes"][ep_idx] if qmc_u else None
 
         # Update tribe assignments at swap and merge
         if elims_since_start == 24 - swap_at and ep_idx > 0:
@@ -258,10 +634,14 @@ def generate_scenario(
             break
 
         voted_out = None
-        if ep_template.get("tribal", True) and boot_index < len(boot_order):
+        leaver = None
+        leave_kind = leave_episodes.get(ep_idx)
+        if leave_kind and len(active) > 3:
+            leaver = leave_rng.choice(list(active))
+        elif ep_template.get("tribal", True) and boot_index < len(boot_order):
             voted_out = boot_order[boot_index]
             if voted_out in active:
-                active.remove(voted_out)
+                del active[voted_out]
                 boot_index += 1
                 elims_since_start += 1
                 idol_holders.discard(voted_out)
@@ -286,28 +666,28 @@ def generate_scenario(
 
         # Vote count
         if phase in ("pre_merge", "swap"):
-            voted_out_votes = (
-                random.randint(
-                    vote_cfg.get("pre_merge_min", 4),
-                    vote_cfg.get("pre_merge_max", 7),
-                )
-                if voted_out
-                else 0
-            )
+            votes_range = (vote_cfg.get("pre_merge_min", 4), vote_cfg.get("pre_merge_max", 7))
         else:
-            voted_out_votes = (
-                random.randint(
-                    vote_cfg.get("post_merge_min", 5),
-                    vote_cfg.get("post_merge_max", 10),
-                )
-                if voted_out
-                else 0
-            )
+            votes_range = (vote_cfg.get("post_merge_min", 5), vote_cfg.get("post_merge_max", 10))
+        if not voted_out:
+            voted_out_votes = 0
+        elif qmc_ep:
+            voted_out_votes = _qmc_randint(*votes_range, qmc_ep["votes"])
+        else:
+            voted_out_votes = random.randint(*votes_range)
 
         voted_out_pocket = 0
-        if voted_out:
-            if random.random() < pocket_cfg.get("probability_has_item", 0.17):
-                voted_out_pocket = 2 if random.random() < pocket_cfg.get("probability_two_items", 0.03) else 1
+        p_item = pocket_cfg.get("probability_has_item", 0.17)
+        p_two = pocket_cfg.get("probability_two_items", 0.03)
+        q_two = tilt.get("probability_two_items", p_two)
+        if voted_out and qmc_ep:
+            u = qmc_ep["pocket"]
+            voted_out_pocket = 2 if u < p_item * q_two else 1 if u < p_item else 0
+        elif voted_out:
+            if random.random() < p_item:
+                voted_out_pocket = 2 if random.random() < q_two else 1
+        if voted_out_pocket and q_two != p_two:
+            ratio *= p_two / q_two if voted_out_pocket == 2 else (1.0 - p_two) / (1.0 - q_two)
 
         # Team immunity/reward
         immunity_teams = ep_template.get("immunity_teams", 3)
@@ -316,12 +696,16 @@ def generate_scenario(
         team_reward_results = {}
         if phase in ("pre_merge", "swap") and immunity_teams >= 2:
             tribe_names = list(tribes.keys())[:immunity_teams]
-            placements = list(range(1, immunity_teams + 1))
-            random.shuffle(placements)
+            placements = (
+                _qmc_placements(immunity_teams, qmc_ep["immunity"]) if qmc_ep
+                else _placements(immunity_teams, placement_rng, mirrored)
+            )
             for i, t in enumerate(tribe_names):
                 team_immunity_results[t] = placements[i]
-            placements = list(range(1, reward_teams + 1))
-            random.shuffle(placements)
+            placements = (
+                _qmc_placements(reward_teams, qmc_ep["reward"]) if qmc_ep
+                else _placements(reward_teams, placement_rng, mirrored)
+            )
             for i, t in enumerate(tribe_names[:reward_teams]):
                 team_reward_results[t] = placements[i] if i < len(placements) else reward_teams
 
@@ -329,7 +713,10 @@ def generate_scenario(
         individual_winner = None
         if ep_template.get("immunity_type") == "individual" and active:
             weights = [contestant_map.get(c, {}).get("challenge_ability", 0.5) for c in active]
-            individual_winner = random.choices(list(active), weights=weights, k=1)[0]
+            if qmc_ep:
+                individual_winner = _qmc_choice(list(active), weights, qmc_ep["individual"])
+            else:
+                individual_winner = random.choices(list(active), weights=weights, k=1)[0]
 
         # Clue readers and clue finder
         clue_readers = []
@@ -459,5 +846,11 @@ def generate_scenario(
             "confessional_counts": confessional_counts,
             **bps_placeholders,
         })
-
-    return episode_outcomes
+        if leaver:
+            episode_outcomes[-1].update({leave_kind: leaver, "tribal": False})
+            del active[leaver]
+            boot_order.remove(leaver)
+            elims_since_start += 1
+            idol_holders.discard(leaver)
+
+    return episode_outcomes, ratio
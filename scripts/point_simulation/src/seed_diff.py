@@ -0,0 +1,133 @@
+"""
+Incremental seed exports. A manifest records a content hash per exported row
+(table -> key -> sha256 of the row's canonical JSON). Comparing it with the rows
+of a new export gives the minimal change set: rows to upsert (new or changed)
+and keys to delete. write_delta_sql turns that into one SQL script, so
+re-seeding after a small pricing tweak touches only the rows that moved.
+The manifest describes what was last applied, not what was last exported: each
+delta is written against it (so repeated exports stay cumulative) alongside a
+pending manifest, which commit_manifest promotes once the delta is loaded.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Any, Sequence, Tuple
+
+from .bulk_export import SqlWriter, sql_literal
+
+# table -> (key column, columns); rows are tuples in column order
+Tables = Dict[str, Tuple[str, Sequence[str]]]
+Rows = Dict[str, Dict[str, Tuple[Any, ...]]]
+Manifest = Dict[str, Dict[str, str]]
+
+
+def row_hash(row: Sequence[Any]) -> str:
+    """sha256 of a row's canonical JSON (sorted keys, no whitespace)."""
+    text = json.dumps(list(row), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_manifest(rows: Rows) -> Manifest:
+    """table -> key -> row hash, for rows keyed by str(key)."""
+    return {table: {key: row_hash(row) for key, row in by_key.items()} for table, by_key in rows.items()}
+
+
+def load_manifest(path: Path) -> Manifest:
+    """The manifest at path, or an empty one (everything is new)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f).get("tables", {})
+
+
+def save_manifest(path: Path, manifest: Manifest) -> None:
+    with open(path, "w") as f:
+        json.dump({"tables": manifest}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def pending_manifest_path(manifest_path: Path) -> Path:
+    """Where seed_delta keeps the manifest its delta leads to (seed_manifest.pending.json)."""
+    manifest_path = Path(manifest_path)
+    return manifest_path.with_name(f"{manifest_path.stem}.pending{manifest_path.suffix}")
+
+
+def commit_manifest(manifest_path: Path) -> bool:
+    """Record the pending manifest as applied (call after loading its delta); False if none is pending."""
+    pending = pending_manifest_path(manifest_path)
+    if not pending.exists():
+        return False
+    pending.replace(manifest_path)
+    return True
+
+
+def diff_manifests(old: Manifest, new: Manifest) -> Dict[str, Dict[str, List[str]]]:
+    """table -> {"upserts": keys new or changed, "deletes": keys gone}, keys sorted."""
+    diff = {}
+    for table in sorted(set(old) | set(new)):
+        before, after = old.get(table, {}), new.get(table, {})
+        diff[table] = {
+            "upserts": sorted(k for k, h in after.items() if before.get(k) != h),
+            "deletes": sorted(k for k in before if k not in after),
+        }
+    return diff
+
+
+def write_delta_sql(
+    path: Path,
+    tables: Tables,
+    rows: Rows,
+    diff: Dict[str, Dict[str, List[str]]],
+    batch_rows: int = 1000,
+) -> Dict[str, int]:
+    """
+    Upserts (INSERT ... ON CONFLICT on the key column) in table order, then deletes in
+    reverse order, in one transaction. Returns {"upserts", "deletes"} row counts.
+    """
+    upserts = deletes = 0
+    with open(path, "w", encoding="utf-8") as out:
+        out.write("-- Seed delta: rows changed since the last manifest\nBEGIN;\n")
+        for table, (key, columns) in tables.items():
+            changed = diff.get(table, {}).get("upserts", [])
+            if changed:
+                with SqlWriter(out, table, columns, mode="insert", conflict=(key,), batch_rows=batch_rows) as writer:
+                    writer.write_many(rows[table][k] for k in changed)
+                upserts += len(changed)
+        for table, (key, _) in reversed(list(tables.items())):
+            gone = diff.get(table, {}).get("deletes", [])
+            if gone:
+                out.write(f"DELETE FROM {table} WHERE {key} IN ({', '.join(map(sql_literal, gone))});\n")
+                deletes += len(gone)
+        out.write("COMMIT;\n")
+    return {"upserts": upserts, "deletes": deletes}
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already holds it; True if written."""
+    path = Path(path)
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def seed_delta(
+    tables: Tables,
+    rows: Rows,
+    manifest_path: Path,
+    delta_path: Path,
+    batch_rows: int = 1000,
+) -> Dict[str, Any]:
+    """
+    Diff rows against the applied manifest at manifest_path, write the delta script
+    to delta_path and the new manifest to pending_manifest_path (manifest_path is
+    left alone until commit_manifest). Returns per-table diff and totals.
+    """
+    old = load_manifest(manifest_path)
+    new = build_manifest(rows)
+    diff = diff_manifests(old, new)
+    counts = write_delta_sql(delta_path, tables, rows, diff, batch_rows=batch_rows)
+    save_manifest(pending_manifest_path(manifest_path), new)
+    return {"tables": diff, **counts}
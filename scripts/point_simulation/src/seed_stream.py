@@ -0,0 +1,112 @@
+"""
+Streaming seed export for staging databases: many full simulated seasons instead
+of export_seed_data's single truncated one. Seasons are generated, priced and
+written one at a time through TableWriter buffers, so memory stays flat however
+many seasons are exported. Season s (seed + s*7777) gets its episode ids offset by
+s * episode_stride, the same convention as the materialize export.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from .bulk_export import TableWriter, table_counts, write_load_script
+from .dynamic_pricing import price_history_by_episode
+
+# Tables in foreign-key order: table -> columns
+TABLES = {
+    "contestants": ("id", "name", "starting_tribe", "pre_merge_price", "photo_url"),
+    "scoring_config": ("id", "config"),
+    "episode_outcomes": ("episode_id", "phase", "outcome"),
+    "contestant_episode_prices": ("episode_id", "contestant_id", "price", "price_change"),
+}
+
+
+def season_rows(
+    episode_outcomes: List[Dict[str, Any]],
+    prices: Dict[str, int],
+    scoring_config: Dict[str, Any],
+    pricing_config: Dict[str, Any],
+    episode_offset: int = 0,
+) -> Tuple[List[Tuple[Any, ...]], Iterator[Tuple[Any, ...]]]:
+    """
+    One season's episode_outcomes rows (outcome episode_id shifted too) and its
+    contestant_episode_prices rows: the price going into each episode, with the
+    change since the previous episode (None in the first).
+    """
+    outcome_rows = []
+    for ep_idx, ep in enumerate(episode_outcomes):
+        episode_id = ep.get("episode_id", ep_idx + 1) + episode_offset
+        outcome_rows.append((episode_id, ep.get("phase", "pre_merge"), dict(ep, episode_id=episode_id)))
+
+    def price_rows() -> Iterator[Tuple[Any, ...]]:
+        history = price_history_by_episode(episode_outcomes, prices, scoring_config, pricing_config)
+        previous: Optional[Dict[str, int]] = None
+        for (episode_id, _, _), table in zip(outcome_rows, history):
+            for cid, price in table.items():
+                change = price - previous[cid] if previous is not None and cid in previous else None
+                yield episode_id, cid, price, change
+            previous = table
+
+    return outcome_rows, price_rows()
+
+
+def export_seasons(
+    contestants: List[Dict[str, Any]],
+    prices: Dict[str, int],
+    seasons: Iterable[List[Dict[str, Any]]],
+    scoring_config: Dict[str, Any],
+    pricing_config: Dict[str, Any],
+    output_dir: Path,
+    fmt: str = "copy",
+    buffer_rows: int = 10000,
+    episode_stride: int = 100,
+    seeds: Optional[List[int]] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Stream contestants (with starting prices), the scoring config and every season's
+    episode outcomes and price history to one file per table (TABLES), plus
+    seasons.json (season -> seed and episode id range) and, for COPY / CSV, load.sql.
+    contestants: dicts with id, name, starting_tribe and optional photo_url.
+    Returns {"files", "rows", "seasons"}.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    writers = {
+        table: TableWriter(output_dir, table, columns, fmt=fmt, buffer_rows=buffer_rows)
+        for table, columns in TABLES.items()
+    }
+    index = []
+    try:
+        for c in contestants:
+            writers["contestants"].write((
+                c["id"], c["name"], c["starting_tribe"], prices.get(c["id"], 150000), c.get("photo_url"),
+            ))
+        writers["scoring_config"].write(("default", scoring_config))
+        for s, episode_outcomes in enumerate(seasons):
+            offset = s * episode_stride
+            outcome_rows, price_rows = season_rows(episode_outcomes, prices, scoring_config, pricing_config, offset)
+            writers["episode_outcomes"].write_many(outcome_rows)
+            writers["contestant_episode_prices"].write_many(price_rows)
+            index.append({
+                "season": s,
+                "seed": seeds[s] if seeds else None,
+                "first_episode_id": outcome_rows[0][0] if outcome_rows else None,
+                "last_episode_id": outcome_rows[-1][0] if outcome_rows else None,
+                "episodes": len(outcome_rows),
+            })
+            if progress:
+                progress(s + 1)
+    finally:
+        for w in writers.values():
+            w.close()
+    with open(output_dir / "seasons.json", "w") as f:
+        json.dump(index, f, indent=2)
+    if fmt != "jsonl":
+        write_load_script(output_dir, writers.values())
+    return {
+        "files": {table: str(w.path) for table, w in writers.items()},
+        "rows": table_counts(writers.values()),
+        "seasons": len(index),
+    }
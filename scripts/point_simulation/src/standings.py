@@ -0,0 +1,298 @@
+"""
+League standings for user teams: the reference for app/lib/leaderboard.ts.
+A team is its tribe_entries rows (contestant, added_at_episode,
+removed_at_episode) plus per-episode captain_picks. A contestant scores for a
+team in episode N when added_at_episode <= N and (removed_at_episode is null or
+removed_at_episode >= N). The captain's points count captain_multiplier times,
+and every entry added by transfer (added_at_episode > 1) costs
+other.add_player_penalty once, as in scoring.ts calculateRosterPoints (standings
+as of an earlier episode only charge the transfers made by then).
+Scoring reads a per-contestant episode points matrix. Each distinct entry
+(contestant, added, removed) becomes a per-episode points vector once, and
+every team holding that entry shares it. Ranks come from a RankIndex, which
+can then be moved on episode by episode with team_episode_points.
+"""
+
+import csv
+import json
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+from .bps import rank_bonuses_by_episode
+from .dynamic_pricing import calculate_contestant_episode_points
+from .rank_index import RankIndex
+
+# (contestant_id, added_at_episode, removed_at_episode or None)
+Entry = Tuple[str, int, Optional[int]]
+
+
+def read_rows(path: Path) -> List[Dict[str, Any]]:
+    """Table rows from a CSV file (header row) or a JSON list of objects."""
+    path = Path(path)
+    if path.suffix == ".csv":
+        with open(path, newline="") as f:
+            return list(csv.DictReader(f))
+    with open(path) as f:
+        return json.load(f)
+
+
+def iter_columns(path: Path, columns: Sequence[str]) -> Iterator[Tuple[Any, ...]]:
+    """
+    Stream the given columns of a CSV or JSON table as tuples (None where a column
+    is missing). CSV is read with csv.reader, so millions of rows never become dicts.
+    """
+    path = Path(path)
+    if path.suffix == ".csv":
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            index = [header.index(c) if c in header else None for c in columns]
+            if all(i is not None for i in index):
+                yield from map(itemgetter(*index), reader)
+            else:
+                yield from (tuple(rec[i] if i is not None else None for i in index) for rec in reader)
+        return
+    for row in read_rows(path):
+        yield tuple(row.get(c) for c in columns)
+
+
+def episode_points_from_outcomes(
+    episode_outcomes: List[Dict[str, Any]],
+    scoring_config: Dict[str, Any],
+    bps_config: Optional[Dict[str, Any]] = None,
+) -> Dict[int, Dict[str, float]]:
+    """
+    episode_id -> contestant_id -> points, for everyone active or voted out that episode
+    (plus the BPS episode rank bonus with bps_config).
+    """
+    rank_bonuses = rank_bonuses_by_episode(episode_outcomes, bps_config)
+    points = {}
+    for ep_idx, ep in enumerate(episode_outcomes):
+        episode_id = ep.get("episode_id", ep_idx + 1)
+        cids = list(ep.get("active_contestants", []))
+        if ep.get("voted_out") and ep["voted_out"] not in cids:
+            cids.append(ep["voted_out"])
+        bonuses = rank_bonuses.get(episode_id, {})
+        points[episode_id] = {
+            cid: calculate_contestant_episode_points(cid, ep, scoring_config) + max(bonuses.get(cid, 0), 0)
+            for cid in cids
+        }
+    return points
+
+
+def episode_points_from_rows(rows: List[Dict[str, Any]]) -> Dict[int, Dict[str, float]]:
+    """Same matrix from contestant_episode_points rows (episode_id, contestant_id, total_points)."""
+    points: Dict[int, Dict[str, float]] = {}
+    for row in rows:
+        value = float(row["total_points"])
+        points.setdefault(int(row["episode_id"]), {})[row["contestant_id"]] = int(value) if value.is_integer() else value
+    return points
+
+
+ENTRY_COLUMNS = ("user_id", "contestant_id", "added_at_episode", "removed_at_episode", "phase")
+CAPTAIN_COLUMNS = ("user_id", "episode_id", "contestant_id")
+
+
+def _group(
+    entries: Iterable[Tuple[Any, ...]],
+    captains: Iterable[Tuple[Any, ...]],
+    phase: Optional[str],
+) -> Dict[str, Dict[str, Any]]:
+    teams: Dict[str, Dict[str, Any]] = {}
+    # Few distinct (contestant, added, removed) triples: parse each once and share the tuple
+    interned: Dict[Tuple[Any, Any, Any], Entry] = {}
+    for uid, cid, added, removed, row_phase in entries:
+        if phase is not None and (row_phase or "pre_merge") != phase:
+            continue
+        team = teams.get(uid)
+        if team is None:
+            team = teams[uid] = {"entries": [], "captains": {}}
+        entry = interned.get((cid, added, removed))
+        if entry is None:
+            entry = interned[(cid, added, removed)] = (
+                cid,
+                int(added) if added else 1,
+                int(removed) if removed not in (None, "", "null") else None,
+            )
+        team["entries"].append(entry)
+    for uid, ep, cid in captains:
+        team = teams.get(uid)
+        if team is not None:
+            team["captains"][int(ep)] = cid
+    return teams
+
+
+def group_teams(
+    entry_rows: List[Dict[str, Any]],
+    captain_rows: Optional[List[Dict[str, Any]]] = None,
+    phase: Optional[str] = "pre_merge",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    user_id -> {"entries": [Entry], "captains": {episode_id: contestant_id}} from
+    tribe_entries and captain_picks rows. Only entries of the given phase are kept
+    (rows without a phase count as pre_merge), like leaderboard.ts; phase=None keeps all.
+    """
+    return _group(
+        (tuple(row.get(c) for c in ENTRY_COLUMNS) for row in entry_rows),
+        (tuple(row.get(c) for c in CAPTAIN_COLUMNS) for row in captain_rows or []),
+        phase,
+    )
+
+
+def load_teams(
+    entries_path: Path,
+    captains_path: Optional[Path] = None,
+    phase: Optional[str] = "pre_merge",
+) -> Dict[str, Dict[str, Any]]:
+    """group_teams straight from tribe_entries / captain_picks files (CSV or JSON), streamed."""
+    return _group(
+        iter_columns(entries_path, ENTRY_COLUMNS),
+        iter_columns(captains_path, CAPTAIN_COLUMNS) if captains_path else (),
+        phase,
+    )
+
+
+def compute_standings(
+    teams: Dict[str, Dict[str, Any]],
+    episode_points: Dict[int, Dict[str, float]],
+    scoring_config: Dict[str, Any],
+    current_episode: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Score every team through current_episode (default: the last episode with points).
+    Returns {"episode_ids", "standings"}. Standings are sorted by rank, and each row has
+    total_points, penalties, captain_bonus, episode_points (per episode, captain
+    included, penalties excluded), and rank, previous_rank and rank_change against the
+    standings before the current episode.
+    """
+    if current_episode is None:
+        current_episode = max(episode_points) if episode_points else 0
+    episode_ids = list(range(1, current_episode + 1))
+    position = {ep: k for k, ep in enumerate(episode_ids)}
+    zeros = (0,) * len(episode_ids)
+    captain_extra = scoring_config.get("captain_multiplier", 2.0) - 1
+    add_penalty = scoring_config.get("other", {}).get("add_player_penalty", -5)
+
+    by_contestant: Dict[str, List[float]] = {}
+    for k, ep in enumerate(episode_ids):
+        for cid, pts in episode_points.get(ep, {}).items():
+            by_contestant.setdefault(cid, [0] * len(episode_ids))[k] = pts
+
+    # entry -> (points per episode while held, bitmask of the episodes held)
+    vectors: Dict[Entry, Tuple[Tuple[float, ...], int]] = {}
+
+    def entry_vector(entry: Entry) -> Tuple[Tuple[float, ...], int]:
+        cid, added, removed = entry
+        row = by_contestant.get(cid, zeros)
+        held = 0
+        for k, ep in enumerate(episode_ids):
+            if added <= ep and (removed is None or removed >= ep):
+                held |= 1 << k
+        vec = vectors[entry] = (tuple(p if held >> k & 1 else 0 for k, p in enumerate(row)), held)
+        return vec
+
+    rows = {}
+    current_delta: Dict[str, float] = {}
+    for uid, team in teams.items():
+        entries = team["entries"]
+        if not entries:
+            continue
+        points_vectors = []
+        held_by_contestant: Dict[str, int] = {}
+        transfers = transfers_now = 0
+        for entry in entries:
+            vec, held = vectors.get(entry) or entry_vector(entry)
+            points_vectors.append(vec)
+            held_by_contestant[entry[0]] = held_by_contestant.get(entry[0], 0) | held
+            if 1 < entry[1] <= current_episode:
+                transfers += 1
+                transfers_now += entry[1] == current_episode
+        per_episode = [sum(col) for col in zip(*points_vectors)] if episode_ids else []
+        captain_bonus = 0
+        for ep, captain in team.get("captains", {}).items():
+            k = position.get(ep)
+            if k is not None and held_by_contestant.get(captain, 0) >> k & 1:
+                bonus = captain_extra * by_contestant.get(captain, zeros)[k]
+                per_episode[k] += bonus
+                captain_bonus += bonus
+        penalties = add_penalty * transfers
+        rows[uid] = {
+            "user_id": uid,
+            "total_points": sum(per_episode) + penalties,
+            "penalties": penalties,
+            "captain_bonus": captain_bonus,
+            "episode_points": per_episode,
+        }
+        # What the current episode moved the total by, its transfer penalties included (as team_episode_points)
+        current_delta[uid] = (per_episode[-1] if episode_ids else 0) + add_penalty * transfers_now
+
+    # Rank before the current episode, then move every team by its episode points
+    index = RankIndex({uid: r["total_points"] - current_delta[uid] for uid, r in rows.items()})
+    previous = index.ranks()
+    index.update({uid: r["total_points"] for uid, r in rows.items()})
+    standings = []
+    for uid, _, rank in index.iter_ranked():
+        r = rows[uid]
+        r["rank"] = rank
+        r["previous_rank"] = previous[uid]
+        r["rank_change"] = previous[uid] - rank
+        standings.append(r)
+
+    return {"episode_ids": episode_ids, "standings": standings}
+
+
+def standings_index(result: Dict[str, Any]) -> RankIndex:
+    """RankIndex over the totals of a compute_standings result, for incremental updates."""
+    return RankIndex({r["user_id"]: r["total_points"] for r in result["standings"]})
+
+
+def team_episode_points(
+    teams: Dict[str, Dict[str, Any]],
+    points: Dict[str, float],
+    scoring_config: Dict[str, Any],
+    episode_id: int,
+) -> Dict[str, float]:
+    """
+    Each team's change in total for one newly aired episode (points: contestant_id ->
+    points that episode), captain included, with the transfer penalty for entries
+    added that episode. Feed it to RankIndex.apply to move the standings on without
+    rescoring the season.
+    """
+    captain_extra = scoring_config.get("captain_multiplier", 2.0) - 1
+    add_penalty = scoring_config.get("other", {}).get("add_player_penalty", -5)
+    deltas = {}
+    for uid, team in teams.items():
+        total = 0
+        held = set()
+        for cid, added, removed in team["entries"]:
+            if added == episode_id and added > 1:
+                total += add_penalty
+            if added <= episode_id and (removed is None or removed >= episode_id):
+                total += points.get(cid, 0)
+                held.add(cid)
+        captain = team.get("captains", {}).get(episode_id)
+        if captain in held:
+            total += captain_extra * points.get(captain, 0)
+        if team["entries"]:
+            deltas[uid] = total
+    return deltas
+
+
+def write_standings(result: Dict[str, Any], output_dir: Path) -> None:
+    """standings.csv (one row per team) and episode_points.csv (team x episode)."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / "standings.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["rank", "user_id", "total_points", "penalties", "captain_bonus", "previous_rank", "rank_change"])
+        for r in result["standings"]:
+            writer.writerow([
+                r["rank"], r["user_id"], r["total_points"], r["penalties"], r["captain_bonus"],
+                r["previous_rank"], r["rank_change"],
+            ])
+    with open(output_dir / "episode_points.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["user_id"] + [f"ep{ep}" for ep in result["episode_ids"]])
+        for r in result["standings"]:
+            writer.writerow([r["user_id"]] + r["episode_points"])
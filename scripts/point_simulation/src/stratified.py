@@ -0,0 +1,132 @@
+"""
+Stratified Monte Carlo over season structure.
+generate_scenario flips two fair coins for the structure: the swap at 16 or 17
+players and the merge at 12 or 11. The four structures shift survival and team
+challenge points a lot. Stratified runs force the structure (generate_scenario's
+structure) and split the runs across the four strata, proportionally or by
+Neyman allocation from a pilot's spread. The estimates then recombine the
+per-stratum means with the 1/4 probabilities, so the between-structure variance
+drops out of the error.
+"""
+
+import math
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from .config import load_probabilities
+from .price_generator import price_seasons
+from .profiling import Profiler
+from .variance import allocate, stratified_mean
+
+# (swap_at, merge_at) and its probability under generate_scenario's coin flips
+STRATA: Tuple[Tuple[int, int], ...] = ((16, 12), (16, 11), (17, 12), (17, 11))
+STRATUM_WEIGHTS: Tuple[float, ...] = (0.25, 0.25, 0.25, 0.25)
+ALLOCATIONS = ("proportional", "neyman")
+
+
+def stratum_label(structure: Tuple[int, int]) -> str:
+    return f"swap{structure[0]}_merge{structure[1]}"
+
+
+def structure_for_unit(unit: int) -> Tuple[int, int]:
+    """Systematic proportional assignment: unit i gets stratum i mod 4."""
+    return STRATA[unit % len(STRATA)]
+
+
+def stratified_expected_points(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring_config: Dict[str, Any],
+    config_dir: Optional[Path] = None,
+    num_runs: int = 2000,
+    seed: int = 42,
+    allocation: str = "proportional",
+    pilot_runs: Optional[int] = None,
+    profiler: Optional[Profiler] = None,
+    bps_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Expected points per contestant from num_runs seasons stratified by structure.
+    allocation "proportional" gives each stratum a quarter of the runs; "neyman" runs
+    a proportional pilot (pilot_runs, default a fifth of the runs) and gives the rest
+    to strata in proportion to their spread (root of the summed contestant variances).
+    Runs are price_seasons with the structure forced, numbered across the pilot and the rest.
+    Every stratum needs a run (and with neyman, a pilot run): ValueError otherwise,
+    since an unsampled structure would bias the recombined mean.
+    Returns expected_points, se, se_srs (plain Monte Carlo with the same runs),
+    vrf (summed variances, plain over stratified), runs and stratum allocation / means.
+    """
+    if allocation not in ALLOCATIONS:
+        raise ValueError(f"Unknown allocation {allocation!r} (expected one of {', '.join(ALLOCATIONS)})")
+    probabilities = load_probabilities(config_dir) if config_dir is not None else None
+    contestant_ids = [c["id"] for c in contestants]
+    counts = [0] * len(STRATA)
+    sums = [dict.fromkeys(contestant_ids, 0.0) for _ in STRATA]
+    squares = [dict.fromkeys(contestant_ids, 0.0) for _ in STRATA]
+    next_run = 0
+
+    def run(per_stratum: List[int]) -> None:
+        nonlocal next_run
+        stratum_of = [h for h, n in enumerate(per_stratum) for _ in range(n)]
+        first = next_run
+        next_run += len(stratum_of)
+        for run_idx, _, _, season_points in price_seasons(
+            contestants, season_template, scoring_config, range(first, next_run), seed=seed,
+            probabilities=probabilities, profiler=profiler, bps_config=bps_config,
+            options=lambda i: {"structure": STRATA[stratum_of[i - first]]},
+        ):
+            h = stratum_of[run_idx - first]
+            for cid, points in season_points.items():
+                sums[h][cid] += points
+                squares[h][cid] += points * points
+            counts[h] += 1
+
+    def variance(h: int, cid: str) -> float:
+        n = counts[h]
+        if n < 2:
+            return 0.0
+        m = sums[h][cid] / n
+        return max(0.0, (squares[h][cid] - n * m * m) / (n - 1))
+
+    if num_runs <= 0:
+        return {"expected_points": {}, "se": {}, "se_srs": {}, "vrf": 1.0, "runs": 0, "strata": {}}
+    if num_runs < len(STRATA):
+        raise ValueError(f"Stratified runs need one season per structure: {num_runs} runs for {len(STRATA)} strata")
+    if allocation == "neyman":
+        pilot = min(num_runs, pilot_runs if pilot_runs is not None else max(2 * len(STRATA), num_runs // 5))
+        if pilot < len(STRATA):
+            raise ValueError(f"Neyman pilot needs one season per structure: {pilot} runs for {len(STRATA)} strata")
+        run(allocate(pilot, STRATUM_WEIGHTS))
+        spreads = [math.sqrt(sum(variance(h, cid) for cid in contestant_ids)) for h in range(len(STRATA))]
+        run(allocate(num_runs - pilot, STRATUM_WEIGHTS, spreads))
+    else:
+        run(allocate(num_runs, STRATUM_WEIGHTS))
+
+    strata = range(len(STRATA))
+    expected, se, se_srs = {}, {}, {}
+    for cid in contestant_ids:
+        means = [sums[h][cid] / counts[h] for h in strata]
+        variances = [variance(h, cid) for h in strata]
+        estimate, var_strat = stratified_mean(means, variances, counts, STRATUM_WEIGHTS)
+        # Plain Monte Carlo variance: within-stratum plus between-stratum spread
+        spread = sum(w * (v + (m - estimate) ** 2) for w, v, m in zip(STRATUM_WEIGHTS, variances, means))
+        expected[cid] = estimate
+        se[cid] = math.sqrt(var_strat)
+        se_srs[cid] = math.sqrt(spread / num_runs)
+    total_strat = sum(v * v for v in se.values())
+    total_srs = sum(v * v for v in se_srs.values())
+    return {
+        "expected_points": expected,
+        "se": se,
+        "se_srs": se_srs,
+        "vrf": total_srs / total_strat if total_strat > 0 else 1.0,
+        "runs": num_runs,
+        "allocation": allocation,
+        "strata": {
+            stratum_label(STRATA[h]): {
+                "runs": counts[h],
+                "mean_points": sum(sums[h].values()) / counts[h] / len(contestant_ids) if counts[h] else 0.0,
+            }
+            for h in strata
+        },
+    }
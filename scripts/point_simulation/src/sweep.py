@@ -0,0 +1,330 @@
+"""
+Parameter sweeps over pricing.yaml / dynamic_pricing.yaml keys.
+Every point is evaluated against one shared scenario bank: prices are derived
+from the point's config, the bank is replayed for replacement diversity and
+merge budget pressure, and budget rosters per strategy are scored for spreads.
+Expected points, prices and point metrics are cached on disk by config hash.
+"""
+
+import itertools
+import json
+import os
+import random
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from .checkpoint import config_fingerprint
+from .dynamic_pricing import simulate_replacement_events, summarize_replacement_events
+from .point_calculator import calculate_roster_points
+from .price_generator import (
+    compute_expected_points_per_contestant,
+    expected_points_to_prices,
+    calibrate_prices,
+)
+from .roster_generator import generate_budget_rosters_for_simulation, dedupe_rosters
+from .scenario_generator import generate_scenario
+
+
+# Result columns, in table order
+METRICS = [
+    "avg_viable_replacements",
+    "pct_with_3plus_viable",
+    "min_viable_replacements",
+    "avg_merge_valid_pct",
+    "merge_valid_gap",
+    "strategy_spread",
+]
+
+# How to rank by each metric: more replacement diversity is better, merge % should
+# sit on its target, and a small spread means no strategy dominates
+RANK_KEYS = {
+    "avg_viable_replacements": lambda r: -r["avg_viable_replacements"],
+    "pct_with_3plus_viable": lambda r: -r["pct_with_3plus_viable"],
+    "min_viable_replacements": lambda r: -r["min_viable_replacements"],
+    "avg_merge_valid_pct": lambda r: -r["avg_merge_valid_pct"],
+    "merge_valid_gap": lambda r: abs(r["merge_valid_gap"]),
+    "strategy_spread": lambda r: r["strategy_spread"],
+}
+
+
+def parse_param(spec: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Parse KEY=SPEC from the command line:
+      key=1.4,1.8,2.2    explicit values
+      key=0.5:0.8        continuous range (random search)
+      key=0.5:0.8:4      4 evenly spaced values
+    """
+    if "=" not in spec:
+        raise ValueError(f"Expected KEY=VALUES, got {spec!r}")
+    key, values = spec.split("=", 1)
+    key = key.strip()
+    if ":" in values:
+        parts = [float(v) for v in values.split(":")]
+        if len(parts) == 2:
+            return key, {"min": parts[0], "max": parts[1]}
+        if len(parts) == 3:
+            return key, {"min": parts[0], "max": parts[1], "num": int(parts[2])}
+        raise ValueError(f"Range for {key} must be MIN:MAX or MIN:MAX:NUM")
+    return key, {"values": [float(v) for v in values.split(",")]}
+
+
+def normalize_space(raw: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Space from a YAML/JSON file: key -> list of values or {min, max[, num]}."""
+    space = {}
+    for key, spec in raw.items():
+        if isinstance(spec, list):
+            space[key] = {"values": spec}
+        elif isinstance(spec, dict) and "min" in spec and "max" in spec:
+            space[key] = dict(spec)
+        else:
+            space[key] = {"values": [spec]}
+    return space
+
+
+def _discrete_values(key: str, spec: Dict[str, Any]) -> List[Any]:
+    if "values" in spec:
+        return list(spec["values"])
+    if "num" not in spec:
+        raise ValueError(f"{key} is a continuous range; give MIN:MAX:NUM for a grid or use random search")
+    lo, hi, num = spec["min"], spec["max"], spec["num"]
+    if num <= 1:
+        return [lo]
+    return [round(lo + (hi - lo) * i / (num - 1), 10) for i in range(num)]
+
+
+def grid_points(space: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Cartesian product of every key's values, in key order."""
+    keys = list(space)
+    axes = [_discrete_values(k, space[k]) for k in keys]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*axes)]
+
+
+def random_points(space: Dict[str, Dict[str, Any]], n: int, seed: int) -> List[Dict[str, Any]]:
+    """n points: uniform over ranges, uniform choice over value lists."""
+    rng = random.Random(seed)
+    points = []
+    for _ in range(n):
+        point = {}
+        for key, spec in space.items():
+            if "values" in spec:
+                point[key] = rng.choice(spec["values"])
+            elif "num" in spec:
+                point[key] = rng.choice(_discrete_values(key, spec))
+            else:
+                point[key] = round(rng.uniform(spec["min"], spec["max"]), 6)
+        points.append(point)
+    return points
+
+
+def point_problems(point_config: Dict[str, Any]) -> List[str]:
+    """Reasons a point's merged config is not worth simulating (empty if fine)."""
+    problems = []
+    target = point_config.get("target_valid_pct")
+    if target is not None and not 0 < target <= 1:
+        problems.append("target_valid_pct outside (0, 1]")
+    if point_config.get("replacement_value_tolerance_base", 0) > point_config.get("replacement_value_tolerance_max", float("inf")):
+        problems.append("replacement_value_tolerance_base > replacement_value_tolerance_max")
+    if point_config.get("price_curve", 1) <= 0:
+        problems.append("price_curve must be positive")
+    return problems
+
+
+# --- disk cache --------------------------------------------------------------
+
+def _cache_file(cache_dir: Optional[Path], kind: str, key: str) -> Optional[Path]:
+    if cache_dir is None:
+        return None
+    return Path(cache_dir) / f"{kind}-{key[:20]}.json"
+
+
+def load_cached(cache_dir: Optional[Path], kind: str, key: str) -> Optional[Any]:
+    path = _cache_file(cache_dir, kind, key)
+    if path is None or not path.exists():
+        return None
+    with open(path) as f:
+        payload = json.load(f)
+    return payload["value"] if payload.get("key") == key else None
+
+
+def store_cached(cache_dir: Optional[Path], kind: str, key: str, value: Any) -> None:
+    path = _cache_file(cache_dir, kind, key)
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    with os.fdopen(fd, "w") as f:
+        json.dump({"key": key, "value": value}, f)
+    os.replace(tmp_path, path)
+
+
+# --- evaluation --------------------------------------------------------------
+
+def build_scenario_bank(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    probabilities: Dict[str, Any],
+    num_scenarios: int,
+    seed: int,
+) -> List[List[Dict[str, Any]]]:
+    """Seasons every point is evaluated on (same seeds as the dynamic pricing simulation)."""
+    return [
+        generate_scenario(contestants, season_template, seed=seed + s * 7777, probabilities=probabilities)
+        for s in range(num_scenarios)
+    ]
+
+
+def expected_points_for_sweep(
+    contestants: List[Dict],
+    season_template: List[Dict],
+    scoring: Dict[str, Any],
+    probabilities: Dict[str, Any],
+    config_dir: Path,
+    num_runs: int,
+    seed: int,
+    cache_dir: Optional[Path] = None,
+) -> Tuple[Dict[str, float], str]:
+    """Expected points (independent of pricing keys), cached; returns (points, cache key)."""
+    key = config_fingerprint("expected_points", contestants, season_template, scoring, probabilities, num_runs, seed)
+    cached = load_cached(cache_dir, "expected", key)
+    if cached is not None:
+        return cached, key
+    expected_points = compute_expected_points_per_contestant(
+        contestants, season_template, scoring, config_dir, num_runs=num_runs, seed=seed
+    )
+    store_cached(cache_dir, "expected", key, expected_points)
+    return expected_points, key
+
+
+def point_prices(
+    expected_points: Dict[str, float],
+    expected_key: str,
+    contestants: List[Dict],
+    pricing_config: Dict[str, Any],
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, int]:
+    """
+    Initial prices for a point: curve mapping plus target_valid_pct calibration.
+    Cached on the pricing.yaml keys only, so points differing in dynamic keys share prices.
+    """
+    key = config_fingerprint("prices", expected_key, pricing_config)
+    cached = load_cached(cache_dir, "prices", key)
+    if cached is not None:
+        return cached
+    prices = expected_points_to_prices(expected_points, pricing_config)
+    roster_size = pricing_config.get("roster_max", 7)
+    if pricing_config.get("roster_min", 7) == roster_size:
+        prices, _ = calibrate_prices(prices, contestants, pricing_config, roster_size=roster_size)
+    store_cached(cache_dir, "prices", key, prices)
+    return prices
+
+
+def evaluate_point(
+    overrides: Dict[str, Any],
+    shared: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Metrics for one point. shared holds contestants, scoring, pricing_config,
+    dynamic_config, bank, bank_key, expected_points, expected_key,
+    rosters_per_strategy, seed and cache_dir.
+    """
+    pricing_config = shared["pricing_config"]
+    point_pricing = dict(pricing_config, **{k: v for k, v in overrides.items() if k in pricing_config})
+    point_config = dict(point_pricing, **shared["dynamic_config"])
+    point_config.update(overrides)
+    row: Dict[str, Any] = {"overrides": overrides}
+    problems = point_problems(point_config)
+    if problems:
+        row["skipped"] = "; ".join(problems)
+        return row
+
+    key = config_fingerprint("point", shared["bank_key"], shared["rosters_per_strategy"], point_config)
+    row["hash"] = key[:12]
+    cache_dir = shared.get("cache_dir")
+    cached = load_cached(cache_dir, "point", key)
+    if cached is not None:
+        row.update(cached, cached_result=True)
+        return row
+
+    contestants = shared["contestants"]
+    scoring = shared["scoring"]
+    expected_points = shared["expected_points"]
+    prices = point_prices(expected_points, shared["expected_key"], contestants, point_pricing, cache_dir)
+
+    events = []
+    for s, scenario in enumerate(shared["bank"]):
+        scenario_events, _ = simulate_replacement_events(
+            scenario, prices, expected_points, contestants, scoring, point_config, scenario_index=s,
+        )
+        events.extend(scenario_events)
+    metrics = summarize_replacement_events(events)
+    metrics["merge_valid_gap"] = metrics["avg_merge_valid_pct"] - 100 * point_config.get("target_merge_valid_pct", 0.70)
+
+    budget = point_config.get("budget", 1_000_000)
+    rosters = generate_budget_rosters_for_simulation(
+        contestants, prices, budget, expected_points,
+        num_per_strategy=shared["rosters_per_strategy"], seed=shared["seed"],
+        roster_min=point_config.get("roster_min", 7), roster_max=point_config.get("roster_max", 7),
+    )
+    unique, by_strategy = dedupe_rosters(rosters, contestants)
+    roster_totals = [
+        sum(calculate_roster_points(r["roster"], scenario, scoring)["total"] for scenario in shared["bank"])
+        for r in unique
+    ]
+    strategy_means = {}
+    for s, indices in by_strategy.items():
+        count = sum(unique[i]["strategies"][s] for i in indices) * len(shared["bank"])
+        if count:
+            strategy_means[s] = sum(roster_totals[i] * unique[i]["strategies"][s] for i in indices) / count
+    metrics["distinct_rosters"] = {s: len(indices) for s, indices in by_strategy.items()}
+    metrics["strategy_means"] = strategy_means
+    metrics["strategy_spread"] = (max(strategy_means.values()) - min(strategy_means.values())) if strategy_means else 0
+    metrics["top7_cost"] = sum(sorted(prices.values(), reverse=True)[:7])
+
+    store_cached(cache_dir, "point", key, metrics)
+    row.update(metrics, cached_result=False)
+    return row
+
+
+_worker_shared: Dict[str, Any] = {}
+
+
+def _init_worker(shared: Dict[str, Any]) -> None:
+    _worker_shared.clear()
+    _worker_shared.update(shared)
+
+
+def _evaluate_in_worker(overrides: Dict[str, Any]) -> Dict[str, Any]:
+    return evaluate_point(overrides, _worker_shared)
+
+
+def run_points(
+    points: List[Dict[str, Any]],
+    shared: Dict[str, Any],
+    workers: int = 1,
+    on_result=None,
+) -> List[Dict[str, Any]]:
+    """Evaluate points (in parallel when workers > 1); results keep point order."""
+    results = []
+    if workers <= 1 or len(points) <= 1:
+        for i, point in enumerate(points):
+            row = evaluate_point(point, shared)
+            results.append(row)
+            if on_result:
+                on_result(i, row)
+        return results
+
+    import multiprocessing
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(shared,)) as pool:
+        for i, row in enumerate(pool.imap(_evaluate_in_worker, points)):
+            results.append(row)
+            if on_result:
+                on_result(i, row)
+    return results
+
+
+def rank_results(results: List[Dict[str, Any]], sort_by: str) -> List[Dict[str, Any]]:
+    """Evaluated rows best-first by sort_by (see RANK_KEYS); skipped points go last."""
+    evaluated = [r for r in results if "skipped" not in r]
+    skipped = [r for r in results if "skipped" in r]
+    return sorted(evaluated, key=RANK_KEYS[sort_by]) + skipped
@@ -0,0 +1,179 @@
+"""
+Variance-reduction statistics for Monte Carlo comparisons.
+paired_difference compares two estimators scored on the same scenarios (common
+random numbers), optionally grouped into antithetic pairs, against what the
+same number of independent scenarios per arm would give. The variance reduction
+factor (VRF) is independent-estimator variance over the paired one, and the
+effective sample size is scenarios x VRF: the independent scenarios per arm
+the paired estimate is worth.
+Stratified estimates (allocate, stratified_mean) combine per-stratum means with
+the strata's probabilities; their variance leaves out the between-strata part.
+control_variate_mean adjusts a sample mean by controls with known expectations,
+using least-squares coefficients.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, List, Any, Hashable, Optional, Sequence, Tuple
+
+
+def mean(values: Sequence[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def sample_variance(values: Sequence[float]) -> float:
+    """Unbiased sample variance (0 for fewer than two values)."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    m = sum(values) / n
+    return sum((v - m) ** 2 for v in values) / (n - 1)
+
+
+def group_means(values: Sequence[float], group_size: int) -> List[float]:
+    """Means of consecutive groups (antithetic pairs when group_size is 2); a short tail group is dropped."""
+    if group_size <= 1:
+        return list(values)
+    return [
+        sum(values[i:i + group_size]) / group_size
+        for i in range(0, len(values) - group_size + 1, group_size)
+    ]
+
+
+def allocate(total: int, weights: Sequence[float], spreads: Optional[Sequence[float]] = None) -> List[int]:
+    """
+    Split total samples across strata: proportional to weights, or with spreads
+    (per-stratum standard deviations) Neyman allocation, proportional to weight x
+    spread. Largest-remainder rounding, so the counts sum to total.
+    """
+    shares = [w * (s if spreads is not None else 1.0) for w, s in zip(weights, spreads or weights)]
+    norm = sum(shares)
+    if norm <= 0:
+        shares, norm = list(weights), sum(weights)
+    exact = [total * sh / norm for sh in shares]
+    counts = [int(x) for x in exact]
+    by_remainder = sorted(range(len(exact)), key=lambda i: counts[i] - exact[i])
+    for i in by_remainder[:total - sum(counts)]:
+        counts[i] += 1
+    return counts
+
+
+def stratified_mean(
+    means: Sequence[float],
+    variances: Sequence[float],
+    counts: Sequence[int],
+    weights: Sequence[float],
+) -> Tuple[float, float]:
+    """(estimate, its variance) from per-stratum sample means, sample variances and counts."""
+    estimate = sum(w * m for w, m in zip(weights, means))
+    variance = sum(w * w * v / n for w, v, n in zip(weights, variances, counts) if n)
+    return estimate, variance
+
+
+def _stratified_units(units: Sequence[float], strata: Sequence[Hashable]) -> Tuple[float, float]:
+    """Mean and variance of units with their own strata, weighted by each stratum's share."""
+    by_stratum: Dict[Hashable, List[float]] = defaultdict(list)
+    for value, stratum in zip(units, strata):
+        by_stratum[stratum].append(value)
+    groups = list(by_stratum.values())
+    total = sum(len(g) for g in groups)
+    return stratified_mean(
+        [mean(g) for g in groups], [sample_variance(g) for g in groups],
+        [len(g) for g in groups], [len(g) / total for g in groups],
+    )
+
+
+def paired_difference(
+    a: Sequence[float],
+    b: Sequence[float],
+    group_size: int = 1,
+    strata: Optional[Sequence[Hashable]] = None,
+) -> Dict[str, Any]:
+    """
+    Mean of a - b over scenarios scored with common random numbers.
+    group_size 2 treats consecutive scenarios as antithetic pairs (the pair mean is
+    the independent unit). strata: a label per scenario for proportionally stratified
+    runs (one label per group); the paired variance is then the stratified one.
+    Returns mean_diff, se (paired), se_independent (two arms of the same number of
+    independent scenarios), ci95, vrf and ess.
+    """
+    n = min(len(a), len(b))
+    diffs = group_means([a[i] - b[i] for i in range(n)], group_size)
+    units = len(diffs)
+    if strata is not None and units:
+        mean_diff, var_paired = _stratified_units(diffs, list(strata)[::max(1, group_size)])
+    else:
+        mean_diff, var_paired = mean(diffs), sample_variance(diffs) / units if units else 0.0
+    var_independent = (sample_variance(a[:n]) + sample_variance(b[:n])) / n if n else 0.0
+    se = math.sqrt(var_paired)
+    vrf = var_independent / var_paired if var_paired > 0 else float("inf") if var_independent > 0 else 1.0
+    return {
+        "mean_diff": mean_diff,
+        "se": se,
+        "se_independent": math.sqrt(var_independent),
+        "ci95": (mean_diff - 1.96 * se, mean_diff + 1.96 * se),
+        "vrf": vrf,
+        "ess": n * vrf,
+        "scenarios": n,
+    }
+
+
+def _solve(matrix: Sequence[Sequence[float]], rhs: Sequence[float]) -> List[float]:
+    """Gauss-Jordan with partial pivoting; a (near-)dependent column gets coefficient 0."""
+    n = len(rhs)
+    rows = [list(row) + [b] for row, b in zip(matrix, rhs)]
+    scale = max((abs(rows[i][i]) for i in range(n)), default=0.0)
+    pivots = []
+    r = 0
+    for col in range(n):
+        best = max(range(r, n), key=lambda i: abs(rows[i][col]), default=None)
+        if best is None or abs(rows[best][col]) <= 1e-10 * scale:
+            continue
+        rows[r], rows[best] = rows[best], rows[r]
+        for i in range(n):
+            if i != r and rows[i][col]:
+                f = rows[i][col] / rows[r][col]
+                rows[i] = [x - f * y for x, y in zip(rows[i], rows[r])]
+        pivots.append((r, col))
+        r += 1
+    solution = [0.0] * n
+    for row, col in pivots:
+        solution[col] = rows[row][n] / rows[row][col]
+    return solution
+
+
+def control_variate_mean(
+    values: Sequence[float],
+    controls: Sequence[Sequence[float]],
+    control_means: Sequence[float],
+    control_mean_variances: Optional[Sequence[float]] = None,
+) -> Dict[str, Any]:
+    """
+    Mean of values adjusted by controls (one sequence per control, aligned with
+    values) whose expectations are control_means: mean - beta . (control mean -
+    expectation), beta the least-squares coefficients fitted on the same samples.
+    control_mean_variances: the variance of each expectation when it is itself an
+    estimate (omit for exact ones). Returns estimate, variance, variance_plain (of
+    the unadjusted mean) and beta.
+    """
+    n, p = len(values), len(controls)
+    if n < 2:
+        return {"estimate": mean(values), "variance": 0.0, "variance_plain": 0.0, "beta": [0.0] * p}
+    y_mean = mean(values)
+    x_means = [mean(x) for x in controls]
+    dy = [v - y_mean for v in values]
+    dx = [[v - m for v in x] for x, m in zip(controls, x_means)]
+    beta = _solve(
+        [[sum(a * b for a, b in zip(dx[i], dx[j])) for j in range(p)] for i in range(p)],
+        [sum(a * b for a, b in zip(dx[i], dy)) for i in range(p)],
+    )
+    residuals = [dy[t] - sum(b * x[t] for b, x in zip(beta, dx)) for t in range(n)]
+    dof = max(1, n - 1 - sum(1 for b in beta if b))
+    variance = sum(r * r for r in residuals) / dof / n
+    variance += sum(b * b * v for b, v in zip(beta, control_mean_variances or [0.0] * p))
+    return {
+        "estimate": y_mean - sum(b * (m - mu) for b, m, mu in zip(beta, x_means, control_means)),
+        "variance": variance,
+        "variance_plain": sample_variance(values) / n,
+        "beta": beta,
+    }
@@ -0,0 +1,270 @@
+"""
+What-if scoring and pricing against the current game state.
+A WhatIfService holds the configs, the aired episodes, current prices (seed
+prices replayed through every aired episode) and rest-of-season expected
+points, all built once. Hypothetical episode outcomes ("c07 voted out next
+with 6 votes") are then scored, priced and checked for viable replacements
+in well under a millisecond; answers are kept in an LRU keyed by a hash of
+the request, so repeated questions are dictionary lookups.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable
+
+from .checkpoint import config_fingerprint
+from .conditional import remaining_contestants, rest_of_season_expected_points
+from .config import (
+    load_scoring,
+    load_season_template,
+    load_contestants,
+    load_pricing,
+    load_dynamic_pricing,
+    load_probabilities,
+)
+from .dynamic_pricing import (
+    calculate_contestant_episode_points,
+    update_prices_from_episode,
+    count_viable_replacements,
+)
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        # Computed outside the lock; two threads racing on one key just both compute it
+        value = compute()
+        if self.maxsize > 0:
+            with self._lock:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+class WhatIfService:
+    """Hypothetical episode outcomes evaluated against one observed game state."""
+
+    def __init__(
+        self,
+        contestants: List[Dict],
+        scoring_config: Dict[str, Any],
+        update_config: Dict[str, Any],
+        prices: Dict[str, int],
+        expected_points: Dict[str, float],
+        observed: Optional[List[Dict[str, Any]]] = None,
+        cache_size: int = 1024,
+    ):
+        self.contestants = contestants
+        self.scoring = scoring_config
+        self.update_config = update_config
+        self.observed = list(observed or [])
+        self.expected_points = expected_points
+        self.remaining = remaining_contestants(self.observed, contestants)
+        self.cache = LRUCache(cache_size)
+
+        # Current prices: seed prices moved by every aired episode
+        self.prices = dict(prices)
+        tribals = 0
+        for ep_idx, ep in enumerate(self.observed):
+            if ep.get("voted_out"):
+                tribals += 1
+                self.prices = update_prices_from_episode(
+                    self.prices, ep, scoring_config, update_config,
+                    episode_index=ep_idx, tribal_episode_count=tribals,
+                )
+        self.tribal_count = tribals
+
+        if self.observed and self.observed[-1].get("contestant_tribes"):
+            self.tribes = self.observed[-1]["contestant_tribes"]
+        else:
+            self.tribes = {}
+            for c in contestants:
+                self.tribes.setdefault(c["starting_tribe"], []).append(c["id"])
+
+    # --- building blocks -------------------------------------------------
+
+    def hypothetical_episode(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Next episode from a what-if spec: voted_out, votes, pocket_items and phase
+        (default: the last aired phase), plus any outcome fields in spec["episode"]
+        (team_immunity_results, vote_matched, idol_played, ...) which win.
+        A spec with "outcome" is a complete episode outcome and is used as is.
+        """
+        if "outcome" in spec:
+            return spec["outcome"]
+        voted_out = spec.get("voted_out")
+        if voted_out is not None and voted_out not in self.remaining:
+            raise ValueError(f"{voted_out} is not a remaining contestant")
+        phase = spec.get("phase") or (self.observed[-1].get("phase", "pre_merge") if self.observed else "pre_merge")
+        team_phase = phase in ("pre_merge", "swap")
+        active = [c for c in self.remaining if c != voted_out]
+        votes = int(spec.get("votes", 0)) if voted_out else 0
+        episode = {
+            "episode_id": len(self.observed) + 1,
+            "phase": phase,
+            "tribal": True,
+            "immunity_type": "team" if team_phase else "individual",
+            "reward_type": "team" if team_phase else "individual",
+            "immunity_teams": len(self.tribes),
+            "reward_teams": len(self.tribes),
+            "active_contestants": active,
+            "survived": list(active) if voted_out else [],
+            "voted_out": voted_out,
+            "vote_matched": [],
+            "strategic_player": [],
+            "voted_out_votes": votes,
+            "voted_out_pocket_items": int(spec.get("pocket_items", 0)),
+            "team_immunity_results": {},
+            "team_reward_results": {},
+            "contestant_tribes": self.tribes,
+            "individual_immunity_winner": None,
+            "clue_readers": [],
+            "idol_played": [],
+            "idol_failed": [],
+            "advantage_played": [],
+            "vote_targets": {},
+            "votes_received": {voted_out: votes, **{c: 0 for c in active}} if voted_out else {},
+            "idol_votes_nullified": 0,
+            "confessional_counts": {},
+        }
+        episode.update(spec.get("episode", {}))
+        return episode
+
+    def episode_points(self, episode: Dict[str, Any]) -> Dict[str, float]:
+        """Points every remaining contestant scores in the episode."""
+        return {cid: calculate_contestant_episode_points(cid, episode, self.scoring) for cid in self.remaining}
+
+    def price_update(self, episode: Dict[str, Any], prices: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Prices after the episode, with per-contestant changes from the prices before it."""
+        prior = prices or self.prices
+        tribals = self.tribal_count + (1 if episode.get("voted_out") else 0)
+        updated = update_prices_from_episode(
+            prior, episode, self.scoring, self.update_config,
+            episode_index=len(self.observed), tribal_episode_count=tribals,
+        )
+        return {"prices": updated, "changes": {cid: updated[cid] - prior[cid] for cid in updated if updated[cid] != prior[cid]}}
+
+    def viable_replacements(
+        self,
+        budget: int,
+        prices: Optional[Dict[str, int]] = None,
+        remaining: Optional[List[str]] = None,
+        value_tolerance: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """count_viable_replacements over the remaining players at the given (default: current) prices."""
+        pool = remaining if remaining is not None else self.remaining
+        ep_remaining = {c: self.expected_points.get(c, 0) for c in pool}
+        return count_viable_replacements(
+            pool, prices or self.prices, ep_remaining, budget,
+            value_tolerance=value_tolerance, config=self.update_config,
+        )
+
+    def what_if(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Episode points, price moves, team totals and replacement options for a
+        hypothetical next episode. spec["teams"] maps a team name to a roster
+        (list of IDs) or {"roster": [...], "captain": id}.
+        """
+        episode = self.hypothetical_episode(spec)
+        points = self.episode_points(episode)
+        priced = self.price_update(episode)
+        captain_multiplier = self.scoring.get("captain_multiplier", 2.0)
+
+        teams = {}
+        for name, team in (spec.get("teams") or {}).items():
+            roster = team["roster"] if isinstance(team, dict) else team
+            captain = team.get("captain") if isinstance(team, dict) else None
+            total = sum(points.get(c, 0) for c in roster)
+            if captain in roster:
+                total += (captain_multiplier - 1) * points.get(captain, 0)
+            teams[name] = {
+                "episode_points": total,
+                "value_before": sum(self.prices.get(c, 0) for c in roster),
+                "value_after": sum(priced["prices"].get(c, 0) for c in roster),
+            }
+
+        result = {"episode": episode, "points": points, **priced, "teams": teams}
+        voted_out = episode.get("voted_out")
+        if voted_out:
+            # A team that loses voted_out frees its price going into the episode
+            result["replacements"] = self.viable_replacements(
+                self.prices.get(voted_out, 0),
+                prices=priced["prices"],
+                remaining=list(episode.get("active_contestants", [])),
+            )
+        return result
+
+    # --- request dispatch ------------------------------------------------
+
+    def handle(self, endpoint: str, payload: Dict[str, Any]) -> Any:
+        """Answer one request; identical requests are served from the LRU."""
+        handler = ENDPOINTS.get(endpoint)
+        if handler is None:
+            raise KeyError(endpoint)
+        key = config_fingerprint(endpoint, payload)
+        return self.cache.get_or_compute(key, lambda: handler(self, payload))
+
+    def state(self) -> Dict[str, Any]:
+        return {
+            "episodes_aired": len(self.observed),
+            "remaining": self.remaining,
+            "prices": self.prices,
+            "expected_points": self.expected_points,
+            "cache": self.cache.stats(),
+        }
+
+
+# endpoint -> handler(service, payload)
+ENDPOINTS: Dict[str, Callable[[WhatIfService, Dict[str, Any]], Any]] = {
+    "episode-points": lambda s, p: s.episode_points(s.hypothetical_episode(p)),
+    "update-prices": lambda s, p: s.price_update(s.hypothetical_episode(p), prices=p.get("prices")),
+    "viable-replacements": lambda s, p: s.viable_replacements(
+        p["budget"] if "budget" in p else s.prices[p["voted_out"]],
+        prices=p.get("prices"),
+        remaining=p.get("remaining") or ([c for c in s.remaining if c != p["voted_out"]] if p.get("voted_out") else None),
+        value_tolerance=p.get("value_tolerance"),
+    ),
+    "what-if": lambda s, p: s.what_if(p),
+}
+
+
+def load_whatif_service(
+    config_dir: Path,
+    prices: Dict[str, int],
+    observed: Optional[List[Dict[str, Any]]] = None,
+    expected_runs: int = 200,
+    seed: int = 42,
+    cache_size: int = 1024,
+) -> WhatIfService:
+    """Service for the observed state, with expected points from expected_runs continuations."""
+    contestants = load_contestants(config_dir)
+    scoring = load_scoring(config_dir)
+    update_config = dict(load_pricing(config_dir), **load_dynamic_pricing(config_dir))
+    expected_points = rest_of_season_expected_points(
+        observed or [], contestants, load_season_template(config_dir), scoring,
+        probabilities=load_probabilities(config_dir), num_runs=expected_runs, seed=seed,
+    )
+    return WhatIfService(
+        contestants, scoring, update_config, prices, expected_points,
+        observed=observed, cache_size=cache_size,
+    )